@@ -13,6 +13,7 @@ export default function WhisperSection() {
     handleSave,
     isSaving,
     localWhisperAvailable,
+    fasterWhisperAvailable,
     handleWhisperTypeChange,
     getWhisperApiKey,
     envOverrides,
@@ -66,16 +67,24 @@ export default function WhisperSection() {
           <select
             className="input"
             value={whisperType}
-            onChange={(e) => handleWhisperTypeChange(e.target.value as 'local' | 'remote' | 'groq')}
+            onChange={(e) =>
+              handleWhisperTypeChange(
+                e.target.value as 'local' | 'faster_whisper' | 'remote' | 'groq'
+              )
+            }
           >
             {localWhisperAvailable !== false && <option value="local">local</option>}
+            {fasterWhisperAvailable !== false && (
+              <option value="faster_whisper">faster_whisper (CPU, int8)</option>
+            )}
             <option value="remote">remote</option>
             <option value="groq">groq</option>
           </select>
         </Field>
 
         {/* Local Whisper Options */}
-        {pending?.whisper?.whisper_type === 'local' && (
+        {(pending?.whisper?.whisper_type === 'local' ||
+          pending?.whisper?.whisper_type === 'faster_whisper') && (
           <Field
             label="Local Model"
             envMeta={getEnvHint('whisper.model', { env_var: 'WHISPER_LOCAL_MODEL' })}
@@ -67,6 +67,7 @@ export interface UseConfigStateReturn {
   whisperStatus: ConnectionStatus;
   hasEdits: boolean;
   localWhisperAvailable: boolean | null;
+  fasterWhisperAvailable: boolean | null;
   isSaving: boolean;
 
   // Actions
@@ -95,7 +96,7 @@ export interface UseConfigStateReturn {
   handleDismissEnvWarning: () => void;
 
   // Whisper type change handler
-  handleWhisperTypeChange: (nextType: 'local' | 'remote' | 'groq') => void;
+  handleWhisperTypeChange: (nextType: 'local' | 'faster_whisper' | 'remote' | 'groq') => void;
 
   // Groq quick setup mutation
   applyGroqKey: (key: string) => Promise<void>;
@@ -123,6 +124,7 @@ export function useConfigState(): UseConfigStateReturn {
   const [pending, setPending] = useState<CombinedConfig | null>(null);
   const [hasEdits, setHasEdits] = useState(false);
   const [localWhisperAvailable, setLocalWhisperAvailable] = useState<boolean | null>(null);
+  const [fasterWhisperAvailable, setFasterWhisperAvailable] = useState<boolean | null>(null);
 
   // Connection statuses
   const [llmStatus, setLlmStatus] = useState<ConnectionStatus>({
@@ -307,24 +309,31 @@ export function useConfigState(): UseConfigStateReturn {
     configApi
       .getWhisperCapabilities()
       .then((res) => {
-        if (!cancelled) setLocalWhisperAvailable(!!res.local_available);
+        if (cancelled) return;
+        setLocalWhisperAvailable(!!res.local_available);
+        setFasterWhisperAvailable(!!res.faster_whisper_available);
       })
       .catch(() => {
-        if (!cancelled) setLocalWhisperAvailable(false);
+        if (cancelled) return;
+        setLocalWhisperAvailable(false);
+        setFasterWhisperAvailable(false);
       });
     return () => {
       cancelled = true;
     };
   }, []);
 
-  // If local is unavailable but selected, switch to safe default
+  // If a local engine is unavailable but selected, switch to safe default
   useEffect(() => {
-    if (!pending || localWhisperAvailable !== false) return;
+    if (!pending) return;
     const currentType = pending.whisper.whisper_type;
-    if (currentType === 'local') {
+    if (
+      (currentType === 'local' && localWhisperAvailable === false) ||
+      (currentType === 'faster_whisper' && fasterWhisperAvailable === false)
+    ) {
       setField(['whisper', 'whisper_type'], 'remote');
     }
-  }, [localWhisperAvailable, pending, setField]);
+  }, [localWhisperAvailable, fasterWhisperAvailable, pending, setField]);
 
   // Save mutation
   const saveMutation = useMutation({
@@ -397,7 +406,7 @@ export function useConfigState(): UseConfigStateReturn {
   };
 
   // Whisper type change handler
-  const handleWhisperTypeChange = (nextType: 'local' | 'remote' | 'groq') => {
+  const handleWhisperTypeChange = (nextType: 'local' | 'faster_whisper' | 'remote' | 'groq') => {
     updatePending((prevConfig) => {
       const prevWhisper = {
         ...(prevConfig.whisper as unknown as Record<string, unknown>),
@@ -419,7 +428,7 @@ export function useConfigState(): UseConfigStateReturn {
         if (!nextModel || prevModel === 'base' || prevModel === 'base.en') {
           nextModel = 'whisper-1';
         }
-      } else if (nextType === 'local') {
+      } else if (nextType === 'local' || nextType === 'faster_whisper') {
         if (!nextModel || prevModel === 'whisper-1' || prevModel.startsWith('whisper-large')) {
           nextModel = 'base.en';
         }
@@ -439,7 +448,7 @@ export function useConfigState(): UseConfigStateReturn {
       } else if (nextType === 'remote') {
         nextWhisper.model = nextModel ?? 'whisper-1';
         nextWhisper.language = (prevWhisper.language as string | undefined) || 'en';
-      } else if (nextType === 'local') {
+      } else if (nextType === 'local' || nextType === 'faster_whisper') {
         nextWhisper.model = nextModel ?? 'base.en';
         delete nextWhisper.api_key;
       } else if (nextType === 'test') {
@@ -527,6 +536,7 @@ export function useConfigState(): UseConfigStateReturn {
     whisperStatus,
     hasEdits,
     localWhisperAvailable,
+    fasterWhisperAvailable,
     isSaving: saveMutation.isPending,
 
     // Actions
@@ -565,10 +565,14 @@ export const configApi = {
     const response = await api.post('/api/config/test-whisper', payload ?? {});
     return response.data;
   },
-  getWhisperCapabilities: async (): Promise<{ local_available: boolean }> => {
+  getWhisperCapabilities: async (): Promise<{
+    local_available: boolean;
+    faster_whisper_available: boolean;
+  }> => {
     const response = await api.get('/api/config/whisper-capabilities');
     const local_available = !!response.data?.local_available;
-    return { local_available };
+    const faster_whisper_available = !!response.data?.faster_whisper_available;
+    return { local_available, faster_whisper_available };
   },
 };
 
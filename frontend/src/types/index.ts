@@ -110,6 +110,7 @@ export interface LLMConfig {
 
 export type WhisperConfig =
   | { whisper_type: 'local'; model: string }
+  | { whisper_type: 'faster_whisper'; model: string }
   | {
       whisper_type: 'remote';
       model: string;
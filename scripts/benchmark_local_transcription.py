@@ -0,0 +1,132 @@
+"""
+Benchmark local transcription backends by real-time factor (RTF).
+
+Transcribes an episode on this machine with openai-whisper in fp32 (the
+"local" backend) and with faster-whisper (the "faster_whisper" backend), and
+reports model load time, transcription time and RTF: transcription time over
+audio duration, so below 1.0 is faster than real time.
+
+Usage: PYTHONPATH=src python scripts/benchmark_local_transcription.py EPISODE
+       [--model NAME] [--compute-type int8] [--cpu-threads N] [--no-vad]
+       [--clip-seconds N] [--backends local faster_whisper]
+"""
+
+import argparse
+import functools
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Tuple
+
+import ffmpeg  # type: ignore[import-untyped]
+
+from podcast_processor.audio import get_audio_duration_ms
+from podcast_processor.transcribe import (
+    FasterWhisperTranscriber,
+    LocalWhisperTranscriber,
+    Transcriber,
+)
+from podcast_processor.whisper_model_cache import (
+    WhisperModelCache,
+    load_faster_whisper_model,
+)
+from shared.config import FasterWhisperConfig
+
+BACKENDS = ("local", "faster_whisper")
+
+
+def build_transcriber(
+    backend: str, args: argparse.Namespace
+) -> Tuple[Transcriber, WhisperModelCache]:
+    logger = logging.getLogger("benchmark")
+    if backend == "local":
+        cache = WhisperModelCache(idle_timeout=0)
+        return LocalWhisperTranscriber(logger, args.model, cache), cache
+    config = FasterWhisperConfig(
+        model=args.model,
+        compute_type=args.compute_type,
+        cpu_threads=args.cpu_threads,
+        vad_filter=not args.no_vad,
+    )
+    cache = WhisperModelCache(
+        idle_timeout=0,
+        loader=functools.partial(
+            load_faster_whisper_model,
+            compute_type=config.compute_type,
+            cpu_threads=config.cpu_threads,
+        ),
+    )
+    return FasterWhisperTranscriber(logger, config, cache), cache
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("episode", type=Path)
+    parser.add_argument("--model", default="base.en", help="default base.en")
+    parser.add_argument(
+        "--compute-type", default="int8", help="faster-whisper quantization"
+    )
+    parser.add_argument(
+        "--cpu-threads",
+        type=int,
+        default=0,
+        help="faster-whisper threads (default 0: CTranslate2 decides)",
+    )
+    parser.add_argument(
+        "--no-vad", action="store_true", help="disable faster-whisper VAD"
+    )
+    parser.add_argument(
+        "--clip-seconds",
+        type=int,
+        default=None,
+        help="only transcribe the first N seconds",
+    )
+    parser.add_argument(
+        "--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS)
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        audio_path = args.episode
+        if args.clip_seconds:
+            audio_path = Path(temp_dir) / f"clip{args.episode.suffix}"
+            ffmpeg.input(str(args.episode), t=args.clip_seconds).output(
+                str(audio_path), acodec="copy"
+            ).overwrite_output().run(quiet=True)
+
+        duration_ms = get_audio_duration_ms(str(audio_path))
+        if duration_ms is None:
+            sys.exit(f"Could not read the duration of {audio_path}")
+        audio_seconds = duration_ms / 1000
+        print(
+            f"{args.episode.name}: {audio_seconds / 60:.1f} min, model {args.model}\n"
+        )
+        print(
+            f"{'backend':<16}{'load s':>8}{'transcribe s':>14}{'RTF':>8}"
+            f"{'segments':>10}{'words':>8}"
+        )
+
+        for backend in args.backends:
+            transcriber, cache = build_transcriber(backend, args)
+            start = time.perf_counter()
+            with cache.use(args.model):
+                pass
+            load_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            segments = transcriber.transcribe(str(audio_path))
+            transcribe_seconds = time.perf_counter() - start
+            cache.unload_all()
+
+            words = sum(len(seg.text.split()) for seg in segments)
+            print(
+                f"{backend:<16}{load_seconds:>8.1f}{transcribe_seconds:>14.1f}"
+                f"{transcribe_seconds / audio_seconds:>8.3f}"
+                f"{len(segments):>10}{words:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
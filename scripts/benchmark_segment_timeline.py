@@ -0,0 +1,157 @@
+"""
+Benchmark list-based vs array-backed identification post-processing.
+
+Builds a synthetic 5,000-segment episode (no database) and times neighbor
+expansion, ad-block grouping and cut-interval merging both ways.
+
+Usage: python scripts/benchmark_segment_timeline.py [--segments N] [--repeat N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# isort: split
+# pylint: disable=wrong-import-position
+import app  # noqa: F401,E402  # resolves the app <-> podcast_processor import order
+from app.models import Identification, ModelCall, TranscriptSegment  # noqa: E402
+from podcast_processor import audio_processor as audio_processor_module  # noqa: E402
+from podcast_processor.ad_classifier import AdClassifier  # noqa: E402
+from podcast_processor.audio_processor import AudioProcessor  # noqa: E402
+from podcast_processor.segment_timeline import SegmentTimeline  # noqa: E402
+from shared.test_utils import create_standard_test_config  # noqa: E402
+
+TEXTS = [
+    "and we're back with the interview",
+    "visit example.com slash podcast for twenty percent off",
+    "this episode is brought to you by our sponsor",
+    "so what got you interested in this field",
+    "anyway, where were we",
+]
+
+
+def synthetic_episode(count: int) -> Tuple[List[Any], List[Any]]:
+    rng = random.Random(42)
+    segments = []
+    t = 0.0
+    for i in range(count):
+        length = rng.uniform(2.0, 14.0)
+        segments.append(
+            TranscriptSegment(
+                id=i + 1,
+                post_id=1,
+                sequence_num=i,
+                start_time=t,
+                end_time=t + length,
+                text=rng.choice(TEXTS),
+            )
+        )
+        t += length + rng.choice([0.0, 0.0, 0.5, 12.0])
+    idents = [
+        Identification(
+            id=i,
+            transcript_segment=seg,
+            transcript_segment_id=seg.id,
+            label="ad",
+            confidence=rng.uniform(0.5, 1.0),
+        )
+        for i, seg in enumerate(rng.sample(segments, count // 8))
+    ]
+    return segments, idents
+
+
+def best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def report(name: str, loop_s: float, vector_s: float) -> None:
+    print(
+        f"{name:<22} loop {loop_s * 1000:9.2f} ms   "
+        f"array {vector_s * 1000:9.2f} ms   x{loop_s / vector_s:6.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--segments", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    segments, idents = synthetic_episode(args.segments)
+    classifier = AdClassifier(
+        config=create_standard_test_config(),
+        model_call_query=MagicMock(),
+        identification_query=MagicMock(),
+        db_session=MagicMock(),
+    )
+    # The loop path normally fetches neighbors from the database; give it a
+    # dict so only the in-memory work is compared.
+    by_seq = {seg.sequence_num: seg for seg in segments}
+    classifier._get_segments_bulk = lambda post_id, seqs: {  # type: ignore[method-assign]
+        s: by_seq[s] for s in seqs if s in by_seq
+    }
+    model_call = ModelCall(id=1)
+    # classify() builds the timeline once and shares it between both passes
+    timeline = SegmentTimeline.from_segments(segments)
+    build_s = best_of(args.repeat, lambda: SegmentTimeline.from_segments(segments))
+
+    print(f"{args.segments} segments, {len(idents)} ad identifications")
+    print(f"timeline build         {build_s * 1000:9.2f} ms (once per post)")
+    report(
+        "neighbor expansion",
+        best_of(
+            args.repeat,
+            lambda: classifier._neighbor_rows_loop(idents, model_call, set(), 1, 5),
+        ),
+        best_of(
+            args.repeat,
+            lambda: classifier._neighbor_rows_vectorized(
+                idents,
+                model_call,
+                set(),
+                timeline,
+                5,
+            ),
+        ),
+    )
+    report(
+        "block grouping",
+        best_of(args.repeat, lambda: classifier._group_into_blocks(idents)),
+        best_of(
+            args.repeat,
+            lambda: classifier._group_into_blocks(idents, timeline),
+        ),
+    )
+
+    processor = AudioProcessor(
+        config=create_standard_test_config(),
+        identification_query=MagicMock(),
+        transcript_segment_query=MagicMock(),
+        model_call_query=MagicMock(),
+        db_session=MagicMock(),
+    )
+    ad_segments = [(s.start_time, s.end_time) for s in segments]
+
+    def merge() -> None:
+        processor._merge_close_segments(ad_segments, min_separation=5.0)
+
+    vector_merge = best_of(args.repeat, merge)
+    audio_processor_module.HAS_NUMPY = False
+    loop_merge = best_of(args.repeat, merge)
+    audio_processor_module.HAS_NUMPY = True
+    report("interval merge", loop_merge, vector_merge)
+
+
+if __name__ == "__main__":
+    main()
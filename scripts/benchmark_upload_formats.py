@@ -0,0 +1,75 @@
+"""
+Benchmark remote-transcription upload formats: bytes uploaded and time taken.
+
+Splits an episode the way the remote Whisper transcribers do, once per upload
+format, and reports chunk count, bytes to upload and wall time for transcode
+plus split. No API is called; upload time is estimated from --upload-mbps.
+
+Usage: python scripts/benchmark_upload_formats.py EPISODE [--chunk-mb N]
+       [--upload-mbps N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# isort: split
+# pylint: disable=wrong-import-position
+from podcast_processor.audio import (  # noqa: E402
+    SPEECH_ENCODINGS,
+    get_audio_duration_ms,
+    split_audio,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("episode", type=Path)
+    parser.add_argument(
+        "--chunk-mb", type=int, default=24, help="chunk size limit (default 24)"
+    )
+    parser.add_argument(
+        "--upload-mbps",
+        type=float,
+        default=20.0,
+        help="uplink bandwidth used to estimate upload time (default 20)",
+    )
+    args = parser.parse_args()
+
+    duration_ms = get_audio_duration_ms(str(args.episode))
+    if duration_ms is None:
+        sys.exit(f"Could not read the duration of {args.episode}")
+    print(
+        f"{args.episode.name}: {duration_ms / 60_000:.1f} min, "
+        f"{args.episode.stat().st_size / 1024**2:.1f} MB\n"
+    )
+    print(
+        f"{'format':<10}{'chunks':>7}{'upload MB':>11}{'split s':>9}"
+        f"{'upload s':>10}{'total s':>9}"
+    )
+
+    for upload_format in ["original", *SPEECH_ENCODINGS]:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            start = time.perf_counter()
+            chunks = split_audio(
+                args.episode,
+                Path(temp_dir),
+                args.chunk_mb * 1024 * 1024,
+                upload_format=upload_format,
+            )
+            split_seconds = time.perf_counter() - start
+            upload_bytes = sum(path.stat().st_size for path, _ in chunks)
+        upload_seconds = upload_bytes * 8 / (args.upload_mbps * 1_000_000)
+        print(
+            f"{upload_format:<10}{len(chunks):>7}{upload_bytes / 1024**2:>11.2f}"
+            f"{split_seconds:>9.2f}{upload_seconds:>10.2f}"
+            f"{split_seconds + upload_seconds:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
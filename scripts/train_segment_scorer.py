@@ -0,0 +1,62 @@
+"""
+Train the local segment scorer from the identifications stored in the database.
+
+Fits a logistic regression over hashed n-grams and cue features, reports
+precision/recall on held-out posts and writes the model (by default to
+<instance>/models/segment_scorer.npz). Point `SEGMENT_SCORER_PATH` at the file
+to let the classifier use it.
+
+Usage: python scripts/train_segment_scorer.py [--min-confidence F] [--output PATH]
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("PODLY_DISABLE_SCHEDULER", "1")
+
+# isort: split
+# pylint: disable=wrong-import-position
+from app import create_app  # noqa: E402
+from app.runtime_config import config as runtime_config  # noqa: E402
+from app.segment_scorer_training import (  # noqa: E402
+    default_segment_scorer_path,
+    train_from_database,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--min-confidence",
+        type=float,
+        default=None,
+        help="Ad identifications below this are ignored (default: output.min_confidence)",
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--holdout", type=float, default=0.2)
+    parser.add_argument("--epochs", type=int, default=150)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        min_confidence = (
+            args.min_confidence
+            if args.min_confidence is not None
+            else runtime_config.output.min_confidence
+        )
+        metadata = train_from_database(
+            min_confidence=min_confidence,
+            output_path=args.output,
+            holdout_fraction=args.holdout,
+            epochs=args.epochs,
+        )
+    print(json.dumps(metadata, indent=2))
+    print(f"Saved to {args.output or default_segment_scorer_path()}")
+
+
+if __name__ == "__main__":
+    main()
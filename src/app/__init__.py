@@ -18,7 +18,11 @@ from app.auth import AuthSettings, load_auth_settings
 from app.auth.bootstrap import bootstrap_admin_user
 from app.auth.discord_settings import load_discord_settings
 from app.auth.middleware import init_auth_middleware
-from app.background import add_background_job, schedule_cleanup_job
+from app.background import (
+    add_background_job,
+    schedule_batch_classification_job,
+    schedule_cleanup_job,
+)
 from app.config_store import (
     ensure_defaults_and_hydrate,
     hydrate_runtime_config_inplace,
@@ -487,3 +491,7 @@ def _start_scheduler_and_jobs(app: Flask) -> None:
         else int(config.background_update_interval_minute)
     )
     schedule_cleanup_job(getattr(config, "post_cleanup_retention_days", None))
+    schedule_batch_classification_job(
+        config.llm_enable_batch_classification,
+        config.llm_batch_poll_interval_minutes,
+    )
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from typing import Optional
 
+from app.batch_classification import scheduled_batch_classification
 from app.extensions import scheduler
 from app.jobs_manager import (
     scheduled_refresh_all_feeds,
@@ -43,3 +44,23 @@ def schedule_cleanup_job(retention_days: Optional[int]) -> None:
         next_run_time=datetime.utcnow() + timedelta(minutes=15),
         replace_existing=True,
     )
+
+
+def schedule_batch_classification_job(enabled: bool, minutes: int) -> None:
+    """Schedule the batch-API submit/poll job when batch classification is on."""
+    job_id = "batch_classification"
+    if not enabled or minutes <= 0:
+        try:
+            scheduler.remove_job(job_id)
+        except Exception:
+            # Job may not be scheduled; ignore.
+            pass
+        return
+
+    scheduler.add_job(
+        id=job_id,
+        func=scheduled_batch_classification,
+        trigger="interval",
+        minutes=minutes,
+        replace_existing=True,
+    )
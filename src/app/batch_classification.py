@@ -0,0 +1,235 @@
+"""Scheduled submission and collection of batch-API classification requests.
+
+When `llm_enable_batch_classification` is on, AdClassifier leaves unanswered
+chunks in status "batch_queued" and the processor parks the job as "waiting".
+This module periodically:
+
+1. collects finished provider batches and stores the responses on ModelCall,
+2. submits queued calls from every post as one batch per model,
+3. moves waiting jobs back to "pending" once their calls have settled, so the
+   rerun picks up the stored responses without any inline LLM traffic.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from app.db_guard import db_guard, reset_session
+from app.extensions import db, scheduler
+from app.models import ModelCall, ProcessingJob
+from app.runtime_config import config as runtime_config
+from app.writer.client import writer_client
+from podcast_processor.llm_batch_client import (
+    BatchRequest,
+    LLMBatchClient,
+    resolve_batch_model,
+)
+from podcast_processor.llm_model_call_utils import classification_completion_args
+from podcast_processor.prompt import DEFAULT_SYSTEM_PROMPT_PATH, apply_prompt_encoding
+from shared.config import Config
+
+logger = logging.getLogger("global_logger")
+
+# While the worker is still producing chunks we hold the queue back so that a
+# backfill ends up in a few large batches; after this long we submit anyway.
+SUBMIT_HOLD_MINUTES = 10
+
+ClientFactory = Callable[[str], LLMBatchClient]
+
+
+def _custom_id(model_call_id: int) -> str:
+    return f"model_call-{model_call_id}"
+
+
+def _model_call_id(custom_id: str) -> Optional[int]:
+    prefix = "model_call-"
+    if not custom_id.startswith(prefix):
+        return None
+    try:
+        return int(custom_id[len(prefix) :])
+    except ValueError:
+        return None
+
+
+def _default_client_factory(config: Config) -> ClientFactory:
+    def factory(model_name: str) -> LLMBatchClient:
+        _, base_url = resolve_batch_model(model_name, config.openai_base_url)
+        return LLMBatchClient(
+            api_key=config.llm_api_key,
+            base_url=base_url,
+            timeout=config.openai_timeout,
+        )
+
+    return factory
+
+
+def _load_system_prompt() -> str:
+    with open(DEFAULT_SYSTEM_PROMPT_PATH, "r") as f:
+        return f.read()
+
+
+def collect_finished_batches(client_factory: ClientFactory) -> int:
+    """Store results of terminal batches. Returns the number of batches collected."""
+    rows = (
+        db.session.query(ModelCall.batch_id, ModelCall.model_name)
+        .filter(ModelCall.status == "batch_submitted", ModelCall.batch_id.isnot(None))
+        .distinct()
+        .all()
+    )
+    batch_models: Dict[str, str] = {}
+    for batch_id, model_name in rows:
+        batch_models.setdefault(batch_id, model_name)
+
+    collected = 0
+    for batch_id, model_name in batch_models.items():
+        client = client_factory(model_name)
+        status = client.retrieve(batch_id)
+        if not status.is_terminal:
+            logger.debug(f"LLM batch {batch_id} still {status.status}")
+            continue
+
+        payload: List[Dict[str, object]] = []
+        for result in client.fetch_results(status):
+            model_call_id = _model_call_id(result.custom_id)
+            if model_call_id is None:
+                continue
+            payload.append(
+                {
+                    "model_call_id": model_call_id,
+                    "response": result.content,
+                    "error": result.error,
+                }
+            )
+
+        res = writer_client.action(
+            "apply_model_call_batch_results",
+            {
+                "batch_id": batch_id,
+                "results": payload,
+                "missing_error": f"Batch {batch_id} ended with status {status.status}",
+            },
+            wait=True,
+        )
+        if not res or not res.success:
+            raise RuntimeError(getattr(res, "error", "Failed to store batch results"))
+        logger.info(f"Collected LLM batch {batch_id} ({status.status}): {res.data}")
+        collected += 1
+    return collected
+
+
+def submit_queued_calls(
+    config: Config,
+    client_factory: ClientFactory,
+    system_prompt: str,
+) -> int:
+    """Submit queued calls as one batch per model. Returns the number submitted."""
+    queued: List[ModelCall] = (
+        ModelCall.query.filter(ModelCall.status == "batch_queued")
+        .order_by(ModelCall.timestamp.asc())
+        .all()
+    )
+    if not queued:
+        return 0
+
+    busy = (
+        ProcessingJob.query.filter(
+            ProcessingJob.status.in_(["pending", "running"])
+        ).count()
+        > 0
+    )
+    hold_until = queued[0].timestamp + timedelta(minutes=SUBMIT_HOLD_MINUTES)
+    if busy and datetime.utcnow() < hold_until:
+        logger.debug(
+            f"Holding {len(queued)} queued batch calls while jobs are still running"
+        )
+        return 0
+
+    by_model: Dict[str, List[ModelCall]] = defaultdict(list)
+    for model_call in queued:
+        by_model[model_call.model_name].append(model_call)
+
+    submitted = 0
+    for model_name, model_calls in by_model.items():
+        provider_model, _ = resolve_batch_model(model_name, config.openai_base_url)
+        requests = [
+            BatchRequest.from_completion_args(
+                _custom_id(mc.id),
+                {
+                    # Same arguments as the inline call, addressed to the
+                    # provider's own model name
+                    **classification_completion_args(
+                        config,
+                        model_name,
+                        [
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": mc.prompt},
+                        ],
+                    ),
+                    "model": provider_model,
+                },
+            )
+            for mc in model_calls
+        ]
+        batch_id = client_factory(model_name).submit(requests)
+        res = writer_client.action(
+            "assign_model_call_batch",
+            {"model_call_ids": [mc.id for mc in model_calls], "batch_id": batch_id},
+            wait=True,
+        )
+        if not res or not res.success:
+            raise RuntimeError(getattr(res, "error", "Failed to record batch id"))
+        submitted += len(model_calls)
+    return submitted
+
+
+def resume_waiting_jobs() -> int:
+    res = writer_client.action("resume_waiting_jobs", {}, wait=True)
+    if not res or not res.success:
+        raise RuntimeError(getattr(res, "error", "Failed to resume waiting jobs"))
+    return int((res.data or {}).get("resumed", 0))
+
+
+def run_batch_classification_cycle(
+    config: Config,
+    client_factory: Optional[ClientFactory] = None,
+    system_prompt: Optional[str] = None,
+) -> Dict[str, int]:
+    """Run one collect/submit/resume pass. Callers must provide an app context."""
+    factory = client_factory or _default_client_factory(config)
+    with db_guard("batch_classification", db.session, logger):
+        collected = collect_finished_batches(factory)
+        submitted = submit_queued_calls(
+            config,
+            factory,
+            apply_prompt_encoding(
+                system_prompt or _load_system_prompt(),
+                config.llm_compact_prompt_encoding,
+            ),
+        )
+        resumed = resume_waiting_jobs()
+
+    if collected or submitted or resumed:
+        logger.info(
+            "Batch classification cycle: collected=%s submitted=%s resumed=%s",
+            collected,
+            submitted,
+            resumed,
+        )
+    return {"collected": collected, "submitted": submitted, "resumed": resumed}
+
+
+def scheduled_batch_classification() -> None:
+    """Entry-point for APScheduler."""
+    if scheduler.app is None:
+        logger.warning("Batch classification skipped: scheduler has no app.")
+        return
+
+    try:
+        with scheduler.app.app_context():
+            run_batch_classification_cycle(runtime_config)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error("Scheduled batch classification failed: %s", exc, exc_info=True)
+        reset_session(db.session, logger, "scheduled_batch_classification", exc)
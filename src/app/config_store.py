@@ -3,7 +3,7 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple, cast, get_args
 
 from flask import current_app
 
@@ -20,10 +20,12 @@ from app.runtime_config import config as runtime_config
 from shared import defaults as DEFAULTS
 from shared.config import Config as PydanticConfig
 from shared.config import (
+    FasterWhisperConfig,
     GroqWhisperConfig,
     LocalWhisperConfig,
     RemoteWhisperConfig,
     TestWhisperConfig,
+    UploadFormat,
 )
 
 # pylint: disable=too-many-lines
@@ -43,6 +45,13 @@ def _parse_int(val: Any) -> Optional[int]:
         return None
 
 
+def _parse_float(val: Any) -> Optional[float]:
+    try:
+        return float(val) if val is not None else None
+    except Exception:
+        return None
+
+
 def _parse_bool(val: Any) -> Optional[bool]:
     if val is None:
         return None
@@ -275,7 +284,7 @@ def _apply_whisper_env_overrides_to_db(whisper: Any) -> bool:
     env_whisper_type = os.environ.get("WHISPER_TYPE")
     if env_whisper_type and isinstance(env_whisper_type, str):
         env_whisper_type_norm = env_whisper_type.strip().lower()
-        if env_whisper_type_norm in {"local", "remote", "groq"}:
+        if env_whisper_type_norm in {"local", "remote", "groq", "faster_whisper"}:
             changed = (
                 _set_if_default(
                     whisper,
@@ -361,7 +370,7 @@ def _apply_whisper_env_overrides_to_db(whisper: Any) -> bool:
             or changed
         )
 
-    elif whisper.whisper_type == "local":
+    elif whisper.whisper_type in ("local", "faster_whisper"):
         local_model_env = os.environ.get("WHISPER_LOCAL_MODEL")
         changed = (
             _set_if_default(
@@ -414,7 +423,7 @@ def read_combined() -> Dict[str, Any]:
     assert llm and whisper and processing and output and app_s
 
     whisper_payload: Dict[str, Any] = {"whisper_type": whisper.whisper_type}
-    if whisper.whisper_type == "local":
+    if whisper.whisper_type in ("local", "faster_whisper"):
         whisper_payload.update({"model": whisper.local_model})
     elif whisper.whisper_type == "remote":
         whisper_payload.update(
@@ -514,9 +523,11 @@ def _update_section_whisper(data: Dict[str, Any]) -> None:
         "remote",
         "groq",
         "test",
+        "faster_whisper",
     }:
         row.whisper_type = data["whisper_type"]
-    if row.whisper_type == "local":
+    # Both local engines take a model name stored in local_model
+    if row.whisper_type in ("local", "faster_whisper"):
         if "model" in data:
             row.local_model = data["model"]
     elif row.whisper_type == "remote":
@@ -689,12 +700,18 @@ def to_pydantic_config() -> PydanticConfig:
     data = read_combined()
     # Map whisper section to discriminated union config
     whisper_obj: Optional[
-        LocalWhisperConfig | RemoteWhisperConfig | TestWhisperConfig | GroqWhisperConfig
+        LocalWhisperConfig
+        | RemoteWhisperConfig
+        | TestWhisperConfig
+        | GroqWhisperConfig
+        | FasterWhisperConfig
     ] = None
     w = data["whisper"]
     wtype = w.get("whisper_type")
     if wtype == "local":
         whisper_obj = LocalWhisperConfig(model=w.get("model", "base.en"))
+    elif wtype == "faster_whisper":
+        whisper_obj = FasterWhisperConfig(model=w.get("model", "base.en"))
     elif wtype == "remote":
         whisper_obj = RemoteWhisperConfig(
             model=w.get("model", "whisper-1"),
@@ -812,6 +829,8 @@ def hydrate_runtime_config_inplace(db_config: Optional[PydanticConfig] = None) -
 
     _apply_top_level_env_overrides(cfg)
 
+    _apply_processing_env_overrides(cfg)
+
     _apply_whisper_env_overrides(cfg)
 
     _apply_llm_model_override(cfg)
@@ -846,11 +865,187 @@ def _apply_top_level_env_overrides(cfg: PydanticConfig) -> None:
     if env_openai_base_url:
         cfg.openai_base_url = env_openai_base_url
 
+    env_adaptive_max = _parse_int(os.environ.get("LLM_ADAPTIVE_MAX_CONCURRENT_CALLS"))
+    if env_adaptive_max is not None:
+        cfg.llm_adaptive_max_concurrent_calls = env_adaptive_max
+
+    env_share_token_budget = _parse_bool(os.environ.get("LLM_SHARE_TOKEN_BUDGET"))
+    if env_share_token_budget is not None:
+        cfg.llm_share_token_budget = env_share_token_budget
+
+    for env_name, attr in (
+        ("TRANSCRIPT_CACHE_MAX_ENTRIES", "transcript_cache_max_entries"),
+        ("TRANSCRIPT_CACHE_MAX_MB", "transcript_cache_max_mb"),
+    ):
+        env_cache_limit = _parse_int(os.environ.get(env_name))
+        if env_cache_limit is not None and env_cache_limit >= 0:
+            setattr(cfg, attr, env_cache_limit)
+
+    env_async_execution = _parse_bool(os.environ.get("LLM_ENABLE_ASYNC_EXECUTION"))
+    if env_async_execution is not None:
+        cfg.llm_enable_async_execution = env_async_execution
+
+    env_streaming = _parse_bool(os.environ.get("LLM_ENABLE_STREAMING"))
+    if env_streaming is not None:
+        cfg.llm_enable_streaming = env_streaming
+
+    env_compact_prompt = _parse_bool(os.environ.get("LLM_COMPACT_PROMPT_ENCODING"))
+    if env_compact_prompt is not None:
+        cfg.llm_compact_prompt_encoding = env_compact_prompt
+
+    env_cascade_model = os.environ.get("LLM_CASCADE_MODEL")
+    if env_cascade_model:
+        cfg.llm_cascade_model = env_cascade_model
+
+    for env_name, attr in (
+        ("LLM_CASCADE_ESCALATE_MIN_CONFIDENCE", "llm_cascade_escalate_min_confidence"),
+        ("LLM_CASCADE_ESCALATE_MAX_CONFIDENCE", "llm_cascade_escalate_max_confidence"),
+    ):
+        env_confidence = _parse_float(os.environ.get(env_name))
+        if env_confidence is not None and 0.0 <= env_confidence <= 1.0:
+            setattr(cfg, attr, env_confidence)
+
+    env_hedge_percentile = _parse_float(os.environ.get("LLM_HEDGE_AFTER_PERCENTILE"))
+    if env_hedge_percentile is not None and 0.0 < env_hedge_percentile <= 100.0:
+        cfg.llm_hedge_after_percentile = env_hedge_percentile
+
+    env_hedge_model = os.environ.get("LLM_HEDGE_MODEL")
+    if env_hedge_model:
+        cfg.llm_hedge_model = env_hedge_model
+
+    env_call_deadline = _parse_int(os.environ.get("LLM_CALL_DEADLINE_SECONDS"))
+    if env_call_deadline is not None and env_call_deadline > 0:
+        cfg.llm_call_deadline_seconds = env_call_deadline
+
+    env_scorer_path = os.environ.get("SEGMENT_SCORER_PATH")
+    if env_scorer_path:
+        cfg.segment_scorer_path = env_scorer_path
+
+    env_scorer_threshold = _parse_float(os.environ.get("SEGMENT_SCORER_GATE_THRESHOLD"))
+    if env_scorer_threshold is not None and 0.0 <= env_scorer_threshold <= 1.0:
+        cfg.segment_scorer_gate_threshold = env_scorer_threshold
+
+    env_batch_classification = _parse_bool(
+        os.environ.get("LLM_ENABLE_BATCH_CLASSIFICATION")
+    )
+    if env_batch_classification is not None:
+        cfg.llm_enable_batch_classification = env_batch_classification
+
+    env_batch_poll_interval = _parse_int(
+        os.environ.get("LLM_BATCH_POLL_INTERVAL_MINUTES")
+    )
+    if env_batch_poll_interval is not None and env_batch_poll_interval > 0:
+        cfg.llm_batch_poll_interval_minutes = env_batch_poll_interval
+
+
+def _apply_processing_env_overrides(cfg: PydanticConfig) -> None:
+    processing = cfg.processing
+
+    env_adaptive = _parse_bool(os.environ.get("PROCESSING_ADAPTIVE_CHUNK_SIZING"))
+    if env_adaptive is not None:
+        processing.adaptive_chunk_sizing = env_adaptive
+
+    env_stream = _parse_bool(os.environ.get("PROCESSING_STREAM_CLASSIFICATION"))
+    if env_stream is not None:
+        processing.stream_classification = env_stream
+
+    env_min_segments = _parse_int(
+        os.environ.get("PROCESSING_MIN_SEGMENTS_TO_INPUT_TO_PROMPT")
+    )
+    if env_min_segments is not None and env_min_segments > 0:
+        processing.min_segments_to_input_to_prompt = env_min_segments
+
+    env_max_segments = _parse_int(
+        os.environ.get("PROCESSING_MAX_SEGMENTS_TO_INPUT_TO_PROMPT")
+    )
+    if env_max_segments is not None and env_max_segments > 0:
+        processing.max_segments_to_input_to_prompt = env_max_segments
+
+    env_target_latency = _parse_int(
+        os.environ.get("PROCESSING_TARGET_CHUNK_LATENCY_SECONDS")
+    )
+    if env_target_latency is not None and env_target_latency > 0:
+        processing.target_chunk_latency_seconds = float(env_target_latency)
+
+
+def _env_max_parallel_chunks() -> Optional[int]:
+    value = _parse_int(os.environ.get("WHISPER_MAX_PARALLEL_CHUNKS"))
+    return value if value is not None and value > 0 else None
+
+
+def _env_audio_quotas() -> Dict[str, int]:
+    """Provider audio-seconds and request quotas set through the environment."""
+    quotas: Dict[str, int] = {}
+    for env_name, field in (
+        ("WHISPER_AUDIO_SECONDS_PER_HOUR", "audio_seconds_per_hour"),
+        ("WHISPER_REQUESTS_PER_MINUTE", "requests_per_minute"),
+    ):
+        value = _parse_int(os.environ.get(env_name))
+        if value is not None and value > 0:
+            quotas[field] = value
+    return quotas
+
+
+def _audio_quotas_for(cfg: PydanticConfig) -> Dict[str, Optional[int]]:
+    """Env overrides, else the current whisper config's quotas."""
+    quotas: Dict[str, Optional[int]] = {
+        field: getattr(cfg.whisper, field, None)
+        for field in ("audio_seconds_per_hour", "requests_per_minute")
+    }
+    quotas.update(_env_audio_quotas())
+    return quotas
+
+
+def _env_local_model_idle_timeout() -> Optional[int]:
+    value = _parse_int(os.environ.get("WHISPER_LOCAL_MODEL_IDLE_TIMEOUT_SEC"))
+    return value if value is not None and value >= 0 else None
+
+
+def _env_faster_whisper_options() -> Dict[str, Any]:
+    """faster-whisper engine options set through the environment."""
+    options: Dict[str, Any] = {}
+    compute_type = (os.environ.get("WHISPER_FASTER_COMPUTE_TYPE") or "").strip()
+    if compute_type:
+        options["compute_type"] = compute_type
+    cpu_threads = _parse_int(os.environ.get("WHISPER_FASTER_CPU_THREADS"))
+    if cpu_threads is not None and cpu_threads >= 0:
+        options["cpu_threads"] = cpu_threads
+    vad_filter = _parse_bool(os.environ.get("WHISPER_FASTER_VAD_FILTER"))
+    if vad_filter is not None:
+        options["vad_filter"] = vad_filter
+    return options
+
+
+def _env_upload_format() -> Optional[UploadFormat]:
+    value = (os.environ.get("WHISPER_UPLOAD_FORMAT") or "").strip().lower()
+    return cast(UploadFormat, value) if value in get_args(UploadFormat) else None
+
+
+def _upload_format_for(cfg: PydanticConfig) -> UploadFormat:
+    """Env override, else the current whisper config's upload format."""
+    existing = getattr(cfg.whisper, "upload_format", None)
+    if existing not in get_args(UploadFormat):
+        existing = DEFAULTS.WHISPER_UPLOAD_FORMAT
+    return _env_upload_format() or cast(UploadFormat, existing)
+
 
 def _apply_whisper_env_overrides(cfg: PydanticConfig) -> None:
     if cfg.whisper is None:
         return
     wtype = getattr(cfg.whisper, "whisper_type", None)
+    upload_format = _env_upload_format()
+    if upload_format is not None and isinstance(
+        cfg.whisper, (RemoteWhisperConfig, GroqWhisperConfig)
+    ):
+        cfg.whisper.upload_format = upload_format
+    max_parallel_chunks = _env_max_parallel_chunks()
+    if max_parallel_chunks is not None and isinstance(
+        cfg.whisper, (RemoteWhisperConfig, GroqWhisperConfig)
+    ):
+        cfg.whisper.max_parallel_chunks = max_parallel_chunks
+    if isinstance(cfg.whisper, (RemoteWhisperConfig, GroqWhisperConfig)):
+        for field, value in _env_audio_quotas().items():
+            setattr(cfg.whisper, field, value)
     if wtype == "remote":
         remote_key = os.environ.get("WHISPER_REMOTE_API_KEY") or os.environ.get(
             "OPENAI_API_KEY"
@@ -878,8 +1073,22 @@ def _apply_whisper_env_overrides(cfg: PydanticConfig) -> None:
                 cfg.whisper.model = groq_model
     elif wtype == "local":
         loc_model = os.environ.get("WHISPER_LOCAL_MODEL")
-        if isinstance(cfg.whisper, LocalWhisperConfig) and loc_model:
-            cfg.whisper.model = loc_model
+        idle_timeout = _env_local_model_idle_timeout()
+        if isinstance(cfg.whisper, LocalWhisperConfig):
+            if loc_model:
+                cfg.whisper.model = loc_model
+            if idle_timeout is not None:
+                cfg.whisper.model_idle_timeout_sec = idle_timeout
+    elif wtype == "faster_whisper":
+        loc_model = os.environ.get("WHISPER_LOCAL_MODEL")
+        idle_timeout = _env_local_model_idle_timeout()
+        if isinstance(cfg.whisper, FasterWhisperConfig):
+            if loc_model:
+                cfg.whisper.model = loc_model
+            if idle_timeout is not None:
+                cfg.whisper.model_idle_timeout_sec = idle_timeout
+            for option, value in _env_faster_whisper_options().items():
+                setattr(cfg.whisper, option, value)
 
 
 def _apply_llm_model_override(cfg: PydanticConfig) -> None:
@@ -912,7 +1121,54 @@ def _configure_local_whisper(cfg: PydanticConfig) -> None:
         if isinstance(loc_model_env, str) and loc_model_env
         else existing_model
     )
-    cfg.whisper = LocalWhisperConfig(model=loc_model)
+    env_idle_timeout = _env_local_model_idle_timeout()
+    idle_timeout: int = (
+        env_idle_timeout
+        if env_idle_timeout is not None
+        else int(
+            getattr(
+                cfg.whisper,
+                "model_idle_timeout_sec",
+                DEFAULTS.WHISPER_LOCAL_MODEL_IDLE_TIMEOUT_SEC,
+            )
+        )
+    )
+    cfg.whisper = LocalWhisperConfig(
+        model=loc_model, model_idle_timeout_sec=idle_timeout
+    )
+
+
+def _configure_faster_whisper(cfg: PydanticConfig) -> None:
+    """Configure faster-whisper (CTranslate2) local whisper type."""
+    try:
+        import faster_whisper as _  # type: ignore[import-not-found]  # noqa: F401
+    except ImportError as e:
+        error_msg = (
+            f"WHISPER_TYPE is set to 'faster_whisper' but faster-whisper is not available. "
+            f"Either install it with 'pip install faster-whisper' or set WHISPER_TYPE to 'local', 'remote' or 'groq'. "
+            f"Import error: {e}"
+        )
+        logger.error(error_msg)
+        raise RuntimeError(error_msg) from e
+
+    if isinstance(cfg.whisper, FasterWhisperConfig):
+        existing = cfg.whisper
+    elif isinstance(cfg.whisper, LocalWhisperConfig):
+        # Same model names as openai-whisper (base.en, small, large-v3, ...)
+        existing = FasterWhisperConfig(
+            model=cfg.whisper.model,
+            model_idle_timeout_sec=cfg.whisper.model_idle_timeout_sec,
+        )
+    else:
+        existing = FasterWhisperConfig()
+    updates: Dict[str, Any] = _env_faster_whisper_options()
+    loc_model_env = os.environ.get("WHISPER_LOCAL_MODEL")
+    if loc_model_env:
+        updates["model"] = loc_model_env
+    env_idle_timeout = _env_local_model_idle_timeout()
+    if env_idle_timeout is not None:
+        updates["model_idle_timeout_sec"] = env_idle_timeout
+    cfg.whisper = FasterWhisperConfig(**{**existing.model_dump(), **updates})
 
 
 def _configure_remote_whisper(cfg: PydanticConfig) -> None:
@@ -970,6 +1226,16 @@ def _configure_remote_whisper(cfg: PydanticConfig) -> None:
         )
     )
 
+    max_parallel_chunks: int = _env_max_parallel_chunks() or int(
+        getattr(
+            cfg.whisper,
+            "max_parallel_chunks",
+            DEFAULTS.WHISPER_REMOTE_MAX_PARALLEL_CHUNKS,
+        )
+    )
+    upload_format = _upload_format_for(cfg)
+    quotas = _audio_quotas_for(cfg)
+
     cfg.whisper = RemoteWhisperConfig(
         model=rem_model,
         api_key=rem_api_key,
@@ -977,6 +1243,10 @@ def _configure_remote_whisper(cfg: PydanticConfig) -> None:
         language=lang,
         timeout_sec=timeout_sec,
         chunksize_mb=chunksize_mb,
+        max_parallel_chunks=max_parallel_chunks,
+        upload_format=upload_format,
+        audio_seconds_per_hour=quotas["audio_seconds_per_hour"],
+        requests_per_minute=quotas["requests_per_minute"],
     )
 
 
@@ -1011,11 +1281,25 @@ def _configure_groq_whisper(cfg: PydanticConfig) -> None:
         os.environ.get("GROQ_MAX_RETRIES", str(getattr(cfg.whisper, "max_retries", 3)))
     )
 
+    max_parallel_chunks: int = _env_max_parallel_chunks() or int(
+        getattr(
+            cfg.whisper,
+            "max_parallel_chunks",
+            DEFAULTS.WHISPER_GROQ_MAX_PARALLEL_CHUNKS,
+        )
+    )
+    upload_format = _upload_format_for(cfg)
+    quotas = _audio_quotas_for(cfg)
+
     cfg.whisper = GroqWhisperConfig(
         api_key=groq_api_key,
         model=groq_model_val,
         language=groq_lang,
         max_retries=max_retries,
+        max_parallel_chunks=max_parallel_chunks,
+        upload_format=upload_format,
+        audio_seconds_per_hour=quotas["audio_seconds_per_hour"],
+        requests_per_minute=quotas["requests_per_minute"],
     )
 
 
@@ -1047,6 +1331,8 @@ def _apply_whisper_type_override(cfg: PydanticConfig) -> None:
         _configure_remote_whisper(cfg)
     elif wtype == "groq":
         _configure_groq_whisper(cfg)
+    elif wtype == "faster_whisper":
+        _configure_faster_whisper(cfg)
     elif wtype == "test":
         cfg.whisper = TestWhisperConfig()
 
@@ -1295,7 +1581,7 @@ def _apply_whisper_env_overrides_force(whisper: WhisperSettings) -> bool:
     env_whisper_type = os.environ.get("WHISPER_TYPE")
     if env_whisper_type:
         wtype = env_whisper_type.strip().lower()
-        if wtype in {"local", "remote", "groq"}:
+        if wtype in {"local", "remote", "groq", "faster_whisper"}:
             whisper.whisper_type = wtype
             changed = True
 
@@ -1313,7 +1599,7 @@ def _apply_whisper_env_overrides_force(whisper: WhisperSettings) -> bool:
         if _apply_whisper_groq_overrides(whisper):
             changed = True
 
-    elif whisper.whisper_type == "local":
+    elif whisper.whisper_type in ("local", "faster_whisper"):
         local_model_env = os.environ.get("WHISPER_LOCAL_MODEL")
         if local_model_env:
             whisper.local_model = local_model_env
@@ -10,7 +10,7 @@ from podcast_processor.processing_status_manager import ProcessingStatusManager
 class JobManager:
     """Manage the lifecycle guarantees for a single `ProcessingJob` record."""
 
-    ACTIVE_STATUSES = {"pending", "running"}
+    ACTIVE_STATUSES = {"pending", "running", "waiting"}
 
     def __init__(
         self,
@@ -218,6 +218,13 @@ class JobManager:
                 "job_id": job.id,
             }
 
+        if job.status == "waiting":
+            return {
+                "status": "waiting",
+                "message": "Waiting for batch classification results",
+                "job_id": job.id,
+            }
+
         self._status_manager.update_job_status(
             job,
             "pending",
@@ -14,6 +14,7 @@ from app.job_manager import JobManager as SingleJobManager
 from app.models import Feed, JobsManagerRun, Post, ProcessingJob
 from app.processor import get_processor
 from app.writer.client import writer_client
+from podcast_processor.ad_classifier import ClassificationDeferred
 from podcast_processor.podcast_processor import ProcessorException
 from podcast_processor.processing_status_manager import ProcessingStatusManager
 
@@ -269,7 +270,7 @@ class JobsManager:
             rows = (
                 _db.session.query(ProcessingJob, Post, priority_order)
                 .outerjoin(Post, ProcessingJob.post_guid == Post.guid)
-                .filter(ProcessingJob.status.in_(["pending", "running"]))
+                .filter(ProcessingJob.status.in_(["pending", "running", "waiting"]))
                 .order_by(priority_order.desc(), ProcessingJob.created_at.desc())
                 .limit(limit)
                 .all()
@@ -381,7 +382,7 @@ class JobsManager:
             # Find active jobs for this post in database
             active_jobs = (
                 ProcessingJob.query.filter_by(post_guid=post_guid)
-                .filter(ProcessingJob.status.in_(["pending", "running"]))
+                .filter(ProcessingJob.status.in_(["pending", "running", "waiting"]))
                 .all()
             )
 
@@ -636,6 +637,12 @@ class JobsManager:
                         get_processor().process(
                             worker_post, job_id=job_id, cancel_callback=_cancelled
                         )
+                    except ClassificationDeferred as deferred:
+                        logger.info(
+                            "Job %s is waiting on batch classification: %s",
+                            job_id,
+                            deferred,
+                        )
                     except ProcessorException as exc:
                         logger.info(
                             "Job %s finished with processor exception: %s", job_id, exc
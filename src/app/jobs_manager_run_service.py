@@ -112,7 +112,9 @@ def recalculate_run_counts(session: Any) -> Optional[JobsManagerRun]:
     )
 
     now = datetime.utcnow()
-    queued = counts.get("pending", 0) + counts.get("queued", 0)
+    queued = (
+        counts.get("pending", 0) + counts.get("queued", 0) + counts.get("waiting", 0)
+    )
     running = counts.get("running", 0)
     completed = counts.get("completed", 0)
     failed = counts.get("failed", 0) + counts.get("cancelled", 0)
@@ -209,7 +211,9 @@ def build_run_status_snapshot(session: Any) -> Optional[Dict[str, object]]:
         query = query.filter(ProcessingJob.created_at >= cutoff)
     counts = dict(query.group_by(ProcessingJob.status).all())
 
-    queued = counts.get("pending", 0) + counts.get("queued", 0)
+    queued = (
+        counts.get("pending", 0) + counts.get("queued", 0) + counts.get("waiting", 0)
+    )
     running = counts.get("running", 0)
     completed = counts.get("completed", 0)
     failed = counts.get("failed", 0) + counts.get("cancelled", 0)
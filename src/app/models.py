@@ -93,6 +93,10 @@ class Post(db.Model):  # type: ignore[name-defined, misc]
     refined_ad_boundaries = db.Column(db.JSON, nullable=True)
     refined_ad_boundaries_updated_at = db.Column(db.DateTime, nullable=True)
 
+    # Chunk sizes, token usage and latency of the last classification run.
+    # Adaptive chunk sizing replays it on re-runs to keep chunk boundaries stable.
+    classification_chunk_plan = db.Column(db.JSON, nullable=True)
+
     segments = db.relationship(
         "TranscriptSegment",
         backref="post",
@@ -196,6 +200,8 @@ class ModelCall(db.Model):  # type: ignore[name-defined, misc]
     status = db.Column(db.String, nullable=False, default="pending")
     error_message = db.Column(db.Text, nullable=True)
     retry_attempts = db.Column(db.Integer, nullable=False, default=0)
+    # Provider batch id while the call is being answered through a batch API.
+    batch_id = db.Column(db.String, nullable=True, index=True)
 
     identifications = db.relationship(
         "Identification", backref="model_call", lazy="dynamic"
@@ -32,7 +32,7 @@ def _build_cleanup_query(
     active_jobs_exists = (
         db.session.query(ProcessingJob.id)
         .filter(ProcessingJob.post_guid == Post.guid)
-        .filter(ProcessingJob.status.in_(["pending", "running"]))
+        .filter(ProcessingJob.status.in_(["pending", "running", "waiting"]))
         .exists()
     )
 
@@ -142,7 +142,7 @@ def _hydrate_whisper_config(data: Dict[str, Any]) -> None:
 def _overlay_whisper_dict(target: Dict[str, Any], source: Dict[str, Any]) -> None:
     wtype = source.get("whisper_type")
     target["whisper_type"] = wtype or target.get("whisper_type")
-    if wtype == "local":
+    if wtype in ("local", "faster_whisper"):
         target["model"] = source.get("model", target.get("model"))
     elif wtype == "remote":
         _overlay_remote_whisper_fields(target, source)
@@ -153,7 +153,7 @@ def _overlay_whisper_dict(target: Dict[str, Any], source: Dict[str, Any]) -> Non
 def _overlay_whisper_object(target: Dict[str, Any], source: Any) -> None:
     wtype = getattr(source, "whisper_type")
     target["whisper_type"] = wtype
-    if wtype == "local":
+    if wtype in ("local", "faster_whisper"):
         target["model"] = getattr(source, "model", target.get("model"))
     elif wtype == "remote":
         _overlay_remote_whisper_fields(target, source)
@@ -369,7 +369,7 @@ def _build_env_override_metadata(data: Dict[str, Any]) -> Dict[str, Any]:
         _register_remote_whisper_overrides(overrides)
     elif wtype == "groq":
         _register_groq_whisper_overrides(overrides)
-    elif wtype == "local":
+    elif wtype in ("local", "faster_whisper"):
         _register_local_whisper_overrides(overrides)
 
     return overrides
@@ -572,6 +572,32 @@ def _test_local_whisper(whisper_cfg: Dict[str, Any]) -> flask.Response:
     return _make_success_response(f"Local whisper OK (model {model_name})")
 
 
+def _test_faster_whisper(whisper_cfg: Dict[str, Any]) -> flask.Response:
+    """Test faster-whisper configuration."""
+    model_name = str(_get_whisper_config_value(whisper_cfg, "model", "base.en"))
+    try:
+        from faster_whisper import (  # type: ignore[import-not-found]
+            available_models,
+        )
+    except ImportError as e:
+        return _make_error_response(f"faster-whisper not installed: {e}")
+
+    available = list(available_models())
+    # Paths and Hugging Face repo ids of converted models are accepted too
+    if model_name not in available and "/" not in model_name:
+        return flask.make_response(
+            jsonify(
+                {
+                    "ok": False,
+                    "error": f"Model '{model_name}' not available. Install or adjust model.",
+                    "available_models": available,
+                }
+            ),
+            400,
+        )
+    return _make_success_response(f"faster-whisper OK (model {model_name})")
+
+
 def _test_remote_whisper(whisper_cfg: Dict[str, Any]) -> flask.Response:
     """Test remote whisper configuration."""
     api_key_any = _get_whisper_config_value(whisper_cfg, "api_key")
@@ -629,6 +655,8 @@ def api_test_whisper() -> flask.Response:
     try:
         if wtype == "local":
             return _test_local_whisper(whisper_cfg)
+        if wtype == "faster_whisper":
+            return _test_faster_whisper(whisper_cfg)
         if wtype == "remote":
             return _test_remote_whisper(whisper_cfg)
         if wtype == "groq":
@@ -643,8 +671,8 @@ def api_test_whisper() -> flask.Response:
 def api_get_whisper_capabilities() -> flask.Response:
     """Report Whisper capabilities for the current runtime.
 
-    Currently returns a boolean indicating whether local Whisper is importable.
-    This enables the frontend to hide the 'local' option when unavailable.
+    Reports whether local Whisper and faster-whisper are importable, so the
+    frontend can hide the 'local' and 'faster_whisper' options when unavailable.
     """
     _, error_response = require_admin()
     if error_response:
@@ -664,7 +692,19 @@ def api_get_whisper_capabilities() -> flask.Response:
     except Exception:
         local_available = False
 
-    return flask.jsonify({"local_available": local_available})
+    try:  # pragma: no cover - simple import feature check
+        import faster_whisper  # noqa: F401
+
+        faster_whisper_available = True
+    except Exception:
+        faster_whisper_available = False
+
+    return flask.jsonify(
+        {
+            "local_available": local_available,
+            "faster_whisper_available": faster_whisper_available,
+        }
+    )
 
 
 @config_bp.route("/api/config/api_configured_check", methods=["GET"])
@@ -0,0 +1,175 @@
+"""Train the local segment scorer from stored classification results.
+
+Labels come from the database: a segment is an ad when it carries an "ad"
+Identification at or above the confidence threshold, and a non-ad when a
+successful ModelCall covered it without any ad identification. Segments with
+only low-confidence ad identifications are left out as ambiguous.
+
+Run through scripts/train_segment_scorer.py.
+"""
+
+from __future__ import annotations
+
+import logging
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+
+from app.extensions import db
+from app.models import Identification, ModelCall, TranscriptSegment
+from podcast_processor.segment_scorer import (
+    evaluate,
+    featurize,
+    relative_positions,
+    train_segment_scorer,
+)
+from shared.processing_paths import get_instance_dir
+
+logger = logging.getLogger("global_logger")
+
+
+def default_segment_scorer_path() -> Path:
+    return get_instance_dir() / "models" / "segment_scorer.npz"
+
+
+@dataclass
+class TrainingSet:
+    texts: List[str] = field(default_factory=list)
+    positions: List[float] = field(default_factory=list)
+    labels: List[int] = field(default_factory=list)
+    post_ids: List[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def split(self, holdout_fraction: float) -> Tuple["TrainingSet", "TrainingSet"]:
+        """Split by post (stable across runs) so holdout episodes are unseen."""
+        train, holdout = TrainingSet(), TrainingSet()
+        for text, position, label, post_id in zip(
+            self.texts, self.positions, self.labels, self.post_ids
+        ):
+            bucket = zlib.crc32(str(post_id).encode()) % 100
+            target = holdout if bucket < holdout_fraction * 100 else train
+            target.texts.append(text)
+            target.positions.append(position)
+            target.labels.append(label)
+            target.post_ids.append(post_id)
+        return train, holdout
+
+
+def _covered_ranges() -> Dict[int, List[Tuple[int, int]]]:
+    rows = (
+        db.session.query(
+            ModelCall.post_id,
+            ModelCall.first_segment_sequence_num,
+            ModelCall.last_segment_sequence_num,
+        )
+        .filter(ModelCall.status == "success")
+        .all()
+    )
+    ranges: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    for post_id, first_seq, last_seq in rows:
+        ranges[post_id].append((first_seq, last_seq))
+    return ranges
+
+
+def collect_training_examples(min_confidence: float) -> TrainingSet:
+    """Labeled segments from every post with at least one successful ModelCall."""
+    ranges = _covered_ranges()
+    if not ranges:
+        return TrainingSet()
+
+    ad_confidence = dict(
+        db.session.query(
+            Identification.transcript_segment_id, func.max(Identification.confidence)
+        )
+        .filter(Identification.label == "ad")
+        .group_by(Identification.transcript_segment_id)
+        .all()
+    )
+
+    examples = TrainingSet()
+    segments = (
+        db.session.query(
+            TranscriptSegment.id,
+            TranscriptSegment.post_id,
+            TranscriptSegment.sequence_num,
+            TranscriptSegment.text,
+        )
+        .filter(TranscriptSegment.post_id.in_(list(ranges)))
+        .order_by(TranscriptSegment.post_id, TranscriptSegment.sequence_num)
+        .all()
+    )
+    by_post: Dict[int, List[Any]] = defaultdict(list)
+    for row in segments:
+        by_post[row.post_id].append(row)
+
+    for post_id, rows in by_post.items():
+        positions = relative_positions([row.sequence_num for row in rows])
+        post_ranges = ranges[post_id]
+        for row, position in zip(rows, positions):
+            confidence = ad_confidence.get(row.id)
+            if confidence is not None:
+                if (confidence or 0.0) < min_confidence:
+                    continue
+                label = 1
+            elif any(first <= row.sequence_num <= last for first, last in post_ranges):
+                label = 0
+            else:
+                continue
+            examples.texts.append(row.text or "")
+            examples.positions.append(position)
+            examples.labels.append(label)
+            examples.post_ids.append(post_id)
+    return examples
+
+
+def train_from_database(
+    *,
+    min_confidence: float,
+    output_path: Optional[Path] = None,
+    holdout_fraction: float = 0.2,
+    epochs: int = 150,
+) -> Dict[str, Any]:
+    """Train, evaluate on held-out posts, then refit on everything and save.
+
+    Returns the metadata stored with the model.
+    """
+    examples = collect_training_examples(min_confidence)
+    if not examples or len(set(examples.labels)) < 2:
+        raise ValueError(
+            "Not enough labeled segments: need both ad and non-ad examples "
+            "from successfully classified posts"
+        )
+
+    train, holdout = examples.split(holdout_fraction)
+    holdout_metrics: Optional[Dict[str, float]] = None
+    if holdout and len(set(train.labels)) == 2:
+        scorer = train_segment_scorer(
+            featurize(train.texts, train.positions), train.labels, epochs=epochs
+        )
+        holdout_metrics = evaluate(
+            scorer, featurize(holdout.texts, holdout.positions), holdout.labels
+        )
+        logger.info(f"Segment scorer holdout metrics: {holdout_metrics}")
+
+    scorer = train_segment_scorer(
+        featurize(examples.texts, examples.positions), examples.labels, epochs=epochs
+    )
+    scorer.metadata = {
+        "trained_at": datetime.utcnow().isoformat(),
+        "segments": len(examples),
+        "ad_segments": sum(examples.labels),
+        "posts": len(set(examples.post_ids)),
+        "min_confidence": min_confidence,
+        "holdout": holdout_metrics,
+    }
+    path = output_path or default_segment_scorer_path()
+    scorer.save(path)
+    logger.info(f"Saved segment scorer to {path}: {scorer.metadata}")
+    return scorer.metadata
@@ -40,7 +40,13 @@ from .jobs import create_job_action as create_job_action
 from .jobs import dequeue_job_action as dequeue_job_action
 from .jobs import mark_cancelled_action as mark_cancelled_action
 from .jobs import reassign_pending_jobs_action as reassign_pending_jobs_action
+from .jobs import resume_waiting_jobs_action as resume_waiting_jobs_action
 from .jobs import update_job_status_action as update_job_status_action
+from .processor import append_transcription_action as append_transcription_action
+from .processor import (
+    apply_model_call_batch_results_action as apply_model_call_batch_results_action,
+)
+from .processor import assign_model_call_batch_action as assign_model_call_batch_action
 from .processor import insert_identifications_action as insert_identifications_action
 from .processor import mark_model_call_failed_action as mark_model_call_failed_action
 from .processor import replace_identifications_action as replace_identifications_action
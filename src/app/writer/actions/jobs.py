@@ -3,7 +3,7 @@ from typing import Any, Dict, Optional
 
 from app.extensions import db
 from app.jobs_manager_run_service import recalculate_run_counts
-from app.models import ProcessingJob
+from app.models import ModelCall, Post, ProcessingJob
 
 
 def dequeue_job_action(params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -82,7 +82,7 @@ def cancel_existing_jobs_action(params: Dict[str, Any]) -> int:
     existing_jobs = (
         ProcessingJob.query.filter_by(post_guid=post_guid)
         .filter(
-            ProcessingJob.status.in_(["pending", "running"]),
+            ProcessingJob.status.in_(["pending", "running", "waiting"]),
             ProcessingJob.id != current_job_id,
         )
         .all()
@@ -172,3 +172,28 @@ def reassign_pending_jobs_action(params: Dict[str, Any]) -> int:
         recalculate_run_counts(db.session)
 
     return reassigned
+
+
+def resume_waiting_jobs_action(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Re-queue jobs parked for batch classification once their calls settled."""
+    outstanding = (
+        db.session.query(ModelCall.id)
+        .join(Post, Post.id == ModelCall.post_id)
+        .filter(
+            Post.guid == ProcessingJob.post_guid,
+            ModelCall.status.in_(["batch_queued", "batch_submitted"]),
+        )
+        .exists()
+    )
+    ready_jobs = ProcessingJob.query.filter(
+        ProcessingJob.status == "waiting", ~outstanding
+    ).all()
+
+    for job in ready_jobs:
+        job.status = "pending"
+        job.step_name = "Batch classification ready; queued for processing"
+
+    if ready_jobs:
+        recalculate_run_counts(db.session)
+
+    return {"resumed": len(ready_jobs)}
@@ -210,6 +210,46 @@ def replace_transcription_action(params: Dict[str, Any]) -> Dict[str, Any]:
     return {"post_id": post_id_i, "segment_count": len(payload)}
 
 
+def append_transcription_action(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Add segments to a transcription started by replace_transcription.
+
+    With model_call_id, the transcription is complete: the ModelCall is
+    marked successful and covers every stored segment of the post.
+    """
+    post_id = params.get("post_id")
+    segments = params.get("segments")
+    model_call_id = params.get("model_call_id")
+
+    if post_id is None:
+        raise ValueError("post_id is required")
+    if not isinstance(segments, list):
+        raise ValueError("segments must be a list")
+
+    post_id_i = int(post_id)
+    payload = _normalize_segments_payload(
+        {**seg, "post_id": post_id_i} for seg in segments if isinstance(seg, dict)
+    )
+    if payload:
+        db.session.execute(sqlite_insert(TranscriptSegment).values(payload))
+
+    if model_call_id is not None:
+        segment_count = (
+            db.session.query(TranscriptSegment)
+            .filter(TranscriptSegment.post_id == post_id_i)
+            .count()
+        )
+        mc = db.session.get(ModelCall, int(model_call_id))
+        if mc is not None:
+            mc.first_segment_sequence_num = 0
+            mc.last_segment_sequence_num = segment_count - 1
+            mc.response = f"{segment_count} segments transcribed."
+            mc.status = "success"
+            mc.error_message = None
+
+    db.session.flush()
+    return {"post_id": post_id_i, "segment_count": len(payload)}
+
+
 def mark_model_call_failed_action(params: Dict[str, Any]) -> Dict[str, Any]:
     model_call_id = params.get("model_call_id")
     error_message = params.get("error_message")
@@ -273,3 +313,64 @@ def replace_identifications_action(params: Dict[str, Any]) -> Dict[str, Any]:
 
     db.session.flush()
     return {"deleted": len(delete_ids), "inserted": int(inserted)}
+
+
+def assign_model_call_batch_action(params: Dict[str, Any]) -> Dict[str, Any]:
+    model_call_ids = params.get("model_call_ids")
+    batch_id = params.get("batch_id")
+
+    if not isinstance(model_call_ids, list) or not batch_id:
+        raise ValueError("model_call_ids (list) and batch_id are required")
+
+    updated = (
+        db.session.query(ModelCall)
+        .filter(
+            ModelCall.id.in_([int(i) for i in model_call_ids]),
+            ModelCall.status == "batch_queued",
+        )
+        .update(
+            {"status": "batch_submitted", "batch_id": str(batch_id)},
+            synchronize_session=False,
+        )
+    )
+    db.session.flush()
+    return {"updated": int(updated)}
+
+
+def apply_model_call_batch_results_action(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Store batch outcomes; calls missing from `results` are marked failed."""
+    batch_id = params.get("batch_id")
+    results = params.get("results") or []
+    missing_error = params.get("missing_error") or "No result returned by batch"
+
+    if not batch_id or not isinstance(results, list):
+        raise ValueError("batch_id and results (list) are required")
+
+    by_id: Dict[int, Dict[str, Any]] = {
+        int(r["model_call_id"]): r for r in results if isinstance(r, dict)
+    }
+    model_calls = (
+        db.session.query(ModelCall)
+        .filter(
+            ModelCall.batch_id == str(batch_id),
+            ModelCall.status == "batch_submitted",
+        )
+        .all()
+    )
+
+    succeeded = 0
+    for mc in model_calls:
+        outcome = by_id.get(int(mc.id)) or {"error": missing_error}
+        mc.retry_attempts = (mc.retry_attempts or 0) + 1
+        if outcome.get("response") is not None:
+            mc.status = "success"
+            mc.response = str(outcome["response"])
+            mc.error_message = None
+            succeeded += 1
+        else:
+            # Plain "failed" lets the resumed job retry the chunk inline.
+            mc.status = "failed"
+            mc.error_message = str(outcome.get("error"))
+
+    db.session.flush()
+    return {"succeeded": succeeded, "failed": len(model_calls) - succeeded}
@@ -125,6 +125,9 @@ class CommandExecutor:
         self.register_action(
             "replace_transcription", writer_actions.replace_transcription_action
         )
+        self.register_action(
+            "append_transcription", writer_actions.append_transcription_action
+        )
         self.register_action(
             "mark_model_call_failed", writer_actions.mark_model_call_failed_action
         )
@@ -134,6 +137,16 @@ class CommandExecutor:
         self.register_action(
             "replace_identifications", writer_actions.replace_identifications_action
         )
+        self.register_action(
+            "assign_model_call_batch", writer_actions.assign_model_call_batch_action
+        )
+        self.register_action(
+            "apply_model_call_batch_results",
+            writer_actions.apply_model_call_batch_results_action,
+        )
+        self.register_action(
+            "resume_waiting_jobs", writer_actions.resume_waiting_jobs_action
+        )
         self.register_action(
             "update_user_last_active", writer_actions.update_user_last_active_action
         )
@@ -0,0 +1,30 @@
+"""model call batch id
+
+Revision ID: a3c9e1f27b40
+Revises: 2e25a15d11de
+Create Date: 2026-10-18 09:12:05.114532
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a3c9e1f27b40"
+down_revision = "2e25a15d11de"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("model_call", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("batch_id", sa.String(), nullable=True))
+        batch_op.create_index(
+            batch_op.f("ix_model_call_batch_id"), ["batch_id"], unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("model_call", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_model_call_batch_id"))
+        batch_op.drop_column("batch_id")
@@ -0,0 +1,28 @@
+"""post classification chunk plan
+
+Revision ID: c41d7e9a2f63
+Revises: a3c9e1f27b40
+Create Date: 2026-10-18 14:37:51.220914
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c41d7e9a2f63"
+down_revision = "a3c9e1f27b40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("post", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("classification_chunk_plan", sa.JSON(), nullable=True)
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("post", schema=None) as batch_op:
+        batch_op.drop_column("classification_chunk_plan")
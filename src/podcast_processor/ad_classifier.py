@@ -1,12 +1,14 @@
 import logging
 import math
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # pylint: disable=too-many-lines
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import litellm
+from flask import current_app, has_app_context
 from jinja2 import Template
 from litellm.exceptions import InternalServerError
 from litellm.types.utils import Choices
@@ -16,27 +18,68 @@ from sqlalchemy import and_
 from app.extensions import db
 from app.models import Identification, ModelCall, Post, TranscriptSegment
 from app.writer.client import writer_client
+from podcast_processor.async_llm_executor import (
+    AsyncLLMExecutor,
+    get_executor_for_config,
+)
 from podcast_processor.boundary_refiner import BoundaryRefiner
+from podcast_processor.chunk_sizer import ChunkRecord, ChunkSizer
 from podcast_processor.cue_detector import CueDetector
+from podcast_processor.hedged_completion import (
+    MIN_HEDGE_DELAY_SECONDS,
+    LLMDeadlineExceeded,
+    get_latency_tracker,
+    hedged_request,
+)
+from podcast_processor.identification_index import IdentificationIndex
 from podcast_processor.llm_concurrency_limiter import (
+    MAX_PROVIDER_PAUSE_SECONDS,
     ConcurrencyContext,
     LLMConcurrencyLimiter,
+    adaptive_max_concurrent_calls,
     get_concurrency_limiter,
 )
+from podcast_processor.llm_error_classifier import LLMErrorClassifier
+from podcast_processor.llm_model_call_utils import (
+    JsonObjectWatcher,
+    classification_completion_args,
+    stream_litellm_completion,
+)
+from podcast_processor.model_call_status import ModelCallStatusBuffer
 from podcast_processor.model_output import (
+    AdSegmentPrediction,
     AdSegmentPredictionList,
+    StreamingPredictionParser,
     clean_and_parse_model_output,
 )
-from podcast_processor.prompt import transcript_excerpt_for_prompt
+from podcast_processor.prompt import (
+    apply_prompt_encoding,
+    compact_segment_ids,
+    compact_transcript_excerpt_for_prompt,
+    transcript_excerpt_for_prompt,
+)
+from podcast_processor.segment_scorer import SegmentScorer, load_segment_scorer
+from podcast_processor.segment_timeline import (
+    HAS_NUMPY,
+    SegmentTimeline,
+    group_adjacent,
+)
 from podcast_processor.token_rate_limiter import (
     TokenRateLimiter,
     configure_rate_limiter_for_model,
+    default_token_usage_db_path,
+    get_rate_limiter,
 )
 from podcast_processor.transcribe import Segment
 from podcast_processor.word_boundary_refiner import WordBoundaryRefiner
 from shared.config import Config, TestWhisperConfig
 from shared.llm_utils import model_uses_max_completion_tokens
 
+try:
+    import numpy as np
+except ImportError:  # lite image; see podcast_processor.segment_timeline
+    np = None  # type: ignore[assignment]
+
 
 class ClassifyParams:
     def __init__(
@@ -46,18 +89,43 @@ class ClassifyParams:
         post: Post,
         num_segments_per_prompt: int,
         max_overlap_segments: int,
+        chunk_sizer: Optional[ChunkSizer] = None,
     ):
         self.system_prompt = system_prompt
         self.user_prompt_template = user_prompt_template
         self.post = post
         self.num_segments_per_prompt = num_segments_per_prompt
         self.max_overlap_segments = max_overlap_segments
+        self.chunk_sizer = chunk_sizer
+
+
+class ClassifyProgress:
+    """How far one classification run has got through the transcript."""
+
+    def __init__(self, classify_params: ClassifyParams):
+        self.classify_params = classify_params
+        self.current_index = 0
+        self.next_overlap_segments: List[TranscriptSegment] = []
+        self.iteration_count = 0
+        self.failed = False
 
 
 class ClassifyException(Exception):
     """Custom exception for classification errors."""
 
 
+class ClassificationDeferred(Exception):
+    """Raised when chunks were queued for the batch API instead of called inline."""
+
+    def __init__(self, post_id: int, model_call_ids: List[int]):
+        super().__init__(
+            f"{len(model_call_ids)} classification chunks for post {post_id} "
+            "are waiting on the batch API"
+        )
+        self.post_id = post_id
+        self.model_call_ids = model_call_ids
+
+
 class AdClassifier:
     """Handles the classification of ad segments in podcast transcripts."""
 
@@ -68,6 +136,7 @@ class AdClassifier:
         model_call_query: Optional[Any] = None,
         identification_query: Optional[Any] = None,
         db_session: Optional[Any] = None,
+        batch_classification: Optional[bool] = None,
     ):
         self.config = config
         self.logger = logger or logging.getLogger("global_logger")
@@ -76,41 +145,51 @@ class AdClassifier:
         self.db_session = db_session or db.session
 
         # Initialize rate limiter for the configured model
-        self.rate_limiter: Optional[TokenRateLimiter]
+        self.rate_limiter: Optional[TokenRateLimiter] = None
         if self.config.llm_enable_token_rate_limiting:
-            tokens_per_minute = self.config.llm_max_input_tokens_per_minute
-            if tokens_per_minute is None:
-                # Use model-specific defaults
-                self.rate_limiter = configure_rate_limiter_for_model(
-                    self.config.llm_model
-                )
-            else:
-                # Use custom limit
-                from podcast_processor.token_rate_limiter import get_rate_limiter
-
-                self.rate_limiter = get_rate_limiter(tokens_per_minute)
-                self.logger.info(
-                    f"Using custom token rate limit: {tokens_per_minute}/min"
-                )
+            self.rate_limiter = self._create_rate_limiter(self.config.llm_model)
         else:
-            self.rate_limiter = None
             self.logger.info("Token rate limiting disabled")
 
         # Initialize concurrency limiter for LLM API calls
         self.concurrency_limiter: Optional[LLMConcurrencyLimiter]
         max_concurrent = getattr(self.config, "llm_max_concurrent_calls", 3)
         if max_concurrent > 0:
-            self.concurrency_limiter = get_concurrency_limiter(max_concurrent)
+            adaptive_max = adaptive_max_concurrent_calls(self.config)
+            self.concurrency_limiter = get_concurrency_limiter(
+                max_concurrent, adaptive_max
+            )
             self.logger.info(
                 f"LLM concurrency limiting enabled: max {max_concurrent} concurrent calls"
+                f" (adaptive up to {adaptive_max})"
             )
         else:
             self.concurrency_limiter = None
             self.logger.info("LLM concurrency limiting disabled")
 
+        # Optional asyncio execution core; it applies concurrency and token
+        # rate limits itself, on its event-loop thread.
+        self.async_executor: Optional[AsyncLLMExecutor] = get_executor_for_config(
+            self.config
+        )
+        if self.async_executor:
+            self.logger.info("LLM calls routed through async executor")
+        elif self.config.llm_hedge_after_percentile is not None:
+            self.logger.warning(
+                "Hedged requests need LLM_ENABLE_ASYNC_EXECUTION; hedging disabled"
+            )
+
         # Initialize cue detector for neighbor expansion
         self.cue_detector = CueDetector()
 
+        # Optional local scorer that lets clearly ad-free chunks skip the LLM
+        self.segment_scorer: Optional[SegmentScorer] = None
+        if config.segment_scorer_gate_threshold is not None:
+            self.segment_scorer = load_segment_scorer(
+                config.segment_scorer_path, self.logger
+            )
+        self._segment_scores: Dict[int, float] = {}
+
         # Initialize boundary refiner (conditionally based on config)
         self.boundary_refiner: Optional[BoundaryRefiner] = None
         if config.enable_boundary_refinement:
@@ -123,6 +202,50 @@ class AdClassifier:
         else:
             self.logger.info("Boundary refinement disabled via config")
 
+        # Queue unanswered chunks for the batch API instead of calling inline
+        self.batch_classification = (
+            config.llm_enable_batch_classification
+            if batch_classification is None
+            else batch_classification
+        )
+        # ModelCall ids handed to the batch API during the current classify() run
+        self._deferred_model_call_ids: List[int] = []
+        # ModelCalls whose identifications were recorded while streaming
+        self._streamed_model_call_ids: Set[int] = set()
+        # Wall time of the LLM call made for the last chunk; None if it was reused
+        self._last_llm_latency: Optional[float] = None
+        # Identifications of the post being classified; None outside classify()
+        self._identification_index: Optional[IdentificationIndex] = None
+
+    def _create_rate_limiter(self, model: str) -> TokenRateLimiter:
+        """Limiter for the budget of `model` with the configured API key."""
+        shared_store_path = (
+            default_token_usage_db_path()
+            if self.config.llm_share_token_budget
+            else None
+        )
+        tokens_per_minute = self.config.llm_max_input_tokens_per_minute
+        if tokens_per_minute is None:
+            # Use model-specific defaults
+            return configure_rate_limiter_for_model(
+                model,
+                api_key=self.config.llm_api_key,
+                shared_store_path=shared_store_path,
+            )
+        self.logger.info(f"Using custom token rate limit: {tokens_per_minute}/min")
+        return get_rate_limiter(
+            tokens_per_minute,
+            model=model,
+            api_key=self.config.llm_api_key,
+            shared_store_path=shared_store_path,
+        )
+
+    def _rate_limiter_for(self, model: str) -> Optional[TokenRateLimiter]:
+        """Each model (e.g. the cascade's screening model) has its own budget."""
+        if self.rate_limiter is None or model == self.config.llm_model:
+            return self.rate_limiter
+        return self._create_rate_limiter(model)
+
     def classify(
         self,
         *,
@@ -139,6 +262,10 @@ class AdClassifier:
             system_prompt: System prompt for the LLM
             user_prompt_template: User prompt template for the LLM
             post: Post containing the podcast to classify
+
+        Raises:
+            ClassificationDeferred: batch mode queued chunks that have no
+                response yet; classify() must be re-run once they are answered.
         """
         self.logger.info(
             f"Starting ad classification for post {post.id} with {len(transcript_segments)} segments."
@@ -150,75 +277,235 @@ class AdClassifier:
             )
             return
 
-        classify_params = ClassifyParams(
+        progress = self._start_classification(
+            post=post,
             system_prompt=system_prompt,
             user_prompt_template=user_prompt_template,
-            post=post,
-            num_segments_per_prompt=self.config.processing.num_segments_to_input_to_prompt,
-            max_overlap_segments=self.config.processing.max_overlap_segments,
+            transcript_segments=transcript_segments,
+        )
+        try:
+            self._classify_available(progress, transcript_segments, final=True)
+            self._finish_classification(progress, transcript_segments)
+        except ClassifyException as e:
+            self.logger.error(f"Classification failed for post {post.id}: {e}")
+            return
+        finally:
+            self._identification_index = None
+
+    def can_classify_stream(self, post: Post) -> bool:
+        """Whether chunks can be classified before the transcript is complete.
+
+        Batch mode, the segment scorer (positions are relative to the whole
+        episode) and replaying a stored adaptive chunk plan all need every
+        segment. Static plans are stored too but never replayed.
+        """
+        plan = post.classification_chunk_plan or {}
+        replays_plan = (
+            self.config.processing.adaptive_chunk_sizing
+            and plan.get("mode") == "adaptive"
+        )
+        return (
+            not self._batch_mode_enabled()
+            and self.segment_scorer is None
+            and not replays_plan
         )
 
-        total_segments = len(transcript_segments)
+    def classify_stream(
+        self,
+        *,
+        segment_batches: Iterable[List[TranscriptSegment]],
+        system_prompt: str,
+        user_prompt_template: Template,
+        post: Post,
+    ) -> List[TranscriptSegment]:
+        """Classify segments as transcription produces them.
 
+        A chunk is sent once more than a full chunk of segments is waiting, so
+        it never contains the last segment seen so far; the tail, neighbor
+        expansion and boundary refinement run once `segment_batches` is
+        exhausted. Every batch is consumed even if classification fails.
+        Returns all transcript segments.
+        """
+        transcript_segments: List[TranscriptSegment] = []
+        progress: Optional[ClassifyProgress] = None
         try:
-            current_index = 0
-            next_overlap_segments: List[TranscriptSegment] = []
-            max_iterations = (
-                total_segments + 10
-            )  # Safety limit to prevent infinite loops
-            iteration_count = 0
-            while current_index < total_segments and iteration_count < max_iterations:
-                consumed_segments, next_overlap_segments = self._step(
-                    classify_params,
-                    next_overlap_segments,
-                    current_index,
-                    transcript_segments,
-                )
-                current_index += consumed_segments
-                iteration_count += 1
-                if consumed_segments == 0:
-                    self.logger.error(
-                        f"No progress made in iteration {iteration_count} for post {post.id}. "
-                        "Breaking to avoid infinite loop."
+            for batch in segment_batches:
+                transcript_segments.extend(batch)
+                if not transcript_segments:
+                    continue
+                if progress is None:
+                    self.logger.info(
+                        f"Starting streaming ad classification for post {post.id}."
                     )
-                    break
+                    progress = self._start_classification(
+                        post=post,
+                        system_prompt=system_prompt,
+                        user_prompt_template=user_prompt_template,
+                        transcript_segments=[],
+                    )
+                if not progress.failed:
+                    try:
+                        self._classify_available(
+                            progress, transcript_segments, final=False
+                        )
+                    except ClassifyException as e:
+                        self.logger.error(
+                            f"Classification failed for post {post.id}: {e}"
+                        )
+                        progress.failed = True
 
-            # Expand neighbors using bulk operations
-            # NOTE: Use self.db_session.query() instead of self.identification_query
-            # to ensure all operations use the same session consistently.
-            ad_identifications = (
-                self.db_session.query(Identification)
-                .join(TranscriptSegment)
-                .filter(
-                    TranscriptSegment.post_id == post.id,
-                    Identification.label == "ad",
+            if progress is None:
+                self.logger.info(
+                    f"No transcript segments to classify for post {post.id}. Skipping."
                 )
-                .all()
+                return transcript_segments
+            if progress.failed:
+                return transcript_segments
+            self.logger.info(
+                f"Transcription finished with {len(transcript_segments)} segments; "
+                f"classifying the rest of post {post.id}."
             )
+            try:
+                self._classify_available(progress, transcript_segments, final=True)
+                self._finish_classification(progress, transcript_segments)
+            except ClassifyException as e:
+                self.logger.error(f"Classification failed for post {post.id}: {e}")
+            return transcript_segments
+        finally:
+            self._identification_index = None
+
+    def _start_classification(
+        self,
+        *,
+        post: Post,
+        system_prompt: str,
+        user_prompt_template: Template,
+        transcript_segments: List[TranscriptSegment],
+    ) -> ClassifyProgress:
+        # Batch mode plans every chunk before any response exists, so there is
+        # nothing to adapt to; it keeps the static size.
+        chunk_sizer = ChunkSizer.for_post(
+            self.config,
+            previous_plan=post.classification_chunk_plan,
+            total_segments=len(transcript_segments),
+            adaptive=self.config.processing.adaptive_chunk_sizing
+            and not self._batch_mode_enabled(),
+        )
+        classify_params = ClassifyParams(
+            system_prompt=apply_prompt_encoding(
+                system_prompt, self.config.llm_compact_prompt_encoding
+            ),
+            user_prompt_template=user_prompt_template,
+            post=post,
+            num_segments_per_prompt=self.config.processing.num_segments_to_input_to_prompt,
+            max_overlap_segments=self.config.processing.max_overlap_segments,
+            chunk_sizer=chunk_sizer,
+        )
+
+        self._deferred_model_call_ids = []
+        self._segment_scores = (
+            self.segment_scorer.score_segments(transcript_segments)
+            if self.segment_scorer
+            else {}
+        )
+        self._identification_index = IdentificationIndex.load(self.db_session, post.id)
+        return ClassifyProgress(classify_params)
+
+    def _classify_available(
+        self,
+        progress: ClassifyProgress,
+        transcript_segments: List[TranscriptSegment],
+        *,
+        final: bool,
+    ) -> None:
+        """Run chunks over the unclassified segments.
 
-            if ad_identifications:
-                # Get model_call from first identification
-                model_call = (
-                    ad_identifications[0].model_call if ad_identifications else None
+        Unless `final`, stop while at most one chunk's worth of segments is
+        left, since later segments may still extend that chunk.
+        """
+        classify_params = progress.classify_params
+        chunk_sizer = classify_params.chunk_sizer
+        post = classify_params.post
+        total_segments = len(transcript_segments)
+        max_iterations = total_segments + 10  # Safety limit to prevent infinite loops
+        while (
+            progress.current_index < total_segments
+            and progress.iteration_count < max_iterations
+        ):
+            if not final:
+                segments_per_prompt = (
+                    chunk_sizer.segments_per_prompt
+                    if chunk_sizer is not None
+                    else classify_params.num_segments_per_prompt
                 )
-                if model_call:
-                    created = self.expand_neighbors_bulk(
-                        ad_identifications=ad_identifications,
-                        model_call=model_call,
-                        post_id=post.id,
-                        window=5,
-                    )
-                    self.logger.info(
-                        f"Created {created} neighbor identifications via bulk ops"
-                    )
+                if total_segments - progress.current_index <= segments_per_prompt:
+                    return
+            consumed_segments, progress.next_overlap_segments = self._step(
+                classify_params,
+                progress.next_overlap_segments,
+                progress.current_index,
+                transcript_segments,
+            )
+            progress.current_index += consumed_segments
+            progress.iteration_count += 1
+            if consumed_segments == 0:
+                self.logger.error(
+                    f"No progress made in iteration {progress.iteration_count} for post {post.id}. "
+                    "Breaking to avoid infinite loop."
+                )
+                break
 
-            # Pass 2: Refine boundaries
-            if self.boundary_refiner:
-                self._refine_boundaries(transcript_segments, post)
+    def _finish_classification(
+        self,
+        progress: ClassifyProgress,
+        transcript_segments: List[TranscriptSegment],
+    ) -> None:
+        post = progress.classify_params.post
+        chunk_sizer = progress.classify_params.chunk_sizer
+        if chunk_sizer is not None:
+            self._store_chunk_plan(post, chunk_sizer, transcript_segments)
 
-        except ClassifyException as e:
-            self.logger.error(f"Classification failed for post {post.id}: {e}")
-            return
+        if self._deferred_model_call_ids:
+            raise ClassificationDeferred(post.id, self._deferred_model_call_ids)
+
+        # One array view of the post's segments serves expansion and grouping
+        timeline = (
+            SegmentTimeline.from_segments(transcript_segments) if HAS_NUMPY else None
+        )
+
+        # Expand neighbors using bulk operations
+        # NOTE: Use self.db_session.query() instead of self.identification_query
+        # to ensure all operations use the same session consistently.
+        ad_identifications = (
+            self.db_session.query(Identification)
+            .join(TranscriptSegment)
+            .filter(
+                TranscriptSegment.post_id == post.id,
+                Identification.label == "ad",
+            )
+            .all()
+        )
+
+        if ad_identifications:
+            # Get model_call from first identification
+            model_call = (
+                ad_identifications[0].model_call if ad_identifications else None
+            )
+            if model_call:
+                created = self.expand_neighbors_bulk(
+                    ad_identifications=ad_identifications,
+                    model_call=model_call,
+                    post_id=post.id,
+                    window=5,
+                    timeline=timeline,
+                )
+                self.logger.info(
+                    f"Created {created} neighbor identifications via bulk ops"
+                )
+
+        # Pass 2: Refine boundaries
+        if self.boundary_refiner:
+            self._refine_boundaries(transcript_segments, post, timeline=timeline)
 
     def _step(
         self,
@@ -227,7 +514,13 @@ class AdClassifier:
         current_index: int,
         transcript_segments: List[TranscriptSegment],
     ) -> Tuple[int, List[TranscriptSegment]]:
-        overlap_segments = self._apply_overlap_cap(prev_overlap_segments)
+        chunk_sizer = classify_params.chunk_sizer
+        if chunk_sizer is not None:
+            classify_params.num_segments_per_prompt = chunk_sizer.segments_per_prompt
+            classify_params.max_overlap_segments = chunk_sizer.max_overlap_segments
+        overlap_segments = self._apply_overlap_cap(
+            prev_overlap_segments, classify_params.max_overlap_segments
+        )
         remaining_segments = transcript_segments[current_index:]
 
         (
@@ -243,6 +536,7 @@ class AdClassifier:
             system_prompt=classify_params.system_prompt,
             user_prompt_template=classify_params.user_prompt_template,
             max_new_segments=classify_params.num_segments_per_prompt,
+            max_overlap_segments=classify_params.max_overlap_segments,
         )
 
         if not chunk_segments or consumed_segments <= 0:
@@ -272,9 +566,30 @@ class AdClassifier:
             post=classify_params.post,
         )
 
+        if chunk_sizer is not None:
+            chunk_sizer.record(
+                ChunkRecord(
+                    first_seq=chunk_segments[0].sequence_num,
+                    last_seq=chunk_segments[-1].sequence_num,
+                    segments_per_prompt=classify_params.num_segments_per_prompt,
+                    max_overlap_segments=classify_params.max_overlap_segments,
+                    new_segments=consumed_segments,
+                    chunk_segments=len(chunk_segments),
+                    prompt_tokens=self._count_prompt_tokens(
+                        user_prompt_str, classify_params.system_prompt
+                    ),
+                    latency_seconds=self._last_llm_latency,
+                    detections=len(identified_segments),
+                )
+            )
+
+        # Batch mode plans chunks without detections so the chunk boundaries
+        # are identical when the job is resumed with the batch responses.
         next_overlap_segments = self._compute_next_overlap_segments(
             chunk_segments=chunk_segments,
-            identified_segments=identified_segments,
+            identified_segments=(
+                [] if self._batch_mode_enabled() else identified_segments
+            ),
             max_overlap_segments=classify_params.max_overlap_segments,
         )
 
@@ -297,6 +612,7 @@ class AdClassifier:
         user_prompt_str: str,
     ) -> List[TranscriptSegment]:
         """Process a chunk of transcript segments for classification."""
+        self._last_llm_latency = None
         if not chunk_segments:
             return []
 
@@ -307,6 +623,26 @@ class AdClassifier:
             f"Processing classification for post {post.id}, segments {first_seq_num}-{last_seq_num}."
         )
 
+        if self._scorer_rules_out_ads(chunk_segments):
+            self.logger.info(
+                f"Segment scorer rates segments {first_seq_num}-{last_seq_num} of post "
+                f"{post.id} below {self.config.segment_scorer_gate_threshold}; skipping LLM call."
+            )
+            return []
+
+        if self._cascade_enabled():
+            screening_call = self._run_screening_call(
+                chunk_segments=chunk_segments,
+                system_prompt=system_prompt,
+                post=post,
+                user_prompt_str=user_prompt_str,
+            )
+            if screening_call is not None:
+                return self._process_successful_response(
+                    model_call=screening_call,
+                    current_chunk_db_segments=chunk_segments,
+                )
+
         model_call = self._get_or_create_model_call(
             post=post,
             first_seq_num=first_seq_num,
@@ -319,9 +655,13 @@ class AdClassifier:
             return []
 
         if self._should_call_llm(model_call):
-            self._perform_llm_call(
+            if self._should_defer_to_batch(model_call):
+                self._queue_for_batch(model_call)
+                return []
+            self._timed_llm_call(
                 model_call=model_call,
                 system_prompt=system_prompt,
+                chunk_segments=chunk_segments,
             )
 
         if model_call.status == "success" and model_call.response:
@@ -335,6 +675,143 @@ class AdClassifier:
             )
         return []
 
+    def _timed_llm_call(
+        self,
+        *,
+        model_call: ModelCall,
+        system_prompt: str,
+        chunk_segments: List[TranscriptSegment],
+        record_streamed: bool = True,
+    ) -> None:
+        """`_perform_llm_call`, adding its wall time to the chunk's LLM latency."""
+        started = time.perf_counter()
+        self._perform_llm_call(
+            model_call=model_call,
+            system_prompt=system_prompt,
+            chunk_segments=chunk_segments,
+            record_streamed=record_streamed,
+        )
+        self._last_llm_latency = (self._last_llm_latency or 0.0) + (
+            time.perf_counter() - started
+        )
+
+    def _scorer_rules_out_ads(self, chunk_segments: List[TranscriptSegment]) -> bool:
+        threshold = self.config.segment_scorer_gate_threshold
+        if threshold is None or not self._segment_scores:
+            return False
+        scores = [self._segment_scores.get(seg.id) for seg in chunk_segments]
+        # Segments the scorer has not seen keep the chunk on the LLM path
+        return all(score is not None and score < threshold for score in scores)
+
+    def _cascade_enabled(self) -> bool:
+        # Batch submissions are planned up front with the main model only.
+        return bool(self.config.llm_cascade_model) and not self._batch_mode_enabled()
+
+    def _run_screening_call(
+        self,
+        *,
+        chunk_segments: List[TranscriptSegment],
+        system_prompt: str,
+        post: Post,
+        user_prompt_str: str,
+    ) -> Optional[ModelCall]:
+        """Classify the chunk with the cascade model.
+
+        Returns the screening ModelCall when its answer can be used as is, or
+        None when the chunk has to be escalated to `llm_model`.
+        """
+        assert self.config.llm_cascade_model
+        screening_call = self._get_or_create_model_call(
+            post=post,
+            first_seq_num=chunk_segments[0].sequence_num,
+            last_seq_num=chunk_segments[-1].sequence_num,
+            user_prompt_str=user_prompt_str,
+            model_name=self.config.llm_cascade_model,
+        )
+        if screening_call is None:
+            return None
+        if self._should_call_llm(screening_call):
+            # Streamed detections are not recorded: the chunk may be escalated.
+            self._timed_llm_call(
+                model_call=screening_call,
+                system_prompt=system_prompt,
+                chunk_segments=chunk_segments,
+                record_streamed=False,
+            )
+
+        reason = self._escalation_reason(screening_call, chunk_segments)
+        if reason is None:
+            return screening_call
+        self.logger.info(
+            f"Escalating post {post.id} segments {screening_call.first_segment_sequence_num}-"
+            f"{screening_call.last_segment_sequence_num} to {self.config.llm_model}: {reason}"
+        )
+        return None
+
+    def _escalation_reason(
+        self, screening_call: ModelCall, chunk_segments: List[TranscriptSegment]
+    ) -> Optional[str]:
+        """Why a screening answer is not trusted, or None if it is."""
+        if screening_call.status != "success" or not screening_call.response:
+            return f"screening call ended with status {screening_call.status}"
+        try:
+            prediction_list = clean_and_parse_model_output(
+                screening_call.response,
+                segment_offsets=self._segment_offsets_by_id(chunk_segments),
+            )
+        except (ValidationError, AssertionError, ValueError) as e:
+            return f"unparseable screening response ({e})"
+
+        low = self.config.llm_cascade_escalate_min_confidence
+        high = self.config.llm_cascade_escalate_max_confidence
+        uncertain = [
+            pred.segment_offset
+            for pred in prediction_list.ad_segments
+            if low <= pred.confidence < high
+        ]
+        if uncertain:
+            return f"mid-range confidence at offsets {uncertain}"
+
+        predicted_ids = set()
+        for pred in prediction_list.ad_segments:
+            matched = self._find_matching_segment(
+                segment_offset=pred.segment_offset,
+                current_chunk_db_segments=chunk_segments,
+            )
+            if matched is not None:
+                predicted_ids.add(matched.id)
+        # Overlap segments already labeled ad by the previous chunk
+        missed = self._ad_identified_segment_ids(
+            [seg.id for seg in chunk_segments]
+        ).difference(predicted_ids)
+        if missed:
+            return f"conflicts with earlier ad detections on segments {sorted(missed)}"
+
+        if not prediction_list.ad_segments:
+            cue_segments = [
+                seg.sequence_num
+                for seg in chunk_segments
+                if self.cue_detector.has_cue(seg.text or "")
+            ]
+            if cue_segments:
+                return f"ad cues without detections at segments {cue_segments}"
+        return None
+
+    def _ad_identified_segment_ids(self, segment_ids: List[int]) -> Set[int]:
+        if not segment_ids:
+            return set()
+        if self._identification_index is not None:
+            return self._identification_index.segments_with_label(segment_ids)
+        rows = (
+            self.db_session.query(Identification.transcript_segment_id)
+            .filter(
+                Identification.transcript_segment_id.in_(segment_ids),
+                Identification.label == "ad",
+            )
+            .all()
+        )
+        return {int(row[0]) for row in rows}
+
     def _build_chunk_payload(
         self,
         *,
@@ -345,12 +822,17 @@ class AdClassifier:
         system_prompt: str,
         user_prompt_template: Template,
         max_new_segments: int,
+        max_overlap_segments: int,
     ) -> Tuple[List[TranscriptSegment], str, int, bool]:
-        """Construct chunk data while enforcing overlap and token constraints."""
+        """Construct chunk data while enforcing overlap and token constraints.
+
+        `max_overlap_segments` is this chunk's cap from the chunk plan, which
+        adaptive sizing can set below the configured maximum.
+        """
         if not remaining_segments:
             return ([], "", 0, False)
 
-        capped_overlap = self._apply_overlap_cap(overlap_segments)
+        capped_overlap = self._apply_overlap_cap(overlap_segments, max_overlap_segments)
         new_segment_count = min(max_new_segments, len(remaining_segments))
         token_limit_trimmed = False
 
@@ -552,11 +1034,7 @@ class AdClassifier:
 
         return list(reversed(tail_segments))
 
-    def _validate_token_limit(self, user_prompt_str: str, system_prompt: str) -> bool:
-        """Validate that the prompt doesn't exceed the configured token limit."""
-        if self.config.llm_max_input_tokens_per_call is None:
-            return True
-
+    def _count_prompt_tokens(self, user_prompt_str: str, system_prompt: str) -> int:
         # Create messages as they would be sent to the API
         messages = [
             {"role": "system", "content": system_prompt},
@@ -565,14 +1043,54 @@ class AdClassifier:
 
         # Count tokens (reuse the existing token counting logic from rate limiter)
         if self.rate_limiter:
-            token_count = self.rate_limiter.count_tokens(
-                messages, self.config.llm_model
+            return self.rate_limiter.count_tokens(messages, self.config.llm_model)
+        # Fallback token estimation if no rate limiter
+        total_chars = len(system_prompt) + len(user_prompt_str)
+        return total_chars // 4  # ~4 characters per token
+
+    def _store_chunk_plan(
+        self,
+        post: Post,
+        chunk_sizer: ChunkSizer,
+        transcript_segments: List[TranscriptSegment],
+    ) -> None:
+        """Persist the chunk plan of this run on the post (best effort)."""
+        if not chunk_sizer.records:
+            return
+        audio_seconds = (
+            transcript_segments[-1].end_time - transcript_segments[0].start_time
+        )
+        plan = chunk_sizer.plan(audio_seconds=audio_seconds)
+        self.logger.info(
+            "Classified post %s in %s chunks (%s mode): %s prompt tokens, %.1fs LLM time",
+            post.id,
+            plan["calls"],
+            plan["mode"],
+            plan["prompt_tokens"],
+            plan["llm_seconds"],
+        )
+        try:
+            res = writer_client.update(
+                "Post", post.id, {"classification_chunk_plan": plan}, wait=True
             )
-        else:
-            # Fallback token estimation if no rate limiter
-            total_chars = len(system_prompt) + len(user_prompt_str)
-            token_count = total_chars // 4  # ~4 characters per token
+            if not res or not res.success:
+                raise RuntimeError(
+                    getattr(res, "error", "Failed to update classification chunk plan")
+                )
+            post.classification_chunk_plan = plan
+        except Exception as exc:  # pylint: disable=broad-except
+            self.logger.warning(
+                "Failed to persist classification chunk plan for post %s: %s",
+                post.id,
+                exc,
+            )
+
+    def _validate_token_limit(self, user_prompt_str: str, system_prompt: str) -> bool:
+        """Validate that the prompt doesn't exceed the configured token limit."""
+        if self.config.llm_max_input_tokens_per_call is None:
+            return True
 
+        token_count = self._count_prompt_tokens(user_prompt_str, system_prompt)
         is_valid = token_count <= self.config.llm_max_input_tokens_per_call
 
         if not is_valid:
@@ -587,7 +1105,10 @@ class AdClassifier:
         return is_valid
 
     def _prepare_api_call(
-        self, model_call_obj: ModelCall, system_prompt: str
+        self,
+        model_call_obj: ModelCall,
+        system_prompt: str,
+        status_buffer: Optional[ModelCallStatusBuffer] = None,
     ) -> Optional[Dict[str, Any]]:
         """Prepare API call arguments and validate token limits."""
         # Prepare messages for the API call
@@ -597,11 +1118,15 @@ class AdClassifier:
         ]
 
         # Use rate limiter to wait if necessary and track token usage
-        if self.rate_limiter:
-            self.rate_limiter.wait_if_needed(messages, model_call_obj.model_name)
+        # (the async executor waits on its own loop instead of blocking here,
+        # but streamed calls don't go through it)
+        rate_limiter = self._rate_limiter_for(model_call_obj.model_name)
+        if rate_limiter:
+            if self.config.llm_enable_streaming or not self.async_executor:
+                rate_limiter.wait_if_needed(messages, model_call_obj.model_name)
 
             # Get usage stats for logging
-            usage_stats = self.rate_limiter.get_usage_stats()
+            usage_stats = rate_limiter.get_usage_stats()
             self.logger.info(
                 f"Token usage: {usage_stats['current_usage']}/{usage_stats['limit']} "
                 f"({usage_stats['usage_percentage']:.1f}%) for ModelCall {model_call_obj.id}"
@@ -616,7 +1141,9 @@ class AdClassifier:
                     f"Consider reducing num_segments_to_input_to_prompt."
                 )
                 self.logger.error(error_msg)
-                if model_call_obj.id is not None:
+                if status_buffer is not None:
+                    status_buffer.finish("failed", error_message=error_msg)
+                elif model_call_obj.id is not None:
                     res = writer_client.update(
                         "ModelCall",
                         model_call_obj.id,
@@ -633,31 +1160,15 @@ class AdClassifier:
                 return None
 
         # Prepare completion arguments
-        completion_args = {
-            "model": model_call_obj.model_name,
-            "messages": messages,
-            "timeout": self.config.openai_timeout,
-        }
-
-        # Use max_completion_tokens for newer OpenAI models (o1, gpt-5, gpt-4o variants)
-        # OpenAI deprecated max_tokens for these models in favor of max_completion_tokens
-        # Check if this is a model that requires max_completion_tokens
-        # This includes: gpt-5, gpt-4o variants, o1 series, and latest chatgpt models
-        uses_max_completion_tokens = model_uses_max_completion_tokens(
-            model_call_obj.model_name
+        completion_args = classification_completion_args(
+            self.config, model_call_obj.model_name, messages
         )
 
         # Debug logging to help diagnose model parameter issues
         self.logger.info(
-            f"Model: '{model_call_obj.model_name}', using max_completion_tokens: {uses_max_completion_tokens}"
+            f"Model: '{model_call_obj.model_name}', using max_completion_tokens: "
+            f"{'max_completion_tokens' in completion_args}"
         )
-
-        if uses_max_completion_tokens:
-            completion_args["max_completion_tokens"] = self.config.openai_max_tokens
-        else:
-            # For older models and non-OpenAI models, use max_tokens
-            completion_args["max_tokens"] = self.config.openai_max_tokens
-
         return completion_args
 
     def _generate_user_prompt(
@@ -675,16 +1186,41 @@ class AdClassifier:
             for db_seg in current_chunk_db_segments
         ]
 
-        return user_prompt_template.render(
-            podcast_title=post.title,
-            podcast_topic=post.description if post.description else "",
-            transcript=transcript_excerpt_for_prompt(
+        if self.config.llm_compact_prompt_encoding:
+            transcript = compact_transcript_excerpt_for_prompt(
                 segments=temp_pydantic_segments_for_prompt,
+                segment_ids=compact_segment_ids(
+                    [db_seg.sequence_num for db_seg in current_chunk_db_segments]
+                ),
                 includes_start=includes_start,
                 includes_end=includes_end,
-            ),
+            )
+        else:
+            transcript = transcript_excerpt_for_prompt(
+                segments=temp_pydantic_segments_for_prompt,
+                includes_start=includes_start,
+                includes_end=includes_end,
+            )
+
+        return user_prompt_template.render(
+            podcast_title=post.title,
+            podcast_topic=post.description if post.description else "",
+            transcript=transcript,
         )
 
+    @staticmethod
+    def _segment_offsets_by_id(
+        chunk_segments: Optional[List[TranscriptSegment]],
+    ) -> Optional[Dict[int, float]]:
+        """Compact-encoding segment id -> start time for a chunk."""
+        if not chunk_segments:
+            return None
+        ids = compact_segment_ids([seg.sequence_num for seg in chunk_segments])
+        return {
+            segment_id: float(seg.start_time)
+            for segment_id, seg in zip(ids, chunk_segments)
+        }
+
     def _get_or_create_model_call(
         self,
         *,
@@ -692,9 +1228,10 @@ class AdClassifier:
         first_seq_num: int,
         last_seq_num: int,
         user_prompt_str: str,
+        model_name: Optional[str] = None,
     ) -> Optional[ModelCall]:
         """Get an existing ModelCall or create a new one via writer."""
-        model = self.config.llm_model
+        model = model_name or self.config.llm_model
         result = writer_client.action(
             "upsert_model_call",
             {
@@ -722,7 +1259,39 @@ class AdClassifier:
         """Determine if an LLM call should be made."""
         return model_call.status not in ("success", "failed_permanent")
 
-    def _perform_llm_call(self, *, model_call: ModelCall, system_prompt: str) -> None:
+    def _batch_mode_enabled(self) -> bool:
+        return self.batch_classification
+
+    def _should_defer_to_batch(self, model_call: ModelCall) -> bool:
+        """Unanswered chunks go to the batch API; failed batch results are retried inline."""
+        return self._batch_mode_enabled() and model_call.status in (
+            "pending",
+            "batch_queued",
+            "batch_submitted",
+        )
+
+    def _queue_for_batch(self, model_call: ModelCall) -> None:
+        if model_call.status == "pending":
+            res = writer_client.update(
+                "ModelCall",
+                model_call.id,
+                {"status": "batch_queued", "batch_id": None},
+                wait=True,
+            )
+            if not res or not res.success:
+                raise RuntimeError(getattr(res, "error", "Failed to update ModelCall"))
+            model_call.status = "batch_queued"
+            self.logger.info(f"Queued ModelCall {model_call.id} for batch API")
+        self._deferred_model_call_ids.append(model_call.id)
+
+    def _perform_llm_call(
+        self,
+        *,
+        model_call: ModelCall,
+        system_prompt: str,
+        chunk_segments: Optional[List[TranscriptSegment]] = None,
+        record_streamed: bool = True,
+    ) -> None:
         """Perform the LLM call for classification."""
         self.logger.info(
             f"Calling LLM for ModelCall {model_call.id} (post {model_call.post_id}, segments {model_call.first_segment_sequence_num}-{model_call.last_segment_sequence_num})."
@@ -731,7 +1300,12 @@ class AdClassifier:
             if isinstance(self.config.whisper, TestWhisperConfig):
                 self._handle_test_mode_call(model_call)
             else:
-                self._call_model(model_call_obj=model_call, system_prompt=system_prompt)
+                self._call_model(
+                    model_call_obj=model_call,
+                    system_prompt=system_prompt,
+                    chunk_segments=chunk_segments,
+                    record_streamed=record_streamed,
+                )
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.error(
                 f"LLM interaction via _call_model for ModelCall {model_call.id} resulted in an exception: {e}",
@@ -771,14 +1345,26 @@ class AdClassifier:
             f"LLM call for ModelCall {model_call.id} was successful. Parsing response."
         )
         try:
-            prediction_list = clean_and_parse_model_output(model_call.response)
-            created_identification_count, matched_segments = (
-                self._create_identifications(
-                    prediction_list=prediction_list,
-                    current_chunk_db_segments=current_chunk_db_segments,
-                    model_call=model_call,
-                )
+            prediction_list = clean_and_parse_model_output(
+                model_call.response,
+                segment_offsets=self._segment_offsets_by_id(current_chunk_db_segments),
             )
+            if model_call.id in self._streamed_model_call_ids:
+                created_identification_count, matched_segments = (
+                    self._replace_streamed_identifications(
+                        prediction_list=prediction_list,
+                        current_chunk_db_segments=current_chunk_db_segments,
+                        model_call=model_call,
+                    )
+                )
+            else:
+                created_identification_count, matched_segments = (
+                    self._create_identifications(
+                        prediction_list=prediction_list,
+                        current_chunk_db_segments=current_chunk_db_segments,
+                        model_call=model_call,
+                    )
+                )
 
             if created_identification_count > 0:
                 self.logger.info(
@@ -790,6 +1376,7 @@ class AdClassifier:
                 f"Error processing LLM response for ModelCall {model_call.id}: {e}",
                 exc_info=True,
             )
+            self._discard_streamed_identifications(model_call)
         return []
 
     def _create_identifications(
@@ -800,6 +1387,42 @@ class AdClassifier:
         model_call: ModelCall,
     ) -> Tuple[int, List[TranscriptSegment]]:
         """Create Identification records from the prediction list."""
+        to_insert, matched_segments = self._identification_rows(
+            prediction_list=prediction_list,
+            current_chunk_db_segments=current_chunk_db_segments,
+            model_call=model_call,
+        )
+        if not to_insert:
+            return 0, matched_segments
+
+        res = writer_client.action(
+            "insert_identifications",
+            {"identifications": to_insert},
+            wait=True,
+        )
+        if not res or not res.success:
+            raise RuntimeError(
+                getattr(res, "error", "Failed to insert identifications")
+            )
+
+        if self._identification_index is not None:
+            self._identification_index.add_rows(to_insert)
+        inserted = int((res.data or {}).get("inserted") or 0)
+        return inserted, matched_segments
+
+    def _identification_rows(
+        self,
+        *,
+        prediction_list: AdSegmentPredictionList,
+        current_chunk_db_segments: List[TranscriptSegment],
+        model_call: ModelCall,
+        exclude_model_call_id: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[TranscriptSegment]]:
+        """Rows to insert for the prediction list, and the segments it matched.
+
+        Rows recorded by `exclude_model_call_id` don't count as existing
+        detections, since they are about to be replaced.
+        """
         to_insert: List[Dict[str, Any]] = []
         matched_segments: List[TranscriptSegment] = []
         processed_segment_ids: Set[int] = set()
@@ -834,7 +1457,9 @@ class AdClassifier:
             processed_segment_ids.add(matched_segment.id)
             matched_segments.append(matched_segment)
 
-            if self._segment_has_ad_identification(matched_segment.id):
+            if self._segment_has_ad_identification(
+                matched_segment.id, exclude_model_call_id=exclude_model_call_id
+            ):
                 self.logger.debug(
                     "Segment %s for post %s already has an ad identification; skipping new record.",
                     matched_segment.id,
@@ -859,23 +1484,9 @@ class AdClassifier:
                 matched_segments=matched_segments,
                 base_confidence=adjusted_confidence,
                 to_insert=to_insert,
+                exclude_model_call_id=exclude_model_call_id,
             )
-
-        if not to_insert:
-            return 0, matched_segments
-
-        res = writer_client.action(
-            "insert_identifications",
-            {"identifications": to_insert},
-            wait=True,
-        )
-        if not res or not res.success:
-            raise RuntimeError(
-                getattr(res, "error", "Failed to insert identifications")
-            )
-
-        inserted = int((res.data or {}).get("inserted") or 0)
-        return inserted, matched_segments
+        return to_insert, matched_segments
 
     def _adjust_confidence(
         self, *, base_confidence: float, content_type: Optional[str]
@@ -900,6 +1511,7 @@ class AdClassifier:
         matched_segments: List[TranscriptSegment],
         base_confidence: float,
         to_insert: List[Dict[str, Any]],
+        exclude_model_call_id: Optional[int] = None,
     ) -> int:
         """If an ad is detected within the first 45s, include up to 3 preceding intro segments."""
         if matched_segment.start_time > 45.0:
@@ -911,7 +1523,9 @@ class AdClassifier:
         for seg in current_chunk_db_segments[start_index:matched_index]:
             if seg.id in processed_segment_ids:
                 continue
-            if self._segment_has_ad_identification(seg.id):
+            if self._segment_has_ad_identification(
+                seg.id, exclude_model_call_id=exclude_model_call_id
+            ):
                 continue
 
             processed_segment_ids.add(seg.id)
@@ -953,20 +1567,26 @@ class AdClassifier:
                 min_diff = diff
         return matched_segment
 
-    def _segment_has_ad_identification(self, transcript_segment_id: int) -> bool:
+    def _segment_has_ad_identification(
+        self,
+        transcript_segment_id: int,
+        exclude_model_call_id: Optional[int] = None,
+    ) -> bool:
         """Check if a transcript segment already has an ad identification.
 
+        Answered from the identification index during classify(); outside of it
+        this falls back to a query.
         NOTE: Uses self.db_session.query() for session consistency.
         """
-        return (
-            self.db_session.query(Identification)
-            .filter_by(
-                transcript_segment_id=transcript_segment_id,
-                label="ad",
-            )
-            .first()
-            is not None
+        if self._identification_index is not None:
+            return self._identification_index.has_label(transcript_segment_id)
+        query = self.db_session.query(Identification).filter_by(
+            transcript_segment_id=transcript_segment_id,
+            label="ad",
         )
+        if exclude_model_call_id is not None:
+            query = query.filter(Identification.model_call_id != exclude_model_call_id)
+        return query.first() is not None
 
     def _is_retryable_error(self, error: Exception) -> bool:
         """Determine if an error should be retried."""
@@ -989,6 +1609,8 @@ class AdClassifier:
         model_call_obj: ModelCall,
         system_prompt: str,
         max_retries: Optional[int] = None,
+        chunk_segments: Optional[List[TranscriptSegment]] = None,
+        record_streamed: bool = True,
     ) -> Optional[str]:
         """Call the LLM model with retry logic."""
         # Use configured retry count if not specified
@@ -1000,108 +1622,91 @@ class AdClassifier:
 
         last_error: Optional[Exception] = None
         raw_response_content = None
+        # Caps the time spent on this call across all attempts and retry waits
+        deadline = (
+            time.monotonic() + self.config.llm_call_deadline_seconds
+            if self.config.llm_call_deadline_seconds
+            else None
+        )
         original_retry_attempts = (
             0
             if model_call_obj.retry_attempts is None
             else model_call_obj.retry_attempts
         )
 
-        for attempt in range(retry_count):
-            retry_attempts_value = original_retry_attempts + attempt + 1
-            current_attempt_num = attempt + 1
+        # Status changes are buffered and written once when the call settles;
+        # the buffer's heartbeat keeps long calls visible as in progress.
+        with ModelCallStatusBuffer(model_call_obj, logger=self.logger) as status:
+            for attempt in range(retry_count):
+                current_attempt_num = attempt + 1
+                status.record_attempt(original_retry_attempts + current_attempt_num)
 
-            self.logger.info(
-                f"Calling model {model_call_obj.model_name} for ModelCall {model_call_obj.id} (attempt {current_attempt_num}/{retry_count})"
-            )
+                self.logger.info(
+                    f"Calling model {model_call_obj.model_name} for ModelCall {model_call_obj.id} (attempt {current_attempt_num}/{retry_count})"
+                )
 
-            try:
-                # Persist retry attempt + pending status via writer
-                if model_call_obj.id is not None:
-                    pending_res = writer_client.update(
-                        "ModelCall",
-                        model_call_obj.id,
-                        {"status": "pending", "retry_attempts": retry_attempts_value},
-                        wait=True,
+                try:
+                    # Prepare API call and validate token limits
+                    completion_args = self._prepare_api_call(
+                        model_call_obj, system_prompt, status_buffer=status
                     )
-                    if not pending_res or not pending_res.success:
-                        raise RuntimeError(
-                            getattr(pending_res, "error", "Failed to update ModelCall")
+                    if completion_args is None:
+                        return None  # Token limit exceeded
+                    if deadline is not None:
+                        self._apply_deadline(completion_args, deadline)
+
+                    if self.config.llm_enable_streaming:
+                        raw_response_content = self._stream_model_response(
+                            model_call_obj=model_call_obj,
+                            completion_args=completion_args,
+                            chunk_segments=chunk_segments,
+                            record_streamed=record_streamed,
+                        )
+                    else:
+                        raw_response_content = self._complete_model_response(
+                            completion_args, deadline=deadline
                         )
 
-                # Prepare API call and validate token limits
-                completion_args = self._prepare_api_call(model_call_obj, system_prompt)
-                if completion_args is None:
-                    return None  # Token limit exceeded
-
-                # Use concurrency limiter if available
-                if self.concurrency_limiter:
-                    with ConcurrencyContext(self.concurrency_limiter, timeout=30.0):
-                        response = litellm.completion(**completion_args)
-                else:
-                    response = litellm.completion(**completion_args)
-
-                response_first_choice = response.choices[0]
-                assert isinstance(response_first_choice, Choices)
-                content = response_first_choice.message.content
-                assert content is not None
-                raw_response_content = content
-
-                success_res = writer_client.update(
-                    "ModelCall",
-                    model_call_obj.id,
-                    {
-                        "response": raw_response_content,
-                        "status": "success",
-                        "error_message": None,
-                        "retry_attempts": retry_attempts_value,
-                    },
-                    wait=True,
-                )
-                if not success_res or not success_res.success:
-                    raise RuntimeError(
-                        getattr(success_res, "error", "Failed to update ModelCall")
+                    status.finish(
+                        "success", response=raw_response_content, error_message=None
                     )
-                # Update local object to reflect database state
-                model_call_obj.status = "success"
-                model_call_obj.response = raw_response_content
-                model_call_obj.error_message = None
-                self.logger.info(
-                    f"Model call {model_call_obj.id} successful on attempt {current_attempt_num}."
-                )
-                return raw_response_content
-
-            except Exception as e:
-                last_error = e
-                if self._is_retryable_error(e):
-                    self._handle_retryable_error(
-                        model_call_obj=model_call_obj,
-                        error=e,
-                        attempt=attempt,
-                        current_attempt_num=current_attempt_num,
-                    )
-                    # Continue to next retry
-                else:
-                    self.logger.error(
-                        f"Non-retryable LLM error for ModelCall {model_call_obj.id} (attempt {current_attempt_num}): {e}",
-                        exc_info=True,
-                    )
-                    fail_res = writer_client.update(
-                        "ModelCall",
-                        model_call_obj.id,
-                        {"status": "failed_permanent", "error_message": str(e)},
-                        wait=True,
+                    self.logger.info(
+                        f"Model call {model_call_obj.id} successful on attempt {current_attempt_num}."
                     )
-                    if not fail_res or not fail_res.success:
-                        raise RuntimeError(
-                            getattr(fail_res, "error", "Failed to update ModelCall")
-                        ) from e
-                    # Update local object to reflect database state
-                    model_call_obj.status = "failed_permanent"
-                    model_call_obj.error_message = str(e)
-                    raise  # Re-raise non-retryable exceptions immediately
+                    return raw_response_content
 
-        # If we get here, all retries were exhausted
-        self._handle_retry_exhausted(model_call_obj, retry_count, last_error)
+                except LLMDeadlineExceeded as e:
+                    self.logger.error(f"ModelCall {model_call_obj.id}: {e}")
+                    last_error = e
+                    break
+                except Exception as e:
+                    last_error = e
+                    if self._is_retryable_error(e):
+                        if not self._handle_retryable_error(
+                            model_call_obj=model_call_obj,
+                            error=e,
+                            attempt=attempt,
+                            current_attempt_num=current_attempt_num,
+                            status_buffer=status,
+                            deadline=deadline,
+                        ):
+                            last_error = LLMDeadlineExceeded(
+                                f"Call deadline reached before retrying: {e}"
+                            )
+                            break
+                        # Continue to next retry
+                    else:
+                        self.logger.error(
+                            f"Non-retryable LLM error for ModelCall {model_call_obj.id} (attempt {current_attempt_num}): {e}",
+                            exc_info=True,
+                        )
+                        status.finish("failed_permanent", error_message=str(e))
+                        raise  # Re-raise non-retryable exceptions immediately
+
+            # If we get here, all retries were exhausted
+            self._handle_retry_exhausted(
+                model_call_obj, retry_count, last_error, status_buffer=status
+            )
 
         if last_error:
             raise last_error
@@ -1109,6 +1714,256 @@ class AdClassifier:
             f"Maximum retries ({retry_count}) exceeded for ModelCall {model_call_obj.id}."
         )
 
+    def _apply_deadline(self, completion_args: Dict[str, Any], deadline: float) -> None:
+        """Cap the request timeout at the time left before `deadline`."""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise LLMDeadlineExceeded("Call deadline reached before the request")
+        completion_args["timeout"] = max(
+            1, min(completion_args["timeout"], math.ceil(remaining))
+        )
+
+    def _complete_model_response(
+        self, completion_args: Dict[str, Any], deadline: Optional[float] = None
+    ) -> str:
+        """Blocking (non-streamed) completion returning the message content."""
+        hedge = self._hedge_plan(completion_args)
+        if hedge is None:
+            response = self._request_completion(completion_args)
+        else:
+            hedge_args, hedge_after = hedge
+            response = hedged_request(
+                self._submit_completion,
+                completion_args,
+                hedge_args=hedge_args,
+                hedge_after=hedge_after,
+                deadline=deadline,
+            )
+
+        response_first_choice = response.choices[0]
+        assert isinstance(response_first_choice, Choices)
+        content = response_first_choice.message.content
+        assert content is not None
+        return str(content)
+
+    def _hedge_plan(
+        self, completion_args: Dict[str, Any]
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Hedge request and delay, or None when hedging is off or not yet calibrated.
+
+        Hedging needs the async executor: its requests are charged to the token
+        rate limiter as they are sent and the losing one is cancelled. A
+        blocking call in a thread can't be cancelled once it has started.
+        """
+        percentile = self.config.llm_hedge_after_percentile
+        if percentile is None or self.async_executor is None:
+            return None
+        model = completion_args["model"]
+        threshold = get_latency_tracker().percentile(model, float(percentile))
+        if threshold is None:
+            return None
+
+        hedge_model = self.config.llm_hedge_model or model
+        hedge_args = dict(completion_args, model=hedge_model)
+        if hedge_model != model:
+            max_tokens = hedge_args.pop("max_completion_tokens", None)
+            max_tokens = hedge_args.pop("max_tokens", max_tokens)
+            if model_uses_max_completion_tokens(hedge_model):
+                hedge_args["max_completion_tokens"] = max_tokens
+            else:
+                hedge_args["max_tokens"] = max_tokens
+        return hedge_args, max(threshold, MIN_HEDGE_DELAY_SECONDS)
+
+    def _submit_completion(self, completion_args: Dict[str, Any]) -> "Future[Any]":
+        """Start one request for hedged_request; its latency is recorded on success."""
+        assert self.async_executor is not None
+        started = time.monotonic()
+        model = completion_args["model"]
+        future = self.async_executor.submit(
+            rate_limiter=self._rate_limiter_for(model), **completion_args
+        )
+
+        def record_latency(done: "Future[Any]") -> None:
+            if not done.cancelled() and done.exception() is None:
+                get_latency_tracker().record(model, time.monotonic() - started)
+
+        future.add_done_callback(record_latency)
+        return future
+
+    def _request_completion(self, completion_args: Dict[str, Any]) -> Any:
+        """One completion request under the concurrency and rate limits."""
+        started = time.monotonic()
+        if self.async_executor:
+            response = self.async_executor.complete(
+                rate_limiter=self._rate_limiter_for(completion_args["model"]),
+                **completion_args,
+            )
+        elif self.concurrency_limiter:
+            with ConcurrencyContext(
+                self.concurrency_limiter, timeout=30.0
+            ) as concurrency:
+                response = litellm.completion(**completion_args)
+                concurrency.observe_response(response)
+        else:
+            response = litellm.completion(**completion_args)
+
+        get_latency_tracker().record(
+            completion_args["model"], time.monotonic() - started
+        )
+        return response
+
+    def _stream_model_response(
+        self,
+        *,
+        model_call_obj: ModelCall,
+        completion_args: Dict[str, Any],
+        chunk_segments: Optional[List[TranscriptSegment]],
+        record_streamed: bool = True,
+    ) -> str:
+        """Stream a completion, recording detections as their JSON objects close.
+
+        Stops reading once the response object is complete or the parser flags
+        a runaway generation; in the latter case the predictions parsed so far
+        are returned as the stored response.
+        """
+        parser = StreamingPredictionParser(
+            max_predictions=len(chunk_segments) if chunk_segments else None,
+            segment_offsets=self._segment_offsets_by_id(chunk_segments),
+        )
+        watcher = JsonObjectWatcher()
+
+        def on_delta(delta: str) -> bool:
+            new_predictions = parser.feed(delta)
+            if new_predictions and chunk_segments and record_streamed:
+                self._record_streamed_predictions(
+                    model_call_obj, new_predictions, chunk_segments
+                )
+            if parser.stop_reason:
+                self.logger.warning(
+                    f"Stopping generation for ModelCall {model_call_obj.id}: {parser.stop_reason}"
+                )
+                return False
+            return watcher.feed(delta)
+
+        try:
+            if self.concurrency_limiter:
+                with ConcurrencyContext(
+                    self.concurrency_limiter, timeout=30.0
+                ) as concurrency:
+                    text = stream_litellm_completion(
+                        on_delta,
+                        on_response=concurrency.observe_response,
+                        **completion_args,
+                    )
+            else:
+                text = stream_litellm_completion(on_delta, **completion_args)
+        except Exception:
+            # A retry starts clean, and a failed call leaves no detections
+            self._discard_streamed_identifications(model_call_obj)
+            raise
+
+        if parser.stop_reason:
+            return parser.result().model_dump_json()
+        assert text, "Streamed response was empty"
+        return text
+
+    def _record_streamed_predictions(
+        self,
+        model_call: ModelCall,
+        predictions: List[AdSegmentPrediction],
+        chunk_segments: List[TranscriptSegment],
+    ) -> None:
+        """Best-effort early write of streamed detections; the final pass is authoritative."""
+        try:
+            self._create_identifications(
+                prediction_list=AdSegmentPredictionList(ad_segments=predictions),
+                current_chunk_db_segments=chunk_segments,
+                model_call=model_call,
+            )
+            self._streamed_model_call_ids.add(model_call.id)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.warning(
+                f"Could not record streamed predictions for ModelCall {model_call.id}: {e}"
+            )
+
+    def _streamed_rows(self, model_call: ModelCall) -> List[Identification]:
+        """Forget `model_call` as streamed and return the rows it recorded."""
+        self._streamed_model_call_ids.discard(model_call.id)
+        rows = (
+            self.db_session.query(Identification)
+            .filter(
+                Identification.model_call_id == model_call.id,
+                Identification.label == "ad",
+            )
+            .all()
+        )
+        if self._identification_index is not None:
+            self._identification_index.discard_identifications(rows)
+        return rows
+
+    def _replace_streamed_identifications(
+        self,
+        *,
+        prediction_list: AdSegmentPredictionList,
+        current_chunk_db_segments: List[TranscriptSegment],
+        model_call: ModelCall,
+    ) -> Tuple[int, List[TranscriptSegment]]:
+        """Make the final response authoritative over detections recorded mid-stream.
+
+        Streamed rows were written before `content_type` was known and may
+        include predictions the completed response dropped, so all of the
+        model call's rows are replaced by the final list in one write.
+        """
+        rows = self._streamed_rows(model_call)
+        to_insert, matched_segments = self._identification_rows(
+            prediction_list=prediction_list,
+            current_chunk_db_segments=current_chunk_db_segments,
+            model_call=model_call,
+            exclude_model_call_id=model_call.id,
+        )
+        self._write_streamed_replacement(model_call, rows, to_insert)
+        return len(to_insert), matched_segments
+
+    def _discard_streamed_identifications(self, model_call: ModelCall) -> None:
+        """Delete the detections a failed streamed call recorded (best effort)."""
+        if model_call.id not in self._streamed_model_call_ids:
+            return
+        try:
+            rows = self._streamed_rows(model_call)
+            self._write_streamed_replacement(model_call, rows, [])
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.warning(
+                f"Could not discard streamed predictions for ModelCall {model_call.id}: {e}"
+            )
+
+    def _write_streamed_replacement(
+        self,
+        model_call: ModelCall,
+        rows: List[Identification],
+        new_identifications: List[Dict[str, Any]],
+    ) -> None:
+        if not rows and not new_identifications:
+            return
+        res = writer_client.action(
+            "replace_identifications",
+            {
+                "delete_ids": [row.id for row in rows],
+                "new_identifications": new_identifications,
+            },
+            wait=True,
+        )
+        if not res or not res.success:
+            raise RuntimeError(
+                getattr(
+                    res,
+                    "error",
+                    f"Failed to replace identifications for ModelCall {model_call.id}",
+                )
+            )
+        if self._identification_index is not None:
+            self._identification_index.add_rows(new_identifications)
+        self.db_session.expire_all()
+
     def _handle_retryable_error(
         self,
         *,
@@ -1116,25 +1971,31 @@ class AdClassifier:
         error: Union[InternalServerError, Exception],
         attempt: int,
         current_attempt_num: int,
-    ) -> None:
-        """Handle a retryable error during LLM call."""
+        status_buffer: Optional[ModelCallStatusBuffer] = None,
+        deadline: Optional[float] = None,
+    ) -> bool:
+        """Handle a retryable error during LLM call.
+
+        Returns False without waiting when the backoff would run past `deadline`.
+        """
         self.logger.error(
             f"LLM retryable error for ModelCall {model_call_obj.id} (attempt {current_attempt_num}): {error}"
         )
-        res = writer_client.update(
-            "ModelCall",
-            model_call_obj.id,
-            {"error_message": str(error)},
-            wait=True,
-        )
-        if not res or not res.success:
-            raise RuntimeError(getattr(res, "error", "Failed to update ModelCall"))
-        # Update local object to reflect database state
-        model_call_obj.error_message = str(error)
+        # Kept in memory; written with the final status (or a heartbeat)
+        if status_buffer is not None:
+            status_buffer.record_error(str(error))
+        else:
+            model_call_obj.error_message = str(error)
 
-        # Use longer backoff for rate limiting errors
+        # Honor the provider's Retry-After, else use longer backoff for rate limiting
+        retry_after = LLMErrorClassifier.get_retry_after(error)
         error_str = str(error).lower()
-        if any(
+        if retry_after is not None:
+            wait_time = min(retry_after, MAX_PROVIDER_PAUSE_SECONDS)
+            self.logger.info(
+                f"Provider asked to retry after {wait_time:.1f}s for ModelCall {model_call_obj.id}."
+            )
+        elif any(
             term in error_str
             for term in ["rate_limit_error", "ratelimiterror", "429", "rate limit"]
         ):
@@ -1150,13 +2011,17 @@ class AdClassifier:
                 f"Waiting {wait_time}s before next retry for ModelCall {model_call_obj.id}."
             )
 
+        if deadline is not None and time.monotonic() + wait_time >= deadline:
+            return False
         time.sleep(wait_time)
+        return True
 
     def _handle_retry_exhausted(
         self,
         model_call_obj: ModelCall,
         max_retries: int,
         last_error: Optional[Exception],
+        status_buffer: Optional[ModelCallStatusBuffer] = None,
     ) -> None:
         """Handle the case when all retries are exhausted."""
         self.logger.error(
@@ -1167,6 +2032,10 @@ class AdClassifier:
         else:
             error_message = f"Maximum retries ({max_retries}) exceeded without a specific InternalServerError."
 
+        if status_buffer is not None:
+            status_buffer.finish("failed_retries", error_message=error_message)
+            return
+
         res = writer_client.update(
             "ModelCall",
             model_call_obj.id,
@@ -1208,6 +2077,8 @@ class AdClassifier:
 
         NOTE: Uses self.db_session.query() for session consistency.
         """
+        if self._identification_index is not None:
+            return self._identification_index.keys_for_model_call(model_call_id)
         ids = (
             self.db_session.query(Identification)
             .join(TranscriptSegment)
@@ -1236,6 +2107,8 @@ class AdClassifier:
             raise RuntimeError(
                 getattr(res, "error", "Failed to insert identifications")
             )
+        if self._identification_index is not None:
+            self._identification_index.add_rows(identifications)
         return int((res.data or {}).get("inserted") or 0)
 
     def expand_neighbors_bulk(
@@ -1244,11 +2117,42 @@ class AdClassifier:
         model_call: ModelCall,
         post_id: int,
         window: int = 5,
+        timeline: Optional[SegmentTimeline] = None,
     ) -> int:
         """Expand neighbors using bulk operations (3 queries instead of 900)"""
 
-        # PHASE 1: Bulk data collection (2 queries)
+        # Query 1: Bulk fetch existing identifications
+        existing = self._get_existing_ids_bulk(post_id, model_call.id)
+
+        if HAS_NUMPY:
+            if timeline is None:
+                timeline = SegmentTimeline.from_segments(
+                    self.db_session.query(TranscriptSegment)
+                    .filter(TranscriptSegment.post_id == post_id)
+                    .all()
+                )
+            to_create = self._neighbor_rows_vectorized(
+                ad_identifications, model_call, existing, timeline, window
+            )
+        else:
+            to_create = self._neighbor_rows_loop(
+                ad_identifications, model_call, existing, post_id, window
+            )
+
+        # Bulk insert (1 query)
+        if to_create:
+            return self._create_identifications_bulk(to_create)
+        return 0
 
+    def _neighbor_rows_loop(
+        self,
+        ad_identifications: List[Identification],
+        model_call: ModelCall,
+        existing: Set[Tuple[int, int, str]],
+        post_id: int,
+        window: int,
+    ) -> List[Dict[str, Any]]:
+        """List-based neighbor expansion, used when NumPy is unavailable."""
         # Collect all sequence numbers we need
         sequence_numbers = set()
         for ident in ad_identifications:
@@ -1256,14 +2160,9 @@ class AdClassifier:
             for offset in range(-window, window + 1):
                 sequence_numbers.add(base_seq + offset)
 
-        # Query 1: Bulk fetch segments
+        # Bulk fetch segments
         segments_by_seq = self._get_segments_bulk(post_id, list(sequence_numbers))
 
-        # Query 2: Bulk fetch existing identifications
-        existing = self._get_existing_ids_bulk(post_id, model_call.id)
-
-        # PHASE 2: In-memory processing (0 queries)
-
         to_create = []
         for ident in ad_identifications:
             base_seq = ident.transcript_segment.sequence_num
@@ -1321,12 +2220,80 @@ class AdClassifier:
                     }
                 )
                 existing.add(key)  # Avoid duplicates in this batch
+        return to_create
 
-        # PHASE 3: Bulk insert (1 query)
+    def _neighbor_rows_vectorized(
+        self,
+        ad_identifications: List[Identification],
+        model_call: ModelCall,
+        existing: Set[Tuple[int, int, str]],
+        timeline: SegmentTimeline,
+        window: int,
+    ) -> List[Dict[str, Any]]:
+        """Array version of `_neighbor_rows_loop`; produces the same rows."""
+        base_pos, found = timeline.positions_of_ids(
+            [ident.transcript_segment_id for ident in ad_identifications]
+        )
+        base_pos = base_pos[found]
+        base_index, neighbor_pos = timeline.neighbor_pairs(base_pos, window)
+
+        labelled = np.fromiter(
+            (
+                seg_id
+                for seg_id, mc_id, label in existing
+                if mc_id == model_call.id and label == "ad"
+            ),
+            dtype=np.int64,
+        )
+        keep = ~np.isin(timeline.ids[neighbor_pos], labelled)
+        base_index, neighbor_pos = base_index[keep], neighbor_pos[keep]
+        if neighbor_pos.size == 0:
+            return []
 
-        if to_create:
-            return self._create_identifications_bulk(to_create)
-        return 0
+        # Cue detection is regex work; run it once per distinct neighbor.
+        unique_pos, inverse = np.unique(neighbor_pos, return_inverse=True)
+        signals = [self.cue_detector.analyze(timeline.texts[p]) for p in unique_pos]
+        strong = np.array(
+            [s["url"] or s["promo"] or s["phone"] or s["cta"] for s in signals],
+            dtype=bool,
+        )[inverse]
+        transition = np.array([s["transition"] for s in signals], dtype=bool)[inverse]
+        self_promo = np.array([s["self_promo"] for s in signals], dtype=bool)[inverse]
+
+        gaps = np.abs(
+            timeline.starts[neighbor_pos] - timeline.starts[base_pos[base_index]]
+        )
+        near = gaps <= 10.0
+
+        # Mirrors _should_expand_neighbor / _neighbor_confidence
+        if self.config.enable_boundary_refinement:
+            expand = strong | transition | near
+        else:
+            expand = strong
+        confidence = np.where(transition, 0.72, 0.75)
+        confidence = np.where(strong, np.where(near, 0.85, 0.8), confidence)
+        confidence = np.where(
+            self_promo, np.maximum(0.5, confidence - 0.25), confidence
+        )
+
+        # First passing (identification, offset) pair wins for each segment.
+        candidates = np.flatnonzero(expand)
+        _, first = np.unique(neighbor_pos[candidates], return_index=True)
+        chosen = candidates[np.sort(first)]
+
+        rows = []
+        for idx in chosen:
+            seg_id = int(timeline.ids[neighbor_pos[idx]])
+            rows.append(
+                {
+                    "transcript_segment_id": seg_id,
+                    "model_call_id": model_call.id,
+                    "label": "ad",
+                    "confidence": float(confidence[idx]),
+                }
+            )
+            existing.add((seg_id, model_call.id, "ad"))
+        return rows
 
     def _should_expand_neighbor(
         self,
@@ -1359,7 +2326,10 @@ class AdClassifier:
         return confidence
 
     def _refine_boundaries(
-        self, transcript_segments: List[TranscriptSegment], post: Post
+        self,
+        transcript_segments: List[TranscriptSegment],
+        post: Post,
+        timeline: Optional[SegmentTimeline] = None,
     ) -> None:
         """Apply boundary refinement to detected ads.
 
@@ -1381,59 +2351,77 @@ class AdClassifier:
         )
 
         # Group into ad blocks
-        ad_blocks = self._group_into_blocks(identifications)
+        if timeline is None and HAS_NUMPY:
+            timeline = SegmentTimeline.from_segments(transcript_segments)
+        ad_blocks = self._group_into_blocks(identifications, timeline)
 
+        all_segments = [
+            {
+                "sequence_num": s.sequence_num,
+                "start_time": s.start_time,
+                "text": s.text,
+                "end_time": s.end_time,
+            }
+            for s in transcript_segments
+        ]
+        requests: List[Tuple[Dict[str, Any], ModelCall, Dict[str, Any]]] = []
         for block in ad_blocks:
             # Skip low confidence or very short blocks
             if block["confidence"] < 0.6 or (block["end"] - block["start"]) < 15.0:
                 continue
+            # Refined rows are attributed to the block's first model call
+            model_call = (
+                block["identifications"][0].model_call
+                if block["identifications"]
+                else None
+            )
+            if not model_call:
+                continue
 
-            # Refine
             seq_nums = [
                 ident.transcript_segment.sequence_num
                 for ident in block["identifications"]
                 if ident.transcript_segment is not None
             ]
+            refine_kwargs = {
+                "ad_start": block["start"],
+                "ad_end": block["end"],
+                "confidence": block["confidence"],
+                "all_segments": all_segments,
+                "post_id": post.id,
+                "first_seq_num": min(seq_nums) if seq_nums else None,
+                "last_seq_num": max(seq_nums) if seq_nums else None,
+            }
+            requests.append((block, model_call, refine_kwargs))
 
-            refinement = self.boundary_refiner.refine(
-                ad_start=block["start"],
-                ad_end=block["end"],
-                confidence=block["confidence"],
-                all_segments=[
-                    {
-                        "sequence_num": s.sequence_num,
-                        "start_time": s.start_time,
-                        "text": s.text,
-                        "end_time": s.end_time,
-                    }
-                    for s in transcript_segments
-                ],
-                post_id=post.id,
-                first_seq_num=min(seq_nums) if seq_nums else None,
-                last_seq_num=max(seq_nums) if seq_nums else None,
-            )
+        refinements = self._run_refinements([kwargs for _, _, kwargs in requests])
 
-            # Apply refinement: delete old identifications, create new ones
-            # Note: Get model_call from block identifications
-            model_call = (
-                block["identifications"][0].model_call
-                if block["identifications"]
-                else None
+        # Applied in block order, then written as a single replace
+        delete_ids: List[int] = []
+        new_identifications: List[Dict[str, Any]] = []
+        refined_blocks: List[Dict[str, Any]] = []
+        for (block, model_call, _), refinement in zip(requests, refinements):
+            if refinement is None:
+                continue
+            block_delete_ids, block_rows = self._refined_identification_rows(
+                block, refinement, transcript_segments, model_call
+            )
+            delete_ids.extend(block_delete_ids)
+            new_identifications.extend(block_rows)
+            refined_blocks.append(block)
+            refined_boundaries.append(
+                {
+                    "orig_start": float(block["start"]),
+                    "orig_end": float(block["end"]),
+                    "refined_start": float(refinement.refined_start),
+                    "refined_end": float(refinement.refined_end),
+                    "confidence": float(block.get("confidence", 0.0) or 0.0),
+                }
+            )
+        if refined_blocks:
+            self._replace_refined_identifications(
+                refined_blocks, delete_ids, new_identifications
             )
-            if model_call:
-                self._apply_refinement(
-                    block, refinement, transcript_segments, post, model_call
-                )
-
-                refined_boundaries.append(
-                    {
-                        "orig_start": float(block["start"]),
-                        "orig_end": float(block["end"]),
-                        "refined_start": float(refinement.refined_start),
-                        "refined_end": float(refinement.refined_end),
-                        "confidence": float(block.get("confidence", 0.0) or 0.0),
-                    }
-                )
 
         # Store latest refined boundaries on the post so audio processing can cut
         # using refined timestamps (including word-level refined start times).
@@ -1462,12 +2450,23 @@ class AdClassifier:
             )
 
     def _group_into_blocks(
-        self, identifications: List[Identification]
+        self,
+        identifications: List[Identification],
+        timeline: Optional[SegmentTimeline] = None,
     ) -> List[Dict[str, Any]]:
         """Group adjacent identifications into ad blocks"""
         if not identifications:
             return []
 
+        if timeline is not None:
+            positions, found = timeline.positions_of_ids(
+                [i.transcript_segment_id for i in identifications]
+            )
+            if found.all():
+                return self._group_into_blocks_vectorized(
+                    identifications, timeline, positions
+                )
+
         identifications = sorted(
             identifications, key=lambda i: i.transcript_segment.start_time
         )
@@ -1491,6 +2490,37 @@ class AdClassifier:
 
         return blocks
 
+    @staticmethod
+    def _group_into_blocks_vectorized(
+        identifications: List[Identification],
+        timeline: SegmentTimeline,
+        positions: Any,
+    ) -> List[Dict[str, Any]]:
+        order = np.argsort(timeline.starts[positions], kind="stable")
+        starts = timeline.starts[positions][order]
+        ends = timeline.ends[positions][order]
+        confidences = np.array(
+            [identifications[i].confidence for i in order], dtype=np.float64
+        )
+
+        runs = group_adjacent(starts, ends, max_gap=10.0)
+        firsts = np.array([lo for lo, _ in runs], dtype=np.int64)
+        sizes = np.array([hi - lo for lo, hi in runs], dtype=np.float64)
+        block_starts = np.minimum.reduceat(starts, firsts).tolist()
+        block_ends = np.maximum.reduceat(ends, firsts).tolist()
+        block_confidences = (np.add.reduceat(confidences, firsts) / sizes).tolist()
+        ordered = [identifications[i] for i in order]
+
+        return [
+            {
+                "start": block_starts[n],
+                "end": block_ends[n],
+                "confidence": block_confidences[n],
+                "identifications": ordered[lo:hi],
+            }
+            for n, (lo, hi) in enumerate(runs)
+        ]
+
     def _create_block(self, identifications: List[Identification]) -> Dict[str, Any]:
         return {
             "start": min(i.transcript_segment.start_time for i in identifications),
@@ -1500,15 +2530,63 @@ class AdClassifier:
             "identifications": identifications,
         }
 
-    def _apply_refinement(
+    def _run_refinements(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """Refine every block concurrently; results come back in request order.
+
+        A block whose refinement could not run gets None and keeps its
+        identifications.
+        """
+        if not requests:
+            return []
+        limiter = self.concurrency_limiter
+        max_workers = limiter.max_concurrent_calls if limiter else len(requests)
+        app = (
+            current_app._get_current_object()  # type: ignore[attr-defined]
+            if has_app_context()
+            else None
+        )
+
+        def refine(kwargs: Dict[str, Any]) -> Any:
+            if app is None:
+                return self._refine_block(kwargs)
+            with app.app_context():
+                return self._refine_block(kwargs)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(requests)),
+            thread_name_prefix="boundary-refine",
+        ) as pool:
+            futures = [pool.submit(refine, kwargs) for kwargs in requests]
+            results: List[Any] = []
+            for kwargs, future in zip(requests, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    self.logger.warning(
+                        f"Boundary refinement for {kwargs['ad_start']:.1f}s-"
+                        f"{kwargs['ad_end']:.1f}s of post {kwargs['post_id']} failed: {e}"
+                    )
+                    results.append(None)
+        return results
+
+    def _refine_block(self, kwargs: Dict[str, Any]) -> Any:
+        assert self.boundary_refiner is not None
+        # The async executor limits non-streaming calls itself
+        if self.concurrency_limiter and (
+            self.config.llm_enable_streaming or not self.async_executor
+        ):
+            with ConcurrencyContext(self.concurrency_limiter, timeout=30.0):
+                return self.boundary_refiner.refine(**kwargs)
+        return self.boundary_refiner.refine(**kwargs)
+
+    def _refined_identification_rows(
         self,
         block: Dict[str, Any],
         refinement: Any,
         transcript_segments: List[TranscriptSegment],
-        post: Post,
         model_call: ModelCall,
-    ) -> None:
-        """Update identifications based on refined boundaries"""
+    ) -> Tuple[List[int], List[Dict[str, Any]]]:
+        """Identification ids to delete and rows to insert for a refined block"""
         delete_ids = [
             i.id
             for i in block.get("identifications", [])
@@ -1532,7 +2610,24 @@ class AdClassifier:
                         "confidence": block["confidence"],
                     }
                 )
+        return delete_ids, new_identifications
 
+    def _replace_refined_identifications(
+        self,
+        blocks: List[Dict[str, Any]],
+        delete_ids: List[int],
+        new_identifications: List[Dict[str, Any]],
+    ) -> None:
+        """Write every refined block with one replace_identifications action"""
+        # Refined windows of neighbouring blocks can overlap; the writer does
+        # not dedupe, so keep one row per segment and label
+        rows_by_key: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+        for row in new_identifications:
+            key = (row["transcript_segment_id"], row["label"])
+            kept = rows_by_key.get(key)
+            if kept is None or row["confidence"] > kept["confidence"]:
+                rows_by_key[key] = row
+        new_identifications = list(rows_by_key.values())
         res = writer_client.action(
             "replace_identifications",
             {"delete_ids": delete_ids, "new_identifications": new_identifications},
@@ -1542,3 +2637,9 @@ class AdClassifier:
             raise RuntimeError(
                 getattr(res, "error", "Failed to replace identifications")
             )
+        if self._identification_index is not None:
+            for block in blocks:
+                self._identification_index.discard_identifications(
+                    block.get("identifications", [])
+                )
+            self._identification_index.add_rows(new_identifications)
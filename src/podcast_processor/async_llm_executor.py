@@ -0,0 +1,262 @@
+"""
+Asyncio execution core for LLM calls.
+
+A single event loop runs on a dedicated daemon thread and issues
+`litellm.acompletion` requests. Synchronous callers (the processor worker,
+boundary refiners) hand requests to the loop and block on a future, so many
+requests can be in flight from one worker thread without a thread per call.
+Concurrency is bounded by an adaptive (AIMD) limit fed by each call's outcome,
+and token rate limiting waits with `asyncio.sleep` instead of blocking the loop.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+import litellm
+
+from podcast_processor.llm_concurrency_limiter import (
+    AIMDController,
+    adaptive_max_concurrent_calls,
+)
+from podcast_processor.token_rate_limiter import TokenRateLimiter
+from shared.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLLMExecutor:
+    """Runs LLM completions on a dedicated event-loop thread."""
+
+    def __init__(
+        self, max_concurrent_calls: int, adaptive_max_calls: Optional[int] = None
+    ):
+        if max_concurrent_calls <= 0:
+            raise ValueError("max_concurrent_calls must be greater than 0")
+
+        self.max_concurrent_calls = max_concurrent_calls
+        self.controller = AIMDController(max_concurrent_calls, adaptive_max_calls)
+        self.adaptive_max_calls = self.controller.maximum
+        self._loop = asyncio.new_event_loop()
+        self._slot_released = asyncio.Condition()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        # Submissions not yet finished, counted from the caller's thread so a
+        # retired executor never stops with work still queued
+        self._pending = 0
+        self._retired = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="llm-event-loop", daemon=True
+        )
+        self._thread.start()
+
+        logger.info(
+            f"Async LLM executor started with {max_concurrent_calls} max concurrent calls"
+            f" (adaptive up to {self.adaptive_max_calls})"
+        )
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _wait_for_rate_limit(
+        self, rate_limiter: TokenRateLimiter, messages: List[Dict[str, str]], model: str
+    ) -> None:
+        """Async counterpart of TokenRateLimiter.wait_if_needed."""
+        while True:
+            # Checks and records atomically, so concurrent coroutines (and
+            # other processes sharing the budget) cannot claim the same tokens.
+            can_proceed, wait_seconds = rate_limiter.try_acquire(messages, model)
+            if can_proceed:
+                return
+            # Never spin when the store reports no wait
+            wait_seconds = max(wait_seconds, 0.1)
+            logger.info(
+                f"Rate limiting: waiting {wait_seconds:.1f}s to avoid API limits"
+            )
+            await asyncio.sleep(wait_seconds)
+
+    async def acomplete(
+        self, rate_limiter: Optional[TokenRateLimiter] = None, **completion_args: Any
+    ) -> Any:
+        """Await a completion under the executor's concurrency and rate limits."""
+        if rate_limiter is not None:
+            await self._wait_for_rate_limit(
+                rate_limiter,
+                completion_args.get("messages", []),
+                completion_args.get("model", ""),
+            )
+
+        await self._acquire_slot()
+        try:
+            response = await litellm.acompletion(**completion_args)
+        except Exception as e:
+            self.controller.on_error(e)
+            raise
+        else:
+            # Before the slot is released, so waiters see the new limit
+            self.controller.on_response(response)
+        finally:
+            await self._release_slot()
+        return response
+
+    async def _acquire_slot(self) -> None:
+        # Slots are only taken and released on the loop thread, so the
+        # in-flight count needs no lock of its own. Checking it under the
+        # condition means a release can't slip in between check and wait.
+        async with self._slot_released:
+            while True:
+                pause = self.controller.pause_remaining()
+                if pause > 0:
+                    try:
+                        await asyncio.wait_for(self._slot_released.wait(), pause)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                if self._in_flight < self.controller.limit:
+                    break
+                await self._slot_released.wait()
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    async def _release_slot(self) -> None:
+        self._in_flight -= 1
+        async with self._slot_released:
+            self._slot_released.notify_all()
+
+    def submit(
+        self, rate_limiter: Optional[TokenRateLimiter] = None, **completion_args: Any
+    ) -> "concurrent.futures.Future[Any]":
+        """Schedule a completion from any thread and return a future for it.
+
+        A retired executor hands new work to the one that replaced it.
+        """
+        with self._lock:
+            successor = _ASYNC_EXECUTOR if self._retired else None
+            if successor is self:
+                successor = None
+            if successor is None:
+                # Counted before scheduling, so the loop can't be stopped first
+                self._pending += 1
+        if successor is not None:
+            return successor.submit(rate_limiter=rate_limiter, **completion_args)
+        future = asyncio.run_coroutine_threadsafe(
+            self.acomplete(rate_limiter=rate_limiter, **completion_args), self._loop
+        )
+        future.add_done_callback(self._submission_done)
+        return future
+
+    def _submission_done(self, _future: "concurrent.futures.Future[Any]") -> None:
+        with self._lock:
+            self._pending -= 1
+            if self._retired and self._pending == 0:
+                self._stop_when_drained()
+
+    def retire(self) -> None:
+        """Stop the loop thread once the work already submitted finishes."""
+        with self._lock:
+            if self._retired:
+                return
+            self._retired = True
+            if self._pending == 0:
+                self._stop_when_drained()
+
+    def _stop_when_drained(self) -> None:
+        # A cancelled request's future is done before its task has unwound,
+        # so wait for every task on the loop before stopping it
+        async def drain_and_stop() -> None:
+            current = asyncio.current_task()
+            tasks = [task for task in asyncio.all_tasks() if task is not current]
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            asyncio.get_running_loop().stop()
+
+        asyncio.run_coroutine_threadsafe(drain_and_stop(), self._loop)
+
+    def complete(
+        self,
+        rate_limiter: Optional[TokenRateLimiter] = None,
+        timeout: Optional[float] = None,
+        **completion_args: Any,
+    ) -> Any:
+        """Blocking completion for synchronous callers."""
+        return self.submit(rate_limiter=rate_limiter, **completion_args).result(
+            timeout=timeout
+        )
+
+    def complete_many(
+        self,
+        requests: List[Dict[str, Any]],
+        rate_limiter: Optional[TokenRateLimiter] = None,
+    ) -> List[Any]:
+        """Run many completions concurrently.
+
+        Returns results in request order; failed requests yield their exception
+        instead of raising so one bad call does not discard the others.
+        """
+        futures = [self.submit(rate_limiter=rate_limiter, **req) for req in requests]
+        results: List[Any] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                results.append(e)
+        return results
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "max_concurrent_calls": self.max_concurrent_calls,
+            "concurrency_limit": self.controller.limit,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+        }
+
+    def shutdown(self) -> None:
+        if self._loop.is_closed():
+            return  # already stopped after being retired
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5.0)
+
+
+# Global executor instance
+_ASYNC_EXECUTOR: Optional[AsyncLLMExecutor] = None  # pylint: disable=invalid-name
+_ASYNC_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_async_llm_executor(
+    max_concurrent_calls: int = 3, adaptive_max_calls: Optional[int] = None
+) -> AsyncLLMExecutor:
+    """Get or create the global async executor instance."""
+    global _ASYNC_EXECUTOR  # pylint: disable=global-statement
+    with _ASYNC_EXECUTOR_LOCK:
+        if (
+            _ASYNC_EXECUTOR is None
+            or _ASYNC_EXECUTOR.max_concurrent_calls != max_concurrent_calls
+            or (
+                adaptive_max_calls is not None
+                and _ASYNC_EXECUTOR.adaptive_max_calls
+                != max(max_concurrent_calls, adaptive_max_calls)
+            )
+        ):
+            # A replaced executor keeps its loop running until the calls
+            # already submitted to it complete, then its thread exits.
+            previous = _ASYNC_EXECUTOR
+            _ASYNC_EXECUTOR = AsyncLLMExecutor(max_concurrent_calls, adaptive_max_calls)
+            if previous is not None:
+                previous.retire()
+        return _ASYNC_EXECUTOR
+
+
+def get_executor_for_config(config: Config) -> Optional[AsyncLLMExecutor]:
+    """Return the shared executor when async execution is enabled in config."""
+    if not config.llm_enable_async_execution:
+        return None
+    max_concurrent_calls = max(1, config.llm_max_concurrent_calls)
+    return get_async_llm_executor(
+        max_concurrent_calls,
+        max(max_concurrent_calls, adaptive_max_concurrent_calls(config)),
+    )
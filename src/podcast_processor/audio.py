@@ -1,14 +1,39 @@
+import csv
 import logging
 import math
 import os
+import re
 import tempfile
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import ffmpeg  # type: ignore[import-untyped]
 
 logger = logging.getLogger("global_logger")
 
+# Chunk cuts are moved back to the longest pause found within this window
+# before the size-based target (at most a quarter of a chunk), so remote
+# transcription chunks end between words rather than mid-word.
+SILENCE_SEARCH_WINDOW_MS = 30_000
+SILENCE_NOISE_DB = -30
+MIN_SILENCE_MS = 250
+
+# Speech recognition runs on 16 kHz mono, so remote transcription chunks can
+# be re-encoded to that before upload: several times smaller than typical
+# 128-320 kbps stereo episodes, meaning fewer chunks and faster uploads.
+SPEECH_SAMPLE_RATE = 16_000
+SPEECH_ENCODINGS: Dict[str, Dict[str, Any]] = {
+    "mp3": {"suffix": ".mp3", "acodec": "libmp3lame", "audio_bitrate": "32k"},
+    "opus": {
+        "suffix": ".ogg",
+        "acodec": "libopus",
+        "audio_bitrate": "24k",
+        "application": "voip",
+    },
+}
+
+_SILENCE_RE = re.compile(r"silence_(start|end): (-?\d+(?:\.\d+)?)")
+
 
 def get_audio_duration_ms(file_path: str) -> Optional[int]:
     try:
@@ -201,13 +226,193 @@ def trim_file(in_path: Path, out_path: Path, start_ms: int, end_ms: int) -> None
     )
 
 
+def parse_silencedetect_output(
+    stderr: str, start_ms: int = 0, end_ms: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """(start_ms, end_ms) silences from ffmpeg silencedetect log lines.
+
+    Times in the log are relative to `start_ms`; a silence still open when
+    the input ends is closed at `end_ms` (or dropped if that is unknown).
+    """
+    silences: List[Tuple[int, int]] = []
+    silence_start: Optional[int] = None
+    for kind, seconds in _SILENCE_RE.findall(stderr):
+        at_ms = start_ms + max(0, round(float(seconds) * 1000))
+        if kind == "start":
+            silence_start = at_ms
+        elif silence_start is not None:
+            silences.append((silence_start, at_ms))
+            silence_start = None
+    if silence_start is not None and end_ms is not None and end_ms > silence_start:
+        silences.append((silence_start, end_ms))
+    return silences
+
+
+def detect_silences(
+    file_path: str,
+    start_ms: int = 0,
+    end_ms: Optional[int] = None,
+    *,
+    noise_db: int = SILENCE_NOISE_DB,
+    min_silence_ms: int = MIN_SILENCE_MS,
+) -> List[Tuple[int, int]]:
+    """Silences between start_ms and end_ms, found with ffmpeg silencedetect."""
+    input_kwargs = {"ss": start_ms / 1000.0}
+    if end_ms is not None:
+        input_kwargs["t"] = (end_ms - start_ms) / 1000.0
+    logger.debug(
+        "[FFMPEG_SILENCE] Scanning %s from %d to %s ms", file_path, start_ms, end_ms
+    )
+    _, stderr = (
+        ffmpeg.input(file_path, **input_kwargs)
+        .filter("silencedetect", noise=f"{noise_db}dB", d=min_silence_ms / 1000.0)
+        .output("-", format="null")
+        .run(capture_stdout=True, capture_stderr=True)
+    )
+    return parse_silencedetect_output(stderr.decode(errors="replace"), start_ms, end_ms)
+
+
+def choose_chunk_boundaries(
+    duration_ms: int,
+    chunk_duration_ms: int,
+    silences: Optional[List[Tuple[int, int]]] = None,
+) -> List[int]:
+    """Chunk start offsets plus the final end: [0, cut_1, ..., duration_ms].
+
+    Each cut defaults to `chunk_duration_ms` after the previous one. Given the
+    file's `silences` (from one detect_silences pass), it moves back to the
+    middle of the longest silence in the window before that target; cuts
+    never move later, so chunks stay within the size budget.
+    """
+    window_ms = min(SILENCE_SEARCH_WINDOW_MS, chunk_duration_ms // 4)
+    boundaries = [0]
+    while duration_ms - boundaries[-1] > chunk_duration_ms:
+        target_ms = boundaries[-1] + chunk_duration_ms
+        cut_ms = target_ms
+        if silences and window_ms > 0:
+            # Silences overlapping the window, clipped to it
+            nearby = [
+                (max(start, target_ms - window_ms), min(end, target_ms))
+                for start, end in silences
+            ]
+            nearby = [(start, end) for start, end in nearby if end > start]
+            if nearby:
+                start, end = max(nearby, key=lambda s: (s[1] - s[0], s[1]))
+                cut_ms = (start + end) // 2
+        boundaries.append(cut_ms)
+    boundaries.append(duration_ms)
+    return boundaries
+
+
+def transcode_for_speech(in_path: Path, out_dir: Path, upload_format: str) -> Path:
+    """Re-encode `in_path` as 16 kHz mono `upload_format` (see SPEECH_ENCODINGS)."""
+    encoding = dict(SPEECH_ENCODINGS[upload_format])
+    out_path = out_dir / f"speech{encoding.pop('suffix')}"
+    logger.info(
+        "[FFMPEG_TRANSCODE] Transcoding %s to 16 kHz mono %s: %s",
+        in_path,
+        upload_format,
+        out_path,
+    )
+    (
+        ffmpeg.input(str(in_path))
+        .output(str(out_path), ac=1, ar=SPEECH_SAMPLE_RATE, vn=None, **encoding)
+        .overwrite_output()
+        .run(capture_stderr=True)
+    )
+    logger.info(
+        "[FFMPEG_TRANSCODE] %d bytes -> %d bytes",
+        in_path.stat().st_size,
+        out_path.stat().st_size,
+    )
+    return out_path
+
+
+def segment_audio(
+    in_path: Path, out_dir: Path, cut_points_ms: List[int]
+) -> List[Tuple[Path, int]]:
+    """Write `out_dir`/0.mp3, 1.mp3, ... cut at `cut_points_ms` in one ffmpeg pass.
+
+    Chunks keep the input's extension when it has one (e.g. 0.ogg).
+
+    Streams are copied, so each cut lands on the next packet boundary; the
+    returned (path, start_ms) pairs are the offsets ffmpeg actually used.
+    """
+    list_path = out_dir / "segments.csv"
+    output_kwargs: Dict[str, Any] = {
+        "f": "segment",
+        "segment_list": str(list_path),
+        "segment_list_type": "csv",
+        "reset_timestamps": 1,
+        "acodec": "copy",
+        "vn": None,
+    }
+    if cut_points_ms:
+        output_kwargs["segment_times"] = ",".join(
+            f"{cut_ms / 1000.0:.3f}" for cut_ms in cut_points_ms
+        )
+
+    logger.debug(
+        "[FFMPEG_SEGMENT] Segmenting %s at %s ms", in_path, cut_points_ms or "none"
+    )
+    (
+        ffmpeg.input(str(in_path))
+        .output(str(out_dir / f"%d{in_path.suffix or '.mp3'}"), **output_kwargs)
+        .overwrite_output()
+        .run(capture_stderr=True)
+    )
+
+    chunks: List[Tuple[Path, int]] = []
+    with open(list_path, encoding="utf-8") as segment_list:
+        for row in csv.reader(segment_list):
+            if row:
+                chunks.append((out_dir / row[0], round(float(row[1]) * 1000)))
+    list_path.unlink()
+    return chunks
+
+
+def _trim_chunks(
+    in_path: Path, out_dir: Path, boundaries: List[int]
+) -> List[Tuple[Path, int]]:
+    """One ffmpeg run per chunk; slower fallback for segment_audio."""
+    chunks: List[Tuple[Path, int]] = []
+    num_chunks = len(boundaries) - 1
+    for i, (start_offset_ms, end_offset_ms) in enumerate(
+        zip(boundaries, boundaries[1:])
+    ):
+        export_path = out_dir / f"{i}{in_path.suffix or '.mp3'}"
+        logger.debug(
+            "[FFMPEG_SPLIT] Creating chunk %d/%d: %s", i + 1, num_chunks, export_path
+        )
+        trim_file(in_path, export_path, start_offset_ms, end_offset_ms)
+        chunks.append((export_path, start_offset_ms))
+    return chunks
+
+
 def split_audio(
     audio_file_path: Path,
     audio_chunk_path: Path,
     chunk_size_bytes: int,
+    *,
+    cut_at_silence: bool = True,
+    upload_format: str = "original",
 ) -> List[Tuple[Path, int]]:
+    """Cut audio into chunks of at most about `chunk_size_bytes`.
 
+    With an `upload_format` other than "original", the audio is first
+    transcoded for speech (transcode_for_speech) and that file is split.
+    """
     audio_chunk_path.mkdir(parents=True, exist_ok=True)
+    if upload_format != "original":
+        try:
+            audio_file_path = transcode_for_speech(
+                audio_file_path, audio_chunk_path, upload_format
+            )
+        except ffmpeg.Error as e:
+            logger.warning(
+                "[FFMPEG_TRANSCODE] Transcode failed, uploading original audio: %s",
+                e.stderr.decode() if e.stderr else str(e),
+            )
 
     logger.info(
         "[FFMPEG_SPLIT] Splitting audio file: %s into chunks of %d bytes",
@@ -226,28 +431,35 @@ def split_audio(
     chunk_ratio = chunk_size_bytes / file_size_bytes
     chunk_duration_ms = max(1, math.ceil(duration_ms * chunk_ratio))
 
-    num_chunks = max(1, math.ceil(duration_ms / chunk_duration_ms))
+    silences: List[Tuple[int, int]] = []
+    if cut_at_silence and duration_ms > chunk_duration_ms:
+        # One pass over the whole file serves every cut
+        try:
+            silences = detect_silences(str(audio_file_path), 0, duration_ms)
+        except ffmpeg.Error as e:
+            logger.warning(
+                "[FFMPEG_SPLIT] Silence detection failed, cutting at size targets: %s",
+                e.stderr.decode() if e.stderr else str(e),
+            )
+
+    boundaries = choose_chunk_boundaries(duration_ms, chunk_duration_ms, silences)
+    num_chunks = len(boundaries) - 1
     logger.info(
-        "[FFMPEG_SPLIT] Will create %d chunks (duration per chunk: %d ms)",
+        "[FFMPEG_SPLIT] Will create %d chunks (duration per chunk: up to %d ms)",
         num_chunks,
         chunk_duration_ms,
     )
 
     chunks: List[Tuple[Path, int]] = []
-
-    for i in range(num_chunks):
-        start_offset_ms = i * chunk_duration_ms
-        if start_offset_ms >= duration_ms:
-            break
-
-        end_offset_ms = min(duration_ms, (i + 1) * chunk_duration_ms)
-
-        export_path = audio_chunk_path / f"{i}.mp3"
-        logger.debug(
-            "[FFMPEG_SPLIT] Creating chunk %d/%d: %s", i + 1, num_chunks, export_path
-        )
-        trim_file(audio_file_path, export_path, start_offset_ms, end_offset_ms)
-        chunks.append((export_path, start_offset_ms))
+    if duration_ms > 0:
+        try:
+            chunks = segment_audio(audio_file_path, audio_chunk_path, boundaries[1:-1])
+        except ffmpeg.Error as e:
+            logger.warning(
+                "[FFMPEG_SPLIT] Segment muxer failed, trimming chunks one by one: %s",
+                e.stderr.decode() if e.stderr else str(e),
+            )
+            chunks = _trim_chunks(audio_file_path, audio_chunk_path, boundaries)
 
     logger.info("[FFMPEG_SPLIT] Split complete: created %d chunks", len(chunks))
     return chunks
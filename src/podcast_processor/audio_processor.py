@@ -6,6 +6,7 @@ from app.models import Identification, ModelCall, Post, TranscriptSegment
 from app.writer.client import writer_client
 from podcast_processor.ad_merger import AdMerger
 from podcast_processor.audio import clip_segments_with_fade, get_audio_duration_ms
+from podcast_processor.segment_timeline import HAS_NUMPY, merge_close_intervals
 from shared.config import Config
 
 
@@ -275,6 +276,14 @@ class AudioProcessor:
         *,
         min_separation: float,
     ) -> List[Tuple[float, float]]:
+        if HAS_NUMPY and ad_segments:
+            starts, ends = merge_close_intervals(
+                [s for s, _ in ad_segments],
+                [e for _, e in ad_segments],
+                min_separation,
+            )
+            return list(zip(starts.tolist(), ends.tolist()))
+
         merged = list(ad_segments)
         i = 0
         while i < len(merged) - 1:
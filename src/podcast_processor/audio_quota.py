@@ -0,0 +1,161 @@
+"""
+Client-side pacing of transcription uploads under provider audio quotas.
+
+Groq and OpenAI limit audio seconds per hour and requests per minute per API
+key. AudioQuotaScheduler is the audio counterpart of TokenRateLimiter: each
+chunk upload first claims its duration and one request from the key's
+budgets, waiting until both fit. Budgets are counted in the same usage stores
+as LLM tokens, so with the shared SQLite store every worker paces against the
+same totals.
+"""
+
+import logging
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from podcast_processor.token_rate_limiter import (
+    TokenUsageStore,
+    budget_key,
+    get_usage_store,
+)
+
+logger = logging.getLogger("global_logger")
+
+AUDIO_WINDOW_SECONDS = 3600
+REQUEST_WINDOW_SECONDS = 60
+
+
+class AudioQuotaScheduler:
+    """Waits before each upload until the provider key's quotas allow it."""
+
+    def __init__(
+        self,
+        *,
+        audio_seconds_per_hour: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        budget: str = "audio:default",
+        store: Optional[TokenUsageStore] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.audio_seconds_per_hour = audio_seconds_per_hour
+        self.requests_per_minute = requests_per_minute
+        self.budget = budget
+        self.store = store or get_usage_store()
+        self._sleep = sleep
+
+        logger.info(
+            f"Initialized AudioQuotaScheduler: {audio_seconds_per_hour or 'unlimited'} "
+            f"audio s/h, {requests_per_minute or 'unlimited'} requests/min "
+            f"(budget {budget}, {type(self.store).__name__})"
+        )
+
+    @property
+    def _audio_budget(self) -> str:
+        return f"{self.budget}:seconds"
+
+    @property
+    def _request_budget(self) -> str:
+        return f"{self.budget}:requests"
+
+    def acquire(self, audio_seconds: float) -> float:
+        """Claim one request of `audio_seconds`, waiting as needed.
+
+        Returns the seconds spent waiting. Audio is claimed first, so a
+        chunk that got its audio budget only waits for a request slot.
+        """
+        waited = 0.0
+        if self.audio_seconds_per_hour:
+            waited += self._claim(
+                self._audio_budget,
+                max(1, math.ceil(audio_seconds)),
+                self.audio_seconds_per_hour,
+                AUDIO_WINDOW_SECONDS,
+                "audio seconds",
+            )
+        if self.requests_per_minute:
+            waited += self._claim(
+                self._request_budget,
+                1,
+                self.requests_per_minute,
+                REQUEST_WINDOW_SECONDS,
+                "requests",
+            )
+        return waited
+
+    def _claim(
+        self, budget: str, amount: int, limit: int, window_seconds: int, unit: str
+    ) -> float:
+        waited = 0.0
+        while True:
+            admitted, wait_seconds = self.store.try_add(
+                budget, amount, limit, window_seconds, time.time()
+            )
+            if admitted:
+                return waited
+            # Never spin when the store reports no wait
+            wait_seconds = max(wait_seconds, 0.1)
+            logger.info(
+                f"Transcription quota: waiting {wait_seconds:.1f}s for {amount} "
+                f"{unit} (limit {limit}/{window_seconds}s, budget {self.budget})"
+            )
+            self._sleep(wait_seconds)
+            waited += wait_seconds
+
+    def get_usage_stats(self) -> Dict[str, Optional[int]]:
+        """Audio seconds and requests used in their current windows."""
+        now = time.time()
+        audio_used, _, _ = self.store.usage(
+            self._audio_budget, AUDIO_WINDOW_SECONDS, now
+        )
+        requests_used, _, _ = self.store.usage(
+            self._request_budget, REQUEST_WINDOW_SECONDS, now
+        )
+        return {
+            "audio_seconds_used": audio_used,
+            "audio_seconds_per_hour": self.audio_seconds_per_hour,
+            "requests_used": requests_used,
+            "requests_per_minute": self.requests_per_minute,
+        }
+
+
+# Schedulers by (budget, limits); all share one store per location
+_SCHEDULERS: Dict[
+    Tuple[str, Optional[int], Optional[int], Optional[str]], AudioQuotaScheduler
+] = {}
+_SCHEDULERS_LOCK = threading.Lock()
+
+
+def get_audio_quota_scheduler(
+    provider: str,
+    api_key: Optional[str],
+    *,
+    audio_seconds_per_hour: Optional[int],
+    requests_per_minute: Optional[int],
+    shared_store_path: Optional[Union[str, Path]] = None,
+) -> Optional[AudioQuotaScheduler]:
+    """Get the scheduler for a provider/API key budget, or None without limits.
+
+    With `shared_store_path` (the token usage database when
+    llm_share_token_budget is on), usage is counted in that SQLite file when
+    its directory exists; otherwise only within this process.
+    """
+    if not audio_seconds_per_hour and not requests_per_minute:
+        return None
+    store = get_usage_store(shared_store_path)
+    store_name = getattr(store, "path", None)
+    budget = budget_key(f"audio:{provider}", api_key)
+    key = (budget, audio_seconds_per_hour, requests_per_minute, store_name)
+    with _SCHEDULERS_LOCK:
+        scheduler = _SCHEDULERS.get(key)
+        if scheduler is None:
+            scheduler = AudioQuotaScheduler(
+                audio_seconds_per_hour=audio_seconds_per_hour,
+                requests_per_minute=requests_per_minute,
+                budget=budget,
+                store=store,
+            )
+            _SCHEDULERS[key] = scheduler
+        return scheduler
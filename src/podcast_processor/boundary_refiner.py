@@ -13,10 +13,14 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import litellm
 from jinja2 import Template
 
 from app.writer.client import writer_client
+from podcast_processor.llm_model_call_utils import (
+    JsonObjectWatcher,
+    run_litellm_completion,
+    stream_litellm_completion,
+)
 from shared.config import Config
 
 # Internal defaults for boundary expansion; not user-configurable.
@@ -120,18 +124,26 @@ Return JSON: {"refined_start": {{ad_start}}, "refined_end": {{ad_end}}, "start_r
                 )
 
         try:
-            response = litellm.completion(
-                model=self.config.llm_model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=4096,
-                timeout=self.config.openai_timeout,
-                api_key=self.config.llm_api_key,
-                base_url=self.config.openai_base_url,
-            )
-
-            choice = response.choices[0] if response.choices else None
+            completion_args = {
+                "model": self.config.llm_model,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0.1,
+                "max_tokens": 4096,
+                "timeout": self.config.openai_timeout,
+                "api_key": self.config.llm_api_key,
+                "base_url": self.config.openai_base_url,
+            }
+            response: Any = None
+            choice = None
             content = ""
+            if self.config.llm_enable_streaming:
+                # Stop reading once the JSON answer closes
+                content = stream_litellm_completion(
+                    JsonObjectWatcher().feed, **completion_args
+                )
+            else:
+                response = run_litellm_completion(self.config, **completion_args)
+                choice = response.choices[0] if response.choices else None
             if choice:
                 # Prefer chat content; fall back to text for completion-style responses
                 content = (
@@ -156,18 +168,21 @@ Return JSON: {"refined_start": {{ad_start}}, "refined_end": {{ad_end}}, "start_r
                 extra={"model": self.config.llm_model},
             )
             # Log the full response object so provider quirks are visible.
-            try:
-                response_payload = (
-                    response.model_dump()
-                    if hasattr(response, "model_dump")
-                    else response
-                )
-                self.logger.debug(
-                    "LLM full response object",
-                    extra={"response_payload": response_payload},
-                )
-            except Exception:
-                self.logger.debug("LLM full response object unavailable", exc_info=True)
+            if response is not None:
+                try:
+                    response_payload = (
+                        response.model_dump()
+                        if hasattr(response, "model_dump")
+                        else response
+                    )
+                    self.logger.debug(
+                        "LLM full response object",
+                        extra={"response_payload": response_payload},
+                    )
+                except Exception:
+                    self.logger.debug(
+                        "LLM full response object unavailable", exc_info=True
+                    )
             # Persist the raw response immediately so it's available even if parsing fails.
             self._update_model_call(
                 model_call_id,
@@ -0,0 +1,90 @@
+"""
+Checkpoints of finished chunk transcriptions, so a retried remote
+transcription only uploads the chunks that did not finish last time.
+
+Each chunk's raw segments are written to `<audio>_chunk_transcripts/` (next
+to the post's audio, so every post has its own) in a file named by chunk
+index and a hash of the chunk's bytes and the model. A chunk whose audio
+changed between attempts, e.g. because the episode was re-downloaded or the
+upload format changed, hashes differently and is transcribed again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger("global_logger")
+
+_READ_BLOCK_BYTES = 1024 * 1024
+
+
+class ChunkCheckpoints:
+    """Finished chunk transcriptions for one audio file and model."""
+
+    def __init__(self, directory: Path, model_name: str, segment_type: Type[BaseModel]):
+        self.directory = Path(directory)
+        self.model_name = model_name
+        self.segment_type = segment_type
+
+    @classmethod
+    def for_audio(
+        cls, audio_file_path: str, model_name: str, segment_type: Type[BaseModel]
+    ) -> "ChunkCheckpoints":
+        return cls(
+            Path(audio_file_path + "_chunk_transcripts"), model_name, segment_type
+        )
+
+    def key(self, idx: int, chunk_path: Path) -> Optional[str]:
+        """Checkpoint key for chunk `idx` with the audio now at `chunk_path`,
+        or None if the chunk cannot be read."""
+        digest = hashlib.sha256(self.model_name.encode("utf-8") + b"\0")
+        try:
+            with open(chunk_path, "rb") as f:
+                for block in iter(lambda: f.read(_READ_BLOCK_BYTES), b""):
+                    digest.update(block)
+        except OSError as e:
+            logger.warning(f"Not checkpointing chunk {chunk_path}: {e}")
+            return None
+        return f"{idx:04d}-{digest.hexdigest()[:32]}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> Optional[List[Any]]:
+        path = self._path(key)
+        try:
+            rows = json.loads(path.read_text(encoding="utf-8"))
+            return [self.segment_type.model_validate(row) for row in rows]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable chunk checkpoint {path}: {e}")
+            return None
+
+    def save(self, key: str, segments: List[Any]) -> None:
+        rows = [seg.model_dump(mode="json") for seg in segments]
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError as e:
+            # Losing a checkpoint only costs a re-upload on retry
+            logger.warning(f"Could not save chunk checkpoint {key}: {e}")
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(rows, f)
+            os.replace(tmp_name, self._path(key))
+        except OSError as e:
+            Path(tmp_name).unlink(missing_ok=True)
+            logger.warning(f"Could not save chunk checkpoint {key}: {e}")
+
+    def clear(self) -> None:
+        """Remove all checkpoints once the whole transcription succeeded."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,186 @@
+"""
+Per-post classification chunk sizing.
+
+With adaptive sizing on, the number of new segments per prompt is adjusted
+after every chunk from what that chunk cost and found, within the configured
+bounds:
+
+- chunks where a large share of segments were detected as ads shrink, so ad
+  breaks get small, focused calls,
+- calls slower than the target latency shrink towards it,
+- prompts close to the per-call token limit stop growing,
+- chunks with no detections grow, so conversational stretches use fewer calls.
+
+The overlap cap shrinks along with smaller chunks. Each chunk is recorded in a plan
+that is stored on the post (`Post.classification_chunk_plan`), which gives
+prompt tokens and LLM seconds per hour of audio for comparing settings. A
+re-run replays the recorded sizes: ModelCalls are keyed on chunk boundaries,
+so replaying keeps them reusable instead of re-prompting shifted chunks.
+"""
+
+import math
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+# Share of a chunk's segments detected as ads above which the next chunk shrinks
+DENSE_AD_FRACTION = 0.15
+GROWTH_FACTOR = 1.5
+SHRINK_FACTOR = 0.5
+# Stop growing once a prompt uses this share of llm_max_input_tokens_per_call
+TOKEN_HEADROOM = 0.8
+
+
+@dataclass
+class ChunkRecord:
+    first_seq: int
+    last_seq: int
+    segments_per_prompt: int
+    max_overlap_segments: int
+    new_segments: int
+    chunk_segments: int
+    prompt_tokens: int
+    # None when the chunk reused a stored response
+    latency_seconds: Optional[float]
+    detections: int
+
+
+class ChunkSizer:
+    """Decides segments per prompt and overlap cap for each chunk of a post."""
+
+    def __init__(
+        self,
+        *,
+        segments_per_prompt: int,
+        max_overlap_segments: int,
+        adaptive: bool = False,
+        min_segments: int = 1,
+        max_segments: Optional[int] = None,
+        target_latency_seconds: Optional[float] = None,
+        max_input_tokens: Optional[int] = None,
+        replay: Optional[List[Dict[str, Any]]] = None,
+    ):
+        self.adaptive = adaptive
+        self.min_segments = max(1, min_segments)
+        self.max_segments = max(self.min_segments, max_segments or segments_per_prompt)
+        self.target_latency_seconds = target_latency_seconds
+        self.max_input_tokens = max_input_tokens
+        self._base_segments = max(1, segments_per_prompt)
+        self._base_overlap = max(0, max_overlap_segments)
+        self._size = (
+            self._clamp(segments_per_prompt) if adaptive else self._base_segments
+        )
+        self._replay = list(replay or []) if adaptive else []
+        self.records: List[ChunkRecord] = []
+
+    @classmethod
+    def for_post(
+        cls,
+        config: Any,
+        *,
+        previous_plan: Optional[Dict[str, Any]] = None,
+        total_segments: int = 0,
+        adaptive: Optional[bool] = None,
+    ) -> "ChunkSizer":
+        """Build a sizer from config, replaying `previous_plan` when it applies."""
+        processing = config.processing
+        if adaptive is None:
+            adaptive = processing.adaptive_chunk_sizing
+        replay = None
+        if (
+            adaptive
+            and previous_plan
+            and previous_plan.get("mode") == "adaptive"
+            and previous_plan.get("segments") == total_segments
+        ):
+            replay = previous_plan.get("chunks") or None
+        return cls(
+            segments_per_prompt=processing.num_segments_to_input_to_prompt,
+            max_overlap_segments=processing.max_overlap_segments,
+            adaptive=adaptive,
+            min_segments=processing.min_segments_to_input_to_prompt,
+            max_segments=processing.max_segments_to_input_to_prompt,
+            target_latency_seconds=processing.target_chunk_latency_seconds,
+            max_input_tokens=config.llm_max_input_tokens_per_call,
+            replay=replay,
+        )
+
+    @property
+    def replaying(self) -> bool:
+        return len(self.records) < len(self._replay)
+
+    @property
+    def segments_per_prompt(self) -> int:
+        if self.replaying:
+            return int(self._replay[len(self.records)]["segments_per_prompt"])
+        return self._size
+
+    @property
+    def max_overlap_segments(self) -> int:
+        if self.replaying:
+            return int(self._replay[len(self.records)]["max_overlap_segments"])
+        if not self.adaptive or self._base_overlap == 0:
+            return self._base_overlap
+        # Shrinks with the chunk but never exceeds the configured maximum
+        scaled = round(self._base_overlap * self._size / self._base_segments)
+        return max(1, min(self._base_overlap, scaled))
+
+    def record(self, record: ChunkRecord) -> None:
+        """Store a finished chunk and pick the size of the next one."""
+        replayed = self.replaying
+        if replayed and record.latency_seconds is None:
+            # A reused response keeps the latency measured when it was made
+            record.latency_seconds = self._replay[len(self.records)].get(
+                "latency_seconds"
+            )
+        self.records.append(record)
+        if not self.adaptive:
+            return
+        if replayed:
+            # Continue adapting from where the recorded plan left off
+            self._size = self._clamp(record.segments_per_prompt)
+            return
+        self._size = self._next_size(record)
+
+    def _next_size(self, record: ChunkRecord) -> int:
+        size = record.segments_per_prompt
+        density = record.detections / max(1, record.chunk_segments)
+        if density >= DENSE_AD_FRACTION:
+            return self._clamp(int(size * SHRINK_FACTOR))
+        if (
+            self.target_latency_seconds
+            and record.latency_seconds is not None
+            and record.latency_seconds > self.target_latency_seconds
+        ):
+            return self._clamp(
+                int(size * self.target_latency_seconds / record.latency_seconds)
+            )
+        if (
+            self.max_input_tokens
+            and record.prompt_tokens >= self.max_input_tokens * TOKEN_HEADROOM
+        ):
+            return self._clamp(size)
+        if record.detections == 0:
+            return self._clamp(math.ceil(size * GROWTH_FACTOR))
+        return self._clamp(size)
+
+    def _clamp(self, size: int) -> int:
+        return max(self.min_segments, min(self.max_segments, size))
+
+    def plan(self, audio_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """JSON-serializable summary stored on the post."""
+        prompt_tokens = sum(r.prompt_tokens for r in self.records)
+        llm_seconds = sum(r.latency_seconds or 0.0 for r in self.records)
+        plan: Dict[str, Any] = {
+            "mode": "adaptive" if self.adaptive else "static",
+            "segments": sum(r.new_segments for r in self.records),
+            "calls": len(self.records),
+            "prompt_tokens": prompt_tokens,
+            "llm_seconds": round(llm_seconds, 3),
+            "chunks": [asdict(r) for r in self.records],
+        }
+        if audio_seconds:
+            hours = audio_seconds / 3600.0
+            plan["audio_seconds"] = round(audio_seconds, 3)
+            plan["prompt_tokens_per_audio_hour"] = round(prompt_tokens / hours)
+            plan["llm_seconds_per_audio_hour"] = round(llm_seconds / hours, 3)
+        return plan
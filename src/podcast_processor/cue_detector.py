@@ -44,13 +44,8 @@ class CueDetector:
             "self_promo": bool(self.self_promo_pattern.search(text)),
         }
 
-    def highlight_cues(self, text: str) -> str:
-        """
-        Highlights detected cues in the text by wrapping them in *** ***.
-        Useful for drawing attention to cues in LLM prompts.
-        """
-        matches: List[Tuple[int, int]] = []
-        patterns = [
+    def _highlight_patterns(self) -> List[Pattern[str]]:
+        return [
             self.url_pattern,
             self.promo_pattern,
             self.phone_pattern,
@@ -59,7 +54,17 @@ class CueDetector:
             self.self_promo_pattern,
         ]
 
-        for pattern in patterns:
+    def has_highlight(self, text: str) -> bool:
+        """True when `highlight_cues` would mark anything in the text."""
+        return any(p.search(text) for p in self._highlight_patterns())
+
+    def highlight_cues(self, text: str) -> str:
+        """
+        Highlights detected cues in the text by wrapping them in *** ***.
+        Useful for drawing attention to cues in LLM prompts.
+        """
+        matches: List[Tuple[int, int]] = []
+        for pattern in self._highlight_patterns():
             for match in pattern.finditer(text):
                 matches.append(match.span())
 
@@ -0,0 +1,129 @@
+"""
+Hedged LLM requests driven by recorded call latencies.
+
+Provider latency has a long tail: most completions return in seconds, a few
+take minutes. Once a request has been outstanding longer than a chosen
+percentile of that model's recent latencies, a duplicate (optionally to a
+fallback model) is sent and whichever answers first wins. The loser's future
+is cancelled, so `submit` must return futures that can be cancelled while
+running (the async executor's); a thread-pool future would keep running and
+still use provider quota.
+
+Latencies are kept per model in memory for the life of the process; hedging
+stays off for a model until it has MIN_LATENCY_SAMPLES successful calls.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Deque, Dict, Optional, Set
+
+logger = logging.getLogger("global_logger")
+
+MAX_LATENCY_SAMPLES = 200
+MIN_LATENCY_SAMPLES = 20
+# Never hedge sooner than this, however fast the model usually is
+MIN_HEDGE_DELAY_SECONDS = 2.0
+
+
+class LLMDeadlineExceeded(TimeoutError):
+    """The per-call deadline passed before the LLM answered."""
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies per model."""
+
+    def __init__(
+        self,
+        max_samples: int = MAX_LATENCY_SAMPLES,
+        min_samples: int = MIN_LATENCY_SAMPLES,
+    ):
+        self.max_samples = max_samples
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.max_samples)
+        )
+        self._lock = threading.Lock()
+
+    def record(self, model: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[model].append(seconds)
+
+    def sample_count(self, model: str) -> int:
+        with self._lock:
+            return len(self._samples.get(model, ()))
+
+    def percentile(self, model: str, percentile: float) -> Optional[float]:
+        """Nearest-rank percentile, or None until enough calls are recorded."""
+        with self._lock:
+            samples = sorted(self._samples.get(model, ()))
+        if len(samples) < self.min_samples:
+            return None
+        rank = math.ceil(percentile / 100.0 * len(samples))
+        return samples[min(len(samples), max(1, rank)) - 1]
+
+
+_LATENCY_TRACKER = LatencyTracker()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    return _LATENCY_TRACKER
+
+
+def hedged_request(
+    submit: Callable[[Dict[str, Any]], "Future[Any]"],
+    completion_args: Dict[str, Any],
+    *,
+    hedge_args: Optional[Dict[str, Any]] = None,
+    hedge_after: Optional[float] = None,
+    deadline: Optional[float] = None,
+) -> Any:
+    """Run `completion_args`, hedging with `hedge_args` after `hedge_after` seconds.
+
+    `submit` starts one request and returns its future. `deadline` is a
+    time.monotonic() value; LLMDeadlineExceeded is raised if no request has
+    answered by then. If every request fails, the last error is raised.
+    """
+    hedge_at = (
+        None
+        if hedge_args is None or hedge_after is None
+        else time.monotonic() + hedge_after
+    )
+    pending: Set["Future[Any]"] = {submit(completion_args)}
+    last_error: Optional[BaseException] = None
+
+    while pending:
+        now = time.monotonic()
+        waits = [at - now for at in (hedge_at, deadline) if at is not None]
+        timeout = max(0.0, min(waits)) if waits else None
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            error = future.exception()
+            if error is None:
+                for other in pending:
+                    other.cancel()
+                return future.result()
+            last_error = error
+
+        now = time.monotonic()
+        if deadline is not None and now >= deadline and pending:
+            for other in pending:
+                other.cancel()
+            raise LLMDeadlineExceeded(
+                f"No response from {completion_args.get('model')} before the call deadline"
+            )
+        if hedge_at is not None and now >= hedge_at and pending:
+            assert hedge_args is not None
+            logger.info(
+                f"LLM call to {completion_args.get('model')} still running after "
+                f"{hedge_after:.1f}s; hedging with {hedge_args.get('model')}"
+            )
+            pending.add(submit(hedge_args))
+            hedge_at = None
+
+    assert last_error is not None
+    raise last_error
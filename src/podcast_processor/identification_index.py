@@ -0,0 +1,92 @@
+"""
+In-memory view of one post's identifications.
+
+Classification asks "does this segment already carry an ad identification?"
+for every matched prediction, pre-roll look-back segment and cascade check.
+The index is loaded with a single query when classify() starts and updated as
+the classifier inserts, replaces and deletes identifications, so those checks
+are set lookups instead of a query per segment.
+
+Keys mirror the unique constraint on Identification:
+(transcript_segment_id, model_call_id, label).
+"""
+
+from collections import Counter
+from typing import Any, Dict, Iterable, Set, Tuple
+
+from app.models import Identification, TranscriptSegment
+
+IdentificationKey = Tuple[int, int, str]
+
+
+class IdentificationIndex:
+    def __init__(self, keys: Iterable[IdentificationKey] = ()):
+        self._keys: Set[IdentificationKey] = set()
+        # (segment id, label) -> number of model calls that labeled it
+        self._labels: Dict[Tuple[int, str], int] = Counter()
+        self.add_keys(keys)
+
+    @classmethod
+    def load(cls, db_session: Any, post_id: int) -> "IdentificationIndex":
+        rows = (
+            db_session.query(
+                Identification.transcript_segment_id,
+                Identification.model_call_id,
+                Identification.label,
+            )
+            .join(TranscriptSegment)
+            .filter(TranscriptSegment.post_id == post_id)
+            .all()
+        )
+        return cls((int(seg_id), int(mc_id), label) for seg_id, mc_id, label in rows)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def has_label(self, segment_id: int, label: str = "ad") -> bool:
+        return self._labels[(segment_id, label)] > 0
+
+    def segments_with_label(
+        self, segment_ids: Iterable[int], label: str = "ad"
+    ) -> Set[int]:
+        return {seg_id for seg_id in segment_ids if self.has_label(seg_id, label)}
+
+    def keys_for_model_call(self, model_call_id: int) -> Set[IdentificationKey]:
+        return {key for key in self._keys if key[1] == model_call_id}
+
+    def add_keys(self, keys: Iterable[IdentificationKey]) -> None:
+        for key in keys:
+            if key not in self._keys:
+                self._keys.add(key)
+                self._labels[(key[0], key[2])] += 1
+
+    def discard_keys(self, keys: Iterable[IdentificationKey]) -> None:
+        for key in keys:
+            if key in self._keys:
+                self._keys.remove(key)
+                self._labels[(key[0], key[2])] -= 1
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Record rows in the shape passed to the insert_identifications action."""
+        self.add_keys(_row_key(row) for row in rows)
+
+    def discard_identifications(self, identifications: Iterable[Any]) -> None:
+        self.discard_keys(
+            (
+                int(ident.transcript_segment_id),
+                int(ident.model_call_id),
+                ident.label,
+            )
+            for ident in identifications
+        )
+
+
+def _row_key(row: Dict[str, Any]) -> IdentificationKey:
+    return (
+        int(row["transcript_segment_id"]),
+        int(row["model_call_id"]),
+        str(row.get("label") or "ad"),
+    )
@@ -0,0 +1,168 @@
+"""
+Thin client for OpenAI-compatible batch APIs.
+
+Batch endpoints trade latency (results within a 24h window) for lower cost and
+separate, much larger rate limits, which suits archive backfills where nobody
+is waiting on a particular episode.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from openai import OpenAI
+
+GROQ_OPENAI_BASE_URL = "https://api.groq.com/openai/v1"
+
+# Batch lifecycle states reported by the provider that will never change again.
+TERMINAL_BATCH_STATES = {"completed", "failed", "expired", "cancelled"}
+
+
+# litellm arguments that configure the HTTP client rather than the request body
+CLIENT_ONLY_ARGS = frozenset({"timeout"})
+
+
+@dataclass
+class BatchRequest:
+    custom_id: str
+    # Chat-completion request body, e.g. the arguments of an inline call
+    body: Dict[str, Any]
+
+    @classmethod
+    def from_completion_args(
+        cls, custom_id: str, completion_args: Dict[str, Any]
+    ) -> "BatchRequest":
+        return cls(
+            custom_id=custom_id,
+            body={
+                key: value
+                for key, value in completion_args.items()
+                if key not in CLIENT_ONLY_ARGS
+            },
+        )
+
+
+@dataclass
+class BatchResult:
+    custom_id: str
+    content: Optional[str]
+    error: Optional[str]
+
+
+@dataclass
+class BatchStatus:
+    batch_id: str
+    status: str
+    output_file_id: Optional[str]
+    error_file_id: Optional[str]
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_BATCH_STATES
+
+
+def resolve_batch_model(
+    model_name: str, base_url: Optional[str]
+) -> Tuple[str, Optional[str]]:
+    """Translate a litellm model name into (provider model, base_url).
+
+    litellm routes on a provider prefix; batch endpoints expect the bare model
+    name and the provider's own OpenAI-compatible base URL.
+    """
+    if model_name.startswith("groq/"):
+        return model_name[len("groq/") :], GROQ_OPENAI_BASE_URL
+    if model_name.startswith("openai/"):
+        return model_name[len("openai/") :], base_url
+    return model_name, base_url
+
+
+class LLMBatchClient:
+    """Submit, poll and collect chat-completion batches."""
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        base_url: Optional[str] = None,
+        client: Optional[OpenAI] = None,
+        logger: Optional[logging.Logger] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.logger = logger or logging.getLogger("global_logger")
+        self.client = client or OpenAI(
+            api_key=api_key, base_url=base_url, timeout=timeout
+        )
+
+    def submit(self, requests: List[BatchRequest]) -> str:
+        """Upload requests as a JSONL file and create a batch. Returns the batch id."""
+        if not requests:
+            raise ValueError("Cannot submit an empty batch")
+
+        lines = [json.dumps(self._request_line(req)) for req in requests]
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        uploaded = self.client.files.create(
+            file=("batch_input.jsonl", payload), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        self.logger.info(
+            f"Submitted LLM batch {batch.id} with {len(requests)} requests"
+        )
+        return str(batch.id)
+
+    def retrieve(self, batch_id: str) -> BatchStatus:
+        batch = self.client.batches.retrieve(batch_id)
+        return BatchStatus(
+            batch_id=str(batch.id),
+            status=str(batch.status),
+            output_file_id=batch.output_file_id,
+            error_file_id=batch.error_file_id,
+        )
+
+    def fetch_results(self, status: BatchStatus) -> List[BatchResult]:
+        """Download and parse the output and error files of a finished batch."""
+        results: List[BatchResult] = []
+        for file_id in (status.output_file_id, status.error_file_id):
+            if not file_id:
+                continue
+            content = self.client.files.content(file_id).text
+            for line in content.splitlines():
+                if line.strip():
+                    results.append(self._parse_result_line(json.loads(line)))
+        return results
+
+    @staticmethod
+    def _request_line(req: BatchRequest) -> Dict[str, Any]:
+        return {
+            "custom_id": req.custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": req.body,
+        }
+
+    @staticmethod
+    def _parse_result_line(line: Dict[str, Any]) -> BatchResult:
+        custom_id = str(line.get("custom_id"))
+        error = line.get("error")
+        if error:
+            message = error.get("message") if isinstance(error, dict) else str(error)
+            return BatchResult(custom_id=custom_id, content=None, error=str(message))
+
+        response = line.get("response") or {}
+        if response.get("status_code") != 200:
+            return BatchResult(
+                custom_id=custom_id,
+                content=None,
+                error=f"HTTP {response.get('status_code')}: {response.get('body')}",
+            )
+
+        try:
+            content = response["body"]["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            return BatchResult(
+                custom_id=custom_id, content=None, error="Malformed batch response"
+            )
+        return BatchResult(custom_id=custom_id, content=content, error=None)
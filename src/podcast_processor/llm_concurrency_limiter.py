@@ -8,31 +8,143 @@ improve system stability.
 
 import logging
 import threading
+import time
 from typing import Any, Optional
 
+from podcast_processor.llm_error_classifier import LLMErrorClassifier
+from podcast_processor.rate_limit_headers import exhausted_reset_seconds, headers_from
+from shared.config import Config
+
 logger = logging.getLogger(__name__)
 
+# Longest pause we honor from Retry-After or rate-limit reset headers
+MAX_PROVIDER_PAUSE_SECONDS = 300.0
+
+
+class AIMDController:
+    """Additive-increase/multiplicative-decrease concurrency limit.
+
+    Each successful call adds 1/limit, so the limit grows by about one slot
+    per limit's worth of successes, up to `maximum`. A rate-limit or overload
+    error halves it (at most once per `decrease_cooldown`, since calls already
+    in flight tend to fail together), and any Retry-After or exhausted
+    rate-limit reset pauses new calls until that time.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        maximum: Optional[int] = None,
+        *,
+        minimum: int = 1,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 2.0,
+    ):
+        self.minimum = minimum
+        self.maximum = max(initial, maximum or initial)
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self._window = float(initial)
+        self._last_decrease = float("-inf")
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return int(self._window)
+
+    def pause_remaining(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def _pause(self, seconds: Optional[float]) -> None:
+        if seconds is None or seconds <= 0:
+            return
+        seconds = min(seconds, MAX_PROVIDER_PAUSE_SECONDS)
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.info(f"Provider rate limit: pausing new LLM calls for {seconds:.1f}s")
+
+    def on_success(self, pause: Optional[float] = None) -> None:
+        with self._lock:
+            self._window = min(float(self.maximum), self._window + 1.0 / self._window)
+            self._pause(pause)
+
+    def on_overload(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease >= self.decrease_cooldown:
+                previous = self.limit
+                self._window = max(
+                    float(self.minimum), self._window * self.decrease_factor
+                )
+                self._last_decrease = now
+                logger.info(
+                    f"LLM concurrency limit reduced from {previous} to {self.limit}"
+                )
+            self._pause(retry_after)
+
+    def on_error(self, error: BaseException) -> None:
+        """Back off if `error` means the provider is shedding load."""
+        if isinstance(error, Exception) and LLMErrorClassifier.is_overload_error(error):
+            self.on_overload(LLMErrorClassifier.get_retry_after(error))
+
+    def on_response(self, response: Any) -> None:
+        """Count a success, pausing if its headers report an exhausted limit."""
+        headers = headers_from(response)
+        self.on_success(exhausted_reset_seconds(headers) if headers else None)
+
+
+def adaptive_max_concurrent_calls(config: Config) -> int:
+    """Ceiling the adaptive limit may grow to while calls succeed.
+
+    Unless llm_adaptive_max_concurrent_calls is set the limit never grows
+    past llm_max_concurrent_calls; it only backs off and recovers.
+    """
+    configured = config.llm_adaptive_max_concurrent_calls
+    if configured:
+        return max(configured, config.llm_max_concurrent_calls)
+    return config.llm_max_concurrent_calls
+
 
 class LLMConcurrencyLimiter:
-    """Controls the number of concurrent LLM API calls using a semaphore."""
+    """Controls the number of concurrent LLM API calls.
 
-    def __init__(self, max_concurrent_calls: int):
+    The limit starts at `max_concurrent_calls` and adapts between 1 and
+    `adaptive_max_calls` (default: no growth) from the outcomes reported by
+    ConcurrencyContext; see AIMDController.
+    """
+
+    def __init__(
+        self, max_concurrent_calls: int, adaptive_max_calls: Optional[int] = None
+    ):
         """
         Initialize the concurrency limiter.
 
         Args:
-            max_concurrent_calls: Maximum number of simultaneous LLM API calls allowed
+            max_concurrent_calls: Initial number of simultaneous LLM API calls allowed
+            adaptive_max_calls: Upper bound the limit may grow to while calls succeed
         """
         if max_concurrent_calls <= 0:
             raise ValueError("max_concurrent_calls must be greater than 0")
 
         self.max_concurrent_calls = max_concurrent_calls
-        self._semaphore = threading.Semaphore(max_concurrent_calls)
+        self.controller = AIMDController(max_concurrent_calls, adaptive_max_calls)
+        self.adaptive_max_calls = self.controller.maximum
+        self._active = 0
+        self._condition = threading.Condition()
 
         logger.info(
             f"LLM concurrency limiter initialized with {max_concurrent_calls} max concurrent calls"
+            f" (adaptive up to {self.adaptive_max_calls})"
         )
 
+    def _wait_out_pause(self) -> None:
+        # Provider-requested pauses do not count against the acquire timeout
+        while True:
+            pause = self.controller.pause_remaining()
+            if pause <= 0:
+                return
+            time.sleep(pause)
+
     def acquire(self, timeout: Optional[float] = None) -> bool:
         """
         Acquire a slot for making an LLM API call.
@@ -45,10 +157,13 @@ class LLMConcurrencyLimiter:
         Returns:
             True if a slot was acquired, False if timeout occurred
         """
-        # Disable specific pylint warning for this line as manual semaphore control is needed
-        acquired = self._semaphore.acquire(  # pylint: disable=consider-using-with
-            timeout=timeout
-        )
+        self._wait_out_pause()
+        with self._condition:
+            acquired = self._condition.wait_for(
+                lambda: self._active < self.controller.limit, timeout=timeout
+            )
+            if acquired:
+                self._active += 1
         if acquired:
             logger.debug("Acquired LLM concurrency slot")
         else:
@@ -63,35 +178,66 @@ class LLMConcurrencyLimiter:
 
         Note: Consider using ConcurrencyContext for automatic resource management.
         """
-        self._semaphore.release()
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
         logger.debug("Released LLM concurrency slot")
 
+    def record_success(self, response: Any = None) -> None:
+        """Report a completed call; the limit may grow."""
+        self.controller.on_response(response)
+        with self._condition:
+            self._condition.notify_all()
+
+    def record_error(self, error: BaseException) -> None:
+        """Report a failed call; rate-limit and overload errors shrink the limit."""
+        self.controller.on_error(error)
+
+    def get_current_limit(self) -> int:
+        """Get the current adaptive concurrency limit."""
+        return self.controller.limit
+
     def get_available_slots(self) -> int:
         """Get the number of currently available slots."""
-        return self._semaphore._value
+        return max(0, self.controller.limit - self._active)
 
     def get_active_calls(self) -> int:
         """Get the number of currently active LLM calls."""
-        return self.max_concurrent_calls - self._semaphore._value
+        return self._active
 
 
 # Global concurrency limiter instance
 _CONCURRENCY_LIMITER: Optional[LLMConcurrencyLimiter] = None
 
 
-def get_concurrency_limiter(max_concurrent_calls: int = 3) -> LLMConcurrencyLimiter:
+def get_concurrency_limiter(
+    max_concurrent_calls: int = 3, adaptive_max_calls: Optional[int] = None
+) -> LLMConcurrencyLimiter:
     """Get or create the global concurrency limiter instance."""
     global _CONCURRENCY_LIMITER  # pylint: disable=global-statement
     if (
         _CONCURRENCY_LIMITER is None
         or _CONCURRENCY_LIMITER.max_concurrent_calls != max_concurrent_calls
+        or (
+            adaptive_max_calls is not None
+            and _CONCURRENCY_LIMITER.adaptive_max_calls
+            != max(max_concurrent_calls, adaptive_max_calls)
+        )
     ):
-        _CONCURRENCY_LIMITER = LLMConcurrencyLimiter(max_concurrent_calls)
+        _CONCURRENCY_LIMITER = LLMConcurrencyLimiter(
+            max_concurrent_calls, adaptive_max_calls
+        )
     return _CONCURRENCY_LIMITER
 
 
 class ConcurrencyContext:
-    """Context manager for controlling LLM API call concurrency."""
+    """Context manager for controlling LLM API call concurrency.
+
+    Exiting normally reports a success to the limiter and exiting with an
+    exception reports that error, so the adaptive limit follows the calls made
+    inside the block. Pass the provider response to `observe_response` to
+    also honor its rate-limit headers.
+    """
 
     def __init__(self, limiter: LLMConcurrencyLimiter, timeout: Optional[float] = None):
         """
@@ -104,6 +250,7 @@ class ConcurrencyContext:
         self.limiter = limiter
         self.timeout = timeout
         self.acquired = False
+        self.response: Any = None
 
     def __enter__(self) -> "ConcurrencyContext":
         """Acquire a concurrency slot."""
@@ -114,12 +261,21 @@ class ConcurrencyContext:
             )
         return self
 
+    def observe_response(self, response: Any) -> None:
+        """Remember the provider response so its headers are read on exit."""
+        self.response = response
+
     def __exit__(
         self,
         exc_type: Optional[type],
         exc_val: Optional[BaseException],
         exc_tb: Optional[Any],
     ) -> None:
-        """Release the concurrency slot."""
-        if self.acquired:
-            self.limiter.release()
+        """Release the concurrency slot and report the outcome."""
+        if not self.acquired:
+            return
+        self.limiter.release()
+        if exc_val is None:
+            self.limiter.record_success(self.response)
+        else:
+            self.limiter.record_error(exc_val)
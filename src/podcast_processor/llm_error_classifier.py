@@ -5,9 +5,19 @@ Provides more robust and extensible error handling beyond simple string matching
 """
 
 import re
-from typing import Union
+from typing import Optional, Union
 
-from litellm.exceptions import InternalServerError
+from litellm.exceptions import (
+    InternalServerError,
+    RateLimitError,
+    ServiceUnavailableError,
+)
+
+from podcast_processor.rate_limit_headers import (
+    exhausted_reset_seconds,
+    headers_from,
+    retry_after_seconds,
+)
 
 
 class LLMErrorClassifier:
@@ -29,6 +39,12 @@ class LLMErrorClassifier:
         re.compile(r"504", re.IGNORECASE),  # HTTP 504 status
     ]
 
+    # Provider overload (e.g. Anthropic's 529 overloaded_error)
+    OVERLOAD_PATTERNS = [
+        re.compile(r"overloaded", re.IGNORECASE),
+        re.compile(r"529", re.IGNORECASE),
+    ]
+
     # Server error patterns (retryable)
     SERVER_ERROR_PATTERNS = [
         re.compile(r"internal.?server.?error", re.IGNORECASE),
@@ -60,7 +76,9 @@ class LLMErrorClassifier:
             True if the error should be retried, False otherwise
         """
         # Handle specific exception types
-        if isinstance(error, InternalServerError):
+        if isinstance(
+            error, (InternalServerError, RateLimitError, ServiceUnavailableError)
+        ):
             return True
 
         # Convert to string for pattern matching
@@ -72,7 +90,10 @@ class LLMErrorClassifier:
 
         # Check for retryable error patterns
         retryable_patterns = (
-            cls.RATE_LIMIT_PATTERNS + cls.TIMEOUT_PATTERNS + cls.SERVER_ERROR_PATTERNS
+            cls.RATE_LIMIT_PATTERNS
+            + cls.TIMEOUT_PATTERNS
+            + cls.OVERLOAD_PATTERNS
+            + cls.SERVER_ERROR_PATTERNS
         )
 
         return cls._matches_patterns(error_str, retryable_patterns)
@@ -83,14 +104,20 @@ class LLMErrorClassifier:
         Categorize the error type for better handling.
 
         Returns:
-            One of: 'rate_limit', 'timeout', 'server_error', 'auth_error', 'client_error', 'unknown'
+            One of: 'rate_limit', 'timeout', 'overloaded', 'server_error',
+            'auth_error', 'client_error', 'unknown'
         """
+        if isinstance(error, RateLimitError):
+            return "rate_limit"
+
         error_str = str(error)
 
         if cls._matches_patterns(error_str, cls.RATE_LIMIT_PATTERNS):
             return "rate_limit"
         if cls._matches_patterns(error_str, cls.TIMEOUT_PATTERNS):
             return "timeout"
+        if cls._matches_patterns(error_str, cls.OVERLOAD_PATTERNS):
+            return "overloaded"
         if cls._matches_patterns(error_str, cls.SERVER_ERROR_PATTERNS):
             return "server_error"
         if cls._matches_patterns(error_str, cls.NON_RETRYABLE_PATTERNS):
@@ -127,10 +154,42 @@ class LLMErrorClassifier:
             return base_backoff * 2.0  # Longer backoff for rate limits
         if category == "timeout":
             return base_backoff * 1.5  # Moderate backoff for timeouts
+        if category == "overloaded":
+            return base_backoff * 2.0
         if category == "server_error":
             return base_backoff  # Standard backoff for server errors
         return base_backoff
 
+    @classmethod
+    def is_overload_error(cls, error: Union[Exception, str]) -> bool:
+        """True when the provider is shedding load: 429s, overloads and 503s.
+
+        These are the errors adaptive concurrency backs off on; timeouts and
+        other server errors are not a signal that we are sending too much.
+        """
+        if isinstance(error, ServiceUnavailableError):
+            return True
+        if cls.get_error_category(error) in ("rate_limit", "overloaded"):
+            return True
+        return bool(re.search(r"503|service.?unavailable", str(error), re.IGNORECASE))
+
+    @classmethod
+    def get_retry_after(cls, error: Union[Exception, str]) -> Optional[float]:
+        """Seconds the provider asked us to wait, from the error's response headers.
+
+        Uses Retry-After when present, otherwise the reset time of whichever
+        request/token limit is exhausted. None when neither is available.
+        """
+        if isinstance(error, str):
+            return None
+        headers = headers_from(error)
+        if not headers:
+            return None
+        retry_after = retry_after_seconds(headers)
+        if retry_after is not None:
+            return retry_after
+        return exhausted_reset_seconds(headers)
+
     @staticmethod
     def _matches_patterns(text: str, patterns: list[re.Pattern[str]]) -> bool:
         """Check if text matches any of the provided regex patterns."""
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+import litellm
 
 from app.writer.client import writer_client
+from podcast_processor.async_llm_executor import get_executor_for_config
+from shared.config import Config
+from shared.llm_utils import model_uses_max_completion_tokens
 
 
 def render_prompt_and_upsert_model_call(
@@ -111,6 +116,26 @@ def try_update_model_call(
         )
 
 
+def classification_completion_args(
+    config: Config, model_name: str, messages: List[Dict[str, str]]
+) -> Dict[str, Any]:
+    """Completion arguments for a classification prompt.
+
+    Shared by inline calls and batch submissions so both send the same request.
+    """
+    completion_args: Dict[str, Any] = {
+        "model": model_name,
+        "messages": messages,
+        "timeout": config.openai_timeout,
+    }
+    # Newer OpenAI models (o1, gpt-5, gpt-4o variants) reject max_tokens
+    if model_uses_max_completion_tokens(model_name):
+        completion_args["max_completion_tokens"] = config.openai_max_tokens
+    else:
+        completion_args["max_tokens"] = config.openai_max_tokens
+    return completion_args
+
+
 def extract_litellm_content(response: Any) -> str:
     """Extracts the primary text content from a litellm completion response."""
     choices = getattr(response, "choices", None) or []
@@ -123,3 +148,87 @@ def extract_litellm_content(response: Any) -> str:
     if not content:
         content = getattr(choice, "text", "") or ""
     return str(content)
+
+
+def run_litellm_completion(config: Config, **completion_args: Any) -> Any:
+    """Issue a completion, via the shared async executor when it is enabled."""
+    executor = get_executor_for_config(config)
+    if executor is not None:
+        return executor.complete(**completion_args)
+    return litellm.completion(**completion_args)
+
+
+def complete_litellm_text(config: Config, **completion_args: Any) -> str:
+    """Return the completion text, streaming it when enabled in config.
+
+    Streamed responses stop reading as soon as the first JSON object closes,
+    so trailing chatter after the answer is never generated.
+    """
+    if config.llm_enable_streaming:
+        return stream_litellm_completion(JsonObjectWatcher().feed, **completion_args)
+    return extract_litellm_content(run_litellm_completion(config, **completion_args))
+
+
+def stream_litellm_completion(
+    on_delta: Callable[[str], bool],
+    on_response: Optional[Callable[[Any], None]] = None,
+    **completion_args: Any,
+) -> str:
+    """Stream a completion and return the accumulated text.
+
+    `on_delta` receives each text fragment and returns False to stop reading,
+    which closes the stream so the provider stops generating tokens.
+    `on_response` receives the stream itself, which carries the provider's
+    response headers (e.g. ConcurrencyContext.observe_response).
+    """
+    stream = litellm.completion(stream=True, **completion_args)
+    if on_response is not None:
+        on_response(stream)
+    parts: List[str] = []
+    try:
+        for chunk in stream:
+            choices = getattr(chunk, "choices", None) or []
+            delta = getattr(getattr(choices[0], "delta", None), "content", None)
+            if not delta:
+                continue
+            parts.append(str(delta))
+            if not on_delta(str(delta)):
+                break
+    finally:
+        close = getattr(stream, "close", None)
+        if callable(close):
+            close()
+    return "".join(parts)
+
+
+class JsonObjectWatcher:
+    """Tracks streamed text until the first top-level JSON object is closed."""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.started = False
+        self.complete = False
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, delta: str) -> bool:
+        """Consume a fragment; returns False once the object is complete."""
+        for ch in delta:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"' and self.started:
+                self._in_string = True
+            elif ch == "{":
+                self.started = True
+                self.depth += 1
+            elif ch == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.complete = True
+                    return False
+        return True
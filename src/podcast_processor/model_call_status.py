@@ -0,0 +1,118 @@
+"""
+Buffered ModelCall status updates for a single LLM call.
+
+Retry counts and intermediate errors are kept in memory and written once when
+the call finishes. Calls that run longer than the heartbeat interval (slow
+providers, long rate-limit backoffs) periodically push the buffered state with
+a fire-and-forget write so the UI still shows them as in progress.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from app.models import ModelCall
+from app.writer.client import writer_client
+
+MODEL_CALL_HEARTBEAT_SECONDS = 15.0
+
+
+class ModelCallStatusBuffer:
+    """Collects status transitions for one ModelCall and flushes them in one write."""
+
+    def __init__(
+        self,
+        model_call: ModelCall,
+        heartbeat_interval: float = MODEL_CALL_HEARTBEAT_SECONDS,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.model_call = model_call
+        self.heartbeat_interval = heartbeat_interval
+        self.logger = logger or logging.getLogger("global_logger")
+        self.retry_attempts = model_call.retry_attempts or 0
+        self.error_message: Optional[str] = model_call.error_message
+        self.heartbeats_sent = 0
+        self._finished = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "ModelCallStatusBuffer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if self.model_call.id is None:
+            return
+        # Calls re-run from a failed state would otherwise look idle until done.
+        if self.model_call.status != "pending":
+            self._send_async({"status": "pending"})
+        if self.heartbeat_interval > 0:
+            self._thread = threading.Thread(
+                target=self._heartbeat_loop,
+                name=f"model-call-heartbeat-{self.model_call.id}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def record_attempt(self, retry_attempts: int) -> None:
+        self.retry_attempts = retry_attempts
+        self.model_call.retry_attempts = retry_attempts
+
+    def record_error(self, error_message: str) -> None:
+        self.error_message = error_message
+        self.model_call.error_message = error_message
+
+    def finish(self, status: str, **fields: Any) -> None:
+        """Write the final state in a single blocking update and stop the heartbeat."""
+        with self._lock:
+            self._finished = True
+        self.stop()
+
+        data: Dict[str, Any] = {
+            "status": status,
+            "retry_attempts": self.retry_attempts,
+            "error_message": self.error_message,
+        }
+        data.update(fields)
+        if self.model_call.id is not None:
+            res = writer_client.update("ModelCall", self.model_call.id, data, wait=True)
+            if not res or not res.success:
+                raise RuntimeError(getattr(res, "error", "Failed to update ModelCall"))
+
+        # Update local object to reflect database state
+        for key, value in data.items():
+            setattr(self.model_call, key, value)
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stop.wait(self.heartbeat_interval):
+            self._send_async(
+                {
+                    "status": "pending",
+                    "retry_attempts": self.retry_attempts,
+                    "error_message": self.error_message,
+                }
+            )
+            self.heartbeats_sent += 1
+
+    def _send_async(self, data: Dict[str, Any]) -> None:
+        # Holding the lock while enqueueing keeps a heartbeat from landing
+        # after the final write in the writer's FIFO queue.
+        with self._lock:
+            if self._finished:
+                return
+            try:
+                writer_client.update("ModelCall", self.model_call.id, data, wait=False)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.logger.debug(
+                    f"ModelCall {self.model_call.id} heartbeat failed: {e}"
+                )
@@ -1,16 +1,52 @@
 import logging
 import re
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError, model_validator
 
 logger = logging.getLogger(__name__)
 
 
+def _resolve_segment_id(
+    item: Any, segment_offsets: Optional[Dict[int, float]]
+) -> Optional[Any]:
+    """Map a compact-encoding `segment_id` item to its segment_offset.
+
+    Returns None for ids that are not part of the chunk.
+    """
+    if (
+        not isinstance(item, dict)
+        or "segment_offset" in item
+        or "segment_id" not in item
+        or segment_offsets is None
+    ):
+        return item
+    try:
+        offset = segment_offsets[int(item["segment_id"])]
+    except (KeyError, TypeError, ValueError):
+        logger.warning(f"Ignoring prediction for unknown segment id: {item!r}")
+        return None
+    resolved = {k: v for k, v in item.items() if k != "segment_id"}
+    resolved["segment_offset"] = offset
+    return resolved
+
+
+def _segment_offsets(info: Any) -> Optional[Dict[int, float]]:
+    # `info` is pydantic's ValidationInfo; typed loosely so runtime type
+    # checkers don't need to resolve the protocol.
+    context = info.context or {}
+    return context.get("segment_offsets") if isinstance(context, dict) else None
+
+
 class AdSegmentPrediction(BaseModel):
     segment_offset: float
     confidence: float
 
+    @model_validator(mode="before")
+    @classmethod
+    def _map_segment_id(cls, data: Any, info: Any) -> Any:
+        return _resolve_segment_id(data, _segment_offsets(info))
+
 
 class AdSegmentPredictionList(BaseModel):
     ad_segments: List[AdSegmentPrediction]
@@ -24,6 +60,18 @@ class AdSegmentPredictionList(BaseModel):
     ] = None
     confidence: Optional[float] = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def _map_segment_ids(cls, data: Any, info: Any) -> Any:
+        segment_offsets = _segment_offsets(info)
+        if segment_offsets is None or not isinstance(data, dict):
+            return data
+        items = data.get("ad_segments")
+        if not isinstance(items, list):
+            return data
+        resolved = [_resolve_segment_id(item, segment_offsets) for item in items]
+        return {**data, "ad_segments": [item for item in resolved if item is not None]}
+
 
 def _attempt_json_repair(json_str: str) -> str:
     """
@@ -91,8 +139,16 @@ def _attempt_json_repair(json_str: str) -> str:
     return repaired
 
 
-def clean_and_parse_model_output(model_output: str) -> AdSegmentPredictionList:
+def clean_and_parse_model_output(
+    model_output: str, segment_offsets: Optional[Dict[int, float]] = None
+) -> AdSegmentPredictionList:
+    """Parse a classification response.
+
+    `segment_offsets` maps compact-encoding segment ids to start times; items
+    reporting `segment_id` instead of `segment_offset` are translated with it.
+    """
     start_marker, end_marker = "{", "}"
+    context = {"segment_offsets": segment_offsets}
 
     assert (
         model_output.count(start_marker) >= 1
@@ -115,14 +171,18 @@ def clean_and_parse_model_output(model_output: str) -> AdSegmentPredictionList:
 
     # First attempt: try to parse as-is
     try:
-        return AdSegmentPredictionList.parse_raw(model_output)
+        return AdSegmentPredictionList.model_validate_json(
+            model_output, context=context
+        )
     except Exception as first_error:
         logger.debug(f"Initial parse failed: {first_error}")
 
         # Second attempt: try to repair truncated JSON
         try:
             repaired_output = _attempt_json_repair(model_output)
-            result = AdSegmentPredictionList.parse_raw(repaired_output)
+            result = AdSegmentPredictionList.model_validate_json(
+                repaired_output, context=context
+            )
             logger.info("Successfully parsed model output after JSON repair")
             return result
         except Exception as repair_error:
@@ -131,3 +191,114 @@ def clean_and_parse_model_output(model_output: str) -> AdSegmentPredictionList:
             )
             # Re-raise the original error with more context
             raise first_error from repair_error
+
+
+_AD_SEGMENTS_ARRAY_RE = re.compile(r"[\"']ad_segments[\"']\s*:\s*\[")
+_PREDICTION_OBJECT_RE = re.compile(r"\s*,?\s*(\{[^{}]*\})")
+_ARRAY_END_RE = re.compile(r"\s*,?\s*\]")
+
+
+class StreamingPredictionParser:
+    """
+    Incrementally extract AdSegmentPrediction objects from a streamed response.
+
+    `feed` returns predictions as soon as their JSON object closes. Runaway
+    generations are flagged through `stop_reason` once the model emits more
+    predictions than the chunk has segments or keeps repeating an offset, so
+    the caller can stop reading the stream.
+    """
+
+    def __init__(
+        self,
+        max_predictions: Optional[int] = None,
+        max_offset_repeats: int = 3,
+        segment_offsets: Optional[Dict[int, float]] = None,
+    ):
+        self.max_predictions = max_predictions
+        self.segment_offsets = segment_offsets
+        self.max_offset_repeats = max_offset_repeats
+        self.predictions: List[AdSegmentPrediction] = []
+        self.stop_reason: Optional[str] = None
+        self._buffer = ""
+        self._pos: Optional[int] = None
+        self._array_closed = False
+        self._offset_counts: Dict[float, int] = {}
+
+    @property
+    def text(self) -> str:
+        return self._buffer
+
+    @property
+    def array_closed(self) -> bool:
+        return self._array_closed
+
+    def feed(self, delta: str) -> List[AdSegmentPrediction]:
+        self._buffer += delta
+        if self._pos is None:
+            match = _AD_SEGMENTS_ARRAY_RE.search(self._buffer)
+            if not match:
+                return []
+            self._pos = match.end()
+
+        new_predictions: List[AdSegmentPrediction] = []
+        while not self._array_closed and self.stop_reason is None:
+            match = _PREDICTION_OBJECT_RE.match(self._buffer, self._pos)
+            if match:
+                self._pos = match.end()
+                prediction = self._parse_prediction(match.group(1))
+                if prediction is not None:
+                    self._accept(prediction)
+                    new_predictions.append(prediction)
+                continue
+            if _ARRAY_END_RE.match(self._buffer, self._pos):
+                self._array_closed = True
+            break
+        return new_predictions
+
+    def _parse_prediction(self, raw: str) -> Optional[AdSegmentPrediction]:
+        try:
+            return AdSegmentPrediction.model_validate_json(
+                raw.replace("'", '"'),
+                context={"segment_offsets": self.segment_offsets},
+            )
+        except ValueError as e:
+            logger.debug(f"Skipping unparseable streamed prediction {raw!r}: {e}")
+            return None
+
+    def _accept(self, prediction: AdSegmentPrediction) -> None:
+        self.predictions.append(prediction)
+        count = self._offset_counts.get(prediction.segment_offset, 0) + 1
+        self._offset_counts[prediction.segment_offset] = count
+
+        if count >= self.max_offset_repeats:
+            self.stop_reason = (
+                f"offset {prediction.segment_offset} repeated {count} times"
+            )
+        elif (
+            self.max_predictions is not None
+            and len(self.predictions) > self.max_predictions
+        ):
+            self.stop_reason = (
+                f"{len(self.predictions)} predictions exceed the "
+                f"{self.max_predictions} segments in the chunk"
+            )
+
+    def result(self) -> AdSegmentPredictionList:
+        """Final prediction list; falls back to the streamed objects if cut off."""
+        if self.stop_reason is None:
+            try:
+                return clean_and_parse_model_output(
+                    self._buffer, segment_offsets=self.segment_offsets
+                )
+            except (ValidationError, AssertionError, ValueError):
+                logger.warning(
+                    "Full streamed response did not parse; using streamed predictions"
+                )
+
+        unique: Dict[float, AdSegmentPrediction] = {}
+        for prediction in self.predictions:
+            unique.setdefault(prediction.segment_offset, prediction)
+        ad_segments = list(unique.values())
+        if self.max_predictions is not None:
+            ad_segments = ad_segments[: self.max_predictions]
+        return AdSegmentPredictionList(ad_segments=ad_segments)
@@ -3,7 +3,7 @@ import os
 import shutil
 import threading
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 import litellm
 from jinja2 import Template
@@ -12,7 +12,7 @@ from sqlalchemy.orm import object_session
 from app.extensions import db
 from app.models import Post, ProcessingJob, TranscriptSegment
 from app.writer.client import writer_client
-from podcast_processor.ad_classifier import AdClassifier
+from podcast_processor.ad_classifier import AdClassifier, ClassificationDeferred
 from podcast_processor.audio_processor import AudioProcessor
 from podcast_processor.podcast_downloader import PodcastDownloader, sanitize_title
 from podcast_processor.processing_status_manager import ProcessingStatusManager
@@ -140,6 +140,10 @@ class PodcastProcessor:
 
         Returns:
             Path to the processed audio file
+
+        Raises:
+            ClassificationDeferred: the job was parked as "waiting" on the batch
+                API; there is no processed audio yet.
         """
         job = self.db_session.get(ProcessingJob, job_id)
         if not job:
@@ -241,6 +245,10 @@ class PodcastProcessor:
                     # Best-effort lock release; avoid masking original exceptions
                     pass
 
+        except ClassificationDeferred:
+            # The job is already parked, not failed
+            raise
+
         except ProcessorException as e:
             error_msg = str(e)
             if "Processing job in progress" in error_msg:
@@ -335,6 +343,17 @@ class PodcastProcessor:
             job: The ProcessingJob for tracking
             processed_audio_path: Path where the processed audio will be saved
         """
+        if self._should_stream_classification(post):
+            # Steps 2 and 3 overlap: chunks are classified while later ones
+            # are still being transcribed
+            self.status_manager.update_job_status(
+                job, "running", 2, "Transcribing audio and identifying ads", 50.0
+            )
+            self._transcribe_and_classify(post, job, cancel_callback)
+            self._raise_if_cancelled(job, 3, cancel_callback)
+            self._process_audio_and_finish(post, job, processed_audio_path)
+            return
+
         # Step 2: Transcribe audio
         self.status_manager.update_job_status(
             job, "running", 2, "Transcribing audio", 50.0
@@ -343,9 +362,26 @@ class PodcastProcessor:
         self._raise_if_cancelled(job, 2, cancel_callback)
 
         # Step 3: Classify ad segments
-        self._classify_ad_segments(post, job, transcript_segments)
+        try:
+            self._classify_ad_segments(post, job, transcript_segments)
+        except ClassificationDeferred as deferred:
+            # Park the job instead of holding the worker; the batch poller
+            # moves it back to pending once the responses are stored.
+            self.logger.info(f"Parking job for post {post.id}: {deferred}")
+            self.status_manager.update_job_status(
+                job,
+                "waiting",
+                3,
+                f"Waiting for batch classification ({len(deferred.model_call_ids)} chunks)",
+                75.0,
+            )
+            raise
         self._raise_if_cancelled(job, 3, cancel_callback)
+        self._process_audio_and_finish(post, job, processed_audio_path)
 
+    def _process_audio_and_finish(
+        self, post: Post, job: ProcessingJob, processed_audio_path: str
+    ) -> None:
         # Step 4: Process audio (remove ad segments)
         self.status_manager.update_job_status(
             job, "running", 4, "Processing audio", 90.0
@@ -384,6 +420,36 @@ class PodcastProcessor:
             )
             raise ProcessorException("Cancelled")
 
+    def _should_stream_classification(self, post: Post) -> bool:
+        transcriber = getattr(self.transcription_manager, "transcriber", None)
+        return (
+            self.config.processing.stream_classification
+            and getattr(transcriber, "streams_batches", False) is True
+            and self.ad_classifier.can_classify_stream(post) is True
+        )
+
+    def _transcribe_and_classify(
+        self,
+        post: Post,
+        job: ProcessingJob,
+        cancel_callback: Optional[Callable[[], bool]],
+    ) -> None:
+        """Classify transcript segments as each transcription chunk is stored."""
+
+        def segment_batches() -> Iterator[List[TranscriptSegment]]:
+            for batch in self.transcription_manager.transcribe_stream(post):
+                yield batch
+                self._raise_if_cancelled(job, 2, cancel_callback)
+
+        self.ad_classifier.classify_stream(
+            segment_batches=segment_batches(),
+            system_prompt=self.get_system_prompt(DEFAULT_SYSTEM_PROMPT_PATH),
+            user_prompt_template=self.get_user_prompt_template(
+                DEFAULT_USER_PROMPT_TEMPLATE_PATH
+            ),
+            post=post,
+        )
+
     def _classify_ad_segments(
         self,
         post: Post,
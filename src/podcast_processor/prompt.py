@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence
 
 from podcast_processor.cue_detector import CueDetector
 from podcast_processor.model_output import AdSegmentPrediction, AdSegmentPredictionList
@@ -26,6 +26,53 @@ def transcript_excerpt_for_prompt(
     return "\n".join(excerpts)
 
 
+def compact_segment_ids(sequence_nums: Sequence[int]) -> List[int]:
+    """Segment ids used by the compact encoding: sequence numbers relative to the
+    chunk's first segment, so they stay short and are recoverable from the chunk."""
+    if not sequence_nums:
+        return []
+    return [seq - sequence_nums[0] for seq in sequence_nums]
+
+
+def compact_transcript_excerpt_for_prompt(
+    segments: List[Segment],
+    segment_ids: List[int],
+    includes_start: bool,
+    includes_end: bool,
+) -> str:
+    """Token-lean variant of `transcript_excerpt_for_prompt`.
+
+    Lines read `id|seconds text`, with seconds relative to the first segment
+    rounded to whole numbers, and a single `*` after the seconds instead of
+    `***` around every cue.
+    """
+    base = segments[0].start if segments else 0.0
+    excerpts = [
+        f"{segment_id}|{segment.start - base:.0f}"
+        f"{'*' if _cue_detector.has_highlight(segment.text) else ''} {segment.text}"
+        for segment_id, segment in zip(segment_ids, segments)
+    ]
+    if includes_start:
+        excerpts.insert(0, "[TRANSCRIPT START]")
+    if includes_end:
+        excerpts.append("[TRANSCRIPT END]")
+
+    return "\n".join(excerpts)
+
+
+COMPACT_ENCODING_INSTRUCTIONS = """
+
+ENCODING: lines start "ID|S" (segment id|seconds since the first line; a trailing * marks ad cues). Report {"segment_id": ID, "confidence": C} instead of segment_offset.
+"""
+
+
+def apply_prompt_encoding(system_prompt: str, compact: bool) -> str:
+    """Append the compact-encoding instructions when that encoding is in use."""
+    if not compact or COMPACT_ENCODING_INSTRUCTIONS in system_prompt:
+        return system_prompt
+    return system_prompt.rstrip() + COMPACT_ENCODING_INSTRUCTIONS
+
+
 def generate_system_prompt() -> str:
     valid_empty_example = AdSegmentPredictionList(ad_segments=[]).model_dump_json(
         exclude_none=True
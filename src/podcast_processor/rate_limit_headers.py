@@ -0,0 +1,133 @@
+"""
+Provider rate-limit headers exposed by litellm.
+
+Errors carry the raw HTTP response (`error.response.headers`, or
+`litellm_response_headers`); successful responses carry the provider headers in
+`_hidden_params["additional_headers"]`, prefixed with "llm_provider-". Both are
+normalized to a lowercase dict so callers can read:
+
+- Retry-After / retry-after-ms, sent with 429 and overload responses.
+- OpenAI-style x-ratelimit-remaining-*/x-ratelimit-reset-* (also used by Groq
+  and by litellm for other providers); resets are durations such as "6m0s".
+- Anthropic anthropic-ratelimit-*-remaining/-reset; resets are RFC 3339 times.
+"""
+
+import re
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+_PROVIDER_PREFIX = "llm_provider-"
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_LIMIT_KINDS = ("requests", "tokens", "input-tokens", "output-tokens")
+
+
+def headers_from(obj: Any) -> Dict[str, str]:
+    """Provider response headers from a litellm exception or response."""
+    sources = [
+        getattr(getattr(obj, "response", None), "headers", None),
+        getattr(obj, "litellm_response_headers", None),
+        getattr(obj, "headers", None),
+    ]
+    hidden_params = getattr(obj, "_hidden_params", None)
+    if isinstance(hidden_params, dict):
+        sources.append(hidden_params.get("additional_headers"))
+
+    headers: Dict[str, str] = {}
+    for source in sources:
+        if not isinstance(source, Mapping):  # httpx.Headers is a Mapping
+            continue
+        for key, value in source.items():
+            name = str(key).lower()
+            if name.startswith(_PROVIDER_PREFIX):
+                name = name[len(_PROVIDER_PREFIX) :]
+            headers.setdefault(name, str(value))
+    return headers
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Seconds from "20", "1.5s", "250ms" or "6m0s"."""
+    number = _parse_number(value)
+    if number is not None:
+        return number
+    parts = _DURATION_PART_RE.findall(value.strip())
+    if not parts or "".join(n + u for n, u in parts) != value.strip():
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(n) * scale[unit] for n, unit in parts)
+
+
+def _seconds_until(value: str, now: float) -> Optional[float]:
+    """Seconds from `now` until an HTTP date or RFC 3339 timestamp."""
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if when.tzinfo is None:
+        return None
+    return when.timestamp() - now
+
+
+def _parse_reset(value: Optional[str], now: float) -> Optional[float]:
+    if value is None:
+        return None
+    seconds = _parse_duration(value)
+    if seconds is None:
+        seconds = _seconds_until(value, now)
+    return None if seconds is None else max(0.0, seconds)
+
+
+def retry_after_seconds(
+    headers: Mapping[str, str], now: Optional[float] = None
+) -> Optional[float]:
+    """Explicit Retry-After (or retry-after-ms) delay, if the provider sent one."""
+    now = time.time() if now is None else now
+    millis = _parse_number(headers.get("retry-after-ms"))
+    if millis is not None:
+        return max(0.0, millis / 1000.0)
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    seconds = _parse_number(value)
+    if seconds is None:
+        seconds = _seconds_until(value, now)
+    return None if seconds is None else max(0.0, seconds)
+
+
+def exhausted_reset_seconds(
+    headers: Mapping[str, str], now: Optional[float] = None
+) -> Optional[float]:
+    """Time until the longest exhausted request/token limit resets.
+
+    None when every reported limit still has budget remaining.
+    """
+    now = time.time() if now is None else now
+    waits = []
+    for kind in _LIMIT_KINDS:
+        for remaining_key, reset_key in (
+            (f"x-ratelimit-remaining-{kind}", f"x-ratelimit-reset-{kind}"),
+            (
+                f"anthropic-ratelimit-{kind}-remaining",
+                f"anthropic-ratelimit-{kind}-reset",
+            ),
+        ):
+            remaining = _parse_number(headers.get(remaining_key))
+            if remaining is None or remaining > 0:
+                continue
+            reset = _parse_reset(headers.get(reset_key), now)
+            if reset is not None:
+                waits.append(reset)
+    return max(waits) if waits else None
@@ -0,0 +1,253 @@
+"""
+Lightweight per-segment ad scorer trained from stored identifications.
+
+A logistic regression over hashed word unigrams/bigrams plus the CueDetector
+signals and a coarse position-in-episode feature. Features are kept as CSR
+arrays, so scoring an episode is a handful of NumPy calls (a few milliseconds
+for thousands of segments) and training is plain full-batch Adagrad on the CPU.
+
+NumPy is optional (see podcast_processor.segment_timeline); without it the
+scorer cannot be trained or loaded and callers fall back to LLM-only
+classification.
+"""
+
+import json
+import logging
+import re
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from podcast_processor.cue_detector import CueDetector
+from podcast_processor.segment_timeline import HAS_NUMPY
+
+try:
+    import numpy as np
+except ImportError:  # lite image
+    np = None  # type: ignore[assignment]
+
+HASH_BITS = 18
+N_HASH_BUCKETS = 1 << HASH_BITS
+CUE_FEATURES = ("url", "promo", "phone", "cta", "transition", "self_promo")
+# Pre-roll and post-roll ads cluster at the ends of an episode
+POSITION_FEATURES = ("first_tenth", "last_tenth")
+N_FEATURES = N_HASH_BUCKETS + len(CUE_FEATURES) + len(POSITION_FEATURES)
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+_cue_detector = CueDetector()
+
+
+@lru_cache(maxsize=1 << 17)
+def _bucket(term: str) -> int:
+    # crc32 rather than hash(): bucket ids must be stable across processes
+    return zlib.crc32(term.encode("utf-8")) & (N_HASH_BUCKETS - 1)
+
+
+def _text_features(text: str) -> List[int]:
+    tokens = _TOKEN_RE.findall(text.lower())
+    terms = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    return sorted({_bucket(term) for term in terms})
+
+
+@dataclass
+class SegmentFeatures:
+    """CSR feature matrix: row i spans indices[indptr[i]:indptr[i + 1]]."""
+
+    indices: Any
+    values: Any
+    indptr: Any
+
+    @property
+    def n_rows(self) -> int:
+        return int(self.indptr.size - 1)
+
+    def row_ids(self) -> Any:
+        return np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+
+
+def featurize(texts: Sequence[str], positions: Sequence[float]) -> SegmentFeatures:
+    """Hashed n-grams (L2-normalized), cue flags and position flags per segment.
+
+    `positions` are relative positions in the episode, 0.0 (start) to 1.0 (end).
+    """
+    indices: List[int] = []
+    values: List[float] = []
+    indptr = [0]
+    for text, position in zip(texts, positions):
+        buckets = _text_features(text or "")
+        if buckets:
+            weight = 1.0 / len(buckets) ** 0.5
+            indices.extend(buckets)
+            values.extend([weight] * len(buckets))
+        signals = _cue_detector.analyze(text or "")
+        for offset, name in enumerate(CUE_FEATURES):
+            if signals[name]:
+                indices.append(N_HASH_BUCKETS + offset)
+                values.append(1.0)
+        position_base = N_HASH_BUCKETS + len(CUE_FEATURES)
+        if position < 0.1:
+            indices.append(position_base)
+            values.append(1.0)
+        elif position > 0.9:
+            indices.append(position_base + 1)
+            values.append(1.0)
+        indptr.append(len(indices))
+    return SegmentFeatures(
+        indices=np.asarray(indices, dtype=np.int64),
+        values=np.asarray(values, dtype=np.float32),
+        indptr=np.asarray(indptr, dtype=np.int64),
+    )
+
+
+def relative_positions(sequence_nums: Sequence[int]) -> List[float]:
+    """Position of each segment within its episode, from sequence numbers."""
+    if not sequence_nums:
+        return []
+    last = max(sequence_nums) or 1
+    return [seq / last for seq in sequence_nums]
+
+
+def _sigmoid(x: Any) -> Any:
+    return 1.0 / (1.0 + np.exp(-np.clip(x, -30.0, 30.0)))
+
+
+class SegmentScorer:
+    """Trained weights plus the metadata recorded at training time."""
+
+    def __init__(
+        self,
+        weights: Any,
+        bias: float,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.bias = float(bias)
+        self.metadata = metadata or {}
+
+    def score_features(self, features: SegmentFeatures) -> Any:
+        contributions = self.weights[features.indices] * features.values
+        margins = np.bincount(
+            features.row_ids(), weights=contributions, minlength=features.n_rows
+        )
+        return _sigmoid(margins + self.bias)
+
+    def score_texts(self, texts: Sequence[str], positions: Sequence[float]) -> Any:
+        """Ad probability per text."""
+        return self.score_features(featurize(texts, positions))
+
+    def score_segments(self, segments: Iterable[Any]) -> Dict[int, float]:
+        """Ad probability keyed by TranscriptSegment id, for one episode."""
+        segments = list(segments)
+        scores = self.score_texts(
+            [seg.text or "" for seg in segments],
+            relative_positions([seg.sequence_num for seg in segments]),
+        )
+        return {seg.id: float(score) for seg, score in zip(segments, scores)}
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                weights=self.weights,
+                bias=np.asarray([self.bias]),
+                hash_bits=np.asarray([HASH_BITS]),
+                metadata=np.asarray(json.dumps(self.metadata)),
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> "SegmentScorer":
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["hash_bits"][0]) != HASH_BITS:
+                raise ValueError(
+                    f"Segment scorer at {path} uses {int(data['hash_bits'][0])} hash bits, "
+                    f"expected {HASH_BITS}; retrain it"
+                )
+            return cls(
+                weights=data["weights"],
+                bias=float(data["bias"][0]),
+                metadata=json.loads(str(data["metadata"])),
+            )
+
+
+def train_segment_scorer(
+    features: SegmentFeatures,
+    labels: Sequence[int],
+    *,
+    epochs: int = 150,
+    learning_rate: float = 0.5,
+    l2: float = 1e-5,
+) -> SegmentScorer:
+    """Fit class-balanced logistic regression with full-batch Adagrad."""
+    y = np.asarray(labels, dtype=np.float64)
+    n = y.size
+    if n == 0 or y.min() == y.max():
+        raise ValueError("Training needs both ad and non-ad segments")
+
+    positives = y.sum()
+    sample_weight = np.where(y == 1.0, n / (2 * positives), n / (2 * (n - positives)))
+    row_ids = features.row_ids()
+    weights = np.zeros(N_FEATURES, dtype=np.float64)
+    bias = 0.0
+    grad_sq = np.zeros(N_FEATURES, dtype=np.float64)
+    bias_grad_sq = 0.0
+    eps = 1e-8
+
+    for _ in range(epochs):
+        margins = np.bincount(
+            row_ids, weights=weights[features.indices] * features.values, minlength=n
+        )
+        error = (_sigmoid(margins + bias) - y) * sample_weight / n
+        grad = (
+            np.bincount(
+                features.indices,
+                weights=features.values * error[row_ids],
+                minlength=N_FEATURES,
+            )
+            + l2 * weights
+        )
+        grad_sq += grad * grad
+        weights -= learning_rate * grad / (np.sqrt(grad_sq) + eps)
+        bias_grad = float(error.sum())
+        bias_grad_sq += bias_grad * bias_grad
+        bias -= learning_rate * bias_grad / (bias_grad_sq**0.5 + eps)
+
+    return SegmentScorer(weights=weights, bias=bias)
+
+
+def evaluate(
+    scorer: SegmentScorer,
+    features: SegmentFeatures,
+    labels: Sequence[int],
+    threshold: float = 0.5,
+) -> Dict[str, float]:
+    """Precision, recall and accuracy at `threshold`."""
+    y = np.asarray(labels, dtype=bool)
+    predicted = scorer.score_features(features) >= threshold
+    true_pos = float(np.sum(predicted & y))
+    return {
+        "segments": float(y.size),
+        "precision": true_pos / max(1.0, float(predicted.sum())),
+        "recall": true_pos / max(1.0, float(y.sum())),
+        "accuracy": float(np.mean(predicted == y)) if y.size else 0.0,
+    }
+
+
+def load_segment_scorer(
+    path: Optional[str], logger: logging.Logger
+) -> Optional[SegmentScorer]:
+    """Load a trained scorer, or None (with a warning) if it is unavailable."""
+    if not path:
+        return None
+    if not HAS_NUMPY:
+        logger.warning("Segment scorer configured but NumPy is not installed")
+        return None
+    try:
+        scorer = SegmentScorer.load(Path(path))
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Could not load segment scorer from {path}: {e}")
+        return None
+    logger.info(f"Loaded segment scorer from {path} ({scorer.metadata})")
+    return scorer
@@ -0,0 +1,140 @@
+"""
+Array-backed view of a post's transcript segments and ad labels.
+
+Neighbor expansion, ad-block grouping and cut-interval merging used to walk
+lists of ORM objects, paying attribute loads (`ident.transcript_segment.start_time`)
+for every comparison. Here segment ids, sequence numbers and times are copied
+once into NumPy arrays ordered by sequence number, and the interval work runs
+as vectorized operations on them.
+
+NumPy ships with the full image (via whisper) but not the lite one, so callers
+check `HAS_NUMPY` and keep their list-based path as the fallback.
+"""
+
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # lite image
+    np = None  # type: ignore[assignment]
+    HAS_NUMPY = False
+
+
+class SegmentTimeline:
+    """Segment ids, sequence numbers, start and end times as parallel arrays.
+
+    Arrays are sorted by sequence number, so position `i` in every array
+    refers to the same segment.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[int],
+        sequence_nums: Sequence[int],
+        starts: Sequence[float],
+        ends: Sequence[float],
+        texts: Optional[Sequence[str]] = None,
+    ):
+        order = np.argsort(np.asarray(sequence_nums, dtype=np.int64), kind="stable")
+        # Text stays a plain list; it is only read for cue detection.
+        self.texts: List[str] = (
+            [texts[i] for i in order] if texts is not None else [""] * len(order)
+        )
+        self.ids = np.asarray(ids, dtype=np.int64)[order]
+        self.sequence_nums = np.asarray(sequence_nums, dtype=np.int64)[order]
+        self.starts = np.asarray(starts, dtype=np.float64)[order]
+        self.ends = np.asarray(ends, dtype=np.float64)[order]
+        self._id_order = np.argsort(self.ids, kind="stable")
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Any]) -> "SegmentTimeline":
+        rows = [
+            (
+                seg.id,
+                seg.sequence_num,
+                float(seg.start_time or 0.0),
+                float(
+                    seg.end_time if seg.end_time is not None else seg.start_time or 0.0
+                ),
+                seg.text or "",
+            )
+            for seg in segments
+        ]
+        if not rows:
+            return cls([], [], [], [])
+        ids, seqs, starts, ends, texts = zip(*rows)
+        return cls(ids, seqs, starts, ends, texts)
+
+    def __len__(self) -> int:
+        return int(self.ids.size)
+
+    def positions_of_ids(self, segment_ids: Sequence[int]) -> Tuple[Any, Any]:
+        """Map segment ids to positions. Returns (positions, found_mask)."""
+        return self._lookup(self.ids, self._id_order, segment_ids)
+
+    def positions_of_sequence_nums(self, sequence_nums: Any) -> Tuple[Any, Any]:
+        """Map sequence numbers to positions. Returns (positions, found_mask)."""
+        return self._lookup(self.sequence_nums, None, sequence_nums)
+
+    @staticmethod
+    def _lookup(values: Any, order: Any, keys: Any) -> Tuple[Any, Any]:
+        keys = np.asarray(keys, dtype=np.int64)
+        if values.size == 0:
+            return np.zeros(keys.shape, dtype=np.int64), np.zeros(keys.shape, bool)
+        sorted_values = values if order is None else values[order]
+        idx = np.clip(np.searchsorted(sorted_values, keys), 0, values.size - 1)
+        found = sorted_values[idx] == keys
+        positions = idx if order is None else order[idx]
+        return positions, found
+
+    def neighbor_pairs(self, base_positions: Any, window: int) -> Tuple[Any, Any]:
+        """All (base, neighbor) pairs within `window` sequence numbers.
+
+        Returns flat arrays (base_index, neighbor_position) in base order, then
+        offset order (-window..window, skipping 0); `base_index` indexes into
+        `base_positions`. Sequence numbers missing from the post are dropped.
+        """
+        base_positions = np.asarray(base_positions, dtype=np.int64)
+        offsets = np.arange(-window, window + 1, dtype=np.int64)
+        offsets = offsets[offsets != 0]
+        wanted = self.sequence_nums[base_positions][:, None] + offsets[None, :]
+        neighbor_pos, found = self.positions_of_sequence_nums(wanted.ravel())
+        base_index = np.repeat(np.arange(base_positions.size), offsets.size)
+        return base_index[found], neighbor_pos[found]
+
+
+def group_adjacent(starts: Any, ends: Any, max_gap: float) -> List[Tuple[int, int]]:
+    """Split intervals (already sorted by start) into runs of adjacent ones.
+
+    A new run starts where the gap between an interval's start and the
+    previous interval's end exceeds `max_gap`. Returns [start, stop) index
+    ranges into the inputs.
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    if starts.size == 0:
+        return []
+    breaks = np.flatnonzero(starts[1:] - ends[:-1] > max_gap) + 1
+    bounds = np.concatenate(([0], breaks, [starts.size]))
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def merge_close_intervals(
+    starts: Any, ends: Any, min_separation: float
+) -> Tuple[Any, Any]:
+    """Merge intervals (sorted by start) closer than `min_separation`.
+
+    Matches the sequential merge in AudioProcessor: a run of merged intervals
+    spans from the first interval's start to the last interval's end.
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    if starts.size == 0:
+        return starts, ends
+    run_starts = np.concatenate(
+        ([0], np.flatnonzero(ends[:-1] + min_separation < starts[1:]) + 1)
+    )
+    run_ends = np.concatenate((run_starts[1:] - 1, [starts.size - 1]))
+    return starts[run_starts], ends[run_ends]
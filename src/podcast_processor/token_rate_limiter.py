@@ -3,17 +3,255 @@ Token-based rate limiting for LLM API calls.
 
 This module provides client-side rate limiting based on input token consumption
 to prevent hitting API provider rate limits (e.g., Anthropic's 30,000 tokens/minute).
+
+Usage is kept as per-second bucket counters with a running total per budget,
+so checking the limit does not re-sum the window. A budget is one model used
+with one API key. Counters live in a TokenUsageStore: in memory for a single
+process, or in a SQLite file so the web process and every worker draw from
+the same budget.
 """
 
+import hashlib
 import logging
+import math
+import sqlite3
 import threading
 import time
+from abc import ABC, abstractmethod
 from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+from shared.processing_paths import get_instance_dir
 
 logger = logging.getLogger(__name__)
 
+BUCKET_SECONDS = 1.0
+
+
+def _bucket(timestamp: float) -> int:
+    return int(timestamp // BUCKET_SECONDS)
+
+
+def _first_live_bucket(current_time: float, window_seconds: int) -> int:
+    """Oldest bucket that still overlaps the window ending at current_time."""
+    return math.floor((current_time - window_seconds) / BUCKET_SECONDS)
+
+
+def _bucket_expiry(bucket: int, window_seconds: int) -> float:
+    return (bucket + 1) * BUCKET_SECONDS + window_seconds
+
+
+class TokenUsageStore(ABC):
+    """Bucketed token counts per budget over a sliding window."""
+
+    @abstractmethod
+    def usage(
+        self, budget: str, window_seconds: int, current_time: float
+    ) -> Tuple[int, int, Optional[int]]:
+        """(tokens in window, live buckets, oldest live bucket)"""
+
+    @abstractmethod
+    def add(
+        self, budget: str, tokens: int, window_seconds: int, timestamp: float
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def try_add(
+        self,
+        budget: str,
+        tokens: int,
+        limit: int,
+        window_seconds: int,
+        current_time: float,
+    ) -> Tuple[bool, float]:
+        """Add `tokens` if they fit under `limit`, atomically.
+
+        Returns (added, wait_seconds) with the same meaning as
+        TokenRateLimiter.check_rate_limit.
+        """
+
+
+def _admit(
+    total: int,
+    oldest: Optional[int],
+    tokens: int,
+    limit: int,
+    window: int,
+    now: float,
+) -> Tuple[bool, float]:
+    if total + tokens <= limit or oldest is None:
+        return True, 0.0
+    return False, max(0.0, _bucket_expiry(oldest, window) - now)
+
+
+class _UsageWindow:
+    def __init__(self) -> None:
+        self.buckets: Deque[List[int]] = deque()  # [[bucket, tokens], ...]
+        self.total = 0
+
+    def expire(self, first_live: int) -> None:
+        while self.buckets and self.buckets[0][0] < first_live:
+            self.total -= self.buckets.popleft()[1]
+
+    def add(self, bucket: int, tokens: int) -> None:
+        if self.buckets and self.buckets[-1][0] == bucket:
+            self.buckets[-1][1] += tokens
+        elif not self.buckets or self.buckets[-1][0] < bucket:
+            self.buckets.append([bucket, tokens])
+        else:
+            # Backdated usage (tests, clock skew); keep buckets ordered
+            for entry in self.buckets:
+                if entry[0] == bucket:
+                    entry[1] += tokens
+                    break
+            else:
+                self.buckets.append([bucket, tokens])
+                self.buckets = deque(sorted(self.buckets))
+        self.total += tokens
+
+
+class InMemoryTokenUsageStore(TokenUsageStore):
+    """Counters for budgets used by this process only."""
+
+    def __init__(self) -> None:
+        self._windows: Dict[str, _UsageWindow] = {}
+        self._lock = threading.Lock()
+
+    def _window(self, budget: str, window_seconds: int, now: float) -> _UsageWindow:
+        window = self._windows.setdefault(budget, _UsageWindow())
+        window.expire(_first_live_bucket(now, window_seconds))
+        return window
+
+    def usage(
+        self, budget: str, window_seconds: int, current_time: float
+    ) -> Tuple[int, int, Optional[int]]:
+        with self._lock:
+            window = self._window(budget, window_seconds, current_time)
+            oldest = window.buckets[0][0] if window.buckets else None
+            return window.total, len(window.buckets), oldest
+
+    def add(
+        self, budget: str, tokens: int, window_seconds: int, timestamp: float
+    ) -> None:
+        with self._lock:
+            window = self._window(budget, window_seconds, time.time())
+            window.add(_bucket(timestamp), tokens)
+
+    def try_add(
+        self,
+        budget: str,
+        tokens: int,
+        limit: int,
+        window_seconds: int,
+        current_time: float,
+    ) -> Tuple[bool, float]:
+        with self._lock:
+            window = self._window(budget, window_seconds, current_time)
+            oldest = window.buckets[0][0] if window.buckets else None
+            admitted = _admit(
+                window.total, oldest, tokens, limit, window_seconds, current_time
+            )
+            if admitted[0]:
+                window.add(_bucket(current_time), tokens)
+            return admitted
+
+
+class SQLiteTokenUsageStore(TokenUsageStore):
+    """Counters in a SQLite file shared by every process on the host.
+
+    At most one row per budget and second is kept, so reading a budget sums
+    a bounded number of rows. `try_add` runs in an IMMEDIATE transaction, so
+    processes cannot both claim the same remaining budget.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_token_usage ("
+            "budget TEXT NOT NULL, bucket INTEGER NOT NULL, tokens INTEGER NOT NULL, "
+            "PRIMARY KEY (budget, bucket))"
+        )
+
+    def _read(
+        self, budget: str, window_seconds: int, now: float
+    ) -> Tuple[int, int, Optional[int]]:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(tokens), 0), COUNT(*), MIN(bucket) "
+            "FROM llm_token_usage WHERE budget = ? AND bucket >= ?",
+            (budget, _first_live_bucket(now, window_seconds)),
+        ).fetchone()
+        return int(row[0]), int(row[1]), row[2]
+
+    def _write(
+        self, budget: str, tokens: int, window_seconds: int, timestamp: float
+    ) -> None:
+        self._conn.execute(
+            "INSERT INTO llm_token_usage (budget, bucket, tokens) VALUES (?, ?, ?) "
+            "ON CONFLICT (budget, bucket) DO UPDATE SET tokens = tokens + excluded.tokens",
+            (budget, _bucket(timestamp), tokens),
+        )
+        self._conn.execute(
+            "DELETE FROM llm_token_usage WHERE budget = ? AND bucket < ?",
+            (budget, _first_live_bucket(time.time(), window_seconds)),
+        )
+
+    def usage(
+        self, budget: str, window_seconds: int, current_time: float
+    ) -> Tuple[int, int, Optional[int]]:
+        with self._lock:
+            return self._read(budget, window_seconds, current_time)
+
+    def add(
+        self, budget: str, tokens: int, window_seconds: int, timestamp: float
+    ) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._write(budget, tokens, window_seconds, timestamp)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def try_add(
+        self,
+        budget: str,
+        tokens: int,
+        limit: int,
+        window_seconds: int,
+        current_time: float,
+    ) -> Tuple[bool, float]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                total, _, oldest = self._read(budget, window_seconds, current_time)
+                admitted = _admit(
+                    total, oldest, tokens, limit, window_seconds, current_time
+                )
+                if admitted[0]:
+                    self._write(budget, tokens, window_seconds, current_time)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return admitted
+
+
+def budget_key(model: Optional[str] = None, api_key: Optional[str] = None) -> str:
+    """Budget name for a model/API key pair; the key itself is never stored."""
+    budget = (model or "default").lower()
+    if api_key:
+        budget += "#" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+    return budget
+
 
 class TokenRateLimiter:
     """
@@ -23,23 +261,31 @@ class TokenRateLimiter:
     when necessary before making API calls.
     """
 
-    def __init__(self, tokens_per_minute: int = 30000, window_minutes: int = 1):
+    def __init__(
+        self,
+        tokens_per_minute: int = 30000,
+        window_minutes: int = 1,
+        *,
+        budget: str = "default",
+        store: Optional[TokenUsageStore] = None,
+    ):
         """
         Initialize the rate limiter.
 
         Args:
             tokens_per_minute: Maximum tokens allowed per minute
             window_minutes: Time window for rate limiting (default: 1 minute)
+            budget: Name of the token budget this limiter draws from
+            store: Where usage is counted (default: this limiter only)
         """
         self.tokens_per_minute = tokens_per_minute
         self.window_seconds = window_minutes * 60
-        self.token_usage: deque[Tuple[float, int]] = (
-            deque()
-        )  # [(timestamp, token_count), ...]
-        self.lock = threading.Lock()
+        self.budget = budget
+        self.store = store or InMemoryTokenUsageStore()
 
         logger.info(
-            f"Initialized TokenRateLimiter: {tokens_per_minute} tokens/{window_minutes}min"
+            f"Initialized TokenRateLimiter: {tokens_per_minute} tokens/{window_minutes}min "
+            f"(budget {budget}, {type(self.store).__name__})"
         )
 
     def count_tokens(self, messages: List[Dict[str, str]], model: str) -> int:
@@ -64,16 +310,10 @@ class TokenRateLimiter:
             logger.warning(f"Token counting failed, using fallback. Error: {e}")
             return 1000  # Conservative fallback
 
-    def _cleanup_old_usage(self, current_time: float) -> None:
-        """Remove token usage records outside the time window."""
-        cutoff_time = current_time - self.window_seconds
-        while self.token_usage and self.token_usage[0][0] < cutoff_time:
-            self.token_usage.popleft()
-
     def _get_current_usage(self, current_time: float) -> int:
         """Get total token usage within the current time window."""
-        self._cleanup_old_usage(current_time)
-        return sum(count for _, count in self.token_usage)
+        total, _, _ = self.store.usage(self.budget, self.window_seconds, current_time)
+        return total
 
     def check_rate_limit(
         self, messages: List[Dict[str, str]], model: str
@@ -89,33 +329,57 @@ class TokenRateLimiter:
             Tuple of (can_proceed, wait_seconds)
             - can_proceed: True if call can be made immediately
             - wait_seconds: Seconds to wait if can_proceed is False
+              (until the oldest counted tokens leave the window)
         """
         token_count = self.count_tokens(messages, model)
         current_time = time.time()
+        current_usage, _, oldest = self.store.usage(
+            self.budget, self.window_seconds, current_time
+        )
+        can_proceed, wait_seconds = _admit(
+            current_usage,
+            oldest,
+            token_count,
+            self.tokens_per_minute,
+            self.window_seconds,
+            current_time,
+        )
+        if not can_proceed:
+            self._log_limited(current_usage, token_count, wait_seconds)
+        return can_proceed, wait_seconds
 
-        with self.lock:
-            current_usage = self._get_current_usage(current_time)
-
-            # Check if adding this request would exceed the limit
-            if current_usage + token_count <= self.tokens_per_minute:
-                return True, 0.0
-
-            # Calculate wait time: find when oldest tokens will expire
-            if not self.token_usage:
-                return True, 0.0
-
-            oldest_time = self.token_usage[0][0]
-            wait_seconds = (oldest_time + self.window_seconds) - current_time
-            wait_seconds = max(0, wait_seconds)
+    def try_acquire(
+        self, messages: List[Dict[str, str]], model: str
+    ) -> Tuple[bool, float]:
+        """Check and record in one step; usage is recorded only when allowed.
 
-            logger.info(
-                f"Rate limit check: current={current_usage}, "
-                f"requested={token_count}, "
-                f"limit={self.tokens_per_minute}, "
-                f"wait={wait_seconds:.1f}s"
+        Unlike check_rate_limit followed by record_usage, no other thread or
+        process can claim the same budget in between.
+        """
+        token_count = self.count_tokens(messages, model)
+        current_time = time.time()
+        can_proceed, wait_seconds = self.store.try_add(
+            self.budget,
+            token_count,
+            self.tokens_per_minute,
+            self.window_seconds,
+            current_time,
+        )
+        if not can_proceed:
+            self._log_limited(
+                self._get_current_usage(current_time), token_count, wait_seconds
             )
+        return can_proceed, wait_seconds
 
-            return False, wait_seconds
+    def _log_limited(
+        self, current_usage: int, token_count: int, wait_seconds: float
+    ) -> None:
+        logger.info(
+            f"Rate limit check: current={current_usage}, "
+            f"requested={token_count}, "
+            f"limit={self.tokens_per_minute}, "
+            f"wait={wait_seconds:.1f}s"
+        )
 
     def record_usage(self, messages: List[Dict[str, str]], model: str) -> None:
         """
@@ -125,72 +389,134 @@ class TokenRateLimiter:
             messages: Messages that were sent to the API
             model: Model name that was used
         """
-        token_count = self.count_tokens(messages, model)
-        current_time = time.time()
-
-        with self.lock:
-            self.token_usage.append((current_time, token_count))
-            logger.debug(
-                f"Recorded {token_count} tokens at {datetime.fromtimestamp(current_time)}"
-            )
+        self.record_tokens(self.count_tokens(messages, model))
+
+    def record_tokens(
+        self, token_count: int, timestamp: Optional[float] = None
+    ) -> None:
+        """Count `token_count` tokens as used at `timestamp` (default: now)."""
+        current_time = time.time() if timestamp is None else timestamp
+        self.store.add(self.budget, token_count, self.window_seconds, current_time)
+        logger.debug(
+            f"Recorded {token_count} tokens at {datetime.fromtimestamp(current_time)}"
+        )
 
     def wait_if_needed(self, messages: List[Dict[str, str]], model: str) -> None:
         """
         Wait if necessary to avoid hitting rate limits, then record usage.
 
+        Usage is only recorded by a successful try_acquire, so limiters that
+        share a store and wake together can't all claim the freed budget.
+
         Args:
             messages: Messages to send to the API
             model: Model name
         """
-        can_proceed, wait_seconds = self.check_rate_limit(messages, model)
-
-        if not can_proceed and wait_seconds > 0:
+        while True:
+            can_proceed, wait_seconds = self.try_acquire(messages, model)
+            if can_proceed:
+                return
+            # Never spin when the store reports no wait
+            wait_seconds = max(wait_seconds, 0.1)
             logger.info(
                 f"Rate limiting: waiting {wait_seconds:.1f}s to avoid API limits"
             )
             time.sleep(wait_seconds)
 
-        # Record the usage immediately before making the call
-        self.record_usage(messages, model)
-
     def get_usage_stats(self) -> Dict[str, Union[int, float]]:
         """Get current usage statistics."""
-        current_time = time.time()
-        with self.lock:
-            current_usage = self._get_current_usage(current_time)
-            usage_percentage = (current_usage / self.tokens_per_minute) * 100
+        current_usage, active_buckets, _ = self.store.usage(
+            self.budget, self.window_seconds, time.time()
+        )
+        usage_percentage = (current_usage / self.tokens_per_minute) * 100
 
-            return {
-                "current_usage": current_usage,
-                "limit": self.tokens_per_minute,
-                "usage_percentage": usage_percentage,
-                "window_seconds": self.window_seconds,
-                "active_records": len(self.token_usage),
-            }
+        return {
+            "current_usage": current_usage,
+            "limit": self.tokens_per_minute,
+            "usage_percentage": usage_percentage,
+            "window_seconds": self.window_seconds,
+            "active_records": active_buckets,
+        }
 
 
-# Global rate limiter instance
-_RATE_LIMITER: Optional[TokenRateLimiter] = None  # pylint: disable=invalid-name
+# Limiters by (budget, tokens per minute); all share one store per location
+_RATE_LIMITERS: Dict[Tuple[str, int, Optional[str]], TokenRateLimiter] = {}
+_LOCAL_STORE = InMemoryTokenUsageStore()
+_SHARED_STORES: Dict[str, SQLiteTokenUsageStore] = {}
+_REGISTRY_LOCK = threading.Lock()
 
 
-def get_rate_limiter(tokens_per_minute: int = 30000) -> TokenRateLimiter:
-    """Get or create the global rate limiter instance."""
-    global _RATE_LIMITER  # pylint: disable=global-statement
-    if _RATE_LIMITER is None or _RATE_LIMITER.tokens_per_minute != tokens_per_minute:
-        _RATE_LIMITER = TokenRateLimiter(tokens_per_minute=tokens_per_minute)
-    return _RATE_LIMITER
+def default_token_usage_db_path() -> Path:
+    return get_instance_dir() / "db" / "llm_token_usage.sqlite3"
 
 
-def configure_rate_limiter_for_model(model: str) -> TokenRateLimiter:
+def _shared_store(path: Union[str, Path]) -> Optional[SQLiteTokenUsageStore]:
+    path = Path(path)
+    store = _SHARED_STORES.get(str(path))
+    if store is not None:
+        return store
+    if not path.parent.is_dir():
+        logger.info(
+            f"Token usage directory {path.parent} does not exist; "
+            "rate limiting with per-process budgets"
+        )
+        return None
+    try:
+        store = SQLiteTokenUsageStore(path)
+    except sqlite3.Error as e:
+        logger.warning(
+            f"Could not open shared token usage store {path}: {e}; "
+            "rate limiting with per-process budgets"
+        )
+        return None
+    _SHARED_STORES[str(path)] = store
+    return store
+
+
+def get_usage_store(
+    shared_store_path: Optional[Union[str, Path]] = None,
+) -> TokenUsageStore:
+    """The shared store at `shared_store_path` if usable, else this process's."""
+    with _REGISTRY_LOCK:
+        if shared_store_path is not None:
+            shared = _shared_store(shared_store_path)
+            if shared is not None:
+                return shared
+        return _LOCAL_STORE
+
+
+def get_rate_limiter(
+    tokens_per_minute: int = 30000,
+    *,
+    model: Optional[str] = None,
+    api_key: Optional[str] = None,
+    shared_store_path: Optional[Union[str, Path]] = None,
+) -> TokenRateLimiter:
+    """Get or create the limiter for a model/API key budget.
+
+    With `shared_store_path`, usage is counted in that SQLite file and shared
+    with every process using it; otherwise it is counted in this process.
     """
-    Configure rate limiter with appropriate limits for the given model.
+    budget = budget_key(model, api_key)
+    with _REGISTRY_LOCK:
+        store: TokenUsageStore = _LOCAL_STORE
+        store_name: Optional[str] = None
+        if shared_store_path is not None:
+            shared = _shared_store(shared_store_path)
+            if shared is not None:
+                store, store_name = shared, shared.path
+        key = (budget, tokens_per_minute, store_name)
+        limiter = _RATE_LIMITERS.get(key)
+        if limiter is None:
+            limiter = TokenRateLimiter(
+                tokens_per_minute=tokens_per_minute, budget=budget, store=store
+            )
+            _RATE_LIMITERS[key] = limiter
+        return limiter
 
-    Args:
-        model: Model name (e.g., "anthropic/claude-sonnet-4-20250514")
 
-    Returns:
-        Configured TokenRateLimiter instance
-    """
+def model_tokens_per_minute(model: str) -> int:
+    """Default tokens-per-minute limit for a model."""
     # Model-specific rate limits (tokens per minute)
     model_limits = {
         # Anthropic models
@@ -208,13 +534,36 @@ def configure_rate_limiter_for_model(model: str) -> TokenRateLimiter:
     }
 
     # Extract base model name and find limit
-    tokens_per_minute = 30000  # Conservative default
     for model_pattern, limit in model_limits.items():
         if model_pattern in model:
-            tokens_per_minute = limit
-            break
+            return limit
+    return 30000  # Conservative default
 
+
+def configure_rate_limiter_for_model(
+    model: str,
+    *,
+    api_key: Optional[str] = None,
+    shared_store_path: Optional[Union[str, Path]] = None,
+) -> TokenRateLimiter:
+    """
+    Configure rate limiter with appropriate limits for the given model.
+
+    Args:
+        model: Model name (e.g., "anthropic/claude-sonnet-4-20250514")
+        api_key: API key the calls are made with; each key has its own budget
+        shared_store_path: SQLite file shared between processes (see get_rate_limiter)
+
+    Returns:
+        Configured TokenRateLimiter instance
+    """
+    tokens_per_minute = model_tokens_per_minute(model)
     logger.info(
         f"Configured rate limiter for {model}: {tokens_per_minute} tokens/minute"
     )
-    return get_rate_limiter(tokens_per_minute)
+    return get_rate_limiter(
+        tokens_per_minute,
+        model=model,
+        api_key=api_key,
+        shared_store_path=shared_store_path,
+    )
@@ -1,17 +1,190 @@
 import logging
 import shutil
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from groq import Groq
 from openai import OpenAI
 from openai.types.audio.transcription_segment import TranscriptionSegment
 from pydantic import BaseModel
 
-from podcast_processor.audio import split_audio
-from shared.config import GroqWhisperConfig, RemoteWhisperConfig
+from podcast_processor.audio import get_audio_duration_ms, split_audio
+from podcast_processor.audio_quota import (
+    AudioQuotaScheduler,
+    get_audio_quota_scheduler,
+)
+from podcast_processor.chunk_checkpoints import ChunkCheckpoints
+from podcast_processor.llm_concurrency_limiter import (
+    ConcurrencyContext,
+    LLMConcurrencyLimiter,
+)
+from podcast_processor.whisper_model_cache import (
+    WhisperModelCache,
+    get_faster_whisper_model_cache,
+    get_whisper_model_cache,
+)
+from shared.config import FasterWhisperConfig, GroqWhisperConfig, RemoteWhisperConfig
+
+ChunkSegment = TypeVar("ChunkSegment")
+
+# One adaptive limiter per provider, shared by every transcription using it, so
+# a 429 on one episode slows uploads for all of them.
+_PROVIDER_LIMITERS: Dict[str, LLMConcurrencyLimiter] = {}
+_PROVIDER_LIMITERS_LOCK = threading.Lock()
+
+
+def _provider_limiter(provider: str, max_parallel: int) -> LLMConcurrencyLimiter:
+    with _PROVIDER_LIMITERS_LOCK:
+        limiter = _PROVIDER_LIMITERS.get(provider)
+        if limiter is None or limiter.max_concurrent_calls != max_parallel:
+            limiter = LLMConcurrencyLimiter(max_parallel)
+            _PROVIDER_LIMITERS[provider] = limiter
+        return limiter
+
+
+def transcribe_chunks(
+    chunks: Sequence[Tuple[Path, int]],
+    get_segments: Callable[[str], List[ChunkSegment]],
+    *,
+    provider: str,
+    max_parallel: int,
+    logger: logging.Logger,
+    log_prefix: str,
+    checkpoints: Optional[ChunkCheckpoints] = None,
+    quota: Optional[AudioQuotaScheduler] = None,
+) -> List[Tuple[List[ChunkSegment], int]]:
+    """Transcribe audio chunks concurrently.
+
+    Returns (segments, offset_ms) per chunk, in chunk order. At most
+    `max_parallel` uploads per provider are in flight; rate-limit errors halve
+    that and Retry-After pauses new uploads (see AIMDController). The first
+    failed chunk's error is raised. With `checkpoints`, each chunk's segments
+    are saved as it finishes and chunks saved by an earlier attempt are not
+    uploaded again. With `quota`, each upload first waits for the provider's
+    audio-seconds and request budgets.
+    """
+    return list(
+        iter_transcribed_chunks(
+            chunks,
+            get_segments,
+            provider=provider,
+            max_parallel=max_parallel,
+            logger=logger,
+            log_prefix=log_prefix,
+            checkpoints=checkpoints,
+            quota=quota,
+        )
+    )
+
+
+def _chunk_durations_ms(chunks: Sequence[Tuple[Path, int]]) -> List[int]:
+    """Chunk lengths from their offsets; the last chunk is probed."""
+    durations = [
+        next_offset - offset
+        for (_, offset), (_, next_offset) in zip(chunks, chunks[1:])
+    ]
+    if chunks:
+        try:
+            last = get_audio_duration_ms(str(chunks[-1][0]))
+        except OSError:
+            last = None
+        durations.append(last if last is not None else max(durations, default=0))
+    return durations
+
+
+def iter_transcribed_chunks(
+    chunks: Sequence[Tuple[Path, int]],
+    get_segments: Callable[[str], List[ChunkSegment]],
+    *,
+    provider: str,
+    max_parallel: int,
+    logger: logging.Logger,
+    log_prefix: str,
+    checkpoints: Optional[ChunkCheckpoints] = None,
+    quota: Optional[AudioQuotaScheduler] = None,
+) -> Iterator[Tuple[List[ChunkSegment], int]]:
+    """Like transcribe_chunks, but yields each chunk as soon as it and every
+    earlier chunk are done, while later chunks keep uploading."""
+    limiter = _provider_limiter(provider, max_parallel)
+    durations_ms = _chunk_durations_ms(chunks) if quota is not None else []
+
+    def transcribe_chunk(idx: int, chunk_path: Path) -> List[ChunkSegment]:
+        checkpoint_key = (
+            checkpoints.key(idx, chunk_path) if checkpoints is not None else None
+        )
+        if checkpoints is not None and checkpoint_key is not None:
+            saved: Optional[List[ChunkSegment]] = checkpoints.load(checkpoint_key)
+            if saved is not None:
+                logger.info(
+                    "%s Chunk %d/%d already transcribed: %d segments",
+                    log_prefix,
+                    idx + 1,
+                    len(chunks),
+                    len(saved),
+                )
+                return saved
+        # Wait for quota before taking a slot, so a paced chunk doesn't hold
+        # one that another chunk could use meanwhile
+        if quota is not None:
+            waited = quota.acquire(durations_ms[idx] / 1000)
+            if waited:
+                logger.info(
+                    "%s Chunk %d/%d waited %.1fs for transcription quota",
+                    log_prefix,
+                    idx + 1,
+                    len(chunks),
+                    waited,
+                )
+        with ConcurrencyContext(limiter):
+            logger.info(
+                "%s Processing chunk %d/%d: %s",
+                log_prefix,
+                idx + 1,
+                len(chunks),
+                chunk_path,
+            )
+            segments = get_segments(str(chunk_path))
+        if checkpoints is not None and checkpoint_key is not None:
+            checkpoints.save(checkpoint_key, segments)
+        logger.info(
+            "%s Chunk %d/%d complete: %d segments",
+            log_prefix,
+            idx + 1,
+            len(chunks),
+            len(segments),
+        )
+        return segments
+
+    workers = max(1, min(max_parallel, len(chunks)))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="transcribe-chunk"
+    ) as pool:
+        futures = [
+            pool.submit(transcribe_chunk, idx, chunk_path)
+            for idx, (chunk_path, _) in enumerate(chunks)
+        ]
+        try:
+            for future, (_, offset) in zip(futures, chunks):
+                yield future.result(), offset
+        except BaseException:
+            # Also reached when the consumer stops iterating early
+            for future in futures:
+                future.cancel()
+            raise
 
 
 class Segment(BaseModel):
@@ -20,7 +193,78 @@ class Segment(BaseModel):
     text: str
 
 
+# Segments either side of a chunk cut closer together than this, where the
+# first does not end a sentence, are treated as one utterance split by the cut.
+STITCH_MAX_GAP_SEC = 1.0
+_SENTENCE_END = (".", "?", "!", "\u2026", '"', "\u201d")
+
+
+class SegmentStitcher:
+    """Rejoins utterances split at chunk cuts as chunks arrive in order.
+
+    Each chunk's last segment is held back until the next chunk shows whether
+    it continues there. Empty segments on either side of a cut (common at
+    chunk edges) are dropped; empty segments elsewhere are kept.
+    """
+
+    def __init__(self) -> None:
+        self._held: Optional[Segment] = None
+        # Empty segments after the held one; only kept if no chunk follows
+        self._trailing: List[Segment] = []
+
+    def add_chunk(self, segments: List[Segment]) -> List[Segment]:
+        """Add the next chunk's segments; returns the segments now final."""
+        end = len(segments)
+        while end > 0 and not segments[end - 1].text.strip():
+            end -= 1
+        if end == 0:
+            if self._held is None:
+                # Nothing to stitch against yet, so these aren't at a cut
+                return list(segments)
+            return []
+        start = 0
+        if self._held is not None:
+            while not segments[start].text.strip():
+                start += 1
+        trailing = segments[end:]
+        segments = segments[start:end]
+        if self._held is not None:
+            last, first = self._held, segments[0]
+            if (
+                not last.text.rstrip().endswith(_SENTENCE_END)
+                and first.start - last.end <= STITCH_MAX_GAP_SEC
+            ):
+                segments[0] = Segment(
+                    start=last.start,
+                    end=max(last.end, first.end),
+                    text=f"{last.text.rstrip()} {first.text.lstrip()}",
+                )
+            else:
+                segments.insert(0, last)
+        self._held = segments.pop()
+        self._trailing = trailing
+        return segments
+
+    def finish(self) -> List[Segment]:
+        """The held-back segment, once no chunks are left."""
+        held, self._held = self._held, None
+        trailing, self._trailing = self._trailing, []
+        return ([held] if held is not None else []) + trailing
+
+
+def stitch_chunk_segments(chunk_segments: Sequence[List[Segment]]) -> List[Segment]:
+    """Concatenate per-chunk segments, rejoining utterances split at the cuts."""
+    stitcher = SegmentStitcher()
+    stitched: List[Segment] = []
+    for segments in chunk_segments:
+        stitched.extend(stitcher.add_chunk(segments))
+    stitched.extend(stitcher.finish())
+    return stitched
+
+
 class Transcriber(ABC):
+    # True when transcribe_stream yields several batches before finishing
+    streams_batches = False
 
     @property
     @abstractmethod
@@ -31,6 +275,10 @@ class Transcriber(ABC):
     def transcribe(self, audio_file_path: str) -> List[Segment]:
         pass
 
+    def transcribe_stream(self, audio_file_path: str) -> Iterator[List[Segment]]:
+        """Segments in batches as they become final; one batch unless chunked."""
+        yield self.transcribe(audio_file_path)
+
 
 class LocalTranscriptSegment(BaseModel):
     id: int
@@ -67,9 +315,15 @@ class TestWhisperTranscriber(Transcriber):
 
 class LocalWhisperTranscriber(Transcriber):
 
-    def __init__(self, logger: logging.Logger, whisper_model: str):
+    def __init__(
+        self,
+        logger: logging.Logger,
+        whisper_model: str,
+        model_cache: Optional[WhisperModelCache] = None,
+    ):
         self.logger = logger
         self.whisper_model = whisper_model
+        self.model_cache = model_cache or get_whisper_model_cache()
 
     @property
     def model_name(self) -> str:
@@ -86,24 +340,11 @@ class LocalWhisperTranscriber(Transcriber):
         return [seg.to_segment() for seg in local_segments]
 
     def transcribe(self, audio_file_path: str) -> List[Segment]:
-        # Import whisper only when needed to avoid CUDA dependencies during module import
-        try:
-            import whisper  # type: ignore[import-untyped]
-        except ImportError as e:
-            self.logger.error(f"Failed to import whisper: {e}")
-            raise ImportError(
-                "whisper library is required for LocalWhisperTranscriber"
-            ) from e
-
         self.logger.info("Using local whisper")
-        models = whisper.available_models()
-        self.logger.info(f"Available models: {models}")
-
-        model = whisper.load_model(name=self.whisper_model)
-
-        self.logger.info("Beginning transcription")
-        start = time.time()
-        result = model.transcribe(audio_file_path, fp16=False, language="English")
+        with self.model_cache.use(self.whisper_model) as model:
+            self.logger.info("Beginning transcription")
+            start = time.time()
+            result = model.transcribe(audio_file_path, fp16=False, language="English")
         end = time.time()
         elapsed = end - start
         self.logger.info(f"Transcription completed in {elapsed}")
@@ -113,11 +354,69 @@ class LocalWhisperTranscriber(Transcriber):
         return self.local_seg_to_seg(typed_segments)
 
 
-class OpenAIWhisperTranscriber(Transcriber):
+class FasterWhisperTranscriber(Transcriber):
+    """Local transcription with faster-whisper (CTranslate2), tuned for CPUs:
+    int8 weights, VAD to skip non-speech and a fixed intra-op thread count."""
 
-    def __init__(self, logger: logging.Logger, config: RemoteWhisperConfig):
+    def __init__(
+        self,
+        logger: logging.Logger,
+        config: FasterWhisperConfig,
+        model_cache: Optional[WhisperModelCache] = None,
+    ):
         self.logger = logger
         self.config = config
+        self.model_cache = model_cache or get_faster_whisper_model_cache(
+            config.compute_type, config.cpu_threads
+        )
+
+    @property
+    def model_name(self) -> str:
+        return f"faster_whisper_{self.config.model}"
+
+    def transcribe(self, audio_file_path: str) -> List[Segment]:
+        self.logger.info(
+            "Using faster-whisper (%s, %s, vad=%s)",
+            self.config.model,
+            self.config.compute_type,
+            self.config.vad_filter,
+        )
+        with self.model_cache.use(self.config.model) as model:
+            start = time.time()
+            segments, info = model.transcribe(
+                audio_file_path,
+                language="en",
+                # Greedy decoding, like openai-whisper's transcribe() default
+                beam_size=1,
+                vad_filter=self.config.vad_filter,
+            )
+            # Segments are decoded lazily, so consume them while holding the model
+            result = [
+                Segment(start=seg.start, end=seg.end, text=seg.text) for seg in segments
+            ]
+        elapsed = time.time() - start
+        duration = getattr(info, "duration", None)
+        rtf = f", RTF {elapsed / duration:.3f}" if duration else ""
+        self.logger.info(
+            f"Transcription completed in {elapsed:.1f}s{rtf}: {len(result)} segments"
+        )
+        return result
+
+
+class OpenAIWhisperTranscriber(Transcriber):
+    streams_batches = True
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        config: RemoteWhisperConfig,
+        quota_store_path: Optional[Path] = None,
+    ):
+        self.logger = logger
+        self.config = config
+        # Audio quota usage is shared through this SQLite file; None keeps it
+        # in this process (see get_audio_quota_scheduler)
+        self.quota_store_path = quota_store_path
 
         self.openai_client = OpenAI(
             base_url=config.base_url,
@@ -130,44 +429,82 @@ class OpenAIWhisperTranscriber(Transcriber):
         return self.config.model  # e.g. "whisper-1"
 
     def transcribe(self, audio_file_path: str) -> List[Segment]:
+        return [
+            segment
+            for batch in self.transcribe_stream(audio_file_path)
+            for segment in batch
+        ]
+
+    def transcribe_stream(self, audio_file_path: str) -> Iterator[List[Segment]]:
         self.logger.info(
             "[WHISPER_REMOTE] Starting remote whisper transcription for: %s",
             audio_file_path,
         )
         audio_chunk_path = audio_file_path + "_parts"
+        checkpoints = ChunkCheckpoints.for_audio(
+            audio_file_path, self.model_name, TranscriptionSegment
+        )
 
+        try:
+            yield from self._transcribe_chunks(
+                audio_file_path, audio_chunk_path, checkpoints
+            )
+        finally:
+            shutil.rmtree(audio_chunk_path, ignore_errors=True)
+        # Only reached once every chunk succeeded; a failed run keeps its
+        # checkpoints so the retry skips the chunks that finished
+        checkpoints.clear()
+
+    def _transcribe_chunks(
+        self,
+        audio_file_path: str,
+        audio_chunk_path: str,
+        checkpoints: ChunkCheckpoints,
+    ) -> Iterator[List[Segment]]:
         chunks = split_audio(
             Path(audio_file_path),
             Path(audio_chunk_path),
             self.config.chunksize_mb * 1024 * 1024,
+            upload_format=self.config.upload_format,
         )
 
-        self.logger.info("[WHISPER_REMOTE] Processing %d chunks", len(chunks))
-        all_segments: List[TranscriptionSegment] = []
-
-        for idx, chunk in enumerate(chunks):
-            chunk_path, offset = chunk
-            self.logger.info(
-                "[WHISPER_REMOTE] Processing chunk %d/%d: %s",
-                idx + 1,
-                len(chunks),
-                chunk_path,
-            )
-            segments = self.get_segments_for_chunk(str(chunk_path))
-            self.logger.info(
-                "[WHISPER_REMOTE] Chunk %d/%d complete: %d segments",
-                idx + 1,
-                len(chunks),
-                len(segments),
+        self.logger.info(
+            "[WHISPER_REMOTE] Processing %d chunks (up to %d at once)",
+            len(chunks),
+            self.config.max_parallel_chunks,
+        )
+        stitcher = SegmentStitcher()
+        total_segments = 0
+
+        for segments, offset in iter_transcribed_chunks(
+            chunks,
+            self.get_segments_for_chunk,
+            provider=f"openai:{self.config.base_url}",
+            max_parallel=self.config.max_parallel_chunks,
+            logger=self.logger,
+            log_prefix="[WHISPER_REMOTE]",
+            checkpoints=checkpoints,
+            quota=get_audio_quota_scheduler(
+                f"openai:{self.config.base_url}",
+                self.config.api_key,
+                audio_seconds_per_hour=self.config.audio_seconds_per_hour,
+                requests_per_minute=self.config.requests_per_minute,
+                shared_store_path=self.quota_store_path,
+            ),
+        ):
+            batch = stitcher.add_chunk(
+                self.convert_segments(self.add_offset_to_segments(segments, offset))
             )
-            all_segments.extend(self.add_offset_to_segments(segments, offset))
+            total_segments += len(batch)
+            yield batch
 
-        shutil.rmtree(audio_chunk_path)
+        batch = stitcher.finish()
+        total_segments += len(batch)
         self.logger.info(
             "[WHISPER_REMOTE] Transcription complete: %d total segments",
-            len(all_segments),
+            total_segments,
         )
-        return self.convert_segments(all_segments)
+        yield batch
 
     @staticmethod
     def convert_segments(segments: List[TranscriptionSegment]) -> List[Segment]:
@@ -224,10 +561,17 @@ class GroqTranscriptionSegment(BaseModel):
 
 
 class GroqWhisperTranscriber(Transcriber):
-
-    def __init__(self, logger: logging.Logger, config: GroqWhisperConfig):
+    streams_batches = True
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        config: GroqWhisperConfig,
+        quota_store_path: Optional[Path] = None,
+    ):
         self.logger = logger
         self.config = config
+        self.quota_store_path = quota_store_path
         self.client = Groq(
             api_key=config.api_key,
             max_retries=config.max_retries,
@@ -238,42 +582,82 @@ class GroqWhisperTranscriber(Transcriber):
         return f"groq_{self.config.model}"
 
     def transcribe(self, audio_file_path: str) -> List[Segment]:
+        return [
+            segment
+            for batch in self.transcribe_stream(audio_file_path)
+            for segment in batch
+        ]
+
+    def transcribe_stream(self, audio_file_path: str) -> Iterator[List[Segment]]:
         self.logger.info(
             "[WHISPER_GROQ] Starting Groq whisper transcription for: %s",
             audio_file_path,
         )
         audio_chunk_path = audio_file_path + "_parts"
+        checkpoints = ChunkCheckpoints.for_audio(
+            audio_file_path, self.model_name, GroqTranscriptionSegment
+        )
 
+        try:
+            yield from self._transcribe_chunks(
+                audio_file_path, audio_chunk_path, checkpoints
+            )
+        finally:
+            shutil.rmtree(audio_chunk_path, ignore_errors=True)
+        # Only reached once every chunk succeeded; a failed run keeps its
+        # checkpoints so the retry skips the chunks that finished
+        checkpoints.clear()
+
+    def _transcribe_chunks(
+        self,
+        audio_file_path: str,
+        audio_chunk_path: str,
+        checkpoints: ChunkCheckpoints,
+    ) -> Iterator[List[Segment]]:
         chunks = split_audio(
-            Path(audio_file_path), Path(audio_chunk_path), 12 * 1024 * 1024
+            Path(audio_file_path),
+            Path(audio_chunk_path),
+            12 * 1024 * 1024,
+            upload_format=self.config.upload_format,
         )
 
-        self.logger.info("[WHISPER_GROQ] Processing %d chunks", len(chunks))
-        all_segments: List[GroqTranscriptionSegment] = []
-
-        for idx, chunk in enumerate(chunks):
-            chunk_path, offset = chunk
-            self.logger.info(
-                "[WHISPER_GROQ] Processing chunk %d/%d: %s",
-                idx + 1,
-                len(chunks),
-                chunk_path,
-            )
-            segments = self.get_segments_for_chunk(str(chunk_path))
-            self.logger.info(
-                "[WHISPER_GROQ] Chunk %d/%d complete: %d segments",
-                idx + 1,
-                len(chunks),
-                len(segments),
+        self.logger.info(
+            "[WHISPER_GROQ] Processing %d chunks (up to %d at once)",
+            len(chunks),
+            self.config.max_parallel_chunks,
+        )
+        stitcher = SegmentStitcher()
+        total_segments = 0
+
+        for segments, offset in iter_transcribed_chunks(
+            chunks,
+            self.get_segments_for_chunk,
+            provider="groq",
+            max_parallel=self.config.max_parallel_chunks,
+            logger=self.logger,
+            log_prefix="[WHISPER_GROQ]",
+            checkpoints=checkpoints,
+            quota=get_audio_quota_scheduler(
+                "groq",
+                self.config.api_key,
+                audio_seconds_per_hour=self.config.audio_seconds_per_hour,
+                requests_per_minute=self.config.requests_per_minute,
+                shared_store_path=self.quota_store_path,
+            ),
+        ):
+            batch = stitcher.add_chunk(
+                self.convert_segments(self.add_offset_to_segments(segments, offset))
             )
-            all_segments.extend(self.add_offset_to_segments(segments, offset))
+            total_segments += len(batch)
+            yield batch
 
-        shutil.rmtree(audio_chunk_path)
+        batch = stitcher.finish()
+        total_segments += len(batch)
         self.logger.info(
             "[WHISPER_GROQ] Transcription complete: %d total segments",
-            len(all_segments),
+            total_segments,
         )
-        return self.convert_segments(all_segments)
+        yield batch
 
     @staticmethod
     def convert_segments(segments: List[GroqTranscriptionSegment]) -> List[Segment]:
@@ -0,0 +1,208 @@
+"""
+On-disk transcript cache keyed by audio content.
+
+The same episode is often published under several GUIDs (feed re-imports,
+premium and free feeds, re-added feeds). Keying transcripts by a hash of the
+audio, ignoring ID3 tags that differ between copies, lets those posts reuse
+one transcription. Entries are evicted least recently used first once the
+cache exceeds its entry or size limit.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from shared import defaults as DEFAULTS
+from shared.processing_paths import get_instance_dir
+
+from .transcribe import Segment
+
+logger = logging.getLogger("global_logger")
+
+_READ_BLOCK_BYTES = 1024 * 1024
+_ID3V1_BYTES = 128
+_ENTRY_SUFFIX = ".json.gz"
+
+
+def _id3v2_size(header: bytes) -> int:
+    """Size of a leading ID3v2 tag given the file's first 10 bytes, else 0."""
+    if len(header) < 10 or header[:3] != b"ID3":
+        return 0
+    # Tag size is a 28-bit "syncsafe" integer: 7 bits per byte
+    size = 0
+    for byte in header[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if header[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def audio_content_hash(audio_path: str) -> str:
+    """SHA-256 of the audio frames, skipping leading ID3v2 and trailing ID3v1 tags."""
+    with open(audio_path, "rb") as f:
+        total = os.fstat(f.fileno()).st_size
+        start = _id3v2_size(f.read(10))
+        end = total
+        if total - start >= _ID3V1_BYTES:
+            f.seek(total - _ID3V1_BYTES)
+            if f.read(3) == b"TAG":
+                end = total - _ID3V1_BYTES
+        f.seek(min(start, end))
+        digest = hashlib.sha256()
+        remaining = end - min(start, end)
+        while remaining > 0:
+            block = f.read(min(_READ_BLOCK_BYTES, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+class TranscriptCache:
+    """Transcripts stored as gzipped JSON files named by audio hash and model."""
+
+    def __init__(self, directory: Path, max_entries: int, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(audio_path: str, model_name: str) -> str:
+        """Cache key for a transcription of this audio by this model."""
+        model = hashlib.sha256(model_name.encode("utf-8")).hexdigest()[:16]
+        return f"{audio_content_hash(audio_path)}-{model}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[List[Segment]]:
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                rows = json.load(f)
+            segments = [
+                Segment(start=start, end=end, text=text) for start, end, text in rows
+            ]
+            # Bump mtime so eviction is least recently used first
+            os.utime(path)
+        except FileNotFoundError:
+            segments = None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Discarding unreadable transcript cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            segments = None
+        with self._lock:
+            if segments is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return segments
+
+    def put(self, key: str, segments: List[Segment]) -> None:
+        rows = [[seg.start, seg.end, seg.text] for seg in segments]
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.directory, prefix=".tmp-", suffix=_ENTRY_SUFFIX
+        )
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(rows, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def evict(self) -> int:
+        """Remove least recently used entries until within limits; returns count."""
+        entries = self._entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if len(entries) - removed <= self.max_entries and (
+                total_bytes <= self.max_bytes
+            ):
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+            removed += 1
+        if removed:
+            logger.info(f"Evicted {removed} transcript cache entries")
+        return removed
+
+    def hit_counts(self) -> Tuple[int, int]:
+        """(hits, misses) since startup, without touching the directory."""
+        with self._lock:
+            return self.hits, self.misses
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate since startup plus current entry count and size."""
+        entries = self._entries()
+        hits, misses = self.hit_counts()
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else None,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
+
+
+_CACHES: Dict[str, TranscriptCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def default_transcript_cache_dir() -> Path:
+    return get_instance_dir() / "transcript_cache"
+
+
+def get_transcript_cache(
+    max_entries: int = DEFAULTS.TRANSCRIPT_CACHE_MAX_ENTRIES,
+    max_mb: int = DEFAULTS.TRANSCRIPT_CACHE_MAX_MB,
+    directory: Optional[Path] = None,
+) -> Optional[TranscriptCache]:
+    """Get the process-wide cache for a directory, or None if it is disabled.
+
+    The cache is disabled when either limit is 0 or the parent of the
+    directory (the instance dir by default) does not exist.
+    """
+    if max_entries <= 0 or max_mb <= 0:
+        return None
+    directory = Path(directory or default_transcript_cache_dir())
+    if not directory.parent.is_dir():
+        logger.info(
+            f"Transcript cache parent directory {directory.parent} does not exist; "
+            "transcript cache disabled"
+        )
+        return None
+    with _CACHES_LOCK:
+        cache = _CACHES.get(str(directory))
+        if cache is None:
+            cache = TranscriptCache(directory, max_entries, max_mb * 1024**2)
+            _CACHES[str(directory)] = cache
+        else:
+            cache.max_entries = max_entries
+            cache.max_bytes = max_mb * 1024**2
+        return cache
@@ -1,24 +1,34 @@
 import logging
-from typing import Any, List, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
 from app.extensions import db
 from app.models import ModelCall, Post, TranscriptSegment
 from app.writer.client import writer_client
 from shared.config import (
     Config,
+    FasterWhisperConfig,
     GroqWhisperConfig,
     LocalWhisperConfig,
     RemoteWhisperConfig,
     TestWhisperConfig,
 )
 
+from .token_rate_limiter import default_token_usage_db_path
 from .transcribe import (
+    FasterWhisperTranscriber,
     GroqWhisperTranscriber,
     LocalWhisperTranscriber,
     OpenAIWhisperTranscriber,
+    Segment,
     TestWhisperTranscriber,
     Transcriber,
 )
+from .transcript_cache import TranscriptCache, get_transcript_cache
+from .whisper_model_cache import (
+    get_faster_whisper_model_cache,
+    get_whisper_model_cache,
+)
 
 
 class TranscriptionManager:
@@ -32,6 +42,7 @@ class TranscriptionManager:
         segment_query: Optional[Any] = None,
         db_session: Optional[Any] = None,
         transcriber: Optional[Transcriber] = None,
+        transcript_cache: Optional[TranscriptCache] = None,
     ):
         self.logger = logger
         self.config = config
@@ -41,6 +52,9 @@ class TranscriptionManager:
         self._segment_query_provided = segment_query is not None
         self.segment_query = segment_query or TranscriptSegment.query
         self.db_session = db_session or db.session
+        self.transcript_cache = transcript_cache or get_transcript_cache(
+            config.transcript_cache_max_entries, config.transcript_cache_max_mb
+        )
 
     def _create_transcriber(self) -> Transcriber:
         """Create the appropriate transcriber based on configuration."""
@@ -52,13 +66,39 @@ class TranscriptionManager:
         if isinstance(self.config.whisper, TestWhisperConfig):
             return TestWhisperTranscriber(self.logger)
         if isinstance(self.config.whisper, RemoteWhisperConfig):
-            return OpenAIWhisperTranscriber(self.logger, self.config.whisper)
+            return OpenAIWhisperTranscriber(
+                self.logger, self.config.whisper, self._quota_store_path()
+            )
         if isinstance(self.config.whisper, LocalWhisperConfig):
-            return LocalWhisperTranscriber(self.logger, self.config.whisper.model)
+            return LocalWhisperTranscriber(
+                self.logger,
+                self.config.whisper.model,
+                get_whisper_model_cache(
+                    float(self.config.whisper.model_idle_timeout_sec)
+                ),
+            )
         if isinstance(self.config.whisper, GroqWhisperConfig):
-            return GroqWhisperTranscriber(self.logger, self.config.whisper)
+            return GroqWhisperTranscriber(
+                self.logger, self.config.whisper, self._quota_store_path()
+            )
+        if isinstance(self.config.whisper, FasterWhisperConfig):
+            return FasterWhisperTranscriber(
+                self.logger,
+                self.config.whisper,
+                get_faster_whisper_model_cache(
+                    self.config.whisper.compute_type,
+                    self.config.whisper.cpu_threads,
+                    float(self.config.whisper.model_idle_timeout_sec),
+                ),
+            )
         raise ValueError(f"unhandled whisper config {self.config.whisper}")
 
+    def _quota_store_path(self) -> Optional[Path]:
+        """Audio quotas are shared across processes like the LLM token budget."""
+        if not self.config.llm_share_token_budget:
+            return None
+        return default_token_usage_db_path()
+
     def _check_existing_transcription(
         self, post: Post
     ) -> Optional[List[TranscriptSegment]]:
@@ -161,6 +201,11 @@ class TranscriptionManager:
         if existing_segments is not None:
             return existing_segments
 
+        cache_key = self._cache_key(post)
+        cached_segments = self._transcribe_from_cache(post, cache_key)
+        if cached_segments is not None:
+            return cached_segments
+
         # Create or reuse the ModelCall record for this transcription attempt
         current_whisper_call = self._get_or_create_whisper_model_call(post)
         self.logger.info(
@@ -179,43 +224,26 @@ class TranscriptionManager:
                 f"[TRANSCRIBE_COMPLETE] Transcription by {self.transcriber.model_name} for post {post.id} resulted in {len(pydantic_segments)} segments."
             )
 
-            segments_payload = [
-                {
-                    "sequence_num": i,
-                    "start_time": round(seg.start, 1),
-                    "end_time": round(seg.end, 1),
-                    "text": seg.text,
-                }
-                for i, seg in enumerate(pydantic_segments or [])
-            ]
-
-            write_res = writer_client.action(
+            segments_payload = self._segments_payload(pydantic_segments or [], 0)
+
+            self._write_transcription(
                 "replace_transcription",
                 {
                     "post_id": post.id,
                     "segments": segments_payload,
                     "model_call_id": current_whisper_call.id,
                 },
-                wait=True,
             )
-            if not write_res or not write_res.success:
-                raise RuntimeError(
-                    getattr(write_res, "error", "Failed to persist transcription")
-                )
 
-            segment_query = (
-                self.segment_query
-                if self._segment_query_provided
-                else self.db_session.query(TranscriptSegment)
-            )
             db_segments: List[TranscriptSegment] = (
-                segment_query.filter_by(post_id=post.id)
+                self._segment_query_for(post)
                 .order_by(TranscriptSegment.sequence_num)
                 .all()
             )
             self.logger.info(
                 f"Successfully stored {len(db_segments)} transcript segments and updated ModelCall {current_whisper_call.id} for post {post.id}."
             )
+            self._store_in_cache(cache_key, pydantic_segments or [])
             return db_segments
 
         except Exception as e:
@@ -224,20 +252,194 @@ class TranscriptionManager:
                 exc_info=True,
             )
 
-            fail_res = writer_client.action(
-                "mark_model_call_failed",
+            self._mark_failed(current_whisper_call, e)
+            raise
+
+    def transcribe_stream(self, post: Post) -> Iterator[List[TranscriptSegment]]:
+        """
+        Like transcribe(), but persists and yields segments batch by batch as
+        the transcriber finishes them (one batch per chunk for chunked remote
+        transcription), so classification can start before the whole episode
+        is transcribed. The Whisper ModelCall is only marked successful once
+        the last batch is stored, so an interrupted run is transcribed again.
+        """
+        self.logger.info(
+            f"Starting streaming transcription for post {post.id} using {self.transcriber.model_name}"
+        )
+
+        existing_segments = self._check_existing_transcription(post)
+        if existing_segments is not None:
+            yield existing_segments
+            return
+
+        cache_key = self._cache_key(post)
+        cached_segments = self._transcribe_from_cache(post, cache_key)
+        if cached_segments is not None:
+            yield cached_segments
+            return
+
+        current_whisper_call = self._get_or_create_whisper_model_call(post)
+        try:
+            self.logger.info(
+                f"[TRANSCRIBE_START] Streaming transcriber {self.transcriber.model_name} for post {post.id}, audio: {post.unprocessed_audio_path}"
+            )
+            self.db_session.expire_all()
+
+            transcribed: List[Segment] = []
+            next_sequence_num = 0
+            for batch in self.transcriber.transcribe_stream(
+                post.unprocessed_audio_path
+            ):
+                if not batch:
+                    continue
+                # The first batch replaces segments left by any earlier attempt
+                self._write_transcription(
+                    (
+                        "replace_transcription"
+                        if next_sequence_num == 0
+                        else "append_transcription"
+                    ),
+                    {
+                        "post_id": post.id,
+                        "segments": self._segments_payload(batch, next_sequence_num),
+                    },
+                )
+                db_segments = self._segment_query_for(post).filter(
+                    TranscriptSegment.sequence_num >= next_sequence_num
+                )
+                next_sequence_num += len(batch)
+                transcribed.extend(batch)
+                yield db_segments.order_by(TranscriptSegment.sequence_num).all()
+
+            self._write_transcription(
+                (
+                    "append_transcription"
+                    if next_sequence_num
+                    else "replace_transcription"
+                ),
                 {
+                    "post_id": post.id,
+                    "segments": [],
                     "model_call_id": current_whisper_call.id,
-                    "error_message": str(e),
-                    "status": "failed_permanent",
                 },
-                wait=True,
             )
-            if not fail_res or not fail_res.success:
-                self.logger.error(
-                    "Failed to mark ModelCall %s as failed via writer: %s",
-                    current_whisper_call.id,
-                    getattr(fail_res, "error", None),
-                )
-
+            self.logger.info(
+                f"[TRANSCRIBE_COMPLETE] Streamed {next_sequence_num} transcript segments and updated ModelCall {current_whisper_call.id} for post {post.id}."
+            )
+            self._store_in_cache(cache_key, transcribed)
+        except Exception as e:
+            self.logger.error(
+                f"Transcription failed for post {post.id} using {self.transcriber.model_name}. Error: {e}",
+                exc_info=True,
+            )
+            self._mark_failed(current_whisper_call, e)
             raise
+
+    def _cache_key(self, post: Post) -> Optional[str]:
+        if self.transcript_cache is None or not post.unprocessed_audio_path:
+            return None
+        try:
+            return self.transcript_cache.key(
+                post.unprocessed_audio_path, self.transcriber.model_name
+            )
+        except OSError as e:
+            self.logger.warning(
+                f"Could not hash audio for post {post.id}; skipping transcript cache: {e}"
+            )
+            return None
+
+    def _transcribe_from_cache(
+        self, post: Post, cache_key: Optional[str]
+    ) -> Optional[List[TranscriptSegment]]:
+        """Store and return a cached transcript of identical audio, if any."""
+        if self.transcript_cache is None or cache_key is None:
+            return None
+        cached = self.transcript_cache.get(cache_key)
+        self.logger.info(
+            f"Transcript cache {'hit' if cached is not None else 'miss'} for post {post.id} "
+            f"(hit rate {self._format_hit_rate()})"
+        )
+        if cached is None:
+            return None
+
+        current_whisper_call = self._get_or_create_whisper_model_call(post)
+        self._write_transcription(
+            "replace_transcription",
+            {
+                "post_id": post.id,
+                "segments": self._segments_payload(cached, 0),
+                "model_call_id": current_whisper_call.id,
+            },
+        )
+        db_segments: List[TranscriptSegment] = (
+            self._segment_query_for(post).order_by(TranscriptSegment.sequence_num).all()
+        )
+        self.logger.info(
+            f"Reused {len(db_segments)} cached transcript segments for post {post.id}."
+        )
+        return db_segments
+
+    def _store_in_cache(
+        self, cache_key: Optional[str], segments: List[Segment]
+    ) -> None:
+        if self.transcript_cache is None or cache_key is None:
+            return
+        try:
+            self.transcript_cache.put(cache_key, segments)
+        except OSError as e:
+            self.logger.warning(f"Could not write transcript cache entry: {e}")
+
+    def _format_hit_rate(self) -> str:
+        assert self.transcript_cache is not None
+        hits, misses = self.transcript_cache.hit_counts()
+        lookups = hits + misses
+        if not lookups:
+            return "n/a"
+        return f"{hits / lookups:.0%} of {lookups} lookups"
+
+    @staticmethod
+    def _segments_payload(
+        segments: List[Segment], first_sequence_num: int
+    ) -> List[Dict[str, Any]]:
+        return [
+            {
+                "sequence_num": first_sequence_num + i,
+                "start_time": round(seg.start, 1),
+                "end_time": round(seg.end, 1),
+                "text": seg.text,
+            }
+            for i, seg in enumerate(segments)
+        ]
+
+    def _segment_query_for(self, post: Post) -> Any:
+        segment_query = (
+            self.segment_query
+            if self._segment_query_provided
+            else self.db_session.query(TranscriptSegment)
+        )
+        return segment_query.filter_by(post_id=post.id)
+
+    @staticmethod
+    def _write_transcription(action: str, params: Dict[str, Any]) -> None:
+        write_res = writer_client.action(action, params, wait=True)
+        if not write_res or not write_res.success:
+            raise RuntimeError(
+                getattr(write_res, "error", "Failed to persist transcription")
+            )
+
+    def _mark_failed(self, model_call: ModelCall, error: Exception) -> None:
+        fail_res = writer_client.action(
+            "mark_model_call_failed",
+            {
+                "model_call_id": model_call.id,
+                "error_message": str(error),
+                "status": "failed_permanent",
+            },
+            wait=True,
+        )
+        if not fail_res or not fail_res.success:
+            self.logger.error(
+                "Failed to mark ModelCall %s as failed via writer: %s",
+                model_call.id,
+                getattr(fail_res, "error", None),
+            )
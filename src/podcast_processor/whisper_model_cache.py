@@ -0,0 +1,252 @@
+"""
+Process-wide caches of loaded local Whisper models.
+
+Loading medium or large weights takes many seconds and gigabytes of memory,
+so models are loaded on first use, reused by later jobs and unloaded once
+they have sat idle for `idle_timeout` seconds (0 keeps them loaded).
+
+Whisper installs key/value-cache hooks on the model while decoding, so one
+model serves one transcription at a time; jobs that need a model already in
+use wait for it rather than loading a second copy.
+"""
+
+import functools
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from shared import defaults as DEFAULTS
+
+logger = logging.getLogger("global_logger")
+
+
+@dataclass
+class _CachedModel:
+    name: str
+    model: Any = None
+    # Held while the model is loading or transcribing
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    last_used: float = 0.0
+    loads: int = 0
+    load_seconds: Optional[float] = None
+    resident_bytes: Optional[int] = None
+
+
+def _process_rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _weights_bytes(model: Any) -> Optional[int]:
+    parameters = getattr(model, "parameters", None)
+    if not callable(parameters):
+        return None
+    try:
+        return int(sum(p.numel() * p.element_size() for p in parameters()))
+    except (AttributeError, TypeError):
+        return None
+
+
+def _release_accelerator_memory() -> None:
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def load_whisper_model(name: str) -> Any:
+    # Import whisper only when needed to avoid CUDA dependencies during module import
+    try:
+        import whisper  # type: ignore[import-untyped]
+    except ImportError as e:
+        logger.error(f"Failed to import whisper: {e}")
+        raise ImportError(
+            "whisper library is required for LocalWhisperTranscriber"
+        ) from e
+    return whisper.load_model(name=name)
+
+
+def load_faster_whisper_model(name: str, *, compute_type: str, cpu_threads: int) -> Any:
+    try:
+        from faster_whisper import (  # type: ignore[import-not-found]
+            WhisperModel,
+        )
+    except ImportError as e:
+        logger.error(f"Failed to import faster_whisper: {e}")
+        raise ImportError(
+            "faster-whisper library is required for FasterWhisperTranscriber"
+        ) from e
+    return WhisperModel(
+        name, device="cpu", compute_type=compute_type, cpu_threads=cpu_threads
+    )
+
+
+class WhisperModelCache:
+    """Lazily loaded, idle-unloaded Whisper models keyed by model name."""
+
+    def __init__(
+        self,
+        idle_timeout: float = DEFAULTS.WHISPER_LOCAL_MODEL_IDLE_TIMEOUT_SEC,
+        loader: Callable[[str], Any] = load_whisper_model,
+    ):
+        self.idle_timeout = idle_timeout
+        self._loader = loader
+        self._entries: Dict[str, _CachedModel] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+
+    @contextmanager
+    def use(self, name: str) -> Iterator[Any]:
+        """Yield the loaded model, loading it first if needed."""
+        with self._lock:
+            entry = self._entries.setdefault(name, _CachedModel(name))
+        with entry.lock:
+            if entry.model is None:
+                self._load(entry)
+            try:
+                yield entry.model
+            finally:
+                entry.last_used = time.monotonic()
+        self._ensure_reaper()
+
+    def _load(self, entry: _CachedModel) -> None:
+        rss_before = _process_rss_bytes()
+        start = time.monotonic()
+        entry.model = self._loader(entry.name)
+        entry.load_seconds = time.monotonic() - start
+        entry.loads += 1
+
+        entry.resident_bytes = _weights_bytes(entry.model)
+        rss_after = _process_rss_bytes()
+        if entry.resident_bytes is None and rss_before and rss_after:
+            entry.resident_bytes = max(0, rss_after - rss_before)
+        resident = (
+            f"{entry.resident_bytes / 1024**2:.0f} MB"
+            if entry.resident_bytes is not None
+            else "unknown size"
+        )
+        logger.info(
+            f"Loaded whisper model {entry.name} in {entry.load_seconds:.1f}s ({resident})"
+        )
+
+    def unload_idle(self, now: Optional[float] = None) -> List[str]:
+        """Unload models idle for at least idle_timeout; returns their names."""
+        if self.idle_timeout <= 0:
+            return []
+        return self._unload(
+            lambda entry: (now if now is not None else time.monotonic())
+            - entry.last_used
+            >= self.idle_timeout
+        )
+
+    def unload_all(self) -> List[str]:
+        """Unload every model not currently in use."""
+        return self._unload(lambda entry: True)
+
+    def _unload(self, should_unload: Callable[[_CachedModel], bool]) -> List[str]:
+        with self._lock:
+            entries = list(self._entries.values())
+        unloaded = []
+        for entry in entries:
+            # Skip models that are loading or transcribing right now
+            if entry.model is None or not entry.lock.acquire(blocking=False):
+                continue
+            try:
+                if entry.model is not None and should_unload(entry):
+                    entry.model = None
+                    unloaded.append(entry.name)
+            finally:
+                entry.lock.release()
+        if unloaded:
+            gc.collect()
+            _release_accelerator_memory()
+            logger.info(f"Unloaded idle whisper models: {', '.join(unloaded)}")
+        return unloaded
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Load time, resident memory and idle time per model."""
+        now = time.monotonic()
+        with self._lock:
+            entries = list(self._entries.values())
+        return {
+            entry.name: {
+                "loaded": entry.model is not None,
+                "loads": entry.loads,
+                "load_seconds": entry.load_seconds,
+                "resident_mb": (
+                    entry.resident_bytes / 1024**2
+                    if entry.resident_bytes is not None
+                    else None
+                ),
+                "idle_seconds": now - entry.last_used if entry.last_used else None,
+            }
+            for entry in entries
+        }
+
+    def _ensure_reaper(self) -> None:
+        if self.idle_timeout <= 0:
+            return
+        with self._lock:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(
+                target=self._reap_loop, name="whisper-model-reaper", daemon=True
+            )
+            self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        while True:
+            time.sleep(min(max(self.idle_timeout / 4, 1.0), 60.0))
+            self.unload_idle()
+            with self._lock:
+                if all(entry.model is None for entry in self._entries.values()):
+                    # Nothing left to unload; the next use starts a new reaper
+                    self._reaper = None
+                    return
+
+
+# One cache per engine and load options, since the loader is per cache
+_MODEL_CACHES: Dict[str, WhisperModelCache] = {}
+_MODEL_CACHES_LOCK = threading.Lock()
+
+
+def _get_model_cache(
+    key: str, loader: Callable[[str], Any], idle_timeout: Optional[float]
+) -> WhisperModelCache:
+    with _MODEL_CACHES_LOCK:
+        cache = _MODEL_CACHES.get(key)
+        if cache is None:
+            cache = WhisperModelCache(loader=loader)
+            _MODEL_CACHES[key] = cache
+        if idle_timeout is not None:
+            cache.idle_timeout = idle_timeout
+        return cache
+
+
+def get_whisper_model_cache(idle_timeout: Optional[float] = None) -> WhisperModelCache:
+    """Get the process-wide cache, updating its idle timeout if given."""
+    return _get_model_cache("openai-whisper", load_whisper_model, idle_timeout)
+
+
+def get_faster_whisper_model_cache(
+    compute_type: str, cpu_threads: int, idle_timeout: Optional[float] = None
+) -> WhisperModelCache:
+    """Get the process-wide faster-whisper cache for these load options."""
+    return _get_model_cache(
+        f"faster-whisper:{compute_type}:{cpu_threads}",
+        functools.partial(
+            load_faster_whisper_model,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+        ),
+        idle_timeout,
+    )
@@ -6,18 +6,19 @@ Pylint may flag these as R0801 (duplicate-code); we ignore that for this module.
 
 # pylint: disable=duplicate-code
 
+import bisect
 import json
 import logging
 import re
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
-import litellm
 from jinja2 import Template
 
 from podcast_processor.llm_model_call_utils import (
-    extract_litellm_content,
+    complete_litellm_text,
     render_prompt_and_upsert_model_call,
     try_update_model_call,
 )
@@ -36,6 +37,110 @@ class WordBoundaryRefinement:
     end_adjustment_reason: str
 
 
+@dataclass
+class IndexedSegment:
+    sequence_num: int
+    start_time: float
+    end_time: float
+    # Words of this segment are tokens[offset:offset + word_count]
+    offset: int
+    word_count: int
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.end_time - self.start_time)
+
+
+class SegmentTokenIndex:
+    """Normalized words of a post's segments, tokenized once.
+
+    - `tokens`: every segment's lower-cased words, back to back
+    - `word_times`: estimated start of each token, assuming a constant word
+      duration within its segment
+    - `positions`: token -> ascending indexes into `tokens`
+
+    Phrase lookups check only the places the phrase's first word occurs, and
+    word times are array reads, instead of re-splitting and scanning segment
+    text for every candidate phrase.
+    """
+
+    def __init__(
+        self,
+        all_segments: List[Dict[str, Any]],
+        split_words: Callable[[str], List[str]],
+    ) -> None:
+        self.tokens: List[str] = []
+        self.word_times: List[float] = []
+        self.positions: Dict[str, List[int]] = {}
+        self._by_seq: Dict[int, IndexedSegment] = {}
+        for seg in all_segments:
+            try:
+                seq = int(seg.get("sequence_num", -1))
+            except Exception:
+                continue
+            start_time = float(seg.get("start_time") or 0.0)
+            end_time = float(seg.get("end_time") or start_time)
+            words = [w.lower() for w in split_words(str(seg.get("text", "")))]
+            indexed = IndexedSegment(
+                sequence_num=seq,
+                start_time=start_time,
+                end_time=end_time,
+                offset=len(self.tokens),
+                word_count=len(words),
+            )
+            self._by_seq.setdefault(seq, indexed)
+            seconds_per_word = indexed.duration / len(words) if words else 0.0
+            for i, word in enumerate(words):
+                self.positions.setdefault(word, []).append(len(self.tokens))
+                self.tokens.append(word)
+                self.word_times.append(start_time + i * seconds_per_word)
+
+    def segment(self, segment_seq: Any) -> Optional[IndexedSegment]:
+        if segment_seq is None:
+            return None
+        try:
+            return self._by_seq.get(int(segment_seq))
+        except Exception:
+            return None
+
+    def word_time(self, seg: IndexedSegment, word_index: int) -> float:
+        """Estimated start of the segment's `word_index`-th word."""
+        if word_index >= seg.word_count:
+            return seg.end_time
+        return self.word_times[seg.offset + word_index]
+
+    def word_indexes(self, seg: IndexedSegment, word: str) -> List[int]:
+        """Indexes within the segment where `word` (lower-cased) occurs."""
+        return [
+            pos - seg.offset for pos in self._positions_in(seg, word, seg.word_count)
+        ]
+
+    def find_phrase(
+        self, seg: IndexedSegment, target: List[str], *, choose: str
+    ) -> Optional[Tuple[int, int]]:
+        """First or last occurrence of `target` within the segment, as
+        (first word index, last word index)."""
+        k = len(target)
+        if not target or k > seg.word_count:
+            return None
+        starts = self._positions_in(seg, target[0], seg.word_count - k + 1)
+        if choose == "last":
+            starts = starts[::-1]
+        for pos in starts:
+            if self.tokens[pos : pos + k] == target:
+                local = pos - seg.offset
+                return local, local + k - 1
+        return None
+
+    def _positions_in(self, seg: IndexedSegment, word: str, limit: int) -> List[int]:
+        positions = self.positions.get(word)
+        if not positions or limit <= 0:
+            return []
+        lo = bisect.bisect_left(positions, seg.offset)
+        hi = bisect.bisect_left(positions, seg.offset + limit)
+        return positions[lo:hi]
+
+
 class WordBoundaryRefiner:
     """Refine ad start boundary by finding the first ad word and estimating its time.
 
@@ -47,6 +152,12 @@ class WordBoundaryRefiner:
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
         self.template = self._load_template()
+        # Token index of the segment list passed to the last refine() call;
+        # every block of a post is refined against the same list.
+        self._token_index: Optional[Tuple[List[Dict[str, Any]], SegmentTokenIndex]] = (
+            None
+        )
+        self._token_index_lock = threading.Lock()
 
     def _load_template(self) -> Template:
         path = (
@@ -100,7 +211,8 @@ Ad: {{ad_start}}s-{{ad_end}}s
         raw_response: Optional[str] = None
 
         try:
-            response = litellm.completion(
+            content = complete_litellm_text(
+                self.config,
                 model=self.config.llm_model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
@@ -109,8 +221,6 @@ Ad: {{ad_start}}s-{{ad_end}}s
                 api_key=self.config.llm_api_key,
                 base_url=self.config.openai_base_url,
             )
-
-            content = extract_litellm_content(response)
             raw_response = content
             self._update_model_call(
                 model_call_id,
@@ -473,11 +583,13 @@ Ad: {{ad_start}}s-{{ad_end}}s
         if not phrase_tokens:
             return None
 
+        index = self._get_token_index(all_segments)
+
         # Search order:
         # 1) preferred segment (if provided)
         # 2) other provided context segments (ad-range ±2)
-        candidates: List[Dict[str, Any]] = []
-        preferred_seg = self._find_segment(all_segments, preferred_segment_seq)
+        candidates: List[IndexedSegment] = []
+        preferred_seg = index.segment(preferred_segment_seq)
         if preferred_seg is not None:
             candidates.append(preferred_seg)
 
@@ -497,24 +609,23 @@ Ad: {{ad_start}}s-{{ad_end}}s
             preferred_seq_int = None
 
         for seg in ordered_context:
-            try:
-                seq = int(seg.get("sequence_num", -1))
-            except Exception:
-                seq = None
-            if preferred_seq_int is not None and seq == preferred_seq_int:
+            indexed = index.segment(seg.get("sequence_num"))
+            if indexed is None:
                 continue
-            candidates.append(seg)
-
-        for seg in candidates:
-            start_time = float(seg.get("start_time", 0.0))
-            end_time = float(seg.get("end_time", start_time))
-            duration = max(0.0, end_time - start_time)
-            words = [w.lower() for w in self._split_words(str(seg.get("text", "")))]
-            if not words or duration <= 0.0:
+            if (
+                preferred_seq_int is not None
+                and indexed.sequence_num == preferred_seq_int
+            ):
+                continue
+            candidates.append(indexed)
+
+        for indexed in candidates:
+            if not indexed.word_count or indexed.duration <= 0.0:
                 continue
 
             match = self._find_phrase_match(
-                words=words,
+                index=index,
+                segment=indexed,
                 phrase_tokens=phrase_tokens,
                 direction=direction,
                 max_words=4,
@@ -523,33 +634,32 @@ Ad: {{ad_start}}s-{{ad_end}}s
                 continue
 
             match_start_idx, match_end_idx = match
-            seconds_per_word = duration / float(len(words))
             if direction == "start":
-                estimated = start_time + (float(match_start_idx) * seconds_per_word)
-                return min(estimated, end_time)
+                estimated = index.word_time(indexed, match_start_idx)
+                return min(estimated, indexed.end_time)
 
             # direction == "end": end boundary at the end of the last matched word.
-            estimated = start_time + (float(match_end_idx + 1) * seconds_per_word)
-            return min(estimated, end_time)
+            estimated = index.word_time(indexed, match_end_idx + 1)
+            return min(estimated, indexed.end_time)
 
         return None
 
     def _find_phrase_match(
         self,
         *,
-        words: List[str],
+        index: SegmentTokenIndex,
+        segment: IndexedSegment,
         phrase_tokens: List[str],
         direction: str,
         max_words: int,
     ) -> Optional[Tuple[int, int]]:
-        if not words or not phrase_tokens:
+        if not segment.word_count or not phrase_tokens:
             return None
 
         if direction == "start":
             base = phrase_tokens[:max_words]
             for k in range(len(base), 0, -1):
-                target = base[:k]
-                match = self._find_subsequence(words, target, choose="first")
+                match = index.find_phrase(segment, base[:k], choose="first")
                 if match is not None:
                     return match
             return None
@@ -557,30 +667,11 @@ Ad: {{ad_start}}s-{{ad_end}}s
         # direction == "end"
         base = phrase_tokens[-max_words:]
         for k in range(len(base), 0, -1):
-            target = base[-k:]
-            match = self._find_subsequence(words, target, choose="last")
+            match = index.find_phrase(segment, base[-k:], choose="last")
             if match is not None:
                 return match
         return None
 
-    def _find_subsequence(
-        self, words: List[str], target: List[str], *, choose: str
-    ) -> Optional[Tuple[int, int]]:
-        if not target or len(target) > len(words):
-            return None
-
-        matches: List[Tuple[int, int]] = []
-        k = len(target)
-        for i in range(0, len(words) - k + 1):
-            if words[i : i + k] == target:
-                matches.append((i, i + k - 1))
-
-        if not matches:
-            return None
-        if choose == "last":
-            return matches[-1]
-        return matches[0]
-
     def _estimate_word_time(
         self,
         *,
@@ -590,47 +681,36 @@ Ad: {{ad_start}}s-{{ad_end}}s
         occurrence: Any,
         word_index: Any,
     ) -> float:
-        seg = self._find_segment(all_segments, segment_seq)
+        index = self._get_token_index(all_segments)
+        seg = index.segment(segment_seq)
         if not seg:
             return float(all_segments[0]["start_time"]) if all_segments else 0.0
 
-        start_time = float(seg.get("start_time", 0.0))
-        end_time = float(seg.get("end_time", start_time))
-        duration = max(0.0, end_time - start_time)
-
-        words = self._split_words(str(seg.get("text", "")))
-        if not words or duration <= 0.0:
-            return start_time
+        if not seg.word_count or seg.duration <= 0.0:
+            return seg.start_time
 
         resolved_index = self._resolve_word_index(
-            words,
+            index,
+            seg,
             word=word,
             occurrence=occurrence,
             word_index=word_index,
         )
 
-        # Heuristic timing: constant word duration within the segment.
-        # words_per_second = num_words / segment_duration
-        # seconds_per_word = 1 / words_per_second = segment_duration / num_words
-        seconds_per_word = duration / float(len(words))
-        estimated = start_time + (float(resolved_index) * seconds_per_word)
+        # Heuristic timing: constant word duration within the segment
+        # (precomputed per word in the token index).
+        estimated = index.word_time(seg, resolved_index)
         # Guardrail: never return a start after the block end.
-        return min(estimated, float(seg.get("end_time", end_time)))
+        return min(estimated, seg.end_time)
 
-    def _find_segment(
-        self, all_segments: List[Dict[str, Any]], segment_seq: Any
-    ) -> Optional[Dict[str, Any]]:
-        if segment_seq is None:
-            return None
-        try:
-            seq_int = int(segment_seq)
-        except Exception:
-            return None
-
-        for seg in all_segments:
-            if int(seg.get("sequence_num", -1)) == seq_int:
-                return seg
-        return None
+    def _get_token_index(self, all_segments: List[Dict[str, Any]]) -> SegmentTokenIndex:
+        with self._token_index_lock:
+            cached = self._token_index
+            if cached is not None and cached[0] is all_segments:
+                return cached[1]
+            index = SegmentTokenIndex(all_segments, self._split_words)
+            self._token_index = (all_segments, index)
+            return index
 
     def _split_words(self, text: str) -> List[str]:
         # Word count/indexing heuristic: split on whitespace, then normalize away
@@ -648,7 +728,13 @@ Ad: {{ad_start}}s-{{ad_end}}s
         return re.sub(r"(^[^A-Za-z0-9']+)|([^A-Za-z0-9']+$)", "", token)
 
     def _resolve_word_index(
-        self, words: List[str], *, word: Any, occurrence: Any, word_index: Any
+        self,
+        index: SegmentTokenIndex,
+        seg: IndexedSegment,
+        *,
+        word: Any,
+        occurrence: Any,
+        word_index: Any,
     ) -> int:
         # Prefer the verbatim word match if provided.
         # `occurance` chooses which matching instance to use.
@@ -656,9 +742,7 @@ Ad: {{ad_start}}s-{{ad_end}}s
         target_raw = str(word).strip() if word is not None else ""
         target = self._normalize_token(target_raw).lower()
         if target:
-            match_indexes = [
-                idx for idx, w in enumerate(words) if (w or "").lower() == target
-            ]
+            match_indexes = index.word_indexes(seg, target)
             if match_indexes:
                 occ = str(occurrence).strip().lower() if occurrence is not None else ""
                 if occ == "last":
@@ -671,7 +755,7 @@ Ad: {{ad_start}}s-{{ad_end}}s
         except Exception:
             idx_int = 0
 
-        idx_int = max(0, min(idx_int, len(words) - 1))
+        idx_int = max(0, min(idx_int, seg.word_count - 1))
         return idx_int
 
     def _update_model_call(
@@ -14,12 +14,38 @@ class ProcessingConfig(BaseModel):
         ge=0,
         description="Maximum number of previously identified segments carried into the next prompt.",
     )
+    adaptive_chunk_sizing: bool = Field(
+        default=DEFAULTS.PROCESSING_ADAPTIVE_CHUNK_SIZING,
+        description="Adjust segments per prompt after each chunk from its latency, token usage and ad detections",
+    )
+    stream_classification: bool = Field(
+        default=DEFAULTS.PROCESSING_STREAM_CLASSIFICATION,
+        description="Classify chunked transcriptions chunk by chunk while the rest of the episode is still being transcribed",
+    )
+    min_segments_to_input_to_prompt: int = Field(
+        default=DEFAULTS.PROCESSING_MIN_SEGMENTS_TO_INPUT_TO_PROMPT,
+        ge=1,
+        description="Lower bound for adaptive chunk sizing.",
+    )
+    max_segments_to_input_to_prompt: int = Field(
+        default=DEFAULTS.PROCESSING_MAX_SEGMENTS_TO_INPUT_TO_PROMPT,
+        ge=1,
+        description="Upper bound for adaptive chunk sizing.",
+    )
+    target_chunk_latency_seconds: float = Field(
+        default=DEFAULTS.PROCESSING_TARGET_CHUNK_LATENCY_SECONDS,
+        gt=0,
+        description="Adaptive chunk sizing shrinks chunks whose LLM call takes longer than this.",
+    )
 
     @model_validator(mode="after")
     def validate_overlap_limits(self) -> "ProcessingConfig":
         assert (
             self.max_overlap_segments <= self.num_segments_to_input_to_prompt
         ), "max_overlap_segments must be <= num_segments_to_input_to_prompt"
+        assert (
+            self.min_segments_to_input_to_prompt <= self.max_segments_to_input_to_prompt
+        ), "min_segments_to_input_to_prompt must be <= max_segments_to_input_to_prompt"
         return self
 
 
@@ -39,7 +65,10 @@ class OutputConfig(BaseModel):
         self.min_ad_segement_separation_seconds = value
 
 
-WhisperConfigTypes = Literal["remote", "local", "test", "groq"]
+WhisperConfigTypes = Literal["remote", "local", "test", "groq", "faster_whisper"]
+
+
+UploadFormat = Literal["original", "mp3", "opus"]
 
 
 class TestWhisperConfig(BaseModel):
@@ -54,6 +83,16 @@ class RemoteWhisperConfig(BaseModel):
     model: str = DEFAULTS.WHISPER_REMOTE_MODEL
     timeout_sec: int = DEFAULTS.WHISPER_REMOTE_TIMEOUT_SEC
     chunksize_mb: int = DEFAULTS.WHISPER_REMOTE_CHUNKSIZE_MB
+    # Chunks uploaded at once; backs off automatically on 429s
+    max_parallel_chunks: int = Field(
+        default=DEFAULTS.WHISPER_REMOTE_MAX_PARALLEL_CHUNKS, ge=1
+    )
+    # Re-encode to 16 kHz mono before upload (see podcast_processor.audio)
+    upload_format: UploadFormat = DEFAULTS.WHISPER_UPLOAD_FORMAT
+    # Provider quotas per API key, paced client-side across workers (see
+    # podcast_processor.audio_quota); None leaves them unlimited
+    audio_seconds_per_hour: Optional[int] = Field(default=None, ge=1)
+    requests_per_minute: Optional[int] = Field(default=None, ge=1)
 
 
 class GroqWhisperConfig(BaseModel):
@@ -62,11 +101,39 @@ class GroqWhisperConfig(BaseModel):
     language: str = DEFAULTS.WHISPER_GROQ_LANGUAGE
     model: str = DEFAULTS.WHISPER_GROQ_MODEL
     max_retries: int = DEFAULTS.WHISPER_GROQ_MAX_RETRIES
+    # Chunks uploaded at once; backs off automatically on 429s
+    max_parallel_chunks: int = Field(
+        default=DEFAULTS.WHISPER_GROQ_MAX_PARALLEL_CHUNKS, ge=1
+    )
+    # Re-encode to 16 kHz mono before upload (see podcast_processor.audio)
+    upload_format: UploadFormat = DEFAULTS.WHISPER_UPLOAD_FORMAT
+    # Provider quotas per API key, paced client-side across workers (see
+    # podcast_processor.audio_quota); None leaves them unlimited
+    audio_seconds_per_hour: Optional[int] = Field(default=None, ge=1)
+    requests_per_minute: Optional[int] = Field(default=None, ge=1)
 
 
 class LocalWhisperConfig(BaseModel):
     whisper_type: Literal["local"] = "local"
     model: str = DEFAULTS.WHISPER_LOCAL_MODEL
+    # Unload the cached model after this many idle seconds; 0 keeps it loaded
+    model_idle_timeout_sec: int = Field(
+        default=DEFAULTS.WHISPER_LOCAL_MODEL_IDLE_TIMEOUT_SEC, ge=0
+    )
+
+
+class FasterWhisperConfig(BaseModel):
+    whisper_type: Literal["faster_whisper"] = "faster_whisper"
+    model: str = DEFAULTS.WHISPER_LOCAL_MODEL
+    # CTranslate2 weight quantization: int8, int8_float32, float32, ...
+    compute_type: str = DEFAULTS.WHISPER_FASTER_COMPUTE_TYPE
+    # Intra-op threads per transcription; 0 lets CTranslate2 decide
+    cpu_threads: int = Field(default=DEFAULTS.WHISPER_FASTER_CPU_THREADS, ge=0)
+    # Skip non-speech (Silero VAD) before decoding
+    vad_filter: bool = DEFAULTS.WHISPER_FASTER_VAD_FILTER
+    model_idle_timeout_sec: int = Field(
+        default=DEFAULTS.WHISPER_LOCAL_MODEL_IDLE_TIMEOUT_SEC, ge=0
+    )
 
 
 class Config(BaseModel):
@@ -80,6 +147,10 @@ class Config(BaseModel):
         default=DEFAULTS.LLM_DEFAULT_MAX_CONCURRENT_CALLS,
         description="Maximum concurrent LLM calls to prevent rate limiting",
     )
+    llm_adaptive_max_concurrent_calls: Optional[int] = Field(
+        default=DEFAULTS.LLM_ADAPTIVE_MAX_CONCURRENT_CALLS,
+        description="Upper bound the concurrency limit may grow to while calls succeed (it backs off on rate-limit and overload errors); defaults to llm_max_concurrent_calls (no growth)",
+    )
     llm_max_retry_attempts: int = Field(
         default=DEFAULTS.LLM_DEFAULT_MAX_RETRY_ATTEMPTS,
         description="Maximum retry attempts for failed LLM calls",
@@ -97,6 +168,75 @@ class Config(BaseModel):
         default=DEFAULTS.LLM_MAX_INPUT_TOKENS_PER_MINUTE,
         description="Override default tokens per minute limit for the model",
     )
+    llm_share_token_budget: bool = Field(
+        default=DEFAULTS.LLM_SHARE_TOKEN_BUDGET,
+        description="Count token usage in a SQLite file under the instance db directory so every process shares one budget per model and API key",
+    )
+    llm_enable_async_execution: bool = Field(
+        default=DEFAULTS.LLM_ENABLE_ASYNC_EXECUTION,
+        description="Issue LLM calls through the shared asyncio executor (litellm acompletion) instead of blocking calls",
+    )
+    llm_enable_streaming: bool = Field(
+        default=DEFAULTS.LLM_ENABLE_STREAMING,
+        description="Stream LLM responses, recording detections as they arrive and cutting off runaway generations",
+    )
+    llm_compact_prompt_encoding: bool = Field(
+        default=DEFAULTS.LLM_COMPACT_PROMPT_ENCODING,
+        description="Send transcript chunks with short segment ids and relative timestamps; the model answers with segment ids",
+    )
+    # Two-tier cascade: a cheap model screens every chunk first
+    llm_cascade_model: Optional[str] = Field(
+        default=DEFAULTS.LLM_CASCADE_MODEL,
+        description="Cheap model that classifies every chunk first; uncertain chunks are re-run on llm_model",
+    )
+    llm_cascade_escalate_min_confidence: float = Field(
+        default=DEFAULTS.LLM_CASCADE_ESCALATE_MIN_CONFIDENCE,
+        ge=0.0,
+        le=1.0,
+        description="Screening predictions with confidence in [min, max) escalate the chunk",
+    )
+    llm_cascade_escalate_max_confidence: float = Field(
+        default=DEFAULTS.LLM_CASCADE_ESCALATE_MAX_CONFIDENCE,
+        ge=0.0,
+        le=1.0,
+        description="Screening predictions with confidence in [min, max) escalate the chunk",
+    )
+    # Tail latency: hedged requests and a per-call deadline
+    llm_hedge_after_percentile: Optional[float] = Field(
+        default=DEFAULTS.LLM_HEDGE_AFTER_PERCENTILE,
+        gt=0.0,
+        le=100.0,
+        description="Send a duplicate request once a non-streamed call outlasts this percentile of the model's recent latencies (e.g. 95); first answer wins. Requires llm_enable_async_execution",
+    )
+    llm_hedge_model: Optional[str] = Field(
+        default=DEFAULTS.LLM_HEDGE_MODEL,
+        description="Model for hedge requests; defaults to the model being called",
+    )
+    llm_call_deadline_seconds: Optional[int] = Field(
+        default=DEFAULTS.LLM_CALL_DEADLINE_SECONDS,
+        gt=0,
+        description="Upper bound on the time spent per chunk call, across attempts and retry waits",
+    )
+    # Local segment scorer (scripts/train_segment_scorer.py)
+    segment_scorer_path: Optional[str] = Field(
+        default=DEFAULTS.SEGMENT_SCORER_PATH,
+        description="Trained local segment scorer (.npz) used to gate LLM calls",
+    )
+    segment_scorer_gate_threshold: Optional[float] = Field(
+        default=DEFAULTS.SEGMENT_SCORER_GATE_THRESHOLD,
+        ge=0.0,
+        le=1.0,
+        description="Skip the LLM for chunks where every segment scores below this ad probability",
+    )
+    # Batch API classification for backfills
+    llm_enable_batch_classification: bool = Field(
+        default=DEFAULTS.LLM_ENABLE_BATCH_CLASSIFICATION,
+        description="Queue classification prompts for the provider batch API instead of calling the LLM inline",
+    )
+    llm_batch_poll_interval_minutes: int = Field(
+        default=DEFAULTS.LLM_BATCH_POLL_INTERVAL_MINUTES,
+        description="How often queued batch classification requests are submitted and polled",
+    )
     enable_boundary_refinement: bool = Field(
         default=DEFAULTS.ENABLE_BOUNDARY_REFINEMENT,
         description="Enable LLM-based ad boundary refinement for improved precision (consumes additional LLM tokens)",
@@ -125,7 +265,11 @@ class Config(BaseModel):
     )
     # removed job_timeout
     whisper: Optional[
-        LocalWhisperConfig | RemoteWhisperConfig | TestWhisperConfig | GroqWhisperConfig
+        LocalWhisperConfig
+        | RemoteWhisperConfig
+        | TestWhisperConfig
+        | GroqWhisperConfig
+        | FasterWhisperConfig
     ] = Field(
         default=None,
         discriminator="whisper_type",
@@ -140,6 +284,16 @@ class Config(BaseModel):
         deprecated=True,
         description="deprecated in favor of [Remote|Local]WhisperConfig",
     )
+    transcript_cache_max_entries: int = Field(
+        default=DEFAULTS.TRANSCRIPT_CACHE_MAX_ENTRIES,
+        ge=0,
+        description="Maximum transcripts kept for reuse by posts with identical audio (0 disables the transcript cache)",
+    )
+    transcript_cache_max_mb: int = Field(
+        default=DEFAULTS.TRANSCRIPT_CACHE_MAX_MB,
+        ge=0,
+        description="Maximum size of the transcript cache in megabytes (0 disables it)",
+    )
     automatically_whitelist_new_episodes: bool = (
         DEFAULTS.APP_AUTOMATICALLY_WHITELIST_NEW_EPISODES
     )
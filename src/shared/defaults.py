@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Final
+
 # Centralized default values for application configuration.
 # Single source of truth for defaults across runtime, DB models, and Pydantic config.
 
@@ -8,29 +10,64 @@ LLM_DEFAULT_MODEL = "groq/openai/gpt-oss-120b"
 OPENAI_DEFAULT_MAX_TOKENS = 4096
 OPENAI_DEFAULT_TIMEOUT_SEC = 300
 LLM_DEFAULT_MAX_CONCURRENT_CALLS = 3
+# None: the adaptive concurrency limit never grows past the configured limit
+LLM_ADAPTIVE_MAX_CONCURRENT_CALLS: int | None = None
 LLM_DEFAULT_MAX_RETRY_ATTEMPTS = 5
 LLM_ENABLE_TOKEN_RATE_LIMITING = False
 LLM_MAX_INPUT_TOKENS_PER_CALL: int | None = None
 LLM_MAX_INPUT_TOKENS_PER_MINUTE: int | None = None
+LLM_SHARE_TOKEN_BUDGET = True
+LLM_ENABLE_BATCH_CLASSIFICATION = False
+LLM_ENABLE_ASYNC_EXECUTION = False
+LLM_ENABLE_STREAMING = False
+LLM_COMPACT_PROMPT_ENCODING = False
+LLM_BATCH_POLL_INTERVAL_MINUTES = 5
+LLM_CASCADE_MODEL: str | None = None
+LLM_CASCADE_ESCALATE_MIN_CONFIDENCE = 0.3
+LLM_CASCADE_ESCALATE_MAX_CONFIDENCE = 0.8
+LLM_HEDGE_AFTER_PERCENTILE: float | None = None
+LLM_HEDGE_MODEL: str | None = None
+LLM_CALL_DEADLINE_SECONDS: int | None = None
+SEGMENT_SCORER_PATH: str | None = None
+SEGMENT_SCORER_GATE_THRESHOLD: float | None = None
 ENABLE_BOUNDARY_REFINEMENT = True
 ENABLE_WORD_LEVEL_BOUNDARY_REFINDER = False
 
 # Whisper defaults
 WHISPER_DEFAULT_TYPE = "groq"
 WHISPER_LOCAL_MODEL = "base.en"
+WHISPER_LOCAL_MODEL_IDLE_TIMEOUT_SEC = 600
+# faster-whisper (CTranslate2) on CPU; 0 threads lets CTranslate2 decide
+WHISPER_FASTER_COMPUTE_TYPE = "int8"
+WHISPER_FASTER_CPU_THREADS = 0
+WHISPER_FASTER_VAD_FILTER = True
 WHISPER_REMOTE_BASE_URL = "https://api.openai.com/v1"
 WHISPER_REMOTE_MODEL = "whisper-1"
 WHISPER_REMOTE_LANGUAGE = "en"
 WHISPER_REMOTE_TIMEOUT_SEC = 600
 WHISPER_REMOTE_CHUNKSIZE_MB = 24
+WHISPER_REMOTE_MAX_PARALLEL_CHUNKS = 4
+# "original" uploads the episode audio as-is; "mp3" or "opus" re-encode it
+# to 16 kHz mono first
+WHISPER_UPLOAD_FORMAT: Final = "original"
 
 WHISPER_GROQ_MODEL = "whisper-large-v3-turbo"
 WHISPER_GROQ_LANGUAGE = "en"
 WHISPER_GROQ_MAX_RETRIES = 3
+WHISPER_GROQ_MAX_PARALLEL_CHUNKS = 4
+
+# Transcripts reused across posts with identical audio; 0 disables the cache
+TRANSCRIPT_CACHE_MAX_ENTRIES = 500
+TRANSCRIPT_CACHE_MAX_MB = 200
 
 # Processing defaults
 PROCESSING_NUM_SEGMENTS_TO_INPUT_TO_PROMPT = 60
 PROCESSING_MAX_OVERLAP_SEGMENTS = 30
+PROCESSING_ADAPTIVE_CHUNK_SIZING = False
+PROCESSING_STREAM_CLASSIFICATION = True
+PROCESSING_MIN_SEGMENTS_TO_INPUT_TO_PROMPT = 20
+PROCESSING_MAX_SEGMENTS_TO_INPUT_TO_PROMPT = 180
+PROCESSING_TARGET_CHUNK_LATENCY_SECONDS = 45.0
 
 # Output defaults
 OUTPUT_FADE_MS = 3000
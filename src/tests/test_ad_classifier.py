@@ -1,15 +1,26 @@
-from typing import Generator
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Generator, Iterator, List, Tuple
 from unittest.mock import MagicMock, patch
 
 import pytest
 from flask import Flask
 from jinja2 import Template
-from litellm.exceptions import InternalServerError
+from litellm import token_counter
+from litellm.exceptions import InternalServerError, RateLimitError
 from litellm.types.utils import Choices
+from sqlalchemy import event
 
 from app.extensions import db
-from app.models import ModelCall, Post, TranscriptSegment
+from app.models import Identification, ModelCall, Post, TranscriptSegment
+from app.writer.client import writer_client
 from podcast_processor.ad_classifier import AdClassifier
+from podcast_processor.boundary_refiner import BoundaryRefinement
+from podcast_processor.hedged_completion import LatencyTracker, LLMDeadlineExceeded
+from podcast_processor.llm_concurrency_limiter import LLMConcurrencyLimiter
 from podcast_processor.model_output import (
     AdSegmentPrediction,
     AdSegmentPredictionList,
@@ -112,6 +123,197 @@ def test_call_model(test_config: Config, app: Flask) -> None:
             assert refreshed.response == "test response"
 
 
+def test_call_model_streaming_records_and_cuts_off_runaway(
+    test_config: Config, app: Flask
+) -> None:
+    test_config.llm_enable_streaming = True
+    with app.app_context():
+        post = Post(
+            feed_id=1, guid="stream-guid", download_url="u", title="Stream Post"
+        )
+        db.session.add(post)
+        db.session.commit()
+        segments: List[TranscriptSegment] = []
+        for i in range(3):
+            segment = TranscriptSegment(
+                post_id=post.id,
+                sequence_num=i,
+                start_time=i * 10.0,
+                end_time=(i + 1) * 10.0,
+                text=f"segment {i}",
+            )
+            db.session.add(segment)
+            segments.append(segment)
+        model_call = ModelCall(
+            post_id=post.id,
+            model_name=test_config.llm_model,
+            prompt="prompt",
+            first_segment_sequence_num=0,
+            last_segment_sequence_num=2,
+            status="pending",
+        )
+        db.session.add(model_call)
+        db.session.commit()
+
+        deltas = ['{"ad_segments": [', '{"segment_offset": 10.0, "confidence": 0.95}']
+        deltas += [', {"segment_offset": 20.0, "confidence": 0.9}'] * 50
+        consumed: List[str] = []
+
+        def fake_stream(**kwargs: Any) -> Iterator[Any]:
+            assert kwargs["stream"] is True
+            for delta in deltas:
+                consumed.append(delta)
+                yield SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))]
+                )
+
+        classifier = AdClassifier(config=test_config, db_session=db.session)
+        with patch("litellm.completion", side_effect=fake_stream):
+            response = classifier._call_model(
+                model_call_obj=model_call,
+                system_prompt="system",
+                chunk_segments=segments,
+            )
+
+        # Generation stopped at the third repeat instead of reading all 51 objects
+        assert len(consumed) == 5
+        assert response is not None
+        assert AdSegmentPredictionList.model_validate_json(response).ad_segments == [
+            AdSegmentPrediction(segment_offset=10.0, confidence=0.95),
+            AdSegmentPrediction(segment_offset=20.0, confidence=0.9),
+        ]
+        recorded = {
+            ident.transcript_segment_id
+            for ident in Identification.query.filter_by(model_call_id=model_call.id)
+        }
+        # Segment 0 is picked up by the existing pre-roll look-back
+        assert recorded == {segment.id for segment in segments}
+
+
+def _streamed_chunk(
+    test_config: Config, guid: str
+) -> Tuple[List[TranscriptSegment], ModelCall]:
+    post = Post(feed_id=1, guid=guid, download_url="u", title="Stream Post")
+    db.session.add(post)
+    db.session.commit()
+    segments = [
+        TranscriptSegment(
+            post_id=post.id,
+            sequence_num=i,
+            start_time=100.0 + i * 10.0,
+            end_time=110.0 + i * 10.0,
+            text=f"segment {i}",
+        )
+        for i in range(3)
+    ]
+    db.session.add_all(segments)
+    model_call = ModelCall(
+        post_id=post.id,
+        model_name=test_config.llm_model,
+        prompt="prompt",
+        first_segment_sequence_num=0,
+        last_segment_sequence_num=2,
+        status="pending",
+    )
+    db.session.add(model_call)
+    db.session.commit()
+    return segments, model_call
+
+
+def _fake_stream(deltas: List[str], error: Exception | None = None) -> Any:
+    def stream(**kwargs: Any) -> Iterator[Any]:
+        for delta in deltas:
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))]
+            )
+        if error is not None:
+            raise error
+
+    return stream
+
+
+def _recorded_segment_ids(model_call: ModelCall) -> set[int]:
+    return {
+        ident.transcript_segment_id
+        for ident in Identification.query.filter_by(model_call_id=model_call.id)
+    }
+
+
+def test_failed_stream_discards_its_recorded_identifications(
+    test_config: Config, app: Flask
+) -> None:
+    test_config.llm_enable_streaming = True
+    with app.app_context():
+        segments, model_call = _streamed_chunk(test_config, "failed-stream")
+        classifier = AdClassifier(config=test_config, db_session=db.session)
+        deltas = ['{"ad_segments": [', '{"segment_offset": 110.0, "confidence": 0.95}']
+
+        with patch(
+            "litellm.completion",
+            side_effect=_fake_stream(deltas, error=ValueError("connection reset")),
+        ):
+            with pytest.raises(ValueError):
+                classifier._stream_model_response(
+                    model_call_obj=model_call,
+                    completion_args={"model": test_config.llm_model, "messages": []},
+                    chunk_segments=segments,
+                )
+
+        assert _recorded_segment_ids(model_call) == set()
+
+
+def test_final_response_replaces_streamed_identifications(
+    test_config: Config, app: Flask
+) -> None:
+    test_config.llm_enable_streaming = True
+    with app.app_context():
+        segments, model_call = _streamed_chunk(test_config, "replaced-stream")
+        classifier = AdClassifier(config=test_config, db_session=db.session)
+        classifier._record_streamed_predictions(
+            model_call,
+            [
+                AdSegmentPrediction(segment_offset=110.0, confidence=0.95),
+                AdSegmentPrediction(segment_offset=120.0, confidence=0.9),
+            ],
+            segments,
+        )
+        assert _recorded_segment_ids(model_call) == {segments[1].id, segments[2].id}
+
+        # The completed response kept only one of the streamed detections
+        model_call.response = json.dumps(
+            {"ad_segments": [{"segment_offset": 120.0, "confidence": 0.9}]}
+        )
+        matched = classifier._process_successful_response(
+            model_call=model_call, current_chunk_db_segments=segments
+        )
+
+        assert [segment.id for segment in matched] == [segments[2].id]
+        assert _recorded_segment_ids(model_call) == {segments[2].id}
+
+
+def test_streamed_response_is_reported_to_the_concurrency_limiter(
+    test_config: Config, app: Flask
+) -> None:
+    test_config.llm_enable_streaming = True
+    with app.app_context():
+        segments, model_call = _streamed_chunk(test_config, "observed-stream")
+        classifier = AdClassifier(config=test_config, db_session=db.session)
+        limiter = MagicMock(spec=LLMConcurrencyLimiter)
+        limiter.acquire.return_value = True
+        classifier.concurrency_limiter = limiter
+        stream = _fake_stream(['{"ad_segments": []}'])()
+
+        with patch("litellm.completion", return_value=stream):
+            classifier._stream_model_response(
+                model_call_obj=model_call,
+                completion_args={"model": test_config.llm_model, "messages": []},
+                chunk_segments=segments,
+            )
+
+        # The stream carries the provider's rate-limit headers
+        limiter.record_success.assert_called_once_with(stream)
+
+
 def test_call_model_retry_on_internal_error(test_config: Config, app: Flask) -> None:
     """Test that _call_model retries on InternalServerError"""
     with app.app_context():
@@ -166,6 +368,122 @@ def test_call_model_retry_on_internal_error(test_config: Config, app: Flask) ->
             assert refreshed.retry_attempts == 2
 
 
+def _dummy_model_call(model_name: str) -> ModelCall:
+    model_call = ModelCall(
+        post_id=0,
+        model_name=model_name,
+        prompt="test prompt",
+        first_segment_sequence_num=0,
+        last_segment_sequence_num=0,
+        status="pending",
+    )
+    db.session.add(model_call)
+    db.session.commit()
+    return model_call
+
+
+def test_call_model_hedges_slow_request_to_fallback_model(
+    test_config: Config, app: Flask
+) -> None:
+    test_config.llm_hedge_after_percentile = 95
+    test_config.llm_hedge_model = "fallback-model"
+    test_config.llm_enable_async_execution = True
+    test_config.llm_enable_token_rate_limiting = True
+    # A budget of its own, so usage from other tests doesn't count
+    test_config.llm_max_input_tokens_per_minute = 987_654
+    tracker = LatencyTracker(min_samples=3)
+    for _ in range(3):
+        tracker.record(test_config.llm_model, 0.01)
+    requested: List[str] = []
+    cancelled: List[str] = []
+
+    async def acompletion(**kwargs: Any) -> MagicMock:
+        requested.append(kwargs["model"])
+        if kwargs["model"] == test_config.llm_model:
+            try:
+                await asyncio.sleep(0.5)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["model"])
+                raise
+        choice = MagicMock(spec=Choices)
+        choice.message = MagicMock(content=f"answer from {kwargs['model']}")
+        return MagicMock(choices=[choice])
+
+    with app.app_context():
+        classifier = AdClassifier(config=test_config, db_session=db.session)
+        model_call = _dummy_model_call(test_config.llm_model)
+        hedge_limiter = classifier._rate_limiter_for("fallback-model")
+        assert hedge_limiter is not None
+        hedge_usage = hedge_limiter.get_usage_stats()["current_usage"]
+
+        with patch(
+            "podcast_processor.ad_classifier.get_latency_tracker",
+            return_value=tracker,
+        ), patch(
+            "podcast_processor.ad_classifier.MIN_HEDGE_DELAY_SECONDS", 0.05
+        ), patch(
+            "litellm.acompletion", side_effect=acompletion
+        ):
+            start = time.monotonic()
+            response = classifier._call_model(
+                model_call_obj=model_call, system_prompt="test system prompt"
+            )
+            elapsed = time.monotonic() - start
+            deadline = time.monotonic() + 2
+            while not cancelled and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert response == "answer from fallback-model"
+        assert elapsed < 0.5
+        assert requested == [test_config.llm_model, "fallback-model"]
+        assert cancelled == [test_config.llm_model]
+        # The hedge is charged to its model's token budget like any request
+        assert hedge_limiter.get_usage_stats()["current_usage"] > hedge_usage
+
+
+def test_call_model_does_not_hedge_without_async_executor(
+    test_config: Config, app: Flask
+) -> None:
+    test_config.llm_hedge_after_percentile = 95
+    tracker = LatencyTracker(min_samples=1)
+    tracker.record(test_config.llm_model, 0.01)
+
+    with app.app_context():
+        classifier = AdClassifier(config=test_config, db_session=db.session)
+        with patch(
+            "podcast_processor.ad_classifier.get_latency_tracker",
+            return_value=tracker,
+        ):
+            assert classifier._hedge_plan({"model": test_config.llm_model}) is None
+
+
+def test_call_model_stops_retrying_at_deadline(test_config: Config, app: Flask) -> None:
+    test_config.llm_call_deadline_seconds = 5
+
+    with app.app_context():
+        classifier = AdClassifier(config=test_config, db_session=db.session)
+        model_call = _dummy_model_call(test_config.llm_model)
+
+        rate_limited = RateLimitError(
+            message="rate limited", llm_provider="test_provider", model="test_model"
+        )
+        with patch("time.sleep") as mocked_sleep, patch(
+            "litellm.completion", side_effect=rate_limited
+        ) as mocked_completion:
+            with pytest.raises(LLMDeadlineExceeded):
+                classifier._call_model(
+                    model_call_obj=model_call, system_prompt="test system prompt"
+                )
+
+        # The 60s rate-limit backoff would overrun the deadline, so no retry
+        assert mocked_completion.call_count == 1
+        assert mocked_completion.call_args.kwargs["timeout"] <= 5
+        mocked_sleep.assert_not_called()
+        refreshed = db.session.get(ModelCall, model_call.id)
+        assert refreshed is not None
+        assert refreshed.status == "failed_retries"
+
+
 def test_process_chunk(test_config: Config, app: Flask) -> None:
     """Test processing a chunk of transcript segments"""
     with app.app_context():
@@ -404,6 +722,7 @@ def test_build_chunk_payload_trims_for_token_limit(
                 system_prompt=system_prompt,
                 user_prompt_template=template,
                 max_new_segments=3,
+                max_overlap_segments=5,
             )
         )
 
@@ -412,3 +731,536 @@ def test_build_chunk_payload_trims_for_token_limit(
     assert len(chunk_segments) >= consumed
     assert mock_validator.call_count == 2
     assert user_prompt
+
+
+def test_build_chunk_payload_caps_overlap_at_the_chunk_plan_value(
+    test_classifier_with_mocks: AdClassifier,
+) -> None:
+    classifier = test_classifier_with_mocks
+    classifier.config.processing.max_overlap_segments = 5
+    segments = [
+        TranscriptSegment(
+            id=i + 1,
+            post_id=1,
+            sequence_num=i,
+            start_time=float(i),
+            end_time=float(i + 1),
+            text=f"Segment {i}",
+        )
+        for i in range(6)
+    ]
+
+    chunk_segments, _, consumed, _ = classifier._build_chunk_payload(
+        overlap_segments=segments[:3],
+        remaining_segments=segments[3:],
+        total_segments=segments,
+        post=Post(id=1, title="Test"),
+        system_prompt="System",
+        user_prompt_template=Template("{{ transcript }}"),
+        max_new_segments=3,
+        # An adaptive plan that shrank the cap below the configured 5
+        max_overlap_segments=1,
+    )
+
+    assert consumed == 3
+    assert [segment.sequence_num for segment in chunk_segments] == [2, 3, 4, 5]
+
+
+def _episode_segments() -> List[TranscriptSegment]:
+    texts = [
+        "So that's really where the research started to get interesting.",
+        "This episode is brought to you by Squarespace.",
+        "Go to squarespace.com slash podcast and use code PODLY for ten percent off.",
+        "Head over to betterhelp.com today.",
+        "Okay, back to the interview. Tell me about the early days.",
+        "Yeah, exactly, and the data backs that up.",
+    ]
+    return [
+        TranscriptSegment(
+            id=100 + i,
+            post_id=1,
+            sequence_num=40 + i,
+            start_time=1834.2 + i * 6.3,
+            end_time=1834.2 + (i + 1) * 6.3,
+            text=texts[i % len(texts)],
+        )
+        for i in range(30)
+    ]
+
+
+def _rendered_prompt(
+    classifier: AdClassifier, segments: List[TranscriptSegment]
+) -> str:
+    return classifier._generate_user_prompt(
+        current_chunk_db_segments=segments,
+        post=Post(id=1, title="Test Post"),
+        user_prompt_template=Template("{{ transcript }}"),
+        includes_start=False,
+        includes_end=False,
+    )
+
+
+def test_compact_prompt_encoding_round_trips_predictions(
+    test_classifier_with_mocks: AdClassifier,
+) -> None:
+    classifier = test_classifier_with_mocks
+    segments = _episode_segments()
+    ad_segments = segments[1:4]
+
+    classic_prompt = _rendered_prompt(classifier, segments)
+    classifier.config.llm_compact_prompt_encoding = True
+    compact_prompt = _rendered_prompt(classifier, segments)
+
+    lines = compact_prompt.splitlines()
+    assert lines[0] == f"0|0 {segments[0].text}"
+    assert lines[2].startswith("2|13* Go to squarespace.com")
+    compact_response = AdSegmentPredictionList(ad_segments=[]).model_dump()
+    compact_response["ad_segments"] = [
+        {"segment_id": seg.sequence_num - 40, "confidence": 0.9} for seg in ad_segments
+    ]
+    classic_response = AdSegmentPredictionList(
+        ad_segments=[
+            AdSegmentPrediction(segment_offset=seg.start_time, confidence=0.9)
+            for seg in ad_segments
+        ]
+    )
+
+    matched = {}
+    for name, response in (
+        ("compact", json.dumps(compact_response)),
+        ("classic", classic_response.model_dump_json()),
+    ):
+        model_call = ModelCall(id=1, post_id=1, status="success", response=response)
+        with patch.object(
+            classifier, "_create_identifications", return_value=(0, [])
+        ) as create:
+            classifier._process_successful_response(
+                model_call=model_call, current_chunk_db_segments=segments
+            )
+        matched[name] = create.call_args.kwargs["prediction_list"]
+
+    assert matched["compact"] == matched["classic"]
+    # Fewer prompt tokens for the same transcript
+    assert token_counter(model="gpt-4o", text=compact_prompt) < 0.85 * token_counter(
+        model="gpt-4o", text=classic_prompt
+    )
+
+
+def _cascade_fixture(
+    test_config: Config, texts: List[str]
+) -> Tuple[AdClassifier, Post, List[TranscriptSegment]]:
+    test_config.llm_model = "strong-model"
+    test_config.llm_cascade_model = "cheap-model"
+    post = Post(feed_id=1, guid="cascade-guid", download_url="u", title="Cascade")
+    db.session.add(post)
+    db.session.commit()
+    segments = [
+        TranscriptSegment(
+            post_id=post.id,
+            sequence_num=i,
+            start_time=i * 10.0,
+            end_time=(i + 1) * 10.0,
+            text=text,
+        )
+        for i, text in enumerate(texts)
+    ]
+    db.session.add_all(segments)
+    db.session.commit()
+    return AdClassifier(config=test_config, db_session=db.session), post, segments
+
+
+def _completion_by_model(responses: Dict[str, str]) -> Any:
+    def completion(**kwargs: Any) -> MagicMock:
+        choice = MagicMock(spec=Choices)
+        choice.message = MagicMock(content=responses[kwargs["model"]])
+        return MagicMock(choices=[choice])
+
+    return completion
+
+
+def _calls_by_model(post: Post) -> Dict[str, ModelCall]:
+    return {
+        call.model_name: call for call in ModelCall.query.filter_by(post_id=post.id)
+    }
+
+
+def test_cascade_keeps_confident_screening_answer(
+    test_config: Config, app: Flask
+) -> None:
+    with app.app_context():
+        classifier, post, segments = _cascade_fixture(
+            test_config, ["welcome to the show", "so tell me", "and then"]
+        )
+        responses = {
+            "cheap-model": '{"ad_segments": [{"segment_offset": 10.0, "confidence": 0.95}]}'
+        }
+        with patch("litellm.completion", side_effect=_completion_by_model(responses)):
+            classifier._process_chunk(
+                chunk_segments=segments,
+                system_prompt="system",
+                post=post,
+                user_prompt_str="prompt",
+            )
+
+        calls = _calls_by_model(post)
+        assert set(calls) == {"cheap-model"}
+        idents = Identification.query.all()
+        assert {i.model_call_id for i in idents} == {calls["cheap-model"].id}
+        assert segments[1].id in {i.transcript_segment_id for i in idents}
+
+
+@pytest.mark.parametrize(
+    "texts, cheap_response",
+    [
+        (
+            ["welcome to the show", "so tell me", "and then"],
+            '{"ad_segments": [{"segment_offset": 10.0, "confidence": 0.6}]}',
+        ),
+        (
+            ["welcome to the show", "go to example.com and use code PODLY", "and then"],
+            '{"ad_segments": []}',
+        ),
+    ],
+    ids=["mid_confidence", "cue_without_detection"],
+)
+def test_cascade_escalates_uncertain_chunks(
+    test_config: Config, app: Flask, texts: List[str], cheap_response: str
+) -> None:
+    with app.app_context():
+        classifier, post, segments = _cascade_fixture(test_config, texts)
+        responses = {
+            "cheap-model": cheap_response,
+            "strong-model": '{"ad_segments": [{"segment_offset": 10.0, "confidence": 0.9}]}',
+        }
+        with patch("litellm.completion", side_effect=_completion_by_model(responses)):
+            classifier._process_chunk(
+                chunk_segments=segments,
+                system_prompt="system",
+                post=post,
+                user_prompt_str="prompt",
+            )
+
+        calls = _calls_by_model(post)
+        # Both tiers are recorded; detections come from the strong model only
+        assert set(calls) == {"cheap-model", "strong-model"}
+        assert calls["cheap-model"].response == cheap_response
+        assert {i.model_call_id for i in Identification.query.all()} == {
+            calls["strong-model"].id
+        }
+
+
+def test_cascade_escalates_on_conflicting_overlap(
+    test_config: Config, app: Flask
+) -> None:
+    with app.app_context():
+        classifier, post, segments = _cascade_fixture(
+            test_config, ["welcome to the show", "so tell me", "and then"]
+        )
+        earlier_call = ModelCall(
+            post_id=post.id,
+            model_name="strong-model",
+            prompt="p",
+            first_segment_sequence_num=0,
+            last_segment_sequence_num=1,
+            status="success",
+        )
+        db.session.add(earlier_call)
+        db.session.commit()
+        db.session.add(
+            Identification(
+                transcript_segment_id=segments[1].id,
+                model_call_id=earlier_call.id,
+                label="ad",
+                confidence=0.9,
+            )
+        )
+        db.session.commit()
+        screening = ModelCall(
+            post_id=post.id,
+            model_name="cheap-model",
+            prompt="p",
+            first_segment_sequence_num=1,
+            last_segment_sequence_num=2,
+            status="success",
+            response='{"ad_segments": []}',
+        )
+
+        reason = classifier._escalation_reason(screening, segments[1:])
+
+        assert reason is not None and "conflicts" in reason
+
+
+def test_classify_checks_existing_identifications_without_per_segment_queries(
+    test_config: Config, app: Flask
+) -> None:
+    test_config.enable_boundary_refinement = False
+    with app.app_context():
+        classifier, post, segments = _cascade_fixture(
+            test_config, [f"line {i}" for i in range(12)]
+        )
+        test_config.llm_cascade_model = None
+        earlier_call = ModelCall(
+            post_id=post.id,
+            model_name="earlier-model",
+            prompt="p",
+            first_segment_sequence_num=0,
+            last_segment_sequence_num=11,
+            status="success",
+        )
+        db.session.add(earlier_call)
+        db.session.commit()
+        db.session.add(
+            Identification(
+                transcript_segment_id=segments[3].id,
+                model_call_id=earlier_call.id,
+                label="ad",
+                confidence=0.9,
+            )
+        )
+        db.session.commit()
+
+        predictions = [
+            {"segment_offset": seg.start_time, "confidence": 0.9}
+            for seg in segments[2:6]
+        ]
+        responses = {"strong-model": json.dumps({"ad_segments": predictions})}
+        statements: List[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2])
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            with patch(
+                "litellm.completion", side_effect=_completion_by_model(responses)
+            ):
+                classifier.classify(
+                    transcript_segments=segments,
+                    system_prompt="system",
+                    user_prompt_template=Template("{{ transcript }}"),
+                    post=post,
+                )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        strong_call = _calls_by_model(post)["strong-model"]
+        strong_ids = {
+            i.transcript_segment_id
+            for i in Identification.query.filter_by(model_call_id=strong_call.id)
+        }
+
+    # Segment 3 was already an ad; 0 and 1 come from the pre-roll look-back
+    assert {segments[i].id for i in (0, 1, 2, 4, 5)} <= strong_ids
+    assert segments[3].id not in strong_ids
+    identification_selects = [
+        s
+        for s in statements
+        if s.lstrip().startswith("SELECT") and "FROM identification" in s
+    ]
+    assert not [
+        s
+        for s in identification_selects
+        if "identification.transcript_segment_id = ?" in s
+    ]
+
+
+def test_classify_stream_starts_chunks_before_transcription_finishes(
+    test_config: Config, app: Flask
+) -> None:
+    test_config.processing.num_segments_to_input_to_prompt = 4
+    test_config.processing.max_overlap_segments = 2
+    with app.app_context():
+        classifier, post, segments = _cascade_fixture(
+            test_config, [f"line {i}" for i in range(10)]
+        )
+        steps: List[Tuple[int, int]] = []
+
+        def step(
+            _params: Any,
+            _overlap: Any,
+            current_index: int,
+            transcript_segments: List[TranscriptSegment],
+        ) -> Tuple[int, List[TranscriptSegment]]:
+            steps.append((current_index, len(transcript_segments)))
+            return min(4, len(transcript_segments) - current_index), []
+
+        batches = [segments[0:3], segments[3:6], segments[6:9], segments[9:10]]
+        with patch.object(classifier, "_step", side_effect=step), patch.object(
+            classifier, "_finish_classification"
+        ) as finish:
+            result = classifier.classify_stream(
+                segment_batches=iter(batches),
+                system_prompt="system",
+                user_prompt_template=Template("{{ transcript }}"),
+                post=post,
+            )
+
+    assert result == segments
+    # A chunk is sent only while more than a full chunk is waiting; the rest
+    # goes once transcription ends
+    assert steps == [(0, 6), (4, 9), (8, 10)]
+    finish.assert_called_once()
+
+
+def test_only_a_replayable_chunk_plan_blocks_streaming(
+    test_config: Config, app: Flask
+) -> None:
+    with app.app_context():
+        classifier, post, _ = _cascade_fixture(test_config, ["line"])
+        assert classifier.can_classify_stream(post)
+
+        post.classification_chunk_plan = {"mode": "static", "chunks": [60]}
+        assert classifier.can_classify_stream(post)
+
+        post.classification_chunk_plan = {"mode": "adaptive", "chunks": [40, 80]}
+        test_config.processing.adaptive_chunk_sizing = False
+        assert classifier.can_classify_stream(post)
+        test_config.processing.adaptive_chunk_sizing = True
+        assert not classifier.can_classify_stream(post)
+
+
+class _SlowRefiner:
+    """Stands in for BoundaryRefiner; tracks how many refinements overlap."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def refine(self, **kwargs: Any) -> BoundaryRefinement:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.1)
+        with self.lock:
+            self.active -= 1
+        return BoundaryRefinement(
+            refined_start=kwargs["ad_start"] + 15.0,
+            refined_end=kwargs["ad_end"] - 5.0,
+            start_adjustment_reason="test",
+            end_adjustment_reason="unchanged",
+        )
+
+
+def test_refine_boundaries_runs_blocks_concurrently_with_one_write(
+    test_config: Config, app: Flask
+) -> None:
+    test_config.llm_max_concurrent_calls = 3
+    with app.app_context():
+        classifier, post, segments = _cascade_fixture(
+            test_config, [f"line {i}" for i in range(20)]
+        )
+        model_call = ModelCall(
+            post_id=post.id,
+            model_name="strong-model",
+            prompt="p",
+            first_segment_sequence_num=0,
+            last_segment_sequence_num=19,
+            status="success",
+        )
+        db.session.add(model_call)
+        db.session.commit()
+        # Three separate 30s ad blocks: segments 1-3, 8-10 and 15-17
+        ad_seqs = [1, 2, 3, 8, 9, 10, 15, 16, 17]
+        db.session.add_all(
+            Identification(
+                transcript_segment_id=segments[seq].id,
+                model_call_id=model_call.id,
+                label="ad",
+                confidence=0.9,
+            )
+            for seq in ad_seqs
+        )
+        db.session.commit()
+
+        refiner = _SlowRefiner()
+        classifier.boundary_refiner = refiner  # type: ignore[assignment]
+        with patch(
+            "podcast_processor.ad_classifier.writer_client.action",
+            wraps=writer_client.action,
+        ) as action:
+            classifier._refine_boundaries(segments, post)
+
+        assert refiner.peak > 1
+        replaces = [
+            c for c in action.call_args_list if c.args[0] == "replace_identifications"
+        ]
+        assert len(replaces) == 1
+        refreshed = db.session.get(Post, post.id)
+        assert refreshed is not None
+        assert [b["orig_start"] for b in refreshed.refined_ad_boundaries] == [
+            10.0,
+            80.0,
+            150.0,
+        ]
+        remaining = {
+            i.transcript_segment.sequence_num
+            for i in Identification.query.filter_by(label="ad")
+        }
+    # Each block's refined window drops its first segment
+    assert remaining == {2, 3, 9, 10, 16, 17}
+
+
+class _WideningRefiner:
+    """Stretches every block 40s both ways, so neighbouring blocks overlap."""
+
+    def refine(self, **kwargs: Any) -> BoundaryRefinement:
+        return BoundaryRefinement(
+            refined_start=kwargs["ad_start"] - 40.0,
+            refined_end=kwargs["ad_end"] + 40.0,
+            start_adjustment_reason="test",
+            end_adjustment_reason="test",
+        )
+
+
+def test_overlapping_refined_blocks_do_not_duplicate_identifications(
+    test_config: Config, app: Flask
+) -> None:
+    with app.app_context():
+        classifier, post, segments = _cascade_fixture(
+            test_config, [f"line {i}" for i in range(20)]
+        )
+        # Each block comes from its own chunk's model call, so the unique
+        # (segment, model call, label) index does not catch the overlap
+        model_calls = [
+            ModelCall(
+                post_id=post.id,
+                model_name="strong-model",
+                prompt="p",
+                first_segment_sequence_num=first,
+                last_segment_sequence_num=last,
+                status="success",
+            )
+            for first, last in ((0, 11), (6, 19))
+        ]
+        db.session.add_all(model_calls)
+        db.session.commit()
+        # Blocks at segments 1-3 and 8-10; widened, both cover 4-7
+        db.session.add_all(
+            Identification(
+                transcript_segment_id=segments[seq].id,
+                model_call_id=model_call.id,
+                label="ad",
+                confidence=confidence,
+            )
+            for model_call, confidence, seqs in (
+                (model_calls[0], 0.9, (1, 2, 3)),
+                (model_calls[1], 0.7, (8, 9, 10)),
+            )
+            for seq in seqs
+        )
+        db.session.commit()
+
+        classifier.boundary_refiner = _WideningRefiner()  # type: ignore[assignment]
+        classifier._refine_boundaries(segments, post)
+
+        rows = [
+            (i.transcript_segment.sequence_num, i.confidence)
+            for i in Identification.query.filter_by(label="ad")
+        ]
+    seqs = [seq for seq, _ in rows]
+    assert len(seqs) == len(set(seqs))
+    assert set(seqs) == set(range(0, 16))
+    # Where the windows overlap the higher-confidence block wins
+    assert dict(rows)[5] == pytest.approx(0.9)
+    assert dict(rows)[12] == pytest.approx(0.7)
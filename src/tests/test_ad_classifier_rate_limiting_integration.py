@@ -159,6 +159,37 @@ class TestAdClassifierRateLimiting:
             )
             mock_sleep.assert_called_with(60)  # 60 * (2^0) = 60 seconds
 
+    def test_streaming_waits_on_rate_limiter_with_async_executor(self):
+        """Streamed calls bypass the async executor, so they must wait here."""
+        from app.models import ModelCall
+
+        for streaming, expected_waits in ((True, 1), (False, 0)):
+            config = create_test_config(llm_enable_streaming=streaming)
+
+            with patch("podcast_processor.ad_classifier.db.session") as mock_session:
+                classifier = AdClassifier(config=config, db_session=mock_session)
+                classifier.async_executor = Mock()
+                classifier.rate_limiter = Mock(spec=TokenRateLimiter)
+                classifier.rate_limiter.get_usage_stats = Mock(
+                    return_value={
+                        "current_usage": 0,
+                        "limit": 30000,
+                        "usage_percentage": 0.0,
+                    }
+                )
+                model_call = ModelCall(
+                    id=1,
+                    model_name=config.llm_model,
+                    prompt="test prompt",
+                    status="pending",
+                )
+
+                classifier._prepare_api_call(model_call, "test system prompt")
+
+                assert (
+                    classifier.rate_limiter.wait_if_needed.call_count == expected_waits
+                )
+
     def test_rate_limiter_model_specific_configs(self):
         """Test that different models get appropriate rate limits."""
         test_cases = [
@@ -174,7 +205,7 @@ class TestAdClassifierRateLimiting:
             # Clear singleton before each test case
             import podcast_processor.token_rate_limiter as trl_module
 
-            trl_module._RATE_LIMITER = None
+            trl_module._RATE_LIMITERS.clear()
 
             config = create_test_config(llm_model=model_name)
 
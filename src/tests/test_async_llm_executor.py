@@ -0,0 +1,172 @@
+"""
+Test cases for the asyncio LLM execution core.
+"""
+
+import asyncio
+import threading
+from typing import Any, Generator, List
+
+import pytest
+
+from podcast_processor.async_llm_executor import (
+    AsyncLLMExecutor,
+    get_async_llm_executor,
+    get_executor_for_config,
+)
+from podcast_processor.token_rate_limiter import TokenRateLimiter
+from shared.test_utils import create_standard_test_config
+
+
+@pytest.fixture
+def executor() -> Generator[AsyncLLMExecutor, None, None]:
+    ex = AsyncLLMExecutor(max_concurrent_calls=4)
+    yield ex
+    ex.shutdown()
+
+
+def _fake_acompletion(delay: float = 0.05) -> Any:
+    async def fake(**kwargs: Any) -> str:
+        await asyncio.sleep(delay)
+        if kwargs.get("model") == "boom":
+            raise RuntimeError("provider down")
+        return f"response:{kwargs['messages'][0]['content']}"
+
+    return fake
+
+
+def test_invalid_concurrency_rejected() -> None:
+    with pytest.raises(ValueError, match="max_concurrent_calls must be greater than 0"):
+        AsyncLLMExecutor(max_concurrent_calls=0)
+
+
+def test_complete_runs_on_loop_thread(
+    executor: AsyncLLMExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    seen_threads: List[str] = []
+
+    async def fake(**kwargs: Any) -> str:
+        seen_threads.append(threading.current_thread().name)
+        return "ok"
+
+    monkeypatch.setattr("litellm.acompletion", fake)
+
+    assert executor.complete(model="m", messages=[]) == "ok"
+    assert seen_threads == ["llm-event-loop"]
+
+
+def test_complete_many_bounded_by_semaphore(
+    executor: AsyncLLMExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("litellm.acompletion", _fake_acompletion())
+
+    requests = [
+        {"model": "m", "messages": [{"role": "user", "content": str(i)}]}
+        for i in range(12)
+    ]
+    results = executor.complete_many(requests)
+
+    assert results == [f"response:{i}" for i in range(12)]
+    stats = executor.get_stats()
+    assert stats["peak_in_flight"] == 4
+    assert stats["in_flight"] == 0
+
+
+def test_complete_many_returns_exceptions_in_place(
+    executor: AsyncLLMExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("litellm.acompletion", _fake_acompletion(delay=0))
+
+    results = executor.complete_many(
+        [
+            {"model": "m", "messages": [{"role": "user", "content": "a"}]},
+            {"model": "boom", "messages": [{"role": "user", "content": "b"}]},
+        ]
+    )
+
+    assert results[0] == "response:a"
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_rate_limiter_usage_recorded(
+    executor: AsyncLLMExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("litellm.acompletion", _fake_acompletion(delay=0))
+    limiter = TokenRateLimiter(tokens_per_minute=10_000)
+
+    executor.complete(
+        rate_limiter=limiter,
+        model="m",
+        messages=[{"role": "user", "content": "x" * 400}],
+    )
+
+    assert limiter.get_usage_stats()["current_usage"] == 100
+
+
+def test_executor_only_for_enabled_config() -> None:
+    config = create_standard_test_config()
+    assert get_executor_for_config(config) is None
+
+    config.llm_enable_async_execution = True
+    config.llm_max_concurrent_calls = 7
+    executor = get_executor_for_config(config)
+    assert executor is get_async_llm_executor(7)
+    assert executor is not None and executor.max_concurrent_calls == 7
+
+
+def test_rate_limit_errors_shrink_concurrency(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ex = AsyncLLMExecutor(max_concurrent_calls=4, adaptive_max_calls=8)
+
+    async def fake(**kwargs: Any) -> str:
+        if kwargs["model"] == "limited":
+            raise RuntimeError("429 Too Many Requests")
+        return "ok"
+
+    monkeypatch.setattr("litellm.acompletion", fake)
+    try:
+        for _ in range(5):
+            ex.complete(model="m", messages=[])
+        assert ex.get_stats()["concurrency_limit"] == 5
+
+        with pytest.raises(RuntimeError, match="429"):
+            ex.complete(model="limited", messages=[])
+        assert ex.get_stats()["concurrency_limit"] == 2
+        assert ex.get_stats()["in_flight"] == 0
+    finally:
+        ex.shutdown()
+
+
+def test_single_slot_serves_every_waiter(monkeypatch: pytest.MonkeyPatch) -> None:
+    ex = AsyncLLMExecutor(max_concurrent_calls=1)
+    monkeypatch.setattr("litellm.acompletion", _fake_acompletion(delay=0))
+    try:
+        requests = [
+            {"model": "m", "messages": [{"role": "user", "content": str(i)}]}
+            for i in range(50)
+        ]
+        assert ex.complete_many(requests) == [f"response:{i}" for i in range(50)]
+        assert ex.get_stats()["peak_in_flight"] == 1
+    finally:
+        ex.shutdown()
+
+
+def test_replaced_executor_drains_then_stops(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("litellm.acompletion", _fake_acompletion(delay=0.2))
+    old = get_async_llm_executor(11)
+    in_flight = old.submit(model="m", messages=[{"role": "user", "content": "a"}])
+
+    new = get_async_llm_executor(12)
+    assert new is not old
+    # Work submitted before the switch still completes on the old loop
+    assert in_flight.result(timeout=5) == "response:a"
+    old._thread.join(timeout=5)
+    assert not old._thread.is_alive()
+
+    # Callers still holding the old executor are served by the new one
+    assert old.complete(model="m", messages=[{"role": "user", "content": "b"}]) == (
+        "response:b"
+    )
+    assert new.get_stats()["peak_in_flight"] == 1
@@ -0,0 +1,187 @@
+"""
+Tests for pacing transcription uploads under provider audio quotas.
+"""
+
+import logging
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+from podcast_processor.audio_quota import (
+    AudioQuotaScheduler,
+    get_audio_quota_scheduler,
+)
+from podcast_processor.token_rate_limiter import (
+    BUCKET_SECONDS,
+    InMemoryTokenUsageStore,
+    SQLiteTokenUsageStore,
+)
+from podcast_processor.transcribe import Segment, _provider_limiter, transcribe_chunks
+
+
+class _Clock:
+    """time.time replacement that only advances when slept on."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _scheduler(
+    clock: _Clock, store: InMemoryTokenUsageStore, **limits: int
+) -> AudioQuotaScheduler:
+    return AudioQuotaScheduler(
+        budget="audio:groq:key", store=store, sleep=clock.sleep, **limits
+    )
+
+
+def test_uploads_wait_once_the_hourly_audio_budget_is_used() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(
+        clock, InMemoryTokenUsageStore(), audio_seconds_per_hour=1000
+    )
+
+    with patch("time.time", clock):
+        assert scheduler.acquire(600.0) == 0
+        assert scheduler.acquire(400.0) == 0
+        waited = scheduler.acquire(300.0)
+        assert scheduler.get_usage_stats()["audio_seconds_used"] == 300
+
+    # Usage expires a whole bucket at a time
+    assert 0 < waited <= 3600 + BUCKET_SECONDS
+    assert clock.sleeps
+
+
+def test_uploads_wait_for_a_request_slot() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(clock, InMemoryTokenUsageStore(), requests_per_minute=2)
+
+    with patch("time.time", clock):
+        assert scheduler.acquire(30.0) == 0
+        assert scheduler.acquire(30.0) == 0
+        waited = scheduler.acquire(30.0)
+        assert scheduler.get_usage_stats()["requests_used"] == 1
+
+    assert 0 < waited <= 60 + BUCKET_SECONDS
+
+
+def test_a_chunk_longer_than_the_budget_is_admitted_alone() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(clock, InMemoryTokenUsageStore(), audio_seconds_per_hour=60)
+
+    with patch("time.time", clock):
+        assert scheduler.acquire(600.0) == 0
+
+
+def test_schedulers_sharing_a_store_share_the_budget() -> None:
+    clock = _Clock()
+    store = InMemoryTokenUsageStore()
+    first = _scheduler(clock, store, audio_seconds_per_hour=1000)
+    second = _scheduler(clock, store, audio_seconds_per_hour=1000)
+
+    with patch("time.time", clock):
+        assert first.acquire(900.0) == 0
+        assert second.acquire(300.0) > 0
+
+
+def test_no_scheduler_without_limits(tmp_path: Path) -> None:
+    store_path = tmp_path / "usage.sqlite"
+    assert (
+        get_audio_quota_scheduler(
+            "groq",
+            "key",
+            audio_seconds_per_hour=None,
+            requests_per_minute=None,
+            shared_store_path=store_path,
+        )
+        is None
+    )
+    scheduler = get_audio_quota_scheduler(
+        "groq",
+        "key",
+        audio_seconds_per_hour=7200,
+        requests_per_minute=None,
+        shared_store_path=store_path,
+    )
+    assert scheduler is not None
+    # Budgets are per API key, which is hashed rather than stored
+    assert scheduler.budget.startswith("audio:groq#")
+
+
+def test_usage_stays_in_process_without_a_shared_store(tmp_path: Path) -> None:
+    local = get_audio_quota_scheduler(
+        "groq",
+        "local-key",
+        audio_seconds_per_hour=7200,
+        requests_per_minute=None,
+    )
+    shared = get_audio_quota_scheduler(
+        "groq",
+        "local-key",
+        audio_seconds_per_hour=7200,
+        requests_per_minute=None,
+        shared_store_path=tmp_path / "usage.sqlite",
+    )
+    assert local is not None and shared is not None
+    assert isinstance(local.store, InMemoryTokenUsageStore)
+    assert isinstance(shared.store, SQLiteTokenUsageStore)
+
+
+def test_transcribe_chunks_claims_each_chunk_duration() -> None:
+    claimed: List[float] = []
+
+    class _RecordingScheduler(AudioQuotaScheduler):
+        def acquire(self, audio_seconds: float) -> float:
+            claimed.append(audio_seconds)
+            return 0.0
+
+    chunks = [(Path("/missing/chunk-0.mp3"), 0), (Path("/missing/chunk-1.mp3"), 90_000)]
+    results = transcribe_chunks(
+        chunks,
+        lambda path: [Segment(start=0.0, end=1.0, text=path)],
+        provider="test",
+        max_parallel=1,
+        logger=logging.getLogger("global_logger"),
+        log_prefix="[TEST]",
+        quota=_RecordingScheduler(
+            audio_seconds_per_hour=7200, store=InMemoryTokenUsageStore()
+        ),
+    )
+
+    assert [offset for _, offset in results] == [0, 90_000]
+    # The last chunk can't be probed, so it counts as long as the longest one
+    assert claimed == [90.0, 90.0]
+
+
+def test_quota_is_acquired_before_taking_a_transcription_slot() -> None:
+    active_while_waiting: List[int] = []
+
+    class _RecordingScheduler(AudioQuotaScheduler):
+        def acquire(self, audio_seconds: float) -> float:
+            active_while_waiting.append(
+                _provider_limiter("quota-order", 1).get_active_calls()
+            )
+            return 0.0
+
+    chunks = [(Path("/missing/chunk-0.mp3"), 0), (Path("/missing/chunk-1.mp3"), 90_000)]
+    transcribe_chunks(
+        chunks,
+        lambda path: [Segment(start=0.0, end=1.0, text=path)],
+        provider="quota-order",
+        max_parallel=1,
+        logger=logging.getLogger("global_logger"),
+        log_prefix="[TEST]",
+        quota=_RecordingScheduler(
+            audio_seconds_per_hour=7200, store=InMemoryTokenUsageStore()
+        ),
+    )
+
+    # A chunk waiting on quota doesn't hold the only slot
+    assert active_while_waiting == [0, 0]
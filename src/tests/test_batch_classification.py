@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Dict, Generator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+from jinja2 import Template
+
+from app.batch_classification import run_batch_classification_cycle
+from app.extensions import db
+from app.models import Feed, ModelCall, Post, ProcessingJob, TranscriptSegment
+from podcast_processor.ad_classifier import AdClassifier, ClassificationDeferred
+from podcast_processor.audio_processor import AudioProcessor
+from podcast_processor.llm_batch_client import (
+    BatchRequest,
+    LLMBatchClient,
+    resolve_batch_model,
+)
+from podcast_processor.podcast_downloader import PodcastDownloader
+from podcast_processor.podcast_processor import PodcastProcessor
+from podcast_processor.processing_status_manager import ProcessingStatusManager
+from podcast_processor.transcription_manager import TranscriptionManager
+from shared.test_utils import create_standard_test_config
+
+AD_RESPONSE = '{"ad_segments": [{"segment_offset": 10.0, "confidence": 0.95}]}'
+
+
+class _FakeBatchServer:
+    """Minimal stand-in for the OpenAI files + batches endpoints.
+
+    Batches complete immediately; every request gets AD_RESPONSE unless its
+    custom_id is listed in `fail_ids`.
+    """
+
+    def __init__(self) -> None:
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self.fail_ids: set[str] = set()
+        self.submitted_lines: List[Dict[str, Any]] = []
+        self._server = HTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _complete(self, input_file_id: str) -> str:
+        out_lines = []
+        for raw in self.files[input_file_id].decode().splitlines():
+            line = json.loads(raw)
+            self.submitted_lines.append(line)
+            if line["custom_id"] in self.fail_ids:
+                out_lines.append(
+                    {
+                        "custom_id": line["custom_id"],
+                        "response": {"status_code": 429, "body": {}},
+                    }
+                )
+                continue
+            out_lines.append(
+                {
+                    "custom_id": line["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {
+                            "choices": [
+                                {
+                                    "message": {
+                                        "role": "assistant",
+                                        "content": AD_RESPONSE,
+                                    }
+                                }
+                            ]
+                        },
+                    },
+                }
+            )
+        output_id = f"file-{len(self.files)}"
+        self.files[output_id] = "\n".join(json.dumps(o) for o in out_lines).encode()
+        return output_id
+
+    def _batch_json(self, batch_id: str) -> Dict[str, Any]:
+        batch = self.batches[batch_id]
+        return {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": batch["input_file_id"],
+            "completion_window": "24h",
+            "status": "completed",
+            "output_file_id": batch["output_file_id"],
+            "error_file_id": None,
+            "created_at": 0,
+        }
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args: Any) -> None:  # silence test output
+                pass
+
+            def _send(self, payload: Any, raw: bool = False) -> None:
+                body = payload if raw else json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self) -> None:  # pylint: disable=invalid-name
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.path == "/v1/files":
+                    match = re.search(
+                        rb"filename=\"[^\"]*\"\r\n(?:[^\r\n]*\r\n)*\r\n(.*?)\r\n--",
+                        body,
+                        re.S,
+                    )
+                    assert match is not None
+                    file_id = f"file-{len(fake.files)}"
+                    fake.files[file_id] = match.group(1)
+                    self._send(
+                        {
+                            "id": file_id,
+                            "object": "file",
+                            "bytes": len(match.group(1)),
+                            "created_at": 0,
+                            "filename": "batch_input.jsonl",
+                            "purpose": "batch",
+                            "status": "processed",
+                        }
+                    )
+                elif self.path == "/v1/batches":
+                    params = json.loads(body)
+                    batch_id = f"batch-{len(fake.batches)}"
+                    fake.batches[batch_id] = {
+                        "input_file_id": params["input_file_id"],
+                        "output_file_id": fake._complete(params["input_file_id"]),
+                    }
+                    self._send(fake._batch_json(batch_id))
+                else:
+                    self.send_error(404)
+
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                content = re.fullmatch(r"/v1/files/([^/]+)/content", self.path)
+                batch = re.fullmatch(r"/v1/batches/([^/]+)", self.path)
+                if content:
+                    self._send(fake.files[content.group(1)], raw=True)
+                elif batch:
+                    self._send(fake._batch_json(batch.group(1)))
+                else:
+                    self.send_error(404)
+
+        return Handler
+
+
+@pytest.fixture
+def batch_server() -> Generator[_FakeBatchServer, None, None]:
+    server = _FakeBatchServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def _client(server: _FakeBatchServer) -> LLMBatchClient:
+    return LLMBatchClient(api_key="test-key", base_url=server.base_url)
+
+
+def test_resolve_batch_model_strips_provider_prefix() -> None:
+    assert resolve_batch_model("openai/gpt-4o-mini", None) == ("gpt-4o-mini", None)
+    model, base_url = resolve_batch_model("groq/openai/gpt-oss-120b", None)
+    assert model == "openai/gpt-oss-120b"
+    assert base_url == "https://api.groq.com/openai/v1"
+
+
+def test_batch_client_round_trip(batch_server: _FakeBatchServer) -> None:
+    client = _client(batch_server)
+    batch_server.fail_ids = {"b"}
+    batch_id = client.submit(
+        [
+            BatchRequest.from_completion_args(
+                cid,
+                {
+                    "model": "gpt-4o-mini",
+                    "messages": [{"role": "user", "content": "hi"}],
+                    "max_completion_tokens": 64,
+                    "timeout": 30,
+                },
+            )
+            for cid in ("a", "b")
+        ]
+    )
+
+    status = client.retrieve(batch_id)
+    assert status.is_terminal
+    results = {r.custom_id: r for r in client.fetch_results(status)}
+
+    assert results["a"].content == AD_RESPONSE
+    assert results["b"].content is None
+    assert results["b"].error is not None and "429" in results["b"].error
+    assert batch_server.submitted_lines[0]["url"] == "/v1/chat/completions"
+    assert batch_server.submitted_lines[0]["body"]["max_completion_tokens"] == 64
+    # The timeout configures the HTTP client, not the request
+    assert "timeout" not in batch_server.submitted_lines[0]["body"]
+
+
+def _create_post_with_segments(count: int) -> Post:
+    feed = Feed(title="Feed", rss_url="https://example.com/feed.xml")
+    db.session.add(feed)
+    db.session.commit()
+    post = Post(
+        feed_id=feed.id,
+        guid="batch-guid",
+        download_url="https://example.com/ep.mp3",
+        title="Episode",
+        whitelisted=True,
+    )
+    db.session.add(post)
+    db.session.commit()
+    for i in range(count):
+        db.session.add(
+            TranscriptSegment(
+                post_id=post.id,
+                sequence_num=i,
+                start_time=i * 10.0,
+                end_time=(i + 1) * 10.0,
+                text=f"segment {i}",
+            )
+        )
+    db.session.commit()
+    return post
+
+
+def test_batch_mode_defers_then_resumes_with_responses(
+    app: Flask, batch_server: _FakeBatchServer
+) -> None:
+    config = create_standard_test_config(
+        num_segments_to_input_to_prompt=4, max_overlap_segments=2
+    )
+    config.llm_enable_batch_classification = True
+    config.enable_boundary_refinement = False
+
+    with app.app_context():
+        post = _create_post_with_segments(10)
+        segments = (
+            TranscriptSegment.query.filter_by(post_id=post.id)
+            .order_by(TranscriptSegment.sequence_num)
+            .all()
+        )
+        job = ProcessingJob(
+            id="job-1", post_guid=post.guid, status="waiting", current_step=3
+        )
+        db.session.add(job)
+        db.session.commit()
+
+        classifier = AdClassifier(config=config, db_session=db.session)
+        kwargs = {
+            "transcript_segments": segments,
+            "system_prompt": "system",
+            "user_prompt_template": Template("{{ transcript }}"),
+            "post": post,
+        }
+
+        with pytest.raises(ClassificationDeferred) as deferred:
+            classifier.classify(**kwargs)
+        queued_ids = deferred.value.model_call_ids
+        assert queued_ids
+        assert {
+            mc.status for mc in ModelCall.query.filter(ModelCall.id.in_(queued_ids))
+        } == {"batch_queued"}
+
+        def factory(_: str) -> LLMBatchClient:
+            return _client(batch_server)
+
+        first = run_batch_classification_cycle(config, factory, "system")
+        assert first["submitted"] == len(queued_ids)
+        # Batch requests carry the same arguments as an inline call
+        queued_call = db.session.get(ModelCall, queued_ids[0])
+        inline_args = classifier._prepare_api_call(queued_call, "system")
+        assert inline_args is not None
+        inline_args.pop("timeout")
+        body = next(
+            line["body"]
+            for line in batch_server.submitted_lines
+            if line["custom_id"] == f"model_call-{queued_call.id}"
+        )
+        assert (
+            body.pop("model") == resolve_batch_model(inline_args.pop("model"), None)[0]
+        )
+        assert body == inline_args
+        second = run_batch_classification_cycle(config, factory, "system")
+        assert second == {"collected": 1, "submitted": 0, "resumed": 1}
+
+        db.session.expire_all()
+        assert db.session.get(ProcessingJob, "job-1").status == "pending"
+        assert {
+            mc.status for mc in ModelCall.query.filter(ModelCall.id.in_(queued_ids))
+        } == {"success"}
+
+        # The rerun plans the same chunks and only consumes stored responses.
+        classifier.classify(**kwargs)
+        assert ModelCall.query.count() == len(queued_ids)
+        ad_segment = next(s for s in segments if s.start_time == 10.0)
+        assert ad_segment.identifications.filter_by(label="ad").count() == 1
+
+
+def test_deferred_classification_parks_the_job_without_finishing_it(
+    app: Flask,
+) -> None:
+    status_manager = MagicMock(spec=ProcessingStatusManager)
+    audio_processor = MagicMock(spec=AudioProcessor)
+    processor = PodcastProcessor(
+        config=create_standard_test_config(),
+        transcription_manager=MagicMock(spec=TranscriptionManager),
+        ad_classifier=MagicMock(spec=AdClassifier),
+        audio_processor=audio_processor,
+        status_manager=status_manager,
+        db_session=MagicMock(),
+        downloader=MagicMock(spec=PodcastDownloader),
+    )
+    job = MagicMock(spec=ProcessingJob)
+
+    with (
+        app.app_context(),
+        patch.object(processor, "_should_stream_classification", return_value=False),
+        patch.object(
+            processor,
+            "_classify_ad_segments",
+            side_effect=ClassificationDeferred(1, [7, 8]),
+        ),
+        pytest.raises(ClassificationDeferred),
+    ):
+        processor._perform_processing_steps(
+            MagicMock(spec=Post, id=1), job, "/missing/processed.mp3"
+        )
+
+    status_manager.update_job_status.assert_called_with(
+        job, "waiting", 3, "Waiting for batch classification (2 chunks)", 75.0
+    )
+    audio_processor.process_audio.assert_not_called()
@@ -0,0 +1,172 @@
+"""
+Tests for adaptive classification chunk sizing.
+"""
+
+from typing import Any, List
+
+from flask import Flask
+from jinja2 import Template
+
+from app.extensions import db
+from app.models import Feed, ModelCall, Post, TranscriptSegment
+from podcast_processor.ad_classifier import AdClassifier
+from podcast_processor.chunk_sizer import ChunkRecord, ChunkSizer
+from shared.config import TestWhisperConfig
+from shared.test_utils import create_standard_test_config
+
+
+def _record(sizer: ChunkSizer, **overrides: Any) -> ChunkRecord:
+    values = {
+        "first_seq": 0,
+        "last_seq": 0,
+        "segments_per_prompt": sizer.segments_per_prompt,
+        "max_overlap_segments": sizer.max_overlap_segments,
+        "new_segments": sizer.segments_per_prompt,
+        "chunk_segments": sizer.segments_per_prompt,
+        "prompt_tokens": 1000,
+        "latency_seconds": 5.0,
+        "detections": 0,
+    }
+    values.update(overrides)
+    record = ChunkRecord(**values)
+    sizer.record(record)
+    return record
+
+
+def _sizer(**overrides: Any) -> ChunkSizer:
+    kwargs = {
+        "segments_per_prompt": 60,
+        "max_overlap_segments": 30,
+        "adaptive": True,
+        "min_segments": 20,
+        "max_segments": 120,
+        "target_latency_seconds": 30.0,
+        "max_input_tokens": 10_000,
+    }
+    kwargs.update(overrides)
+    return ChunkSizer(**kwargs)
+
+
+def test_sizer_grows_clean_chunks_and_shrinks_dense_ones() -> None:
+    sizer = _sizer()
+
+    _record(sizer)
+    assert sizer.segments_per_prompt == 90
+    _record(sizer)
+    assert sizer.segments_per_prompt == 120  # capped at max_segments
+    assert sizer.max_overlap_segments == 30  # never above the configured cap
+
+    _record(sizer, detections=40)
+    assert sizer.segments_per_prompt == 60
+    _record(sizer, detections=30)
+    assert sizer.segments_per_prompt == 30
+    assert sizer.max_overlap_segments == 15
+    _record(sizer, detections=30)
+    assert sizer.segments_per_prompt == 20  # floored at min_segments
+
+
+def test_sizer_respects_latency_and_token_headroom() -> None:
+    sizer = _sizer()
+
+    _record(sizer, latency_seconds=60.0)
+    assert sizer.segments_per_prompt == 30
+
+    _record(sizer, prompt_tokens=9_000)
+    assert sizer.segments_per_prompt == 30
+
+    # A reused response has no latency and does not shrink the chunk
+    _record(sizer, latency_seconds=None)
+    assert sizer.segments_per_prompt == 45
+
+
+def test_static_sizer_keeps_configured_values() -> None:
+    sizer = _sizer(adaptive=False)
+
+    _record(sizer, detections=50, latency_seconds=90.0)
+
+    assert sizer.segments_per_prompt == 60
+    assert sizer.max_overlap_segments == 30
+    assert sizer.plan()["mode"] == "static"
+
+
+def test_sizer_replays_previous_plan() -> None:
+    first = _sizer()
+    _record(first, new_segments=60, latency_seconds=12.5)
+    _record(first, new_segments=40, latency_seconds=50.0)
+    plan = first.plan(audio_seconds=1800.0)
+    assert plan["prompt_tokens_per_audio_hour"] == 4000
+
+    config = create_standard_test_config(num_segments_to_input_to_prompt=60)
+    config.processing.adaptive_chunk_sizing = True
+    replay = ChunkSizer.for_post(config, previous_plan=plan, total_segments=100)
+
+    assert replay.segments_per_prompt == 60
+    _record(replay, latency_seconds=None, detections=60)
+    # Follows the recorded plan instead of shrinking for the detections
+    assert replay.segments_per_prompt == 90
+    assert replay.records[0].latency_seconds == 12.5
+
+    other_post = ChunkSizer.for_post(config, previous_plan=plan, total_segments=500)
+    assert not other_post.replaying
+
+
+def _post_with_segments(count: int) -> List[TranscriptSegment]:
+    feed = Feed(title="Feed", rss_url="https://example.com/feed.xml")
+    db.session.add(feed)
+    db.session.flush()
+    post = Post(feed_id=feed.id, guid="adaptive", download_url="u", title="Post")
+    db.session.add(post)
+    db.session.flush()
+    segments = [
+        TranscriptSegment(
+            post_id=post.id,
+            sequence_num=i,
+            start_time=i * 9.0,
+            end_time=(i + 1) * 9.0,
+            text=f"conversation {i}",
+        )
+        for i in range(count)
+    ]
+    db.session.add_all(segments)
+    db.session.commit()
+    return segments
+
+
+def test_classify_records_and_replays_chunk_plan(app: Flask) -> None:
+    config = create_standard_test_config(
+        num_segments_to_input_to_prompt=40, max_overlap_segments=10
+    )
+    config.whisper = TestWhisperConfig()
+    config.enable_boundary_refinement = False
+    config.processing.adaptive_chunk_sizing = True
+    config.processing.min_segments_to_input_to_prompt = 10
+    config.processing.max_segments_to_input_to_prompt = 100
+
+    with app.app_context():
+        segments = _post_with_segments(400)
+        post = db.session.get(Post, segments[0].post_id)
+        assert post is not None
+
+        def run() -> None:
+            AdClassifier(config=config, db_session=db.session).classify(
+                transcript_segments=segments,
+                system_prompt="system",
+                user_prompt_template=Template("{{ transcript }}"),
+                post=post,
+            )
+
+        run()
+        plan = db.session.get(Post, post.id).classification_chunk_plan
+        assert plan["mode"] == "adaptive"
+        assert [c["new_segments"] for c in plan["chunks"]] == [40, 60, 90, 100, 100, 10]
+        assert plan["audio_seconds"] == 3600.0
+        calls = ModelCall.query.filter_by(post_id=post.id).count()
+        assert calls == 6
+
+        # The rerun reuses every stored response instead of re-chunking
+        run()
+        replayed = db.session.get(Post, post.id).classification_chunk_plan
+        assert [(c["first_seq"], c["last_seq"]) for c in replayed["chunks"]] == [
+            (c["first_seq"], c["last_seq"]) for c in plan["chunks"]
+        ]
+        assert ModelCall.query.filter_by(post_id=post.id).count() == calls
@@ -0,0 +1,106 @@
+"""
+Tests for hedged LLM requests and the latency tracker.
+"""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generator
+
+import pytest
+
+from podcast_processor.hedged_completion import (
+    LatencyTracker,
+    LLMDeadlineExceeded,
+    hedged_request,
+)
+
+
+@pytest.fixture
+def pool() -> Generator[ThreadPoolExecutor, None, None]:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+def _submitter(
+    pool: ThreadPoolExecutor, delays: Dict[str, float]
+) -> Callable[[Dict[str, Any]], "Future[Any]"]:
+    def run(args: Dict[str, Any]) -> str:
+        time.sleep(delays[args["model"]])
+        if args["model"] == "broken":
+            raise RuntimeError("provider down")
+        return str(args["model"])
+
+    return lambda args: pool.submit(run, args)
+
+
+def test_percentile_needs_min_samples() -> None:
+    tracker = LatencyTracker(min_samples=5)
+    for seconds in (1.0, 2.0, 3.0, 4.0):
+        tracker.record("m", seconds)
+    assert tracker.percentile("m", 50.0) is None
+
+    tracker.record("m", 10.0)
+    assert tracker.percentile("m", 50.0) == 3.0
+    assert tracker.percentile("m", 95.0) == 10.0
+    assert tracker.percentile("other", 50.0) is None
+
+
+def test_percentile_uses_recent_window() -> None:
+    tracker = LatencyTracker(max_samples=3, min_samples=1)
+    for seconds in (50.0, 1.0, 1.0, 1.0):
+        tracker.record("m", seconds)
+    assert tracker.percentile("m", 100.0) == 1.0
+
+
+def test_fast_primary_is_not_hedged(pool: ThreadPoolExecutor) -> None:
+    submitted = []
+    submit = _submitter(pool, {"primary": 0.0, "hedge": 0.0})
+
+    def tracking_submit(args: Dict[str, Any]) -> "Future[Any]":
+        submitted.append(args["model"])
+        return submit(args)
+
+    result = hedged_request(
+        tracking_submit,
+        {"model": "primary"},
+        hedge_args={"model": "hedge"},
+        hedge_after=0.5,
+    )
+    assert result == "primary"
+    assert submitted == ["primary"]
+
+
+def test_slow_primary_loses_to_hedge(pool: ThreadPoolExecutor) -> None:
+    submit = _submitter(pool, {"primary": 1.0, "hedge": 0.0})
+
+    start = time.monotonic()
+    result = hedged_request(
+        submit, {"model": "primary"}, hedge_args={"model": "hedge"}, hedge_after=0.05
+    )
+    assert result == "hedge"
+    assert time.monotonic() - start < 0.5
+
+
+def test_hedge_failure_falls_back_to_primary(pool: ThreadPoolExecutor) -> None:
+    submit = _submitter(pool, {"primary": 0.2, "broken": 0.0})
+    result = hedged_request(
+        submit, {"model": "primary"}, hedge_args={"model": "broken"}, hedge_after=0.05
+    )
+    assert result == "primary"
+
+
+def test_primary_failure_before_hedge_is_raised(pool: ThreadPoolExecutor) -> None:
+    submit = _submitter(pool, {"broken": 0.0, "hedge": 0.0})
+    with pytest.raises(RuntimeError, match="provider down"):
+        hedged_request(
+            submit, {"model": "broken"}, hedge_args={"model": "hedge"}, hedge_after=1.0
+        )
+
+
+def test_deadline_caps_wait(pool: ThreadPoolExecutor) -> None:
+    submit = _submitter(pool, {"primary": 1.0})
+
+    start = time.monotonic()
+    with pytest.raises(LLMDeadlineExceeded):
+        hedged_request(submit, {"model": "primary"}, deadline=time.monotonic() + 0.1)
+    assert time.monotonic() - start < 0.5
@@ -4,14 +4,18 @@ Test cases for LLM concurrency limiting functionality.
 
 import threading
 import time
+from types import SimpleNamespace
 
 import pytest
 
 from podcast_processor.llm_concurrency_limiter import (
+    AIMDController,
     ConcurrencyContext,
     LLMConcurrencyLimiter,
+    adaptive_max_concurrent_calls,
     get_concurrency_limiter,
 )
+from shared.test_utils import create_standard_test_config
 
 
 class TestLLMConcurrencyLimiter:
@@ -146,6 +150,91 @@ class TestLLMConcurrencyLimiter:
         assert len(end_results) == 4
 
 
+class TestAdaptiveConcurrency:
+    """AIMD adjustment of the concurrency limit."""
+
+    @staticmethod
+    def _rate_limited(retry_after=None):
+        error = Exception("429 Too Many Requests")
+        error.response = SimpleNamespace(
+            headers={"retry-after": str(retry_after)} if retry_after else {}
+        )
+        return error
+
+    def test_grows_additively_up_to_ceiling(self):
+        controller = AIMDController(2, 4)
+
+        for _ in range(2):
+            controller.on_success()
+        assert controller.limit == 2  # 2 + 1/2 + 1/2.5
+        controller.on_success()
+        assert controller.limit == 3
+
+        for _ in range(50):
+            controller.on_success()
+        assert controller.limit == 4
+
+    def test_halves_on_overload_once_per_cooldown(self):
+        controller = AIMDController(8, 8, decrease_cooldown=60.0)
+
+        controller.on_error(self._rate_limited())
+        controller.on_error(Exception("HTTP 529 overloaded"))
+        assert controller.limit == 4
+
+        controller.on_error(Exception("Request timed out"))
+        assert controller.limit == 4
+
+    def test_never_drops_below_one(self):
+        controller = AIMDController(1, decrease_cooldown=0.0)
+        for _ in range(5):
+            controller.on_overload()
+        assert controller.limit == 1
+
+    def test_context_reports_outcomes_to_limiter(self):
+        limiter = LLMConcurrencyLimiter(max_concurrent_calls=4)
+
+        with pytest.raises(Exception, match="429"):
+            with ConcurrencyContext(limiter):
+                raise self._rate_limited()
+
+        assert limiter.get_current_limit() == 2
+        assert limiter.get_available_slots() == 2
+
+        with ConcurrencyContext(limiter):
+            pass
+        assert limiter.controller._window == pytest.approx(2.5)
+
+    def test_retry_after_pauses_new_calls(self):
+        limiter = LLMConcurrencyLimiter(max_concurrent_calls=2)
+        limiter.record_error(self._rate_limited(retry_after=0.2))
+
+        start = time.monotonic()
+        # The pause does not count against the acquire timeout
+        assert limiter.acquire(timeout=0.05) is True
+        assert time.monotonic() - start >= 0.15
+        limiter.release()
+
+    def test_exhausted_limit_in_success_headers_pauses(self):
+        controller = AIMDController(2)
+        response = SimpleNamespace(
+            _hidden_params={
+                "additional_headers": {
+                    "llm_provider-x-ratelimit-remaining-requests": "0",
+                    "llm_provider-x-ratelimit-reset-requests": "30s",
+                }
+            }
+        )
+        controller.on_response(response)
+        assert 29 < controller.pause_remaining() <= 30
+
+    def test_config_ceiling(self):
+        config = create_standard_test_config()
+        config.llm_max_concurrent_calls = 3
+        assert adaptive_max_concurrent_calls(config) == 3
+        config.llm_adaptive_max_concurrent_calls = 10
+        assert adaptive_max_concurrent_calls(config) == 10
+
+
 class TestGlobalConcurrencyLimiter:
     """Test cases for global concurrency limiter functions."""
 
@@ -2,9 +2,14 @@
 Tests for the LLM error classifier.
 """
 
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
 import pytest
 
 from podcast_processor.llm_error_classifier import LLMErrorClassifier
+from podcast_processor.rate_limit_headers import exhausted_reset_seconds, headers_from
 
 
 class TestLLMErrorClassifier:
@@ -146,3 +151,68 @@ class TestLLMErrorClassifier:
         assert not LLMErrorClassifier.is_retryable_error("AUTHENTICATION FAILED")
         assert not LLMErrorClassifier.is_retryable_error("Authentication Failed")
         assert not LLMErrorClassifier.is_retryable_error("authentication failed")
+
+    def test_overload_errors(self):
+        """Overloads and 503s are the signals adaptive concurrency backs off on."""
+        assert LLMErrorClassifier.get_error_category("Overloaded") == "overloaded"
+        assert LLMErrorClassifier.is_retryable_error("HTTP 529 overloaded_error")
+        assert LLMErrorClassifier.is_overload_error("Rate limit exceeded")
+        assert LLMErrorClassifier.is_overload_error("HTTP 503 Service Unavailable")
+        assert not LLMErrorClassifier.is_overload_error("Request timed out")
+        assert not LLMErrorClassifier.is_overload_error("HTTP 500 error")
+
+
+class TestRetryAfter:
+    """Wait times read from provider response headers."""
+
+    @staticmethod
+    def _error(headers):
+        error = Exception("429 Too Many Requests")
+        error.response = SimpleNamespace(headers=headers)
+        return error
+
+    def test_retry_after_seconds_and_millis(self):
+        assert LLMErrorClassifier.get_retry_after(
+            self._error({"Retry-After": "7"})
+        ) == pytest.approx(7.0)
+        assert LLMErrorClassifier.get_retry_after(
+            self._error({"retry-after-ms": "1500", "retry-after": "9"})
+        ) == pytest.approx(1.5)
+
+    def test_retry_after_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        wait = LLMErrorClassifier.get_retry_after(
+            self._error({"Retry-After": format_datetime(when, usegmt=True)})
+        )
+        assert wait is not None and 28 <= wait <= 30
+
+    def test_falls_back_to_exhausted_limit_reset(self):
+        headers = {
+            "x-ratelimit-remaining-requests": "10",
+            "x-ratelimit-reset-requests": "2s",
+            "x-ratelimit-remaining-tokens": "0",
+            "x-ratelimit-reset-tokens": "1m30s",
+        }
+        assert LLMErrorClassifier.get_retry_after(
+            self._error(headers)
+        ) == pytest.approx(90.0)
+
+    def test_no_headers(self):
+        assert LLMErrorClassifier.get_retry_after(Exception("rate limit")) is None
+        assert LLMErrorClassifier.get_retry_after("rate limit") is None
+
+
+def test_exhausted_reset_reads_litellm_response_headers():
+    reset_at = datetime.now(timezone.utc) + timedelta(seconds=20)
+    response = SimpleNamespace(
+        _hidden_params={
+            "additional_headers": {
+                "llm_provider-anthropic-ratelimit-requests-remaining": "0",
+                "llm_provider-anthropic-ratelimit-requests-reset": reset_at.isoformat(),
+                "llm_provider-x-ratelimit-remaining-tokens": "5000",
+                "llm_provider-x-ratelimit-reset-tokens": "250ms",
+            }
+        }
+    )
+    wait = exhausted_reset_seconds(headers_from(response))
+    assert wait is not None and 18 <= wait <= 20
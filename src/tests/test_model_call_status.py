@@ -0,0 +1,104 @@
+"""
+Tests for buffered ModelCall status writes.
+"""
+
+import time
+from typing import Any, List, Tuple
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+from litellm.exceptions import InternalServerError
+from litellm.types.utils import Choices
+
+from app.models import ModelCall
+from podcast_processor.ad_classifier import AdClassifier
+from podcast_processor.model_call_status import ModelCallStatusBuffer
+from shared.test_utils import create_standard_test_config
+
+
+class _RecordingWriter:
+    def __init__(self) -> None:
+        self.calls: List[Tuple[int, dict, bool]] = []
+
+    def update(self, model: str, pk: Any, data: dict, wait: bool = True) -> Any:
+        assert model == "ModelCall"
+        self.calls.append((pk, dict(data), wait))
+        return MagicMock(success=True)
+
+    @property
+    def blocking(self) -> List[dict]:
+        return [data for _, data, wait in self.calls if wait]
+
+
+def _model_call(status: str = "pending") -> ModelCall:
+    return ModelCall(
+        id=7,
+        post_id=1,
+        model_name="test-model",
+        prompt="prompt",
+        first_segment_sequence_num=0,
+        last_segment_sequence_num=1,
+        status=status,
+        retry_attempts=0,
+    )
+
+
+def _response(content: str) -> MagicMock:
+    choice = MagicMock(spec=Choices)
+    choice.message = MagicMock(content=content)
+    return MagicMock(choices=[choice])
+
+
+def test_retries_flush_in_a_single_write(app: Flask) -> None:
+    writer = _RecordingWriter()
+    config = create_standard_test_config()
+    with app.app_context():
+        classifier = AdClassifier(config=config, db_session=MagicMock())
+    model_call = _model_call()
+    error = InternalServerError(
+        message="temporary", llm_provider="test", model="test-model"
+    )
+
+    with patch("podcast_processor.model_call_status.writer_client", writer), patch(
+        "litellm.completion", side_effect=[error, error, _response("ok")]
+    ), patch("time.sleep"):
+        assert classifier._call_model(model_call, "system", max_retries=3) == "ok"
+
+    assert len(writer.calls) == 1
+    assert writer.blocking == [
+        {
+            "status": "success",
+            "retry_attempts": 3,
+            "error_message": None,
+            "response": "ok",
+        }
+    ]
+    assert model_call.status == "success"
+    assert model_call.retry_attempts == 3
+
+
+def test_heartbeat_reports_long_running_call() -> None:
+    writer = _RecordingWriter()
+    model_call = _model_call(status="failed")
+
+    with patch("podcast_processor.model_call_status.writer_client", writer):
+        with ModelCallStatusBuffer(model_call, heartbeat_interval=0.02) as status:
+            status.record_attempt(2)
+            status.record_error("slow provider")
+            time.sleep(0.15)
+            status.finish("failed_retries")
+        sent_after_finish = len(writer.calls)
+        time.sleep(0.05)
+
+    async_writes = [data for _, data, wait in writer.calls if not wait]
+    # Re-run from a failed state is marked pending right away, without blocking
+    assert async_writes[0] == {"status": "pending"}
+    assert status.heartbeats_sent >= 2
+    assert {
+        "status": "pending",
+        "retry_attempts": 2,
+        "error_message": "slow provider",
+    } in async_writes
+    assert writer.calls[-1][2] is True
+    assert writer.blocking[-1]["status"] == "failed_retries"
+    assert len(writer.calls) == sent_after_finish
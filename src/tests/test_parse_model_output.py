@@ -1,9 +1,11 @@
 import pytest
 from pydantic import ValidationError
 
+from podcast_processor.llm_model_call_utils import JsonObjectWatcher
 from podcast_processor.model_output import (
     AdSegmentPrediction,
     AdSegmentPredictionList,
+    StreamingPredictionParser,
     clean_and_parse_model_output,
 )
 
@@ -90,3 +92,111 @@ def test_clean_parse_output_truncated_with_content_type() -> None:
         content_type="promotional_external",
         confidence=0.92,
     )
+
+
+def _feed_in_pieces(parser: StreamingPredictionParser, text: str, size: int) -> list:
+    yielded = []
+    for i in range(0, len(text), size):
+        yielded.append(parser.feed(text[i : i + size]))
+    return yielded
+
+
+def test_streaming_parser_yields_predictions_as_objects_close() -> None:
+    model_output = (
+        '{"ad_segments": [{"segment_offset": 10.5, "confidence": 0.92}, '
+        '{"segment_offset": 25.0, "confidence": 0.85}], '
+        '"content_type": "promotional_external", "confidence": 0.9}'
+    )
+    parser = StreamingPredictionParser()
+
+    split = model_output.index("}") + 1
+    first = parser.feed(model_output[:split])
+    assert first == [AdSegmentPrediction(segment_offset=10.5, confidence=0.92)]
+    second = parser.feed(model_output[split:])
+    assert second == [AdSegmentPrediction(segment_offset=25.0, confidence=0.85)]
+
+    assert parser.array_closed
+    assert parser.stop_reason is None
+    assert parser.result() == clean_and_parse_model_output(model_output)
+
+
+def test_streaming_parser_handles_single_character_deltas() -> None:
+    model_output = '{"ad_segments":[{"segment_offset":1.0,"confidence":0.8}]}'
+    parser = StreamingPredictionParser()
+
+    yielded = [p for batch in _feed_in_pieces(parser, model_output, 1) for p in batch]
+
+    assert yielded == [AdSegmentPrediction(segment_offset=1.0, confidence=0.8)]
+
+
+def test_streaming_parser_flags_repeated_offsets() -> None:
+    repeated = ", ".join(['{"segment_offset": 12.0, "confidence": 0.9}'] * 10)
+    parser = StreamingPredictionParser(max_offset_repeats=3)
+
+    parser.feed('{"ad_segments": [' + repeated)
+
+    assert parser.stop_reason is not None
+    assert "12.0" in parser.stop_reason
+    assert len(parser.predictions) == 3
+    assert parser.result() == AdSegmentPredictionList(
+        ad_segments=[AdSegmentPrediction(segment_offset=12.0, confidence=0.9)]
+    )
+
+
+def test_streaming_parser_flags_more_predictions_than_segments() -> None:
+    objects = ", ".join(
+        f'{{"segment_offset": {i}.0, "confidence": 0.9}}' for i in range(5)
+    )
+    parser = StreamingPredictionParser(max_predictions=3)
+
+    parser.feed('{"ad_segments": [' + objects)
+
+    assert parser.stop_reason is not None
+    assert len(parser.result().ad_segments) == 3
+
+
+def test_json_object_watcher_stops_after_first_object() -> None:
+    watcher = JsonObjectWatcher()
+
+    assert watcher.feed('Sure! {"refined": {"note": "brace } in string"}')
+    assert not watcher.complete
+    assert watcher.feed(', "ok": true}') is False
+    assert watcher.complete
+
+
+def test_clean_parse_output_maps_compact_segment_ids() -> None:
+    model_output = (
+        '{"ad_segments": [{"segment_id": 1, "confidence": 0.9}, '
+        '{"segment_id": 2, "confidence": 0.8}, {"segment_id": 7, "confidence": 0.99}], '
+        '"content_type": "promotional_external", "confidence": 0.9}'
+    )
+
+    result = clean_and_parse_model_output(
+        model_output, segment_offsets={0: 100.0, 1: 104.5, 2: 110.2}
+    )
+
+    # Unknown ids are dropped rather than failing the whole chunk
+    assert result.ad_segments == [
+        AdSegmentPrediction(segment_offset=104.5, confidence=0.9),
+        AdSegmentPrediction(segment_offset=110.2, confidence=0.8),
+    ]
+    assert result.content_type == "promotional_external"
+
+
+def test_clean_parse_output_segment_id_requires_mapping() -> None:
+    with pytest.raises(ValidationError):
+        clean_and_parse_model_output(
+            '{"ad_segments": [{"segment_id": 1, "confidence": 0.9}]}'
+        )
+
+
+def test_streaming_parser_maps_compact_segment_ids() -> None:
+    parser = StreamingPredictionParser(segment_offsets={0: 5.0, 1: 9.5})
+
+    streamed = parser.feed(
+        '{"ad_segments": [{"segment_id": 1, "confidence": 0.9}, '
+        '{"segment_id": 4, "confidence": 0.9}]}'
+    )
+
+    assert streamed == [AdSegmentPrediction(segment_offset=9.5, confidence=0.9)]
+    assert parser.result().ad_segments == streamed
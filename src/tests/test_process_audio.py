@@ -2,9 +2,13 @@ import tempfile
 from pathlib import Path
 
 from podcast_processor.audio import (
+    choose_chunk_boundaries,
     clip_segments_with_fade,
     get_audio_duration_ms,
+    parse_silencedetect_output,
+    segment_audio,
     split_audio,
+    transcode_for_speech,
 )
 
 TEST_FILE_DURATION = 66_048
@@ -99,7 +103,7 @@ def test_clip_segment_with_fade_end() -> None:
 def test_split_audio() -> None:
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_dir_path = Path(temp_dir)
-        split_audio(Path(TEST_FILE_PATH), temp_dir_path, 38_000)
+        split_audio(Path(TEST_FILE_PATH), temp_dir_path, 38_000, cut_at_silence=False)
 
         expected = {
             "0.mp3": (6_384, 38_108),
@@ -129,3 +133,65 @@ def test_split_audio() -> None:
             assert (
                 abs(filesize - split.stat().st_size) <= 500
             ), f"filesize <> 500 bytes for {split}. found {split.stat().st_size}, expected {filesize}"  # pylint: disable=line-too-long
+
+
+def test_parse_silencedetect_output() -> None:
+    stderr = """
+[silencedetect @ 0x1] silence_start: -0.012
+[silencedetect @ 0x1] silence_end: 0.2915 | silence_duration: 0.3035
+[silencedetect @ 0x1] silence_start: 7.5
+[silencedetect @ 0x1] silence_end: 8.25 | silence_duration: 0.75
+[silencedetect @ 0x1] silence_start: 9.9
+"""
+    assert parse_silencedetect_output(stderr, 30_000, 40_000) == [
+        (30_000, 30_292),
+        (37_500, 38_250),
+        (39_900, 40_000),
+    ]
+
+
+def test_choose_chunk_boundaries_cuts_in_longest_nearby_silence() -> None:
+    silences = [
+        (40_000, 60_000),  # before the first window
+        (80_000, 80_400),
+        (95_000, 96_000),
+        (99_800, 101_000),  # clipped to the window: 200 ms
+    ]
+
+    assert choose_chunk_boundaries(250_000, 100_000) == [0, 100_000, 200_000, 250_000]
+    assert choose_chunk_boundaries(250_000, 100_000, silences) == [
+        0,
+        95_500,
+        # Nothing in (170_500, 195_500], so the size target is kept
+        195_500,
+        250_000,
+    ]
+
+
+def test_segment_audio_writes_all_chunks_in_one_pass() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        chunks = segment_audio(Path(TEST_FILE_PATH), temp_dir_path, [5_000, 20_000])
+
+        assert [path.name for path, _ in chunks] == ["0.mp3", "1.mp3", "2.mp3"]
+        assert sorted(p.name for p in temp_dir_path.iterdir()) == [
+            "0.mp3",
+            "1.mp3",
+            "2.mp3",
+        ]
+        offsets = [offset for _, offset in chunks]
+        # Stream copy cuts on the next 24ms mp3 frame
+        assert offsets[0] == 0
+        assert 5_000 <= offsets[1] < 5_024
+        assert 20_000 <= offsets[2] < 20_024
+
+
+def test_transcode_for_speech_shrinks_audio_and_keeps_suffix_when_split() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        speech_path = transcode_for_speech(Path(TEST_FILE_PATH), temp_dir_path, "opus")
+
+        assert speech_path.suffix == ".ogg"
+        assert speech_path.stat().st_size < Path(TEST_FILE_PATH).stat().st_size
+        chunks = segment_audio(speech_path, temp_dir_path, [30_000])
+        assert [path.name for path, _ in chunks] == ["0.ogg", "1.ogg"]
@@ -0,0 +1,178 @@
+"""
+Tests for the local segment scorer and its training data.
+"""
+
+import random
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import patch
+
+from flask import Flask
+
+from app.extensions import db
+from app.models import Identification, ModelCall, Post, TranscriptSegment
+from app.segment_scorer_training import collect_training_examples, train_from_database
+from podcast_processor.ad_classifier import AdClassifier
+from podcast_processor.segment_scorer import (
+    SegmentScorer,
+    evaluate,
+    featurize,
+    train_segment_scorer,
+)
+from shared.test_utils import create_standard_test_config
+
+AD_TEXTS = [
+    "this episode is brought to you by squarespace",
+    "go to betterhelp.com slash show for ten percent off",
+    "use code PODLY at checkout for a free trial",
+    "our sponsor today makes the best mattress, visit example.com",
+]
+CONTENT_TEXTS = [
+    "so tell me about how the research started",
+    "i think the data really backs that up",
+    "and then we moved to a different city",
+    "that was the hardest part of the whole project",
+]
+
+
+def _synthetic_examples(count: int, seed: int = 1) -> Tuple[List[str], List[int]]:
+    rng = random.Random(seed)
+    texts, labels = [], []
+    for _ in range(count):
+        is_ad = rng.random() < 0.2
+        texts.append(rng.choice(AD_TEXTS if is_ad else CONTENT_TEXTS))
+        labels.append(int(is_ad))
+    return texts, labels
+
+
+def _trained_scorer() -> SegmentScorer:
+    texts, labels = _synthetic_examples(400)
+    return train_segment_scorer(featurize(texts, [0.5] * len(texts)), labels)
+
+
+def test_scorer_separates_ads_from_content(tmp_path: Path) -> None:
+    scorer = _trained_scorer()
+    texts, labels = _synthetic_examples(200, seed=2)
+    features = featurize(texts, [0.5] * len(texts))
+
+    metrics = evaluate(scorer, features, labels)
+    assert metrics["precision"] == 1.0
+    assert metrics["recall"] == 1.0
+
+    path = tmp_path / "scorer.npz"
+    scorer.save(path)
+    loaded = SegmentScorer.load(path)
+    assert (loaded.score_features(features) == scorer.score_features(features)).all()
+
+
+def _segment(post: Post, seq: int, text: str) -> TranscriptSegment:
+    segment = TranscriptSegment(
+        post_id=post.id,
+        sequence_num=seq,
+        start_time=seq * 10.0,
+        end_time=(seq + 1) * 10.0,
+        text=text,
+    )
+    db.session.add(segment)
+    return segment
+
+
+def _classified_post(texts: List[str], covered_until: int) -> Tuple[Post, ModelCall]:
+    post = Post(feed_id=1, guid=f"guid-{len(texts)}", download_url="u", title="P")
+    db.session.add(post)
+    db.session.flush()
+    for seq, text in enumerate(texts):
+        _segment(post, seq, text)
+    model_call = ModelCall(
+        post_id=post.id,
+        model_name="m",
+        prompt="p",
+        first_segment_sequence_num=0,
+        last_segment_sequence_num=covered_until,
+        status="success",
+    )
+    db.session.add(model_call)
+    db.session.commit()
+    return post, model_call
+
+
+def test_collect_training_examples_labels(app: Flask) -> None:
+    with app.app_context():
+        post, model_call = _classified_post(
+            [CONTENT_TEXTS[0], AD_TEXTS[0], AD_TEXTS[1], CONTENT_TEXTS[1], "later"],
+            covered_until=3,
+        )
+        segments = {s.sequence_num: s for s in post.segments}
+        for seq, confidence in ((1, 0.95), (2, 0.4)):
+            db.session.add(
+                Identification(
+                    transcript_segment_id=segments[seq].id,
+                    model_call_id=model_call.id,
+                    label="ad",
+                    confidence=confidence,
+                )
+            )
+        db.session.commit()
+
+        examples = collect_training_examples(min_confidence=0.8)
+
+    # Low-confidence ad (seq 2) and the uncovered segment (seq 4) are left out
+    assert examples.texts == [CONTENT_TEXTS[0], AD_TEXTS[0], CONTENT_TEXTS[1]]
+    assert examples.labels == [0, 1, 0]
+
+
+def test_train_from_database_writes_model(app: Flask, tmp_path: Path) -> None:
+    texts, labels = _synthetic_examples(120)
+    with app.app_context():
+        post, model_call = _classified_post(texts, covered_until=len(texts) - 1)
+        for segment in post.segments:
+            if labels[segment.sequence_num]:
+                db.session.add(
+                    Identification(
+                        transcript_segment_id=segment.id,
+                        model_call_id=model_call.id,
+                        label="ad",
+                        confidence=0.9,
+                    )
+                )
+        db.session.commit()
+
+        metadata = train_from_database(
+            min_confidence=0.8, output_path=tmp_path / "scorer.npz", holdout_fraction=0
+        )
+
+    assert metadata["segments"] == 120
+    assert metadata["ad_segments"] == sum(labels)
+    assert SegmentScorer.load(tmp_path / "scorer.npz").metadata == metadata
+
+
+def test_classifier_skips_llm_for_chunks_scored_ad_free(
+    app: Flask, tmp_path: Path
+) -> None:
+    path = tmp_path / "scorer.npz"
+    _trained_scorer().save(path)
+    config = create_standard_test_config()
+    config.segment_scorer_path = str(path)
+    config.segment_scorer_gate_threshold = 0.2
+
+    with app.app_context():
+        post, _ = _classified_post(CONTENT_TEXTS, covered_until=0)
+        segments = list(post.segments)
+        classifier = AdClassifier(config=config, db_session=db.session)
+        assert classifier.segment_scorer is not None
+        classifier._segment_scores = classifier.segment_scorer.score_segments(segments)
+
+        with patch("litellm.completion", side_effect=AssertionError("LLM called")):
+            assert (
+                classifier._process_chunk(
+                    chunk_segments=segments,
+                    system_prompt="system",
+                    post=post,
+                    user_prompt_str="prompt",
+                )
+                == []
+            )
+
+        segments[1].text = AD_TEXTS[0]
+        classifier._segment_scores = classifier.segment_scorer.score_segments(segments)
+        assert not classifier._scorer_rules_out_ads(segments)
@@ -0,0 +1,160 @@
+"""
+The array-backed paths must produce the same results as the list-based ones.
+"""
+
+import random
+from typing import Any, List, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models import Identification, ModelCall, TranscriptSegment
+from podcast_processor import audio_processor as audio_processor_module
+from podcast_processor.ad_classifier import AdClassifier
+from podcast_processor.audio_processor import AudioProcessor
+from podcast_processor.segment_timeline import (
+    SegmentTimeline,
+    group_adjacent,
+    merge_close_intervals,
+)
+from shared.test_utils import create_standard_test_config
+
+TEXTS = [
+    "and we're back with the interview",
+    "visit example.com slash podcast for twenty percent off",
+    "this episode is brought to you by our sponsor",
+    "support the show on patreon",
+    "call 1-800-555-0199 today",
+    "anyway, where were we",
+]
+
+
+def _synthetic_episode(count: int, seed: int = 7) -> Tuple[List[Any], List[Any]]:
+    rng = random.Random(seed)
+    segments = []
+    t = 0.0
+    for i in range(count):
+        length = rng.uniform(2.0, 14.0)
+        segments.append(
+            TranscriptSegment(
+                id=1000 + i,
+                post_id=1,
+                sequence_num=i,
+                start_time=t,
+                end_time=t + length,
+                text=rng.choice(TEXTS),
+            )
+        )
+        t += length + rng.choice([0.0, 0.0, 0.5, 12.0])
+    idents = [
+        Identification(
+            id=i,
+            transcript_segment=seg,
+            transcript_segment_id=seg.id,
+            label="ad",
+            confidence=rng.uniform(0.5, 1.0),
+        )
+        for i, seg in enumerate(rng.sample(segments, count // 10))
+    ]
+    return segments, idents
+
+
+def _classifier(enable_refinement: bool) -> AdClassifier:
+    config = create_standard_test_config()
+    config.enable_boundary_refinement = enable_refinement
+    return AdClassifier(
+        config=config,
+        model_call_query=MagicMock(),
+        identification_query=MagicMock(),
+        db_session=MagicMock(),
+    )
+
+
+def test_timeline_lookups() -> None:
+    segments, _ = _synthetic_episode(20)
+    timeline = SegmentTimeline.from_segments(reversed(segments))
+
+    positions, found = timeline.positions_of_ids([1003, 99, 1019])
+    assert found.tolist() == [True, False, True]
+    assert timeline.sequence_nums[positions[found]].tolist() == [3, 19]
+
+    base_index, neighbors = timeline.neighbor_pairs([0], window=2)
+    assert base_index.tolist() == [0, 0]
+    assert timeline.sequence_nums[neighbors].tolist() == [1, 2]
+
+
+def test_group_and_merge_helpers() -> None:
+    assert group_adjacent([0.0, 5.0, 30.0], [4.0, 10.0, 40.0], 10.0) == [
+        (0, 2),
+        (2, 3),
+    ]
+    starts, ends = merge_close_intervals([0.0, 12.0, 50.0], [10.0, 11.0, 60.0], 5.0)
+    # The sequential merge takes the end of the last merged interval
+    assert list(zip(starts.tolist(), ends.tolist())) == [(0.0, 11.0), (50.0, 60.0)]
+
+
+@pytest.mark.parametrize("enable_refinement", [True, False])
+def test_vectorized_neighbor_expansion_matches_loop(enable_refinement: bool) -> None:
+    segments, idents = _synthetic_episode(600)
+    classifier = _classifier(enable_refinement)
+    model_call = ModelCall(id=5)
+    existing = {(segments[10].id, 5, "ad"), (segments[11].id, 4, "ad")}
+    classifier._get_segments_bulk = lambda post_id, seqs: {  # type: ignore[method-assign]
+        s.sequence_num: s for s in segments if s.sequence_num in set(seqs)
+    }
+
+    expected = classifier._neighbor_rows_loop(
+        idents, model_call, set(existing), post_id=1, window=5
+    )
+    actual = classifier._neighbor_rows_vectorized(
+        idents,
+        model_call,
+        set(existing),
+        SegmentTimeline.from_segments(segments),
+        window=5,
+    )
+
+    assert actual == expected
+    assert expected
+
+
+def test_vectorized_block_grouping_matches_loop() -> None:
+    segments, idents = _synthetic_episode(600)
+    classifier = _classifier(True)
+
+    expected = classifier._group_into_blocks(idents)
+    actual = classifier._group_into_blocks(
+        idents, SegmentTimeline.from_segments(segments)
+    )
+
+    assert len(actual) == len(expected)
+    for got, want in zip(actual, expected):
+        assert got["start"] == want["start"]
+        assert got["end"] == want["end"]
+        assert got["confidence"] == pytest.approx(want["confidence"])
+        assert got["identifications"] == want["identifications"]
+
+
+def test_vectorized_merge_matches_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = random.Random(3)
+    ad_segments = []
+    for _ in range(300):
+        start = rng.uniform(0, 3000)
+        ad_segments.append((start, start + rng.uniform(1, 60)))
+    processor = AudioProcessor(
+        config=create_standard_test_config(),
+        identification_query=MagicMock(),
+        transcript_segment_query=MagicMock(),
+        model_call_query=MagicMock(),
+        db_session=MagicMock(),
+    )
+    kwargs = {
+        "duration_ms": 3_000_000,
+        "ad_segments": ad_segments,
+        "min_ad_segment_length_seconds": 30.0,
+        "min_ad_segment_separation_seconds": 20.0,
+    }
+
+    vectorized = processor.merge_ad_segments(**kwargs)
+    monkeypatch.setattr(audio_processor_module, "HAS_NUMPY", False)
+    assert vectorized == processor.merge_ad_segments(**kwargs)
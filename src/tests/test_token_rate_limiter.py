@@ -4,9 +4,11 @@ Tests for the TokenRateLimiter class and related functionality.
 
 import threading
 import time
+from pathlib import Path
 from unittest.mock import patch
 
 from podcast_processor.token_rate_limiter import (
+    SQLiteTokenUsageStore,
     TokenRateLimiter,
     configure_rate_limiter_for_model,
     get_rate_limiter,
@@ -22,7 +24,7 @@ class TestTokenRateLimiter:
         limiter = TokenRateLimiter()
         assert limiter.tokens_per_minute == 30000
         assert limiter.window_seconds == 60
-        assert len(limiter.token_usage) == 0
+        assert limiter.get_usage_stats()["current_usage"] == 0
 
         # Test custom initialization
         limiter = TokenRateLimiter(tokens_per_minute=15000, window_minutes=2)
@@ -67,16 +69,13 @@ class TestTokenRateLimiter:
         current_time = time.time()
 
         # Add some old usage records
-        limiter.token_usage.append((current_time - 120, 100))  # 2 minutes ago
-        limiter.token_usage.append((current_time - 30, 200))  # 30 seconds ago
-        limiter.token_usage.append((current_time - 10, 300))  # 10 seconds ago
+        limiter.record_tokens(100, current_time - 120)  # 2 minutes ago
+        limiter.record_tokens(200, current_time - 30)  # 30 seconds ago
+        limiter.record_tokens(300, current_time - 10)  # 10 seconds ago
 
-        # Cleanup should remove the 2-minute-old record
-        limiter._cleanup_old_usage(current_time)
-
-        assert len(limiter.token_usage) == 2
-        assert limiter.token_usage[0][1] == 200  # 30 seconds ago should remain
-        assert limiter.token_usage[1][1] == 300  # 10 seconds ago should remain
+        # The 2-minute-old record drops out of the window
+        assert limiter._get_current_usage(current_time) == 500
+        assert limiter.get_usage_stats()["active_records"] == 2
 
     def test_get_current_usage(self) -> None:
         """Test getting current token usage within time window."""
@@ -85,9 +84,9 @@ class TestTokenRateLimiter:
         current_time = time.time()
 
         # Add usage records
-        limiter.token_usage.append((current_time - 120, 100))  # Outside window
-        limiter.token_usage.append((current_time - 30, 200))  # Within window
-        limiter.token_usage.append((current_time - 10, 300))  # Within window
+        limiter.record_tokens(100, current_time - 120)  # Outside window
+        limiter.record_tokens(200, current_time - 30)  # Within window
+        limiter.record_tokens(300, current_time - 10)  # Within window
 
         usage = limiter._get_current_usage(current_time)
         assert usage == 500  # 200 + 300 (only records within window)
@@ -109,7 +108,7 @@ class TestTokenRateLimiter:
         current_time = time.time()
 
         # Add usage that nearly fills the limit
-        limiter.token_usage.append((current_time - 30, 90))
+        limiter.record_tokens(90, current_time - 30)
 
         # Try to add more tokens that would exceed the limit
         messages: list[dict[str, str]] = [
@@ -128,14 +127,15 @@ class TestTokenRateLimiter:
         limiter = TokenRateLimiter()
 
         messages: list[dict[str, str]] = [{"role": "user", "content": "Test message"}]
-        initial_count = len(limiter.token_usage)
+        initial_usage = limiter.get_usage_stats()["current_usage"]
 
         limiter.record_usage(messages, "gpt-4")
 
-        assert len(limiter.token_usage) == initial_count + 1
-        timestamp, token_count = limiter.token_usage[-1]
-        assert timestamp > 0
-        assert token_count > 0
+        stats = limiter.get_usage_stats()
+        assert stats["current_usage"] == initial_usage + limiter.count_tokens(
+            messages, "gpt-4"
+        )
+        assert stats["active_records"] == 1
 
     def test_wait_if_needed_no_wait(self) -> None:
         """Test wait_if_needed when no waiting is required."""
@@ -153,7 +153,7 @@ class TestTokenRateLimiter:
         assert elapsed < 1.0
 
         # Should have recorded usage
-        assert len(limiter.token_usage) > 0
+        assert limiter.get_usage_stats()["current_usage"] > 0
 
     def test_wait_if_needed_with_wait(self) -> None:
         """Test wait_if_needed when waiting is required."""
@@ -161,14 +161,21 @@ class TestTokenRateLimiter:
 
         # Fill up the rate limit
         current_time = time.time()
-        limiter.token_usage.append((current_time - 10, 45))
+        limiter.record_tokens(45, current_time - 10)
 
         messages: list[dict[str, str]] = [
             {"role": "user", "content": "This message should trigger waiting"}
         ]
 
-        # Mock time.sleep to avoid actual waiting in tests
-        with patch("time.sleep") as mock_sleep:
+        # Sleeping advances a fake clock instead of actually waiting
+        clock = [current_time]
+
+        def fake_sleep(seconds: float) -> None:
+            clock[0] += seconds
+
+        with patch("time.time", lambda: clock[0]), patch(
+            "time.sleep", side_effect=fake_sleep
+        ) as mock_sleep:
             limiter.wait_if_needed(messages, "gpt-4")
 
             # Should have called sleep
@@ -182,8 +189,8 @@ class TestTokenRateLimiter:
 
         # Add some usage
         current_time = time.time()
-        limiter.token_usage.append((current_time - 30, 200))
-        limiter.token_usage.append((current_time - 10, 300))
+        limiter.record_tokens(200, current_time - 30)
+        limiter.record_tokens(300, current_time - 10)
 
         stats = limiter.get_usage_stats()
 
@@ -220,7 +227,9 @@ class TestTokenRateLimiter:
             thread.join()
 
         # Should have recorded usage from all threads
-        assert len(limiter.token_usage) == 50  # 5 threads * 10 calls each
+        # 5 threads * 10 calls each
+        expected = 50 * limiter.count_tokens(messages, "gpt-4")
+        assert limiter.get_usage_stats()["current_usage"] == expected
 
 
 class TestGlobalRateLimiter:
@@ -256,12 +265,12 @@ class TestGlobalRateLimiter:
         import podcast_processor.token_rate_limiter as trl_module
 
         # Test gpt-4o-mini first (higher limit)
-        trl_module._RATE_LIMITER = None
+        trl_module._RATE_LIMITERS.clear()
         limiter = configure_rate_limiter_for_model("gpt-4o-mini")
         assert limiter.tokens_per_minute == 200000
 
         # Test gpt-4o (lower limit)
-        trl_module._RATE_LIMITER = None
+        trl_module._RATE_LIMITERS.clear()
         limiter = configure_rate_limiter_for_model("gpt-4o")
         assert limiter.tokens_per_minute == 150000
 
@@ -269,11 +278,11 @@ class TestGlobalRateLimiter:
         """Test model-specific configuration for Gemini models."""
         import podcast_processor.token_rate_limiter as trl_module
 
-        trl_module._RATE_LIMITER = None
+        trl_module._RATE_LIMITERS.clear()
         limiter = configure_rate_limiter_for_model("gemini/gemini-3-flash-preview")
         assert limiter.tokens_per_minute == 60000
 
-        trl_module._RATE_LIMITER = None
+        trl_module._RATE_LIMITERS.clear()
         limiter = configure_rate_limiter_for_model("gemini/gemini-2.5-flash")
         assert limiter.tokens_per_minute == 60000
 
@@ -287,3 +296,122 @@ class TestGlobalRateLimiter:
         # Test that partial matches work
         limiter = configure_rate_limiter_for_model("some-prefix/gpt-4o/some-suffix")
         assert limiter.tokens_per_minute == 150000  # Should match gpt-4o
+
+    def test_budgets_are_separate_per_model_and_api_key(self) -> None:
+        """Each model/API key pair gets its own limiter and budget."""
+        a = get_rate_limiter(5000, model="gpt-4o", api_key="key-a")
+        b = get_rate_limiter(5000, model="gpt-4o", api_key="key-b")
+        other_model = get_rate_limiter(5000, model="gpt-4o-mini", api_key="key-a")
+
+        assert a is get_rate_limiter(5000, model="GPT-4o", api_key="key-a")
+        assert len({a.budget, b.budget, other_model.budget}) == 3
+        assert "key-a" not in a.budget
+
+        a.record_tokens(4000)
+        assert b.get_usage_stats()["current_usage"] == 0
+        assert other_model.get_usage_stats()["current_usage"] == 0
+
+    def test_missing_shared_store_directory_falls_back_to_process_budget(
+        self, tmp_path: Path
+    ) -> None:
+        limiter = get_rate_limiter(
+            5000, model="fallback-model", shared_store_path=tmp_path / "no" / "x.db"
+        )
+        assert not isinstance(limiter.store, SQLiteTokenUsageStore)
+
+
+class TestSharedTokenUsage:
+    """Budgets shared through a SQLite file, as between worker processes."""
+
+    def test_limiters_on_separate_connections_share_budget(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "usage.sqlite3"
+        first = TokenRateLimiter(
+            tokens_per_minute=1000, budget="m", store=SQLiteTokenUsageStore(path)
+        )
+        second = TokenRateLimiter(
+            tokens_per_minute=1000, budget="m", store=SQLiteTokenUsageStore(path)
+        )
+
+        first.record_tokens(700)
+        assert second.get_usage_stats()["current_usage"] == 700
+
+        messages = [{"role": "user", "content": "x" * 1600}]  # 400 tokens
+        can_proceed, wait_seconds = second.try_acquire(messages, "gpt-4")
+        assert not can_proceed
+        assert wait_seconds > 0
+        assert first.get_usage_stats()["current_usage"] == 700
+
+    def test_old_buckets_expire_from_shared_window(self, tmp_path: Path) -> None:
+        limiter = TokenRateLimiter(
+            tokens_per_minute=1000,
+            budget="m",
+            store=SQLiteTokenUsageStore(tmp_path / "usage.sqlite3"),
+        )
+        now = time.time()
+        limiter.record_tokens(100, now - 120)
+        limiter.record_tokens(200, now - 30)
+        limiter.record_tokens(300, now - 10)
+
+        assert limiter._get_current_usage(now) == 500
+        assert limiter.get_usage_stats()["active_records"] == 2
+
+    def test_try_acquire_never_overshoots_under_contention(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "usage.sqlite3"
+        limiters = [
+            TokenRateLimiter(
+                tokens_per_minute=1000, budget="m", store=SQLiteTokenUsageStore(path)
+            )
+            for _ in range(4)
+        ]
+        messages = [{"role": "user", "content": "x" * 400}]  # 100 tokens
+        admitted: list[bool] = []
+
+        def worker(limiter: TokenRateLimiter) -> None:
+            for _ in range(10):
+                admitted.append(limiter.try_acquire(messages, "gpt-4")[0])
+
+        threads = [threading.Thread(target=worker, args=(lim,)) for lim in limiters]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert admitted.count(True) == 10
+        assert limiters[0].get_usage_stats()["current_usage"] == 1000
+
+    def test_waiter_rechecks_budget_claimed_while_it_slept(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "usage.sqlite3"
+        first = TokenRateLimiter(
+            tokens_per_minute=1000, budget="m", store=SQLiteTokenUsageStore(path)
+        )
+        second = TokenRateLimiter(
+            tokens_per_minute=1000, budget="m", store=SQLiteTokenUsageStore(path)
+        )
+        messages = [{"role": "user", "content": "x" * 2400}]  # 600 tokens
+        clock = [1_000_000.0]
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+            if len(sleeps) == 1:
+                # Another process wakes first and takes the freed budget
+                assert first.try_acquire(messages, "gpt-4")[0]
+
+        with patch("time.time", lambda: clock[0]), patch(
+            "time.sleep", side_effect=fake_sleep
+        ):
+            first.wait_if_needed(messages, "gpt-4")
+            second.wait_if_needed(messages, "gpt-4")
+            usage = second.get_usage_stats()["current_usage"]
+
+        # The second limiter waited out another whole window, never overshooting
+        assert len(sleeps) == 2
+        assert sleeps[1] >= second.window_seconds
+        assert usage == 600
@@ -1,4 +1,7 @@
 import logging
+import threading
+import time
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -115,3 +118,231 @@ def test_offset() -> None:
             end=45.800999999999995,
         )
     ]
+
+
+def _chunks(count: int) -> list[tuple[Path, int]]:
+    return [(Path(f"chunk_{i}.mp3"), i * 60_000) for i in range(count)]
+
+
+def test_transcribe_chunks_runs_in_parallel_and_keeps_order() -> None:
+    from podcast_processor.transcribe import (  # pylint: disable=import-outside-toplevel
+        transcribe_chunks,
+    )
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def get_segments(chunk_path: str) -> list[str]:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # Later chunks finish first
+        time.sleep(0.05 * (6 - int(chunk_path[6])))
+        with lock:
+            in_flight -= 1
+        return [chunk_path]
+
+    start = time.monotonic()
+    results = transcribe_chunks(
+        _chunks(6),
+        get_segments,
+        provider="test-parallel",
+        max_parallel=3,
+        logger=logging.getLogger("global_logger"),
+        log_prefix="[TEST]",
+    )
+    elapsed = time.monotonic() - start
+
+    assert results == [([f"chunk_{i}.mp3"], i * 60_000) for i in range(6)]
+    assert peak == 3
+    # Sequential would take 1.05s
+    assert elapsed < 0.7
+
+
+def test_transcribe_chunks_backs_off_on_rate_limit() -> None:
+    # pylint: disable-next=import-outside-toplevel
+    from podcast_processor import transcribe as transcribe_module
+
+    def get_segments(chunk_path: str) -> list[str]:
+        if chunk_path == "chunk_1.mp3":
+            raise RuntimeError("Error code: 429 - rate limit exceeded")
+        return [chunk_path]
+
+    with pytest.raises(RuntimeError, match="429"):
+        transcribe_module.transcribe_chunks(
+            _chunks(2),
+            get_segments,
+            provider="test-rate-limited",
+            max_parallel=4,
+            logger=logging.getLogger("global_logger"),
+            log_prefix="[TEST]",
+        )
+
+    limiter = transcribe_module._PROVIDER_LIMITERS["test-rate-limited"]
+    assert limiter.get_current_limit() == 2
+
+
+def test_groq_transcribe_offsets_parallel_chunks(mocker: Any) -> None:
+    from podcast_processor.transcribe import (  # pylint: disable=import-outside-toplevel
+        GroqTranscriptionSegment,
+        GroqWhisperTranscriber,
+    )
+    from shared.config import (  # pylint: disable=import-outside-toplevel
+        GroqWhisperConfig,
+    )
+
+    mocker.patch("podcast_processor.transcribe.split_audio", return_value=_chunks(3))
+    mocker.patch("shutil.rmtree")
+    transcriber = GroqWhisperTranscriber(
+        logging.getLogger("global_logger"),
+        GroqWhisperConfig(api_key="test_key", max_parallel_chunks=3),
+    )
+    mocker.patch.object(
+        transcriber,
+        "get_segments_for_chunk",
+        side_effect=lambda path: [
+            GroqTranscriptionSegment(start=0.0, end=1.0, text=path)
+        ],
+    )
+
+    transcription = transcriber.transcribe("episode.mp3")
+
+    assert [seg.text for seg in transcription] == [
+        "chunk_0.mp3",
+        "chunk_1.mp3",
+        "chunk_2.mp3",
+    ]
+    assert [seg.start for seg in transcription] == [0.0, 60.0, 120.0]
+
+
+def test_stitch_chunk_segments_rejoins_utterances_split_at_cuts() -> None:
+    from podcast_processor.transcribe import (  # pylint: disable=import-outside-toplevel
+        Segment,
+        stitch_chunk_segments,
+    )
+
+    stitched = stitch_chunk_segments(
+        [
+            [
+                Segment(start=0.0, end=4.0, text="Thanks for listening."),
+                Segment(start=4.0, end=9.8, text=" This episode is brought"),
+            ],
+            [
+                Segment(start=10.0, end=12.0, text=" to you by Acme."),
+                # Empty segments away from the cuts are kept
+                Segment(start=12.0, end=12.5, text=""),
+                Segment(start=12.5, end=19.9, text=" Back to the show."),
+                Segment(start=19.9, end=20.0, text=" "),
+            ],
+            [
+                Segment(start=20.0, end=20.1, text=""),
+                Segment(start=20.1, end=23.0, text=" So where were we?"),
+            ],
+        ]
+    )
+
+    assert [(seg.start, seg.end, seg.text) for seg in stitched] == [
+        (0.0, 4.0, "Thanks for listening."),
+        (4.0, 12.0, " This episode is brought to you by Acme."),
+        (12.0, 12.5, ""),
+        (12.5, 19.9, " Back to the show."),
+        (20.1, 23.0, " So where were we?"),
+    ]
+
+
+def test_groq_transcribe_stream_yields_chunks_before_later_ones_finish(
+    mocker: Any,
+) -> None:
+    from podcast_processor.transcribe import (  # pylint: disable=import-outside-toplevel
+        GroqTranscriptionSegment,
+        GroqWhisperTranscriber,
+    )
+    from shared.config import (  # pylint: disable=import-outside-toplevel
+        GroqWhisperConfig,
+    )
+
+    mocker.patch("podcast_processor.transcribe.split_audio", return_value=_chunks(2))
+    mocker.patch("shutil.rmtree")
+    transcriber = GroqWhisperTranscriber(
+        logging.getLogger("global_logger"),
+        GroqWhisperConfig(api_key="test_key", max_parallel_chunks=2),
+    )
+    last_chunk_started = threading.Event()
+    release_last_chunk = threading.Event()
+
+    def get_segments(path: str) -> list[GroqTranscriptionSegment]:
+        if path == "chunk_1.mp3":
+            last_chunk_started.set()
+            assert release_last_chunk.wait(5)
+        return [GroqTranscriptionSegment(start=0.0, end=1.0, text=f"{path}.")]
+
+    mocker.patch.object(transcriber, "get_segments_for_chunk", side_effect=get_segments)
+
+    batches = transcriber.transcribe_stream("episode.mp3")
+    # Chunk 0's last segment is held back until chunk 1 shows whether it continues
+    assert next(batches) == []
+    assert last_chunk_started.wait(5)
+    release_last_chunk.set()
+    assert [[seg.text for seg in batch] for batch in batches] == [
+        ["chunk_0.mp3."],
+        ["chunk_1.mp3."],
+    ]
+
+
+def test_groq_retry_only_transcribes_chunks_that_failed(
+    mocker: Any, tmp_path: Path
+) -> None:
+    from podcast_processor.transcribe import (  # pylint: disable=import-outside-toplevel
+        GroqTranscriptionSegment,
+        GroqWhisperTranscriber,
+    )
+    from shared.config import (  # pylint: disable=import-outside-toplevel
+        GroqWhisperConfig,
+    )
+
+    audio_path = str(tmp_path / "episode.mp3")
+    parts_dir = Path(audio_path + "_parts")
+
+    def split(*_args: Any, **_kwargs: Any) -> list[tuple[Path, int]]:
+        parts_dir.mkdir(exist_ok=True)
+        chunks = []
+        for i in range(3):
+            chunk_path = parts_dir / f"chunk_{i}.mp3"
+            chunk_path.write_bytes(f"audio {i}".encode())
+            chunks.append((chunk_path, i * 60_000))
+        return chunks
+
+    mocker.patch("podcast_processor.transcribe.split_audio", side_effect=split)
+    transcriber = GroqWhisperTranscriber(
+        logging.getLogger("global_logger"),
+        GroqWhisperConfig(api_key="test_key", max_parallel_chunks=1),
+    )
+    uploaded: list[str] = []
+    fail_chunk = "chunk_2.mp3"
+
+    def get_segments(path: str) -> list[GroqTranscriptionSegment]:
+        name = Path(path).name
+        if name == fail_chunk:
+            raise RuntimeError("Error code: 500 - provider down")
+        uploaded.append(name)
+        return [GroqTranscriptionSegment(start=0.0, end=1.0, text=f"{name}.")]
+
+    mocker.patch.object(transcriber, "get_segments_for_chunk", side_effect=get_segments)
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        transcriber.transcribe(audio_path)
+    assert uploaded == ["chunk_0.mp3", "chunk_1.mp3"]
+    assert not parts_dir.exists()
+
+    fail_chunk = ""
+    transcription = transcriber.transcribe(audio_path)
+
+    assert uploaded == ["chunk_0.mp3", "chunk_1.mp3", "chunk_2.mp3"]
+    assert [(seg.start, seg.text) for seg in transcription] == [
+        (0.0, "chunk_0.mp3."),
+        (60.0, "chunk_1.mp3."),
+        (120.0, "chunk_2.mp3."),
+    ]
+    assert not Path(audio_path + "_chunk_transcripts").exists()
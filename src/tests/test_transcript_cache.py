@@ -0,0 +1,180 @@
+"""
+Tests for the audio-content keyed transcript cache.
+"""
+
+import logging
+import os
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from app.extensions import db
+from app.models import Feed, ModelCall, Post, TranscriptSegment
+from podcast_processor.transcribe import Segment, Transcriber
+from podcast_processor.transcript_cache import TranscriptCache, get_transcript_cache
+from podcast_processor.transcription_manager import TranscriptionManager
+from shared.config import TestWhisperConfig
+from shared.test_utils import create_standard_test_config
+
+_FRAMES = bytes(range(256)) * 64
+
+
+def _id3v2(payload: bytes) -> bytes:
+    size = len(payload)
+    syncsafe = bytes((size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b"ID3\x04\x00\x00" + syncsafe + payload
+
+
+def _id3v1(title: bytes) -> bytes:
+    return (b"TAG" + title).ljust(128, b"\x00")
+
+
+def _write(path: Path, data: bytes) -> str:
+    path.write_bytes(data)
+    return str(path)
+
+
+def _segments(*texts: str) -> list[Segment]:
+    return [
+        Segment(start=float(i), end=float(i + 1), text=text)
+        for i, text in enumerate(texts)
+    ]
+
+
+def test_key_ignores_id3_tags_but_not_audio_or_model(tmp_path: Path) -> None:
+    plain = _write(tmp_path / "plain.mp3", _FRAMES)
+    tagged = _write(
+        tmp_path / "tagged.mp3",
+        _id3v2(b"TIT2 premium feed") + _FRAMES + _id3v1(b"Episode 12"),
+    )
+    other = _write(tmp_path / "other.mp3", _FRAMES + b"\x01")
+
+    key = TranscriptCache.key(plain, "base.en")
+    assert TranscriptCache.key(tagged, "base.en") == key
+    assert TranscriptCache.key(other, "base.en") != key
+    assert TranscriptCache.key(plain, "small.en") != key
+
+
+def test_get_put_round_trip_and_hit_rate(tmp_path: Path) -> None:
+    cache = TranscriptCache(tmp_path / "cache", max_entries=10, max_bytes=10**6)
+
+    assert cache.get("abc") is None
+    cache.put("abc", _segments("Hello", " world."))
+
+    cached = cache.get("abc")
+    assert cached is not None
+    assert [(seg.start, seg.end, seg.text) for seg in cached] == [
+        (0.0, 1.0, "Hello"),
+        (1.0, 2.0, " world."),
+    ]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert cache.hit_counts() == (1, 1)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    cache = TranscriptCache(tmp_path, max_entries=2, max_bytes=10**6)
+    for age, key in enumerate(("old", "used", "new")):
+        cache.put(key, _segments(key))
+        os.utime(tmp_path / f"{key}.json.gz", (1000 + age, 1000 + age))
+        if key == "used":
+            # Reading "old" makes "used" the least recently used entry
+            assert cache.get("old") is not None
+
+    assert cache.get("old") is not None
+    assert cache.get("used") is None
+    assert cache.get("new") is not None
+
+
+def test_size_limit_evicts_entries(tmp_path: Path) -> None:
+    cache = TranscriptCache(tmp_path, max_entries=100, max_bytes=1)
+    cache.put("abc", _segments("text"))
+    assert cache.stats()["entries"] == 0
+
+
+def test_corrupt_entries_are_discarded(tmp_path: Path) -> None:
+    cache = TranscriptCache(tmp_path, max_entries=10, max_bytes=10**6)
+    (tmp_path / "abc.json.gz").write_bytes(b"not gzip")
+    assert cache.get("abc") is None
+    assert not (tmp_path / "abc.json.gz").exists()
+
+
+def test_cache_is_disabled_without_limits_or_directory(tmp_path: Path) -> None:
+    assert get_transcript_cache(0, 200, tmp_path / "cache") is None
+    assert get_transcript_cache(500, 0, tmp_path / "cache") is None
+    assert get_transcript_cache(500, 200, tmp_path / "missing" / "cache") is None
+    assert get_transcript_cache(500, 200, tmp_path / "cache") is not None
+
+
+class _CountingTranscriber(Transcriber):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    def model_name(self) -> str:
+        return "counting"
+
+    def transcribe(self, audio_path: str) -> list[Segment]:
+        self.calls += 1
+        return _segments("Same", " episode.")
+
+
+@pytest.fixture
+def app() -> Flask:
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    with app.app_context():
+        db.init_app(app)
+        db.create_all()
+        yield app
+
+
+def test_identical_audio_under_another_guid_is_not_transcribed_again(
+    app: Flask, tmp_path: Path
+) -> None:
+    config = create_standard_test_config()
+    config.whisper = TestWhisperConfig()
+    free = _write(tmp_path / "free.mp3", _id3v2(b"free") + _FRAMES)
+    premium = _write(tmp_path / "premium.mp3", _id3v2(b"premium feed") + _FRAMES)
+
+    with app.app_context():
+        feed = Feed(title="Test Feed", rss_url="http://example.com/rss.xml")
+        posts = [
+            Post(
+                feed=feed,
+                guid=f"guid-{i}",
+                download_url=f"http://example.com/audio-{i}.mp3",
+                title="Same Episode",
+                unprocessed_audio_path=path,
+            )
+            for i, path in enumerate((free, premium))
+        ]
+        db.session.add_all([feed, *posts])
+        db.session.commit()
+
+        transcriber = _CountingTranscriber()
+        cache = TranscriptCache(tmp_path / "cache", max_entries=10, max_bytes=10**6)
+        manager = TranscriptionManager(
+            logging.getLogger("global_logger"),
+            config,
+            db_session=db.session,
+            transcriber=transcriber,
+            transcript_cache=cache,
+        )
+
+        first = manager.transcribe(posts[0])
+        second = list(manager.transcribe_stream(posts[1]))
+
+        assert transcriber.calls == 1
+        assert [seg.text for seg in first] == ["Same", " episode."]
+        assert [[seg.text for seg in batch] for batch in second] == [
+            ["Same", " episode."]
+        ]
+        assert TranscriptSegment.query.filter_by(post_id=posts[1].id).count() == 2
+        call = ModelCall.query.filter_by(post_id=posts[1].id).one()
+        assert call.status == "success"
+        assert call.last_segment_sequence_num == 1
+        assert cache.stats()["hit_rate"] == 0.5
@@ -292,3 +292,65 @@ def test_transcribe_reuses_placeholder_model_call(
         assert refreshed_call.id == existing_call.id
         assert refreshed_call.status == "success"
         assert refreshed_call.last_segment_sequence_num == 1
+
+
+class StreamingMockTranscriber(MockTranscriber):
+    streams_batches = True
+
+    def __init__(self, batches):
+        super().__init__()
+        self.batches = batches
+
+    def transcribe_stream(self, audio_path):
+        yield from self.batches
+
+
+def test_transcribe_stream_persists_each_batch(
+    test_config: Config,
+    test_logger: logging.Logger,
+    app: Flask,
+) -> None:
+    with app.app_context():
+        feed = Feed(title="Test Feed", rss_url="http://example.com/rss.xml")
+        post = Post(
+            feed=feed,
+            guid="guid-stream",
+            download_url="http://example.com/audio-stream.mp3",
+            title="Test Post",
+            unprocessed_audio_path="/path/to/audio.mp3",
+        )
+        db.session.add_all([feed, post])
+        db.session.commit()
+
+        transcriber = StreamingMockTranscriber(
+            [
+                [
+                    Segment(start=0.0, end=5.0, text="One"),
+                    Segment(start=5.0, end=10.0, text="Two"),
+                ],
+                [],
+                [Segment(start=10.0, end=15.0, text="Three")],
+            ]
+        )
+        manager = TranscriptionManager(
+            test_logger,
+            test_config,
+            db_session=db.session,
+            transcriber=transcriber,
+        )
+
+        batches = manager.transcribe_stream(post)
+        first = next(batches)
+        assert [seg.text for seg in first] == ["One", "Two"]
+        # Stored, but not yet marked complete
+        assert TranscriptSegment.query.filter_by(post_id=post.id).count() == 2
+        assert ModelCall.query.filter_by(post_id=post.id).first().status == "pending"
+
+        rest = list(batches)
+        assert [[seg.sequence_num for seg in batch] for batch in rest] == [[2]]
+        model_call = ModelCall.query.filter_by(post_id=post.id).first()
+        assert model_call.status == "success"
+        assert model_call.last_segment_sequence_num == 2
+
+        # A finished transcription is reused as a single batch
+        assert [len(batch) for batch in manager.transcribe_stream(post)] == [3]
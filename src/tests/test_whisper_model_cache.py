@@ -0,0 +1,166 @@
+"""
+Tests for the process-wide local Whisper model cache.
+"""
+
+import logging
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Tuple
+
+from podcast_processor.transcribe import (
+    FasterWhisperTranscriber,
+    LocalWhisperTranscriber,
+)
+from podcast_processor.whisper_model_cache import (
+    WhisperModelCache,
+    get_faster_whisper_model_cache,
+)
+from shared.config import FasterWhisperConfig
+
+
+class _FakeModel:
+    def __init__(self, name: str):
+        self.name = name
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def transcribe(self, _path: str, **_kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        segment = {
+            "id": 0,
+            "seek": 0,
+            "start": 0.0,
+            "end": 1.0,
+            "text": self.name,
+            "tokens": [],
+            "temperature": 0.0,
+            "avg_logprob": -0.1,
+            "compression_ratio": 1.0,
+            "no_speech_prob": 0.0,
+        }
+        return {"segments": [segment]}
+
+
+def _cache(loaded: List[str], idle_timeout: float = 600.0) -> WhisperModelCache:
+    def loader(name: str) -> _FakeModel:
+        loaded.append(name)
+        return _FakeModel(name)
+
+    return WhisperModelCache(idle_timeout=idle_timeout, loader=loader)
+
+
+def test_model_loads_once_and_is_reused_across_transcribers() -> None:
+    loaded: List[str] = []
+    cache = _cache(loaded)
+    logger = logging.getLogger("global_logger")
+
+    for _ in range(3):
+        segments = LocalWhisperTranscriber(logger, "base.en", cache).transcribe("a.mp3")
+        assert segments[0].text == "base.en"
+
+    assert loaded == ["base.en"]
+    stats = cache.stats()["base.en"]
+    assert stats["loaded"] and stats["loads"] == 1
+    assert stats["load_seconds"] is not None
+
+
+def test_concurrent_jobs_share_one_model_serially() -> None:
+    loaded: List[str] = []
+    cache = _cache(loaded)
+
+    def job() -> None:
+        with cache.use("small") as model:
+            model.transcribe("a.mp3")
+
+    threads = [threading.Thread(target=job) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loaded == ["small"]
+    with cache.use("small") as model:
+        assert model.max_active == 1
+
+
+def test_idle_models_are_unloaded_and_reloaded_on_demand() -> None:
+    loaded: List[str] = []
+    cache = _cache(loaded, idle_timeout=60.0)
+
+    with cache.use("base.en"):
+        pass
+    assert cache.unload_idle() == []
+    assert cache.unload_idle(now=time.monotonic() + 61.0) == ["base.en"]
+    assert not cache.stats()["base.en"]["loaded"]
+
+    with cache.use("base.en"):
+        pass
+    assert loaded == ["base.en", "base.en"]
+    assert cache.stats()["base.en"]["loads"] == 2
+
+
+def test_models_in_use_are_not_unloaded() -> None:
+    cache = _cache([], idle_timeout=1.0)
+
+    with cache.use("base.en"):
+        assert cache.unload_all() == []
+    assert cache.unload_all() == ["base.en"]
+
+
+class _FakeFasterModel:
+    def __init__(self, cache: WhisperModelCache):
+        self.cache = cache
+        self.kwargs: Dict[str, Any] = {}
+
+    def transcribe(
+        self, _path: str, **kwargs: Any
+    ) -> Tuple[Iterator[SimpleNamespace], SimpleNamespace]:
+        self.kwargs = kwargs
+
+        def segments() -> Iterator[SimpleNamespace]:
+            # Decoding happens as segments are consumed, so the model must
+            # still be checked out of the cache
+            assert self.cache.unload_all() == []
+            yield SimpleNamespace(start=0.0, end=2.5, text=" Hello")
+            yield SimpleNamespace(start=2.5, end=4.0, text=" world.")
+
+        return segments(), SimpleNamespace(duration=4.0)
+
+
+def test_faster_whisper_consumes_segments_while_holding_model() -> None:
+    models: List[_FakeFasterModel] = []
+
+    def loader(_name: str) -> _FakeFasterModel:
+        models.append(_FakeFasterModel(cache))
+        return models[-1]
+
+    cache = WhisperModelCache(loader=loader)
+    transcriber = FasterWhisperTranscriber(
+        logging.getLogger("global_logger"),
+        FasterWhisperConfig(model="small.en", vad_filter=False),
+        cache,
+    )
+
+    segments = transcriber.transcribe("a.mp3")
+
+    assert [(seg.start, seg.end, seg.text) for seg in segments] == [
+        (0.0, 2.5, " Hello"),
+        (2.5, 4.0, " world."),
+    ]
+    assert models[0].kwargs == {"language": "en", "beam_size": 1, "vad_filter": False}
+    assert transcriber.model_name == "faster_whisper_small.en"
+
+
+def test_faster_whisper_caches_are_shared_per_load_options() -> None:
+    int8 = get_faster_whisper_model_cache("int8", 4)
+    assert get_faster_whisper_model_cache("int8", 4, idle_timeout=30.0) is int8
+    assert int8.idle_timeout == 30.0
+    assert get_faster_whisper_model_cache("int8", 8) is not int8
+    assert get_faster_whisper_model_cache("float32", 4) is not int8
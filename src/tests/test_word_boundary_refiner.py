@@ -0,0 +1,101 @@
+"""
+Tests for the word-level boundary refiner's phrase and word timing.
+"""
+
+import json
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from podcast_processor.word_boundary_refiner import WordBoundaryRefiner
+from shared.test_utils import create_standard_test_config
+
+SEGMENTS: List[Dict[str, Any]] = [
+    {
+        "sequence_num": 0,
+        "start_time": 0.0,
+        "end_time": 10.0,
+        "text": "Welcome back to the show, everyone.",
+    },
+    {
+        "sequence_num": 1,
+        "start_time": 10.0,
+        "end_time": 20.0,
+        "text": "(This episode is brought to you by Acme. Acme makes...",
+    },
+    {
+        "sequence_num": 2,
+        "start_time": 20.0,
+        "end_time": 28.0,
+        "text": "Go to acme.com slash show. Now, back to it",
+    },
+]
+
+
+def _refine(refiner: WordBoundaryRefiner, response: Dict[str, Any]) -> Any:
+    with patch(
+        "podcast_processor.word_boundary_refiner.complete_litellm_text",
+        return_value=json.dumps(response),
+    ):
+        return refiner.refine(
+            ad_start=10.0,
+            ad_end=28.0,
+            confidence=0.9,
+            all_segments=SEGMENTS,
+            first_seq_num=1,
+            last_seq_num=2,
+        )
+
+
+def test_refine_locates_start_and_end_phrases() -> None:
+    refiner = WordBoundaryRefiner(create_standard_test_config())
+
+    result = _refine(
+        refiner,
+        {
+            "refined_start_segment_seq": 1,
+            "refined_start_phrase": "this episode is brought",
+            "refined_end_segment_seq": 2,
+            "refined_end_phrase": "acme.com slash show.",
+        },
+    )
+
+    # Segment 1 has 10 words over 10s; segment 2 has 9 words over 8s
+    assert result.refined_start == 10.0
+    assert result.refined_end == 20.0 + 5 * (8.0 / 9)
+
+
+def test_refine_falls_back_to_shorter_phrase_and_other_segments() -> None:
+    refiner = WordBoundaryRefiner(create_standard_test_config())
+
+    result = _refine(
+        refiner,
+        {
+            # Wrong segment and a garbled tail: "brought to you" still matches
+            "refined_start_segment_seq": 2,
+            "refined_start_phrase": "brought to you bye",
+            "refined_end_segment_seq": 1,
+            "refined_end_phrase": "back to it",
+        },
+    )
+
+    assert result.refined_start == 13.0
+    assert result.refined_end == 28.0
+
+
+def test_refine_resolves_word_occurrence_and_reuses_index() -> None:
+    refiner = WordBoundaryRefiner(create_standard_test_config())
+
+    result = _refine(
+        refiner,
+        {
+            "refined_start_segment_seq": 1,
+            "refined_start_word": "ACME",
+            "occurrence": "last",
+        },
+    )
+    assert result.refined_start == 18.0
+
+    assert refiner._token_index is not None
+    index = refiner._token_index[1]
+    _refine(refiner, {"refined_start_segment_seq": 1, "refined_start_word_index": 3})
+    assert refiner._token_index[1] is index